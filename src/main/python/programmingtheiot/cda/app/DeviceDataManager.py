@@ -9,48 +9,68 @@
 
 import logging
 
-from programmingtheiot.cda.connection.CoapClientConnector import CoapClientConnector
-from programmingtheiot.cda.connection.MqttClientConnector import MqttClientConnector
+from importlib import import_module
+
+import programmingtheiot.common.ConfigConst as ConfigConst
 
 from programmingtheiot.cda.system.ActuatorAdapterManager import ActuatorAdapterManager
 from programmingtheiot.cda.system.SensorAdapterManager import SensorAdapterManager
 from programmingtheiot.cda.system.SystemPerformanceManager import SystemPerformanceManager
 
+from programmingtheiot.common.ConfigUtil import ConfigUtil
 from programmingtheiot.common.IDataMessageListener import IDataMessageListener
 from programmingtheiot.common.ISystemPerformanceDataListener import ISystemPerformanceDataListener
 from programmingtheiot.common.ITelemetryDataListener import ITelemetryDataListener
 from programmingtheiot.common.ResourceNameEnum import ResourceNameEnum
 
 from programmingtheiot.data.ActuatorData import ActuatorData
+from programmingtheiot.data.MultiSensorData import MultiSensorData
 from programmingtheiot.data.SensorData import SensorData
+from programmingtheiot.data.SensorDataBatch import SensorDataBatch
 from programmingtheiot.data.SystemPerformanceData import SystemPerformanceData
 
 class DeviceDataManager(IDataMessageListener):
 	"""
-	Shell representation of class for student implementation.
+	Partial implementation, which remains a shell for student implementation.
+	
+	Implemented so far: creating the enabled client connectors, starting
+	and stopping the ActuatorAdapterManager (and so its dispatch workers),
+	routing actuator commands to it, and caching the latest sensor reading
+	and actuator response by name. The system performance handling, the
+	data analysis and the upstream transmission are still left to the
+	student.
 	
 	"""
 	
 	def __init__(self):
-		pass
+		# the connectors (and their protocol libraries) are only loaded if they're enabled
+		self.mqttClient = self._createConnector(ConfigConst.ENABLE_MQTT_CLIENT_KEY, 'MqttClientConnector')
+		self.coapClient = self._createConnector(ConfigConst.ENABLE_COAP_CLIENT_KEY, 'CoapClientConnector')
+		
+		self.actuatorAdapterMgr = ActuatorAdapterManager()
+		self.actuatorAdapterMgr.setDataMessageListener(self)
+		
+		# the latest reading of each sensor, and response of each actuator, keyed by name
+		self.sensorDataCache = {}
+		self.actuatorResponseCache = {}
 		
 	def getLatestActuatorDataResponseFromCache(self, name: str = None) -> ActuatorData:
 		"""
 		Retrieves the named actuator data (response) item from the internal data cache.
 		
 		@param name
-		@return ActuatorData
+		@return ActuatorData, or None if there's no response for 'name'.
 		"""
-		pass
+		return self.actuatorResponseCache.get(name)
 		
 	def getLatestSensorDataFromCache(self, name: str = None) -> SensorData:
 		"""
 		Retrieves the named sensor data item from the internal data cache.
 		
 		@param name
-		@return SensorData
+		@return SensorData, or None if there's no reading for 'name'.
 		"""
-		pass
+		return self.sensorDataCache.get(name)
 	
 	def getLatestSystemPerformanceDataFromCache(self, name: str = None) -> SystemPerformanceData:
 		"""
@@ -69,7 +89,7 @@ class DeviceDataManager(IDataMessageListener):
 		@param data The incoming ActuatorData command message.
 		@return boolean
 		"""
-		pass
+		return self.actuatorAdapterMgr.sendActuatorCommand(data)
 	
 	def handleActuatorCommandResponse(self, data: ActuatorData) -> bool:
 		"""
@@ -80,7 +100,12 @@ class DeviceDataManager(IDataMessageListener):
 		@param data The incoming ActuatorData response message.
 		@return boolean
 		"""
-		pass
+		if not data:
+			return False
+		
+		self.actuatorResponseCache[data.getName()] = data
+		
+		return True
 	
 	def handleIncomingMessage(self, resourceEnum: ResourceNameEnum, msg: str) -> bool:
 		"""
@@ -93,6 +118,22 @@ class DeviceDataManager(IDataMessageListener):
 		"""
 		pass
 	
+	def handleMultiSensorMessage(self, data: MultiSensorData) -> bool:
+		"""
+		This callback method will be invoked by the sensor manager in tick
+		mode, with one reading from each sensor. Each reading (see
+		MultiSensorData.getSensorData()) should be cached and analyzed as
+		with handleSensorMessage(), and the whole set converted via
+		DataUtil.multiSensorDataToJson() for a single upstream transmission.
+		
+		@param data The incoming MultiSensorData message.
+		@return boolean
+		"""
+		for index in range(data.getCount()):
+			self._updateSensorDataCache(data.getSensorData(index))
+		
+		return True
+	
 	def handleSensorMessage(self, data: SensorData) -> bool:
 		"""
 		This callback method will be invoked by the sensor manager that just processed
@@ -102,7 +143,41 @@ class DeviceDataManager(IDataMessageListener):
 		@param data The incoming SensorData message.
 		@return boolean
 		"""
-		pass
+		self._updateSensorDataCache(data)
+		
+		return True
+	
+	def handleSensorMessageBatch(self, data: SensorDataBatch) -> bool:
+		"""
+		This callback method will be invoked by the sensor manager when it
+		generates a batch of readings (e.g. to backfill missed polls). The
+		latest reading (see SensorDataBatch.getSensorData()) should be cached
+		and analyzed as with handleSensorMessage(), and the batch converted
+		via DataUtil.sensorDataBatchToJson() for upstream transmission.
+		
+		@param data The incoming SensorDataBatch message.
+		@return boolean
+		"""
+		sensorData = data.getSensorData()
+		
+		if sensorData:
+			self._updateSensorDataCache(sensorData)
+		
+		return True
+	
+	def handleSuppressedSensorMessage(self, data: SensorData) -> bool:
+		"""
+		This callback method will be invoked by the sensor manager for each
+		reading its report-on-change filter suppresses. The reading should be
+		cached (so getLatestSensorDataFromCache() stays current) and may be
+		analyzed as with handleSensorMessage(), but must not be sent upstream.
+		
+		@param data The incoming SensorData message.
+		@return boolean
+		"""
+		self._updateSensorDataCache(data)
+		
+		return True
 	
 	def handleSystemPerformanceMessage(self, data: SystemPerformanceData) -> bool:
 		"""
@@ -122,10 +197,28 @@ class DeviceDataManager(IDataMessageListener):
 		pass
 			
 	def startManager(self):
-		pass
+		self.actuatorAdapterMgr.startManager()
 		
 	def stopManager(self):
-		pass
+		self.actuatorAdapterMgr.stopManager()
+		
+	def _createConnector(self, enableKey: str = None, moduleName: str = None):
+		"""
+		Creates the named client connector - e.g. 'MqttClientConnector' - but only if
+		'enableKey' is set in the CDA config. The connector module (and with it, its
+		protocol library) is only imported in that case.
+		
+		@param enableKey The config key that enables the connector (e.g. ConfigConst.ENABLE_MQTT_CLIENT_KEY).
+		@param moduleName The connector module (and class) name within programmingtheiot.cda.connection.
+		@return The connector instance, or None if it's not enabled.
+		"""
+		if not ConfigUtil().getBoolean(ConfigConst.CONSTRAINED_DEVICE, enableKey):
+			logging.info("%s is disabled. Not loading it.", moduleName)
+			return None
+		
+		connectorModule = import_module('programmingtheiot.cda.connection.' + moduleName, moduleName)
+		
+		return getattr(connectorModule, moduleName)()
 		
 	def _handleIncomingDataAnalysis(self, msg: str):
 		"""
@@ -146,6 +239,10 @@ class DeviceDataManager(IDataMessageListener):
 		"""
 		pass
 		
+	def _updateSensorDataCache(self, data: SensorData):
+		if data:
+			self.sensorDataCache[data.getName()] = data
+			
 	def _handleUpstreamTransmission(self, resourceName: ResourceNameEnum, msg: str):
 		"""
 		Call this from handleActuatorCommandResponse(), handlesensorMessage(), and handleSystemPerformanceMessage()
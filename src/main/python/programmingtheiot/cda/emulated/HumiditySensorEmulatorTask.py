@@ -1,13 +1,14 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
 from programmingtheiot.data.SensorData import SensorData
+from programmingtheiot.data.SensorDataBatch import SensorDataBatch
 
 import programmingtheiot.common.ConfigConst as ConfigConst
 
@@ -18,12 +19,30 @@ from pisense import SenseHAT
 
 class HumiditySensorEmulatorTask(BaseSensorSimTask):
 	"""
-	Shell representation of class for student implementation.
+	Reads the humidity from the SenseHAT (or its emulator, if 'enableEmulator'
+	is set). Each reading is taken from the device when it's requested.
 	
 	"""
 
 	def __init__(self, dataSet = None):
-		pass
+		super( \
+			HumiditySensorEmulatorTask, self).__init__( \
+				name = ConfigConst.HUMIDITY_SENSOR_NAME, \
+				typeID = ConfigConst.HUMIDITY_SENSOR_TYPE)
+		
+		enableEmulation = \
+			ConfigUtil().getBoolean( \
+				ConfigConst.CONSTRAINED_DEVICE, ConfigConst.ENABLE_EMULATOR_KEY)
+		
+		self.sh = SenseHAT(emulate = enableEmulation)
 	
 	def generateTelemetry(self) -> SensorData:
-		pass
+		return self._updateLatestSensorData(self._readSensorValue())
+	
+	def generateTelemetryBatch(self, count: int = 1) -> SensorDataBatch:
+		# the SenseHAT only provides the current reading, so each
+		# value in the batch is a separate (time stamped) read
+		return self._generateReadingBatch(count = count, readValue = self._readSensorValue)
+	
+	def _readSensorValue(self) -> float:
+		return self.sh.environ.humidity
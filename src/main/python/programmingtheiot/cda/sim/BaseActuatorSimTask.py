@@ -1,49 +1,243 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
 import logging
 import random
 
+from time import monotonic
+
 import programmingtheiot.common.ConfigConst as ConfigConst
 
+from programmingtheiot.common.ConfigUtil import ConfigUtil
 from programmingtheiot.data.ActuatorData import ActuatorData
 
 class BaseActuatorSimTask():
 	"""
-	Shell representation of class for student implementation.
+	Base implementation of a simulated actuator task. Valid commands for
+	this actuator's type ID are dispatched to _activateActuator() or
+	_deactivateActuator(), and a response ActuatorData is returned.
+	
+	Commands are coalesced before they reach the actuator. A command is
+	suppressed (not applied) if it:
+	 - repeats the current state (same command and value): ACTUATOR_NO_OP_STATUS
+	 - arrives within the debounce window of the previous command, applied
+	   or not: ACTUATOR_DEBOUNCED_STATUS
+	 - arrives within the minimum interval of the last applied command:
+	   ACTUATOR_RATE_LIMITED_STATUS
+	
+	A suppressed command still gets a response, with the suppressed status
+	code (a positive value, so it isn't flagged as an error); only responses
+	with ConfigConst.DEFAULT_STATUS reflect an actuator state change. The
+	latest debounced or rate limited command is kept as pending, so the
+	final command of a burst isn't lost: applyPendingCommand() applies it
+	once it's due (see getPendingCommandDelay()).
 	
+	If a ZonePlantModel is given, each applied command is also passed
+	to the model for the given zone, so the sensor sim tasks reading
+	from the same model see its effect.
 	"""
 
-	def __init__(self, name: str = ConfigConst.NOT_SET, typeID: int = ConfigConst.DEFAULT_ACTUATOR_TYPE, simpleName: str = "Actuator"):
-		pass
+	def __init__(self, name: str = ConfigConst.NOT_SET, typeID: int = ConfigConst.DEFAULT_ACTUATOR_TYPE, simpleName: str = "Actuator", plantModel = None, zoneIndex: int = 0, debounceSecs: float = None, minIntervalSecs: float = None):
+		"""
+		Constructor.
+		
+		@param name The name of the actuator.
+		@param typeID The actuator type ID.
+		@param simpleName The simple name, used in log messages.
+		@param plantModel The optional ZonePlantModel to apply commands to.
+		@param zoneIndex The zone (within plantModel) this actuator controls.
+		@param debounceSecs The debounce window, in seconds. If None, the
+		'actuatorDebounceSecs' property is used. 0.0 disables debouncing.
+		@param minIntervalSecs The minimum time between applied commands, in seconds.
+		If None, the 'actuatorMinIntervalSecs' property is used. 0.0 disables it.
+		"""
+		self.name = name
+		self.typeID = typeID
+		self.simpleName = simpleName
+		self.plantModel = plantModel
+		self.zoneIndex = zoneIndex
+		
+		configUtil = ConfigUtil()
+		
+		if debounceSecs is None:
+			debounceSecs = configUtil.getFloat( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.ACTUATOR_DEBOUNCE_SECS_KEY, defaultVal = 0.0)
+		
+		if minIntervalSecs is None:
+			minIntervalSecs = configUtil.getFloat( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.ACTUATOR_MIN_INTERVAL_SECS_KEY, defaultVal = 0.0)
+		
+		self.debounceSecs = max(0.0, debounceSecs)
+		self.minIntervalSecs = max(0.0, minIntervalSecs)
+		
+		self.lastKnownCommand = None
+		self.lastKnownValue = None
+		self.lastReceivedTime = None
+		self.lastAppliedTime = None
+		self.pendingCommand = None
+		self.suppressedCommandCount = 0
+		
+		self.latestActuatorResponse = ActuatorData(typeID = self.typeID, name = self.name)
+		self.latestActuatorResponse.setAsResponse()
+		
+	def applyPendingCommand(self) -> ActuatorData:
+		"""
+		Applies the pending (i.e. the latest debounced or rate limited) command,
+		if there is one and it's due.
 		
+		@return ActuatorData The response, or None if no command was applied.
+		"""
+		pendingDelay = self.getPendingCommandDelay()
+		
+		if pendingDelay is None or pendingDelay > 0.0:
+			return None
+		
+		data = self.pendingCommand
+		self.pendingCommand = None
+		
+		if self._isNoOpCommand(data):
+			return None
+		
+		return self._applyCommand(data)
+	
 	def getLatestActuatorResponse(self) -> ActuatorData:
 		"""
-		This can return the current ActuatorData response instance or a copy.
+		Returns a copy of the latest actuator response.
+		
+		@return ActuatorData
+		"""
+		actuatorResponse = ActuatorData(typeID = self.typeID, name = self.name)
+		actuatorResponse.updateData(self.latestActuatorResponse)
+		
+		return actuatorResponse
+	
+	def getName(self) -> str:
+		return self.name
+	
+	def getPendingCommandDelay(self) -> float:
 		"""
-		pass
+		Returns the time, in seconds, until the pending command can be applied.
+		
+		@return float The delay (0.0 if it's due now), or None if there's no pending command.
+		"""
+		if not self.pendingCommand:
+			return None
+		
+		dueTime = self.lastReceivedTime + self.debounceSecs
+		
+		if self.lastAppliedTime is not None:
+			dueTime = max(dueTime, self.lastAppliedTime + self.minIntervalSecs)
+		
+		return max(0.0, dueTime - monotonic())
 	
 	def getSimpleName(self) -> str:
-		pass
+		return self.simpleName
+	
+	def getSuppressedCommandCount(self) -> int:
+		"""
+		Returns the number of commands suppressed (for any reason) so far.
+		
+		@return int
+		"""
+		return self.suppressedCommandCount
 	
-	def updateActuator(self, data: ActuatorData) -> bool:
+	def getTypeID(self) -> int:
+		return self.typeID
+	
+	def updateActuator(self, data: ActuatorData) -> ActuatorData:
 		"""
-		NOTE: If 'data' is valid, the actuator-specific work can be delegated
-		as follows:
+		Processes the command in 'data', if its type ID matches this actuator
+		and it isn't suppressed (see the class description):
 		 - if command is ON: call self._activateActuator()
 		 - if command is OFF: call self._deactivateActuator()
 		
-		Both of these methods will have a generic implementation (logging only) within
-		this base class, although the sub-class may override if preferable.
+		@param data The ActuatorData command to process.
+		@return ActuatorData The response, or None if 'data' is invalid.
 		"""
-		pass
+		if not data or data.getTypeID() != self.typeID:
+			logging.warning("Invalid actuator data for %s. Ignoring: %s", self.simpleName, str(data))
+			return None
+		
+		receivedTime = monotonic()
+		statusCode = ConfigConst.DEFAULT_STATUS
+		
+		if self._isNoOpCommand(data):
+			statusCode = ConfigConst.ACTUATOR_NO_OP_STATUS
+		elif self.lastReceivedTime is not None and receivedTime - self.lastReceivedTime < self.debounceSecs:
+			statusCode = ConfigConst.ACTUATOR_DEBOUNCED_STATUS
+		elif self.lastAppliedTime is not None and receivedTime - self.lastAppliedTime < self.minIntervalSecs:
+			statusCode = ConfigConst.ACTUATOR_RATE_LIMITED_STATUS
+		
+		self.lastReceivedTime = receivedTime
+		
+		if statusCode == ConfigConst.DEFAULT_STATUS:
+			self.pendingCommand = None
+			
+			return self._applyCommand(data)
+		
+		logging.debug("%s command suppressed (status %d): %s %s", self.simpleName, statusCode, str(data.getCommand()), str(data.getValue()))
+		
+		self.suppressedCommandCount += 1
+		
+		# a no-op makes any pending (i.e. different) command stale
+		if statusCode == ConfigConst.ACTUATOR_NO_OP_STATUS:
+			self.pendingCommand = None
+		else:
+			self.pendingCommand = ActuatorData(typeID = self.typeID, name = self.name)
+			self.pendingCommand.updateData(data)
+		
+		return self._createResponse(data, statusCode)
 		
+	def _applyCommand(self, data: ActuatorData) -> ActuatorData:
+		"""
+		Dispatches the command in 'data' to the actuator, and updates
+		the state and latest response if it succeeds.
+		
+		@param data The ActuatorData command to apply.
+		@return ActuatorData The response.
+		"""
+		curCommand = data.getCommand()
+		curVal = data.getValue()
+		
+		if curCommand == ConfigConst.COMMAND_ON:
+			statusCode = self._activateActuator(val = curVal, stateData = data.getStateData())
+		elif curCommand == ConfigConst.COMMAND_OFF:
+			statusCode = self._deactivateActuator(val = curVal, stateData = data.getStateData())
+		else:
+			logging.warning("%s ignoring unknown command: %s", self.simpleName, str(curCommand))
+			statusCode = -1
+		
+		if statusCode == ConfigConst.DEFAULT_STATUS:
+			self.lastKnownCommand = curCommand
+			self.lastKnownValue = curVal
+			self.lastAppliedTime = monotonic()
+			
+			if self.plantModel:
+				self.plantModel.applyActuatorData(data, self.zoneIndex)
+		
+		actuatorResponse = self._createResponse(data, statusCode)
+		
+		self.latestActuatorResponse.updateData(actuatorResponse)
+		
+		return actuatorResponse
+	
+	def _createResponse(self, data: ActuatorData, statusCode: int) -> ActuatorData:
+		actuatorResponse = ActuatorData(typeID = self.typeID, name = self.name)
+		actuatorResponse.updateData(data)
+		actuatorResponse.setStatusCode(statusCode)
+		actuatorResponse.setAsResponse()
+		
+		return actuatorResponse
+	
+	def _isNoOpCommand(self, data: ActuatorData) -> bool:
+		return data.getCommand() == self.lastKnownCommand and data.getValue() == self.lastKnownValue
+	
 	def _activateActuator(self, val: float = ConfigConst.DEFAULT_VAL, stateData: str = None) -> int:
 		"""
 		Implement basic logging. Actuator-specific functionality should be implemented by sub-class.
@@ -51,7 +245,9 @@ class BaseActuatorSimTask():
 		@param val The actuation activation value to process.
 		@param stateData The string state data to use in processing the command.
 		"""
-		pass
+		logging.info("\n*******\n* O N *\n*******\n%s VALUE -> %s", self.simpleName, str(val))
+		
+		return ConfigConst.DEFAULT_STATUS
 		
 	def _deactivateActuator(self, val: float = ConfigConst.DEFAULT_VAL, stateData: str = None) -> int:
 		"""
@@ -60,5 +256,7 @@ class BaseActuatorSimTask():
 		@param val The actuation activation value to process.
 		@param stateData The string state data to use in processing the command.
 		"""
-		pass
+		logging.info("\n*******\n* OFF *\n*******\n%s VALUE -> %s", self.simpleName, str(val))
+		
+		return ConfigConst.DEFAULT_STATUS
 		
\ No newline at end of file
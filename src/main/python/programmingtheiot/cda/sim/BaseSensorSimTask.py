@@ -1,57 +1,521 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
+import copy
 import logging
 import random
 
+from time import monotonic, time
+
+import numpy as calcLib
+
 import programmingtheiot.common.ConfigConst as ConfigConst
 
+from programmingtheiot.common.ConfigUtil import ConfigUtil
 from programmingtheiot.data.SensorData import SensorData
+from programmingtheiot.data.SensorDataBatch import SensorDataBatch
 
 class BaseSensorSimTask():
 	"""
-	Shell representation of class for student implementation.
+	Base implementation of a simulated sensor task. Each call to
+	generateTelemetry() produces a new reading, either from the
+	supplied data set (wrapping around at the end) or, if no data
+	set is given, from a uniform random value between minVal and
+	maxVal.
+	
+	By default, a new SensorData instance is created for each reading.
+	For high-rate polling, a pool of preallocated SensorData instances
+	can be enabled via 'poolSize' (or the 'sensorDataPoolSize' property
+	in the ConstrainedDevice section). Pooled instances are recycled
+	round-robin, and only their value and time stamp are updated, so
+	no new SensorData objects are created per reading.
 	
+	generateTelemetryBatch() returns the next 'count' readings at once as
+	a columnar SensorDataBatch, sliced directly from the data set.
+	
+	In playback mode (see startPlayback()), readings are no longer taken one
+	data set entry per call. Instead, the wall-clock time elapsed since the
+	playback started, multiplied by the playback speed, is mapped onto the
+	data set's time axis, and the value is interpolated between the two
+	nearest entries. Readings are time stamped with this simulated time, so
+	e.g. a speed of 1000 pushes a week of data through in about 10 minutes.
+	
+	If a ZonePlantModel is given, readings are taken from the model's current
+	state for the given zone instead, which closes the loop with the actuator
+	sim tasks that drive the same model.
+	
+	Instead of a data set, the task can be backed by data chunks - e.g. from
+	SensorDataGenerator.generateSensorDataChunks() with 'continuous' enabled.
+	Only the current chunk is resident, and the next one is only generated
+	once the readings reach the end of the current one, so there's no wait
+	for (or memory held by) the full data set. Readings step through the
+	chunks just as they would through a data set, but playback mode isn't
+	available. If the chunks run out, the randomizer is used from then on.
 	"""
 
 	DEFAULT_MIN_VAL = 0.0
 	DEFAULT_MAX_VAL = 1000.0
 	
-	def __init__(self, name = ConfigConst.NOT_SET, typeID: int = ConfigConst.DEFAULT_SENSOR_TYPE, dataSet = None, minVal: float = DEFAULT_MIN_VAL, maxVal: float = DEFAULT_MAX_VAL):
-		pass
+	def __init__(self, name = ConfigConst.NOT_SET, typeID: int = ConfigConst.DEFAULT_SENSOR_TYPE, dataSet = None, minVal: float = DEFAULT_MIN_VAL, maxVal: float = DEFAULT_MAX_VAL, poolSize: int = None, playbackSpeed: float = None, plantModel = None, zoneIndex: int = 0, dataChunks = None):
+		"""
+		Constructor.
+		
+		@param name The name of the sensor.
+		@param typeID The sensor type ID.
+		@param dataSet The optional SensorDataSet to pull values from.
+		@param minVal The minimum random value (if no data set is given).
+		@param maxVal The maximum random value (if no data set is given).
+		@param poolSize The number of recycled SensorData instances. If None,
+		the 'sensorDataPoolSize' property is used. If 0, a new SensorData is
+		created for each reading.
+		@param playbackSpeed The data set playback speed. If None, the 'simPlaybackSpeed'
+		property is used. If greater than 0, playback starts immediately (see startPlayback()).
+		@param plantModel The optional ZonePlantModel to read values from.
+		@param zoneIndex The zone (within plantModel) this sensor is in.
+		@param dataChunks The optional iterator of (timeEntries, dataEntries) chunks to
+		pull values from, if no data set is given.
+		"""
+		self.name = name
+		self.typeID = typeID
+		self.dataSet = dataSet
+		self.dataSetIndex = 0
+		self.dataChunks = None if dataSet else dataChunks
+		self.chunkTimeEntries = None
+		self.chunkDataEntries = None
+		self.chunkIndex = 0
+		self.chunkStartTime = time()
+		self.useRandomizer = False
+		self.minVal = minVal
+		self.maxVal = maxVal
+		self.latestSensorData = None
+		self.plantModel = plantModel
+		self.zoneIndex = zoneIndex
+		
+		if not self.dataSet and not self.dataChunks and not self.plantModel:
+			self.useRandomizer = True
+		
+		configUtil = ConfigUtil()
+		
+		if poolSize is None:
+			poolSize = configUtil.getInteger( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.SENSOR_DATA_POOL_SIZE_KEY, defaultVal = 0)
+		
+		if playbackSpeed is None:
+			playbackSpeed = configUtil.getFloat( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.SIM_PLAYBACK_SPEED_KEY, defaultVal = 0.0)
+		
+		self.poolSize = max(0, poolSize)
+		self.poolIndex = 0
+		self.sensorDataPool = [SensorData(typeID = self.typeID, name = self.name) for _ in range(self.poolSize)]
+		
+		self.playbackSpeed = 0.0
+		self.playbackTimeAxis = None
+		self.playbackValues = None
+		self.playbackStartTime = 0.0
+		self.playbackStartClock = 0.0
+		self.lastPlaybackTime = None
+		
+		logging.debug("Created sensor sim task %s (type %s) with pool size %d.", self.name, str(self.typeID), self.poolSize)
+		
+		if playbackSpeed > 0.0 and self.dataSet:
+			self.startPlayback(speed = playbackSpeed)
 	
 	def generateTelemetry(self) -> SensorData:
 		"""
-		Implement basic logging and SensorData creation. Sensor-specific functionality
-		should be implemented by sub-class.
+		Generates a new reading and stores it as the latest SensorData.
+		
+		If pooling is enabled, the next pooled SensorData is updated in
+		place and returned; callers that keep the instance beyond the
+		next poolSize readings should use getLatestTelemetry() instead.
+		
+		@return SensorData
+		"""
+		sensorVal = ConfigConst.DEFAULT_VAL
+		
+		if self.plantModel:
+			return self._updateLatestSensorData(self._readPlantModelValue())
+		
+		if self.isPlaybackEnabled():
+			playbackTime = self.getPlaybackTime()
+			sensorVal = float(self._getPlaybackValues(playbackTime))
+			self.lastPlaybackTime = playbackTime
+			
+			return self._updateLatestSensorData(sensorVal, timeStamp = playbackTime)
+		
+		if self.dataChunks:
+			chunkEntries = self._readChunkEntries(count = 1)
+			
+			if chunkEntries:
+				return self._updateLatestSensorData(float(chunkEntries[1][0]))
+		
+		if self.useRandomizer:
+			sensorVal = random.uniform(self.minVal, self.maxVal)
+		else:
+			sensorVal = self.dataSet.getDataEntry(index = self.dataSetIndex)
+			self.dataSetIndex += 1
+			
+			if self.dataSetIndex >= self.dataSet.getDataEntryCount():
+				self.dataSetIndex = 0
+		
+		return self._updateLatestSensorData(sensorVal)
+	
+	def generateTelemetryBatch(self, count: int = 1) -> SensorDataBatch:
+		"""
+		Generates the next 'count' readings as a single SensorDataBatch, and
+		advances the data set index (wrapping around) just as 'count' calls
+		to generateTelemetry() would. The latest SensorData is set to the last
+		reading in the batch.
+		
+		If a data set is used, the batch time stamps are those of the data set
+		entries, and - unless the batch wraps around - the batch values are a
+		view into the data set (no copy is made). If the randomizer is used,
+		all readings are time stamped with the current time.
 		
-		A local reference to SensorData can be contained in this base class.
+		In playback mode, the readings are instead evenly spaced over the
+		simulated time elapsed since the previous reading (up to and including
+		the current playback time), and interpolated from the data set.
+		
+		If data chunks are used, the batch is taken from the current chunk (and
+		as many of the following chunks as needed), time stamped relative to the
+		time this task was created.
+		
+		@param count The number of readings to generate.
+		@return SensorDataBatch
 		"""
-		pass
+		count = max(0, int(count))
+		
+		if self.plantModel:
+			return self._generateReadingBatch(count = count, readValue = self._readPlantModelValue)
+		
+		if self.isPlaybackEnabled():
+			playbackTime = self.getPlaybackTime()
+			startTime = playbackTime if self.lastPlaybackTime is None else self.lastPlaybackTime
+			
+			timeStamps = calcLib.linspace(startTime, playbackTime, count + 1)[1:]
+			values = self._getPlaybackValues(timeStamps)
+			
+			self.lastPlaybackTime = playbackTime
+			
+			batch = SensorDataBatch(typeID = self.typeID, name = self.name, timeStamps = timeStamps, values = values)
+			
+			if count > 0:
+				self._updateLatestSensorData(float(values[-1]), timeStamp = playbackTime)
+			
+			return batch
+		
+		chunkEntries = self._readChunkEntries(count = count) if self.dataChunks else None
+		
+		if chunkEntries:
+			timeEntries, values = chunkEntries
+			timeStamps = timeEntries * 3600.0
+			timeStamps += self.chunkStartTime
+		elif self.useRandomizer:
+			values = calcLib.random.uniform(self.minVal, self.maxVal, count)
+			timeStamps = calcLib.full(count, time())
+		else:
+			entryCount = self.dataSet.getDataEntryCount()
+			startIndex = self.dataSetIndex
+			endIndex = startIndex + count
+			
+			if endIndex <= entryCount:
+				indexes = slice(startIndex, endIndex)
+			else:
+				indexes = calcLib.arange(startIndex, endIndex) % entryCount
+			
+			dataEntries = self.dataSet.getDataEntries()
+			
+			# multi-channel data sets use the first channel, as generateTelemetry() does
+			if dataEntries.ndim > 1:
+				dataEntries = dataEntries[0]
+			
+			values = dataEntries[indexes]
+			timeStamps = self.dataSet.getTimeStamps(indexes)
+			
+			self.dataSetIndex = endIndex % entryCount
+		
+		batch = SensorDataBatch(typeID = self.typeID, name = self.name, timeStamps = timeStamps, values = values)
+		
+		if count > 0:
+			self._updateLatestSensorData(float(values[-1]))
+		
+		return batch
 	
 	def getTelemetryValue(self) -> float:
 		"""
-		If a local reference to SensorData is not None, simply return its current value.
-		If SensorData hasn't yet been created, call self.generateTelemetry(), then return
-		its current value.
+		Returns the value of the latest SensorData, generating
+		a reading first if none exists yet.
+		
+		@return float
 		"""
-		pass
+		if not self.latestSensorData:
+			self.generateTelemetry()
+		
+		return self.latestSensorData.getValue()
 	
-	def getLatestTelemetry(self) -> SensorData:
+	def getLatestTelemetry(self, copy: bool = True) -> SensorData:
 		"""
-		This can return the current SensorData instance or a copy.
+		Returns the latest SensorData, or None if no reading has
+		been generated yet.
+		
+		@param copy If True (the default), a shallow copy is returned, which
+		the caller owns. If False, the internal (possibly pooled) instance is
+		returned, and will be overwritten by a later reading.
+		@return SensorData
 		"""
-		pass
+		if not self.latestSensorData or not copy:
+			return self.latestSensorData
+		
+		return self._copySensorData(self.latestSensorData)
 	
 	def getName(self) -> str:
-		pass
+		return self.name
 	
 	def getTypeID(self) -> int:
-		pass
-	
\ No newline at end of file
+		return self.typeID
+	
+	def getDataSetIndex(self) -> int:
+		return self.dataSetIndex
+	
+	def getPoolSize(self) -> int:
+		return self.poolSize
+	
+	def getPlaybackSpeed(self) -> float:
+		"""
+		Returns the playback speed, or 0.0 if playback isn't enabled.
+		
+		@return float
+		"""
+		return self.playbackSpeed
+	
+	def getPlaybackTime(self) -> float:
+		"""
+		Returns the current simulated time (in seconds since Epoch): the
+		playback start time, plus the wall-clock time elapsed since then
+		multiplied by the playback speed.
+		
+		@return float
+		"""
+		return self.playbackStartTime + (monotonic() - self.playbackStartClock) * self.playbackSpeed
+	
+	def isDataSetSampled(self) -> bool:
+		"""
+		Returns True if each reading is simply the next data set entry - i.e.
+		there's a data set, and neither the randomizer, a plant model nor
+		playback is used. Callers (e.g. SensorTickSampler) may then read the
+		data set directly, as long as they keep the data set index in sync.
+		
+		@return bool
+		"""
+		return self.dataSet is not None and not self.useRandomizer and not self.plantModel and not self.isPlaybackEnabled()
+	
+	def isChunked(self) -> bool:
+		"""
+		Returns True if readings are pulled from data chunks (see the class
+		description), rather than from a data set.
+		
+		@return bool
+		"""
+		return self.dataChunks is not None
+	
+	def isPlaybackEnabled(self) -> bool:
+		return self.playbackSpeed > 0.0
+	
+	def setDataSetIndex(self, index: int = 0):
+		"""
+		Sets the index of the next data set entry to read, wrapping around
+		if 'index' is past the end of the data set.
+		
+		@param index The data set index.
+		"""
+		if self.dataSet:
+			index = index % self.dataSet.getDataEntryCount()
+		
+		self.dataSetIndex = max(0, int(index))
+	
+	def startPlayback(self, speed: float = 1.0, startTime: float = None) -> bool:
+		"""
+		Enables (or restarts) playback mode. The data set must contain at least
+		two entries, and is played back in a loop, as with index stepping.
+		
+		@param speed The playback speed (e.g. 1.0 for real time, 10.0, 1000.0).
+		@param startTime The simulated time (in seconds since Epoch) to start at. If
+		None (the default), the current time is used, which aligns playback with the
+		data set's own time stamps (i.e. at a speed of 1.0, the entry for 'now' is
+		played back now).
+		@return bool True if playback was enabled; False otherwise.
+		"""
+		if speed <= 0.0 or not self.dataSet or self.dataSet.getDataEntryCount() < 2:
+			logging.warning("Can't enable playback for %s with speed %s and no (or a single entry) data set.", self.name, str(speed))
+			return False
+		
+		dataEntries = self.dataSet.getDataEntries()
+		
+		# multi-channel data sets use the first channel, as generateTelemetry() does
+		if dataEntries.ndim > 1:
+			dataEntries = dataEntries[0]
+		
+		self.playbackTimeAxis = self.dataSet.getTimeStamps()
+		self.playbackValues = dataEntries
+		self.playbackSpeed = float(speed)
+		self.playbackStartTime = time() if startTime is None else float(startTime)
+		self.playbackStartClock = monotonic()
+		self.lastPlaybackTime = None
+		
+		logging.info("Started %s playback at %sx.", self.name, str(self.playbackSpeed))
+		
+		return True
+	
+	def stopPlayback(self):
+		"""
+		Disables playback mode. Subsequent readings step through the data set
+		one entry at a time again.
+		"""
+		self.playbackSpeed = 0.0
+		self.playbackTimeAxis = None
+		self.playbackValues = None
+		self.lastPlaybackTime = None
+	
+	def _getPlaybackValues(self, playbackTimes):
+		"""
+		Maps the simulated time(s) onto the data set's time axis - wrapping
+		around at the end - and linearly interpolates the values between the
+		two nearest entries.
+		
+		@param playbackTimes A time, or an array of times, in seconds since Epoch.
+		@return The interpolated value(s), with the same shape as 'playbackTimes'.
+		"""
+		timeAxis = self.playbackTimeAxis
+		firstTime = timeAxis[0]
+		
+		playbackTimes = firstTime + (calcLib.asarray(playbackTimes) - firstTime) % (timeAxis[-1] - firstTime)
+		
+		upperIndexes = calcLib.clip(calcLib.searchsorted(timeAxis, playbackTimes, side = 'right'), 1, timeAxis.size - 1)
+		lowerIndexes = upperIndexes - 1
+		
+		lowerTimes = timeAxis[lowerIndexes]
+		lowerValues = self.playbackValues[lowerIndexes]
+		fractions = (playbackTimes - lowerTimes) / (timeAxis[upperIndexes] - lowerTimes)
+		
+		return lowerValues + fractions * (self.playbackValues[upperIndexes] - lowerValues)
+	
+	def _generateReadingBatch(self, count: int = 1, readValue = None) -> SensorDataBatch:
+		"""
+		Creates a SensorDataBatch by calling 'readValue' 'count' times, time
+		stamping each reading when it's taken. This is intended for sub-classes
+		that read from a device (e.g. the emulated sensor tasks), which can't
+		slice readings from a data set.
+		
+		@param count The number of readings to take.
+		@param readValue A function that returns the current sensor value.
+		@return SensorDataBatch
+		"""
+		count = max(0, int(count))
+		
+		timeStamps = calcLib.empty(count)
+		values = calcLib.empty(count)
+		
+		for i in range(count):
+			values[i] = readValue()
+			timeStamps[i] = time()
+		
+		batch = SensorDataBatch(typeID = self.typeID, name = self.name, timeStamps = timeStamps, values = values)
+		
+		if count > 0:
+			self._updateLatestSensorData(float(values[-1]))
+		
+		return batch
+	
+	def _readChunkEntries(self, count: int = 1) -> tuple:
+		"""
+		Returns the next 'count' time and data entries from the data chunks,
+		pulling the next chunk(s) as the current one is used up. Unless the
+		entries span more than one chunk, they're views into the current chunk.
+		
+		If the chunks run out, they're released and the randomizer is enabled.
+		
+		@param count The number of entries to read.
+		@return tuple (timeEntries, dataEntries), or None if the chunks ran out.
+		"""
+		timeParts = []
+		dataParts = []
+		
+		while count > 0:
+			if self.chunkDataEntries is None or self.chunkIndex >= self.chunkDataEntries.size:
+				try:
+					self.chunkTimeEntries, self.chunkDataEntries = next(self.dataChunks)
+					self.chunkIndex = 0
+				except StopIteration:
+					logging.warning("Data chunks for %s ran out. Using randomizer.", self.name)
+					
+					self.dataChunks = None
+					self.chunkTimeEntries = None
+					self.chunkDataEntries = None
+					self.useRandomizer = True
+					
+					return None
+			
+			endIndex = min(self.chunkIndex + count, self.chunkDataEntries.size)
+			
+			timeParts.append(self.chunkTimeEntries[self.chunkIndex:endIndex])
+			dataParts.append(self.chunkDataEntries[self.chunkIndex:endIndex])
+			
+			count -= endIndex - self.chunkIndex
+			self.chunkIndex = endIndex
+		
+		if len(dataParts) == 0:
+			return (calcLib.empty(0), calcLib.empty(0))
+		
+		if len(dataParts) == 1:
+			return (timeParts[0], dataParts[0])
+		
+		return (calcLib.concatenate(timeParts), calcLib.concatenate(dataParts))
+	
+	def _readPlantModelValue(self) -> float:
+		sensorVal = self.plantModel.getSensorValue(typeID = self.typeID, zoneIndex = self.zoneIndex)
+		
+		if sensorVal is None:
+			logging.warning("Zone plant model doesn't provide %s values. Using default.", self.name)
+			return ConfigConst.DEFAULT_VAL
+		
+		return sensorVal
+	
+	def _updateLatestSensorData(self, sensorVal: float, timeStamp: float = None) -> SensorData:
+		"""
+		Stores 'sensorVal' in the next pooled SensorData (or a new instance,
+		if pooling is disabled), and makes it the latest SensorData.
+		
+		@param sensorVal The sensor value.
+		@param timeStamp The optional time stamp (in seconds since Epoch). If
+		None, the current time is used.
+		@return SensorData
+		"""
+		# the value is set directly (not via setValue()), so the time stamp is only formatted once
+		if self.poolSize > 0:
+			sensorData = self.sensorDataPool[self.poolIndex]
+			self.poolIndex = (self.poolIndex + 1) % self.poolSize
+			
+			sensorData.value = sensorVal
+			sensorData.updateTimeStamp(timeStamp)
+		else:
+			# a new instance is already time stamped with the current time
+			sensorData = SensorData(typeID = self.typeID, name = self.name)
+			sensorData.value = sensorVal
+			
+			if timeStamp is not None:
+				sensorData.updateTimeStamp(timeStamp)
+		
+		self.latestSensorData = sensorData
+		
+		return self.latestSensorData
+	
+	def _copySensorData(self, sensorData: SensorData) -> SensorData:
+		# a shallow copy is sufficient, since all SensorData fields are
+		# immutable scalars, and skips the config lookup in __init__
+		return copy.copy(sensorData)
+	
@@ -7,6 +7,8 @@
 # Copyright (c) 2020 by Andrew D. King
 # 
 
+import programmingtheiot.common.ConfigConst as ConfigConst
+
 from programmingtheiot.data.ActuatorData import ActuatorData
 from programmingtheiot.cda.sim.BaseActuatorSimTask import BaseActuatorSimTask
 
@@ -20,6 +22,14 @@ class HumidifierActuatorSimTask(BaseActuatorSimTask):
 	
 	"""
 
-	def __init__(self):
-		pass
+	def __init__(self, plantModel = None, zoneIndex: int = 0, debounceSecs: float = None, minIntervalSecs: float = None):
+		super( \
+			HumidifierActuatorSimTask, self).__init__( \
+				name = ConfigConst.HUMIDIFIER_ACTUATOR_NAME, \
+				typeID = ConfigConst.HUMIDIFIER_ACTUATOR_TYPE, \
+				simpleName = "HUMIDIFIER", \
+				plantModel = plantModel, \
+				zoneIndex = zoneIndex, \
+				debounceSecs = debounceSecs, \
+				minIntervalSecs = minIntervalSecs)
 		
\ No newline at end of file
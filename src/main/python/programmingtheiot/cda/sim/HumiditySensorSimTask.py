@@ -1,14 +1,16 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
 import logging
 
+import programmingtheiot.common.ConfigConst as ConfigConst
+
 from programmingtheiot.cda.sim.BaseSensorSimTask import BaseSensorSimTask
 from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
 
@@ -16,10 +18,23 @@ from programmingtheiot.data.SensorData import SensorData
 
 class HumiditySensorSimTask(BaseSensorSimTask):
 	"""
-	Shell representation of class for student implementation.
+	Simulated humidity sensor. See BaseSensorSimTask for where the readings
+	come from; without a data set (or data chunks) or a plant model, they're
+	random values within the normal environmental humidity range.
 	
 	"""
 
-	def __init__(self):
-		pass
+	def __init__(self, dataSet = None, poolSize: int = None, playbackSpeed: float = None, plantModel = None, zoneIndex: int = 0, dataChunks = None):
+		super( \
+			HumiditySensorSimTask, self).__init__( \
+				name = ConfigConst.HUMIDITY_SENSOR_NAME, \
+				typeID = ConfigConst.HUMIDITY_SENSOR_TYPE, \
+				dataSet = dataSet, \
+				minVal = SensorDataGenerator.LOW_NORMAL_ENV_HUMIDITY, \
+				maxVal = SensorDataGenerator.HI_NORMAL_ENV_HUMIDITY, \
+				poolSize = poolSize, \
+				playbackSpeed = playbackSpeed, \
+				plantModel = plantModel, \
+				zoneIndex = zoneIndex, \
+				dataChunks = dataChunks)
 	
\ No newline at end of file
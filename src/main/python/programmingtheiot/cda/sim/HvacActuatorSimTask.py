@@ -1,24 +1,35 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
 import logging
 import random
 
+import programmingtheiot.common.ConfigConst as ConfigConst
+
 from programmingtheiot.data.ActuatorData import ActuatorData
 from programmingtheiot.cda.sim.BaseActuatorSimTask import BaseActuatorSimTask
 
 class HvacActuatorSimTask(BaseActuatorSimTask):
 	"""
-	Shell representation of class for student implementation.
+	Simulated HVAC actuator. The ActuatorData value of an ON command
+	is the temperature setpoint.
 	
 	"""
 
-	def __init__(self):
-		pass
+	def __init__(self, plantModel = None, zoneIndex: int = 0, debounceSecs: float = None, minIntervalSecs: float = None):
+		super( \
+			HvacActuatorSimTask, self).__init__( \
+				name = ConfigConst.HVAC_ACTUATOR_NAME, \
+				typeID = ConfigConst.HVAC_ACTUATOR_TYPE, \
+				simpleName = "HVAC", \
+				plantModel = plantModel, \
+				zoneIndex = zoneIndex, \
+				debounceSecs = debounceSecs, \
+				minIntervalSecs = minIntervalSecs)
 		
\ No newline at end of file
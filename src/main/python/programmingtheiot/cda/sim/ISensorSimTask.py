@@ -8,6 +8,7 @@
 # 
 
 from programmingtheiot.data.SensorData import SensorData
+from programmingtheiot.data.SensorDataBatch import SensorDataBatch
 
 class ISensorSimTask():
 	"""
@@ -31,6 +32,20 @@ class ISensorSimTask():
 		"""
 		pass
 	
+	def generateTelemetryBatch(self, count: int = 1) -> SensorDataBatch:
+		"""
+		Generates the next 'count' readings as a single SensorDataBatch,
+		containing a time stamp array and a value array along with the
+		shared metadata (name, type ID, etc.). If self.dataSet is valid,
+		the entries starting at self.dataSetIndex will be used (wrapping
+		around as generateTelemetry() does), and self.dataSetIndex will
+		be advanced by 'count'.
+		
+		@param count The number of readings to generate.
+		@return The SensorDataBatch instance.
+		"""
+		pass
+	
 	def getLatestTelemetry(self) -> SensorData:
 		"""
 		Returns a newly created SensorData instance as a copy
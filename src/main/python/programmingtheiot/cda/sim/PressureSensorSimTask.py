@@ -1,14 +1,16 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
 import logging
 
+import programmingtheiot.common.ConfigConst as ConfigConst
+
 from programmingtheiot.cda.sim.BaseSensorSimTask import BaseSensorSimTask
 from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
 
@@ -16,10 +18,21 @@ from programmingtheiot.data.SensorData import SensorData
 
 class PressureSensorSimTask(BaseSensorSimTask):
 	"""
-	Shell representation of class for student implementation.
+	Simulated pressure sensor. See BaseSensorSimTask for where the readings
+	come from; without a data set (or data chunks), they're random values
+	within the normal environmental pressure range.
 	
 	"""
 
-	def __init__(self):
-		pass
+	def __init__(self, dataSet = None, poolSize: int = None, playbackSpeed: float = None, dataChunks = None):
+		super( \
+			PressureSensorSimTask, self).__init__( \
+				name = ConfigConst.PRESSURE_SENSOR_NAME, \
+				typeID = ConfigConst.PRESSURE_SENSOR_TYPE, \
+				dataSet = dataSet, \
+				minVal = SensorDataGenerator.LOW_NORMAL_ENV_PRESSURE, \
+				maxVal = SensorDataGenerator.HI_NORMAL_ENV_PRESSURE, \
+				poolSize = poolSize, \
+				playbackSpeed = playbackSpeed, \
+				dataChunks = dataChunks)
 	
\ No newline at end of file
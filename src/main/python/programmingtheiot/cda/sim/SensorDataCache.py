@@ -0,0 +1,273 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import hashlib
+import logging
+import os
+import tempfile
+import numpy as calcLib
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.common.ConfigUtil import ConfigUtil
+
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataSet
+
+class SensorDataCache():
+	"""
+	Content-addressed, on-disk cache for SensorDataGenerator output.
+	
+	Each generated data set is stored as a single .npy file (one row of time
+	entries followed by one row of data entries), named by the SHA-256 hash of
+	the parameters that produced it. Cached files are memory-mapped on load,
+	so a warm start only reads the pages that are actually used.
+	
+	The total size of the cache directory is capped; when it is exceeded, the
+	least recently used files (by modification time, which is updated on each
+	load) are removed first.
+	"""
+	
+	DEFAULT_MAX_CACHE_SIZE_MB = 256
+	CACHE_FILE_EXT = '.npy'
+	CACHE_KEY_VERSION = 1
+	
+	def __init__(self, cachePath: str = None, maxCacheSizeMB: float = None):
+		"""
+		Constructor.
+		
+		@param cachePath The directory to store the cache files in. If None, the
+		'simDataCachePath' property is used; if that isn't set, a 'sim-cache'
+		directory within 'testCdaDataPath' is used.
+		@param maxCacheSizeMB The maximum total size of the cache files, in MB.
+		If None, the 'simDataCacheMaxSizeMB' property is used.
+		"""
+		configUtil = ConfigUtil()
+		
+		if not cachePath:
+			cachePath = configUtil.getProperty(ConfigConst.CONSTRAINED_DEVICE, ConfigConst.SIM_DATA_CACHE_PATH_KEY)
+		
+		if not cachePath:
+			dataPath = configUtil.getProperty(ConfigConst.CONSTRAINED_DEVICE, ConfigConst.TEST_CDA_DATA_PATH_KEY, defaultVal = '/tmp/cda-data')
+			cachePath = os.path.join(dataPath, 'sim-cache')
+		
+		if maxCacheSizeMB is None:
+			maxCacheSizeMB = configUtil.getFloat( \
+				ConfigConst.CONSTRAINED_DEVICE, ConfigConst.SIM_DATA_CACHE_MAX_SIZE_KEY, defaultVal = self.DEFAULT_MAX_CACHE_SIZE_MB)
+		
+		self.cachePath = cachePath
+		self.maxCacheSizeBytes = int(max(0.0, maxCacheSizeMB) * 1024 * 1024)
+		
+		os.makedirs(self.cachePath, exist_ok = True)
+		
+		logging.info("Sensor data cache at %s (max size: %s bytes)", self.cachePath, self.maxCacheSizeBytes)
+	
+	def generateDailySensorDataSet(self, dataGenerator: SensorDataGenerator = None, curveType: int = SensorDataGenerator.FULL_WAVE, noiseLevel: int = SensorDataGenerator.DEFAULT_NOISE, minValue: float = SensorDataGenerator.DEFAULT_MIN_VALUE, maxValue: float = SensorDataGenerator.DEFAULT_MAX_VALUE, startHour: int = SensorDataGenerator.MIN_HOURS, endHour: int = SensorDataGenerator.MAX_HOURS, useSeconds = False, streamID: int = None, noiseColor: int = SensorDataGenerator.WHITE_NOISE) -> SensorDataSet:
+		"""
+		Returns the same data set as dataGenerator.generateDailySensorDataSet(),
+		loading it from the cache if it's present, and generating (and storing)
+		it otherwise.
+		
+		Noisy data is only reproducible - and therefore only cached - if the
+		generator was created with an explicit seed.
+		
+		@param dataGenerator The SensorDataGenerator to use. If None, a new (unseeded)
+		generator is created.
+		@param curveType The type of curve to implement.
+		@param noiseLevel Any positive integer between 0 (no noise) and 100 (max noise).
+		@param minValue The minimum value, or floor, of the data.
+		@param maxValue The maximum value, or ceiling, of the data.
+		@param startHour The beginning hour.
+		@param endHour The ending hour.
+		@param useSeconds If True, one data pair is generated for every second.
+		@param streamID The random stream to use for the noise. If None, the next
+		stream of the generator is used.
+		@param noiseColor WHITE_NOISE (default), PINK_NOISE or BROWN_NOISE.
+		@return SensorDataSet
+		"""
+		if not dataGenerator:
+			dataGenerator = SensorDataGenerator()
+		
+		if streamID is None:
+			streamID = dataGenerator._getNextStreamID()
+		
+		generatorArgs = { \
+			'curveType': curveType, 'noiseLevel': noiseLevel, 'minValue': minValue, 'maxValue': maxValue, \
+			'startHour': startHour, 'endHour': endHour, 'useSeconds': useSeconds, 'streamID': streamID, \
+			'noiseColor': noiseColor }
+		
+		if (noiseLevel != SensorDataGenerator.NO_NOISE or curveType == SensorDataGenerator.DRIFT_CURVE) and not dataGenerator.isSeeded():
+			logging.debug("Generator isn't seeded. Not caching noisy sensor data.")
+			
+			return dataGenerator.generateDailySensorDataSet(**generatorArgs)
+		
+		cacheFile = os.path.join(self.cachePath, self._getCacheKey(dataGenerator = dataGenerator, generatorArgs = generatorArgs) + self.CACHE_FILE_EXT)
+		cachedEntries = self._loadEntries(cacheFile)
+		
+		if cachedEntries is not None:
+			logging.info("Loaded cached sensor data: %s", cacheFile)
+			
+			return SensorDataSet( \
+				epochOffsetSeconds = dataGenerator.epochOffsetSeconds, useCurrentTime = dataGenerator.useCurrentTime, \
+				timeEntries = cachedEntries[0], dataEntries = cachedEntries[1])
+		
+		dataSet = dataGenerator.generateDailySensorDataSet(**generatorArgs)
+		
+		self._storeEntries(cacheFile, calcLib.stack((dataSet.getTimeEntries(), dataSet.getDataEntries())))
+		self._evictEntries()
+		
+		return dataSet
+	
+	def clearCache(self):
+		"""
+		Removes all cache files.
+		"""
+		for cacheFile, fileSize, modifiedTime in self._listEntries():
+			self._removeEntry(cacheFile)
+	
+	def getCachePath(self) -> str:
+		"""
+		Returns the cache directory.
+		
+		@return str
+		"""
+		return self.cachePath
+	
+	def getCacheSize(self) -> int:
+		"""
+		Returns the total size of the cache files, in bytes.
+		
+		@return int
+		"""
+		return sum(fileSize for cacheFile, fileSize, modifiedTime in self._listEntries())
+	
+	def _getCacheKey(self, dataGenerator: SensorDataGenerator = None, generatorArgs: dict = None) -> str:
+		"""
+		Returns the SHA-256 hex digest of everything that determines the
+		generated data.
+		
+		@param dataGenerator The SensorDataGenerator.
+		@param generatorArgs The generateDailySensorDataSet() arguments.
+		@return str
+		"""
+		keyItems = [('version', self.CACHE_KEY_VERSION), ('alignGeneratorToDay', dataGenerator.alignGeneratorToDay)]
+		
+		# the seed only matters if there's noise (or a random-walk drift) to generate
+		if generatorArgs['noiseLevel'] != SensorDataGenerator.NO_NOISE or generatorArgs['curveType'] == SensorDataGenerator.DRIFT_CURVE:
+			keyItems.append(('seed', dataGenerator.getSeed()))
+		else:
+			generatorArgs = dict(generatorArgs, streamID = None)
+		
+		keyItems.extend(sorted(generatorArgs.items()))
+		
+		return hashlib.sha256(repr(keyItems).encode('utf-8')).hexdigest()
+	
+	def _loadEntries(self, cacheFile: str = None):
+		"""
+		Memory-maps the given cache file (read-only), and marks it as recently used.
+		
+		@param cacheFile The cache file name.
+		@return memmap The (2, entries) array, or None if the file isn't cached or is invalid.
+		"""
+		if not os.path.isfile(cacheFile):
+			return None
+		
+		try:
+			cachedEntries = calcLib.load(cacheFile, mmap_mode = 'r')
+			
+			if cachedEntries.ndim != 2 or cachedEntries.shape[0] != 2:
+				raise ValueError("unexpected shape " + str(cachedEntries.shape))
+			
+			os.utime(cacheFile)
+			
+			return cachedEntries
+		except Exception as e:
+			logging.warning("Failed to load cached sensor data %s. Removing it: %s", cacheFile, e)
+			self._removeEntry(cacheFile)
+		
+		return None
+	
+	def _storeEntries(self, cacheFile: str = None, entries = None):
+		"""
+		Writes the given entries to the cache file. The file is written under a
+		unique temporary name and then renamed, so a concurrent reader never
+		sees a partially written file, and concurrent writers (e.g. threads
+		generating the same data set) never share a temporary file.
+		
+		@param cacheFile The cache file name.
+		@param entries The (2, entries) array to store.
+		"""
+		if entries.nbytes > self.maxCacheSizeBytes:
+			logging.debug("Sensor data too large to cache: %s bytes", entries.nbytes)
+			return
+		
+		tempFile = None
+		
+		try:
+			with tempfile.NamedTemporaryFile( \
+				dir = self.cachePath, prefix = os.path.basename(cacheFile) + '.', suffix = '.tmp', delete = False) as fileRef:
+				
+				tempFile = fileRef.name
+				calcLib.save(fileRef, entries)
+			
+			os.replace(tempFile, cacheFile)
+			
+			logging.info("Stored sensor data in cache: %s", cacheFile)
+		except OSError as e:
+			logging.warning("Failed to store sensor data in cache %s: %s", cacheFile, e)
+			
+			if tempFile:
+				self._removeEntry(tempFile)
+	
+	def _evictEntries(self):
+		"""
+		Removes the least recently used cache files until the total size is
+		within the configured limit.
+		"""
+		cacheEntries = self._listEntries()
+		cacheSize = sum(fileSize for cacheFile, fileSize, modifiedTime in cacheEntries)
+		
+		for cacheFile, fileSize, modifiedTime in sorted(cacheEntries, key = lambda entry: entry[2]):
+			if cacheSize <= self.maxCacheSizeBytes:
+				break
+			
+			logging.info("Evicting cached sensor data: %s", cacheFile)
+			
+			self._removeEntry(cacheFile)
+			cacheSize -= fileSize
+	
+	def _listEntries(self) -> list:
+		"""
+		Returns a (file name, size, modified time) tuple for each cache file.
+		
+		@return list
+		"""
+		cacheEntries = []
+		
+		with os.scandir(self.cachePath) as dirEntries:
+			for dirEntry in dirEntries:
+				if dirEntry.is_file() and dirEntry.name.endswith(self.CACHE_FILE_EXT):
+					fileStat = dirEntry.stat()
+					cacheEntries.append((dirEntry.path, fileStat.st_size, fileStat.st_mtime_ns))
+		
+		return cacheEntries
+	
+	def _removeEntry(self, cacheFile: str = None):
+		"""
+		Removes the given file, ignoring files that are already gone.
+		
+		@param cacheFile The file name.
+		"""
+		try:
+			os.remove(cacheFile)
+		except FileNotFoundError:
+			pass
+		except OSError as e:
+			logging.warning("Failed to remove cached sensor data %s: %s", cacheFile, e)
+		
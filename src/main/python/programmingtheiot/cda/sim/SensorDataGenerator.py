@@ -10,7 +10,9 @@
 import logging
 import math
 import numpy as calcLib
-import matplotlib.pyplot as plotLib
+
+from programmingtheiot.cda.sim.SignalSynthesizer import ColoredNoiseStream
+from programmingtheiot.cda.sim.SignalSynthesizer import SignalSynthesizer
 
 class SensorDataGenerator(object):
 	"""
@@ -51,23 +53,44 @@ class SensorDataGenerator(object):
 	MAX_MONITOR_PRESSURE = 50000.0
 	
 	DEFAULT_DATA_POINTS = 60 * MAX_HOURS
+	DEFAULT_CHUNK_SIZE = 3600
+	
+	DEFAULT_FLEET_SIZE = 100
+	DEFAULT_PHASE_JITTER = 1.0
+	DEFAULT_RANGE_JITTER = 0.05
+	
+	# random stream purposes (see _getRandomGenerator())
+	NOISE_STREAM = 0
+	JITTER_STREAM = 1
+	CURVE_STREAM = 2
 	
 	NO_NOISE = 0
 	MIN_NOISE = 1
 	MAX_NOISE = 100
 	DEFAULT_NOISE = 10
 	
+	WHITE_NOISE = SignalSynthesizer.WHITE_NOISE
+	PINK_NOISE = SignalSynthesizer.PINK_NOISE
+	BROWN_NOISE = SignalSynthesizer.BROWN_NOISE
+	
 	FULL_WAVE = 0
 	BELL_CURVE = 5
 	INVERSE_CURVE = -5
 	CURVE_UP = 10
 	CURVE_DOWN = -10
 	
+	# composite curves, generated by SignalSynthesizer (not sine wave denominators)
+	DAILY_WEEKLY_CURVE = 1000
+	TREND_CURVE = 1001
+	DRIFT_CURVE = 1002
+	
+	SYNTHESIZED_CURVES = (DAILY_WEEKLY_CURVE, TREND_CURVE, DRIFT_CURVE)
+	
 	DEFAULT_TEMP_CURVE = FULL_WAVE
 	DEFAULT_HUMIDITY_CURVE = BELL_CURVE
 	DEFAULT_PRESSURE_CURVE = INVERSE_CURVE
 	
-	def __init__(self, epochOffsetSeconds: float = 0.0, useCurrentTime: bool = True, alignGeneratorToDay: bool = True):
+	def __init__(self, epochOffsetSeconds: float = 0.0, useCurrentTime: bool = True, alignGeneratorToDay: bool = True, seed: int = None):
 		"""
 		Constructor.
 		
@@ -81,13 +104,37 @@ class SensorDataGenerator(object):
 		generator logic will be aligned to create a single sine wave for
 		a day - meaning the 24 hr start and end values will be approximately
 		the same.
+		@param seed The optional seed for all random values (noise and jitter). If None,
+		a random seed is used, which can be retrieved via getSeed() to reproduce the data.
 		"""
 		self.epochOffsetSeconds = epochOffsetSeconds
 		self.useCurrentTime = useCurrentTime
 		self.alignGeneratorToDay = alignGeneratorToDay
 		self.dayDenominator = (1 - (calcLib.pi / 10)) + calcLib.pi
 		
-	def generateDailyEnvironmentHumidityDataSet(self, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_ENV_HUMIDITY, maxValue: float = MAX_ENV_HUMIDITY, useSeconds: bool = False):
+		# each call gets its own child stream of this seed - see _getRandomGenerator()
+		self.seed = calcLib.random.SeedSequence(seed).entropy
+		self.seeded = seed is not None
+		self.nextStreamID = 0
+		
+	def getSeed(self) -> int:
+		"""
+		Returns the seed used by this generator.
+		
+		@return int
+		"""
+		return self.seed
+		
+	def isSeeded(self) -> bool:
+		"""
+		Returns True if this generator was created with an explicit seed, meaning
+		its output is reproducible across runs.
+		
+		@return bool
+		"""
+		return self.seeded
+		
+	def generateDailyEnvironmentHumidityDataSet(self, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_ENV_HUMIDITY, maxValue: float = MAX_ENV_HUMIDITY, useSeconds: bool = False, streamID: int = None):
 		"""
 		Generates a time-series data set for indoor temperature simulation over a 24-hour period.
 		
@@ -102,15 +149,17 @@ class SensorDataGenerator(object):
 		@param: useSeconds Defaults to False. If True, the data set will be generated using
 		second-level granularity; that is, one data pair for every second between
 		startHour and endHour.
+		@param: streamID The random stream to use for the noise (e.g. the sensor type ID).
+		If None, the next stream of this generator is used.
 		@return SensorDataSet The sensor data set containing both time entries and data
 		values for those time entries.
 		"""
 		if maxValue < self.MIN_ENV_HUMIDITY or maxValue > self.MAX_ENV_HUMIDITY: maxValue = self.MAX_ENV_HUMIDITY
 		if minValue < self.MIN_ENV_HUMIDITY or minValue >= maxValue: minValue = maxValue - 1
 		
-		return self.generateDailySensorDataSet(curveType = self.DEFAULT_HUMIDITY_CURVE, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, startHour = 0, endHour = 24, useSeconds = useSeconds)
+		return self.generateDailySensorDataSet(curveType = self.DEFAULT_HUMIDITY_CURVE, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, startHour = 0, endHour = 24, useSeconds = useSeconds, streamID = streamID)
 		
-	def generateDailyEnvironmentPressureDataSet(self, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_ENV_PRESSURE, maxValue: float = MAX_ENV_PRESSURE, useSeconds: bool = False):
+	def generateDailyEnvironmentPressureDataSet(self, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_ENV_PRESSURE, maxValue: float = MAX_ENV_PRESSURE, useSeconds: bool = False, streamID: int = None):
 		"""
 		Generates a time-series data set for indoor temperature simulation over a 24-hour period.
 		
@@ -125,15 +174,17 @@ class SensorDataGenerator(object):
 		@param: useSeconds Defaults to False. If True, the data set will be generated using
 		second-level granularity; that is, one data pair for every second between
 		startHour and endHour.
+		@param: streamID The random stream to use for the noise (e.g. the sensor type ID).
+		If None, the next stream of this generator is used.
 		@return SensorDataSet The sensor data set containing both time entries and data
 		values for those time entries.
 		"""
 		if maxValue < self.MIN_ENV_PRESSURE or maxValue > self.MAX_ENV_PRESSURE: maxValue = self.MAX_ENV_PRESSURE
 		if minValue < self.MIN_ENV_PRESSURE or minValue >= maxValue: minValue = maxValue - 1
 		
-		return self.generateDailySensorDataSet(curveType = self.DEFAULT_PRESSURE_CURVE, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, startHour = 0, endHour = 24, useSeconds = useSeconds)
+		return self.generateDailySensorDataSet(curveType = self.DEFAULT_PRESSURE_CURVE, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, startHour = 0, endHour = 24, useSeconds = useSeconds, streamID = streamID)
 		
-	def generateDailyIndoorTemperatureDataSet(self, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_INDOOR_TEMP, maxValue: float = MAX_INDOOR_TEMP, useSeconds: bool = False):
+	def generateDailyIndoorTemperatureDataSet(self, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_INDOOR_TEMP, maxValue: float = MAX_INDOOR_TEMP, useSeconds: bool = False, streamID: int = None):
 		"""
 		Generates a time-series data set for indoor temperature simulation over a 24-hour period.
 		
@@ -148,15 +199,17 @@ class SensorDataGenerator(object):
 		@param: useSeconds Defaults to False. If True, the data set will be generated using
 		second-level granularity; that is, one data pair for every second between
 		startHour and endHour.
+		@param: streamID The random stream to use for the noise (e.g. the sensor type ID).
+		If None, the next stream of this generator is used.
 		@return SensorDataSet The sensor data set containing both time entries and data
 		values for those time entries.
 		"""
 		if maxValue < self.MIN_ENV_TEMP or maxValue > self.MAX_ENV_TEMP: maxValue = self.MAX_ENV_TEMP
 		if minValue < self.MIN_ENV_TEMP or minValue >= maxValue: minValue = maxValue - 1
 		
-		return self.generateDailySensorDataSet(curveType = self.DEFAULT_TEMP_CURVE, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, startHour = 0, endHour = 24, useSeconds = useSeconds)
+		return self.generateDailySensorDataSet(curveType = self.DEFAULT_TEMP_CURVE, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, startHour = 0, endHour = 24, useSeconds = useSeconds, streamID = streamID)
 		
-	def generateDailyMonitorTemperatureDataSet(self, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_MONITOR_TEMP, maxValue: float = MAX_MONITOR_TEMP, useSeconds: bool = False):
+	def generateDailyMonitorTemperatureDataSet(self, noiseLevel: int = DEFAULT_NOISE, minValue: float = MIN_MONITOR_TEMP, maxValue: float = MAX_MONITOR_TEMP, useSeconds: bool = False, streamID: int = None):
 		"""
 		Generates a time-series data set for indoor temperature simulation over a 24-hour period.
 		
@@ -171,15 +224,17 @@ class SensorDataGenerator(object):
 		@param: useSeconds Defaults to False. If True, the data set will be generated using
 		second-level granularity; that is, one data pair for every second between
 		startHour and endHour.
+		@param: streamID The random stream to use for the noise (e.g. the sensor type ID).
+		If None, the next stream of this generator is used.
 		@return SensorDataSet The sensor data set containing both time entries and data
 		values for those time entries.
 		"""
 		if maxValue < self.MIN_MONITOR_TEMP or maxValue > self.MAX_MONITOR_TEMP: maxValue = self.MAX_MONITOR_TEMP
 		if minValue < self.MIN_MONITOR_TEMP or minValue >= maxValue: minValue = maxValue - 1
 		
-		return self.generateDailySensorDataSet(curveType = self.DEFAULT_TEMP_CURVE, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, startHour = 0, endHour = 24, useSeconds = useSeconds)
+		return self.generateDailySensorDataSet(curveType = self.DEFAULT_TEMP_CURVE, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, startHour = 0, endHour = 24, useSeconds = useSeconds, streamID = streamID)
 		
-	def generateDailySensorDataSet(self, curveType: int = FULL_WAVE, noiseLevel: int = DEFAULT_NOISE, minValue: float = DEFAULT_MIN_VALUE, maxValue: float = DEFAULT_MAX_VALUE, startHour: int = MIN_HOURS, endHour: int = MAX_HOURS, useSeconds = False):
+	def generateDailySensorDataSet(self, curveType: int = FULL_WAVE, noiseLevel: int = DEFAULT_NOISE, minValue: float = DEFAULT_MIN_VALUE, maxValue: float = DEFAULT_MAX_VALUE, startHour: int = MIN_HOURS, endHour: int = MAX_HOURS, useSeconds = False, streamID: int = None, noiseColor: int = WHITE_NOISE):
 		"""
 		Generates a time-series data set. This call will use the parameters to generate
 		time-series data that includes the ordered time points and their values stored
@@ -190,7 +245,9 @@ class SensorDataGenerator(object):
 		single data pair will be generated.
 		
 		@param curveType The type of curve to implement - FULL_WAVE, CURVE_UP, CURVE_DOWN,
-		BELL_CURVE, INVERSE_CURVE. Defaults to FULL_WAVE.
+		BELL_CURVE, INVERSE_CURVE, or one of the composite curves DAILY_WEEKLY_CURVE
+		(daily and weekly cycles), TREND_CURVE (daily cycle and a linear trend) or
+		DRIFT_CURVE (daily cycle and a random-walk drift). Defaults to FULL_WAVE.
 		@param: noiseLevel Any positive integer between 0 (no noise) and 100 (max noise).
 		Defaults to DEFAULT_NOISE (some noise).
 		@param: minValue The minimum value, or floor, of the data. Defaults to DEFAULT_MIN_VALUE.
@@ -206,76 +263,285 @@ class SensorDataGenerator(object):
 		@param: useSeconds Defaults to False. If True, the data set will be generated using
 		second-level granularity; that is, one data pair for every second between
 		startHour and endHour.
+		@param: streamID The random stream to use for the noise (e.g. the sensor type ID).
+		If None, the next stream of this generator is used.
+		@param: noiseColor The noise spectrum - WHITE_NOISE (default), PINK_NOISE (1/f)
+		or BROWN_NOISE (1/f^2).
 		@return SensorDataSet The sensor data set containing both time entries and data
 		values for those time entries.
 		"""
-		# validate noise level - ensure it's between 1 and 100
-		if noiseLevel < self.NO_NOISE: noiseLevel = self.NO_NOISE
-		if noiseLevel > self.MAX_NOISE: noiseLevel = self.MAX_NOISE
+		if streamID is None: streamID = self._getNextStreamID()
 		
-		# validate min and max values
-		if maxValue < minValue: maxValue = minValue
-		if minValue > maxValue: minValue = maxValue
+		channel = SensorDataChannel(curveType = curveType, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, noiseColor = noiseColor)
 		
 		# validate start and end hours
-		if startHour < self.MIN_HOURS or minValue > self.MAX_HOURS: startHour = self.MIN_HOURS
+		if startHour < self.MIN_HOURS or startHour > self.MAX_HOURS: startHour = self.MIN_HOURS
 		if endHour < 0 or endHour > self.MAX_HOURS: endHour = self.MAX_HOURS
 		
-		# calc total data points to be generated
-		totalDataPoints = (endHour - startHour) * 60
+		timeEntries = self._generateTimeEntries(startHour = startHour, endHour = endHour, useSeconds = useSeconds)
+		dataValues = self._generateChannelValues(timeEntries = timeEntries, channels = [channel], streamID = streamID)
 		
-		if useSeconds: totalDataPoints = totalDataPoints * 60
-		if totalDataPoints == 0: totalDataPoints = 1
+		dataSet = SensorDataSet(epochOffsetSeconds = self.epochOffsetSeconds, useCurrentTime = self.useCurrentTime, timeEntries = timeEntries)
+		dataSet.setDataEntries(dataValues[0])
 		
-		# create evenly spaced number of 'totalDataPoints' between 'startHour' and 'endHour'
-		timeEntries = calcLib.linspace(start = startHour, stop = endHour, num = totalDataPoints)
+		return dataSet
+	
+	def generateMultiChannelSensorDataSet(self, channels: list = None, startHour: int = MIN_HOURS, endHour: int = MAX_HOURS, useSeconds = False, streamID: int = None):
+		"""
+		Generates a multi-channel time-series data set. All channels share a single
+		time axis, and the values for every channel are generated in one batched
+		pass and stored within a single 2-D array of shape (channels, time entries).
 		
-		# generate the distribution data for each point - quick ramp up curve
-		# followed by a more gradual ramp down
-		if self.alignGeneratorToDay:
-			if curveType > 0:
-				denominator = (curveType + self.dayDenominator)
-			elif curveType == 0:
-				denominator = self.dayDenominator
-			else:
-				denominator = abs(curveType) * self.dayDenominator
-				
-			dataValuesClean = calcLib.sin(timeEntries / denominator)
-		else:
-			if curveType > 0:
-				denominator = curveType
-			elif curveType == 0:
-				denominator = 1
-			else:
-				denominator = 1 / abs(curveType)
-				
-			dataValuesClean = calcLib.sin(timeEntries / denominator)
+		This is functionally equivalent to calling generateDailySensorDataSet() once
+		for each channel, but avoids re-creating the time axis and the intermediate
+		sine, re-scale and noise arrays for each curve.
 		
-		# re-scale array with 'minValue' as floor and 'maxValue' as ceiling
-		scaledValuesClean = calcLib.interp(dataValuesClean, (dataValuesClean.min(), dataValuesClean.max()), (minValue, maxValue))
-		dataSet = SensorDataSet(epochOffsetSeconds = self.epochOffsetSeconds, useCurrentTime = self.useCurrentTime, timeEntries = timeEntries)
+		@param channels The list of SensorDataChannel instances describing each channel.
+		If None or empty, a single default channel will be generated.
+		@param: startHour The beginning hour. Must be between MIN_HOURS and MAX_HOURS.
+		If less than MIN_HOURS or greater than MAX_HOURS, will be set to MIN_HOURS.
+		@param: endHour The ending hour. Must be between MIN_HOURS and MAX_HOURS.
+		If less than MIN_HOURS or greater than MAX_HOURS, will be set to MAX_HOURS.
+		@param: useSeconds Defaults to False. If True, the data set will be generated using
+		second-level granularity; that is, one data pair for every second between
+		startHour and endHour.
+		@param: streamID The random stream to use for the noise (e.g. the sensor type ID).
+		If None, the next stream of this generator is used.
+		@return MultiSensorDataSet The multi-channel data set containing the shared time
+		entries and the 2-D array of data values (one row per channel).
+		"""
+		if not channels:
+			channels = [SensorDataChannel()]
+		
+		if streamID is None: streamID = self._getNextStreamID()
+		
+		# validate start and end hours
+		if startHour < self.MIN_HOURS or startHour > self.MAX_HOURS: startHour = self.MIN_HOURS
+		if endHour < 0 or endHour > self.MAX_HOURS: endHour = self.MAX_HOURS
+		
+		timeEntries = self._generateTimeEntries(startHour = startHour, endHour = endHour, useSeconds = useSeconds)
+		dataValues = self._generateChannelValues(timeEntries = timeEntries, channels = channels, streamID = streamID)
+		
+		channelNames = [channel.getName() for channel in channels]
+		
+		return MultiSensorDataSet( \
+			epochOffsetSeconds = self.epochOffsetSeconds, useCurrentTime = self.useCurrentTime, \
+			timeEntries = timeEntries, dataEntries = dataValues, channelNames = channelNames)
 		
-		# check if noise should be added
-		if noiseLevel != self.NO_NOISE:
-			# get the mean value, generate base10 log and calculate noise numerator
-			meanValue = calcLib.mean(scaledValuesClean)
+	def generateFleetSensorDataSet(self, deviceCount: int = DEFAULT_FLEET_SIZE, curveType: int = FULL_WAVE, noiseLevel: int = DEFAULT_NOISE, minValue: float = DEFAULT_MIN_VALUE, maxValue: float = DEFAULT_MAX_VALUE, startHour: int = MIN_HOURS, endHour: int = MAX_HOURS, useSeconds = False, phaseJitter: float = DEFAULT_PHASE_JITTER, rangeJitter: float = DEFAULT_RANGE_JITTER, useSharedMemory: bool = False, sharedMemoryName: str = None, streamID: int = None, workerCount: int = 1, noiseColor: int = WHITE_NOISE):
+		"""
+		Generates one sensor type for a fleet of virtual devices as a single
+		(devices, time entries) array. Each device gets its own phase offset,
+		its own jittered floor and ceiling, and independent noise, all of which
+		are computed for the whole fleet at once.
+		
+		Every device's values depend only on this generator's seed, the stream ID
+		and the device index, so the output is identical regardless of how the
+		devices are partitioned across worker processes.
+		
+		@param deviceCount The number of virtual devices (rows) to generate.
+		@param curveType The type of curve to implement - FULL_WAVE, CURVE_UP, CURVE_DOWN,
+		BELL_CURVE, INVERSE_CURVE. Defaults to FULL_WAVE.
+		@param: noiseLevel Any positive integer between 0 (no noise) and 100 (max noise).
+		@param: minValue The nominal minimum value, or floor, of the data.
+		@param: maxValue The nominal maximum value, or ceiling, of the data.
+		@param: startHour The beginning hour. Must be between MIN_HOURS and MAX_HOURS.
+		@param: endHour The ending hour. Must be between MIN_HOURS and MAX_HOURS.
+		@param: useSeconds Defaults to False. If True, one data pair will be generated
+		for every second between startHour and endHour.
+		@param: phaseJitter The maximum time offset (in hours) applied to each device's curve.
+		Each device is offset by a uniformly distributed value between 0 and phaseJitter.
+		@param: rangeJitter The maximum fraction of (maxValue - minValue) by which each
+		device's floor and ceiling are independently moved up or down.
+		@param: useSharedMemory Defaults to False. If True, the time entries and data
+		entries are written into a multiprocessing.shared_memory block that other
+		processes can attach to (see MultiSensorDataSet.attachSharedMemory()).
+		@param: sharedMemoryName The optional name of the shared memory block to create.
+		If None, a unique name is generated.
+		@param: streamID The random stream to use (e.g. the sensor type ID). If None,
+		the next stream of this generator is used.
+		@param: workerCount Defaults to 1. If greater than 1, the devices are split
+		across this many worker processes, which write directly into shared memory.
+		@param: noiseColor The noise spectrum - WHITE_NOISE (default), PINK_NOISE or BROWN_NOISE.
+		@return MultiSensorDataSet The fleet data set - one row per device.
+		"""
+		if deviceCount < 1: deviceCount = 1
+		if phaseJitter < 0: phaseJitter = 0.0
+		if rangeJitter < 0: rangeJitter = 0.0
+		if workerCount > deviceCount: workerCount = deviceCount
+		if streamID is None: streamID = self._getNextStreamID()
+		
+		channel = SensorDataChannel(curveType = curveType, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, noiseColor = noiseColor)
+		
+		# validate start and end hours
+		if startHour < self.MIN_HOURS or startHour > self.MAX_HOURS: startHour = self.MIN_HOURS
+		if endHour < 0 or endHour > self.MAX_HOURS: endHour = self.MAX_HOURS
+		
+		totalDataPoints = self._getTotalDataPoints(startHour = startHour, endHour = endHour, useSeconds = useSeconds)
+		useWorkers = workerCount > 1
+		
+		fleetArgs = { \
+			'deviceCount': deviceCount, 'curveType': channel.getCurveType(), 'noiseLevel': channel.getNoiseLevel(), \
+			'minValue': channel.getMinValue(), 'maxValue': channel.getMaxValue(), 'startHour': startHour, 'endHour': endHour, \
+			'useSeconds': useSeconds, 'phaseJitter': phaseJitter, 'rangeJitter': rangeJitter, 'streamID': streamID, \
+			'noiseColor': channel.getNoiseColor() }
+		
+		sharedMemory = None
+		
+		if useSharedMemory or useWorkers:
+			# row 0 holds the time entries, rows 1..deviceCount hold the data entries
+			sharedMemory, sharedEntries = MultiSensorDataSet.createSharedMemory( \
+				rowCount = deviceCount + 1, dataEntryCount = totalDataPoints, name = sharedMemoryName)
 			
-			# calc order of magnitude of mean value - this is necessary to ensure
-			# the generated noisyness aligns with the magnitude of the values
-			meanMag = int(math.log10(meanValue))
-			noiseScale = ((noiseLevel / 100) * ((10 ** meanMag) / 10))
-			noisyTemp = calcLib.random.normal(0, noiseScale, len(scaledValuesClean))
+			timeEntries = sharedEntries[0]
+			timeEntries[:] = self._generateTimeEntries(startHour = startHour, endHour = endHour, useSeconds = useSeconds)
+			dataValues = sharedEntries[1:]
 			
-			logging.debug("Noise=%f; Noise Scale=%f; Mean Magnitude=%f" % (noiseLevel, noiseScale, meanMag))
+			del sharedEntries
+		else:
+			timeEntries = self._generateTimeEntries(startHour = startHour, endHour = endHour, useSeconds = useSeconds)
+			dataValues = calcLib.empty((deviceCount, totalDataPoints))
+		
+		if useWorkers:
+			from concurrent.futures import ProcessPoolExecutor
 			
-			# update the data set to add in noise with clean values
-			scaledValuesNoisy = (scaledValuesClean + noisyTemp)
+			generatorArgs = { \
+				'epochOffsetSeconds': self.epochOffsetSeconds, 'useCurrentTime': self.useCurrentTime, \
+				'alignGeneratorToDay': self.alignGeneratorToDay, 'seed': self.seed }
 			
-			dataSet.setDataEntries(scaledValuesNoisy)
+			partitions = [(rows[0], rows[-1] + 1) for rows in calcLib.array_split(calcLib.arange(deviceCount), workerCount)]
+			
+			logging.info("Generating %s devices using %s worker processes.", deviceCount, workerCount)
+			
+			with ProcessPoolExecutor(max_workers = workerCount) as executor:
+				list(executor.map(_generateFleetPartition, \
+					[generatorArgs] * workerCount, [fleetArgs] * workerCount, [sharedMemory.name] * workerCount, partitions))
 		else:
-			dataSet.setDataEntries(scaledValuesClean)
+			self._generateFleetRows(timeEntries = timeEntries, dataValues = dataValues, deviceStart = 0, deviceEnd = deviceCount, fleetArgs = fleetArgs)
 		
-		return dataSet
+		if useWorkers and not useSharedMemory:
+			# the caller wants private memory - copy out and release the block
+			timeEntries = timeEntries.copy()
+			dataValues = dataValues.copy()
+			
+			sharedMemory.close()
+			sharedMemory.unlink()
+			sharedMemory = None
+		
+		return MultiSensorDataSet( \
+			epochOffsetSeconds = self.epochOffsetSeconds, useCurrentTime = self.useCurrentTime, \
+			timeEntries = timeEntries, dataEntries = dataValues, sharedMemory = sharedMemory)
+
+	def generateSensorDataChunks(self, curveType: int = FULL_WAVE, noiseLevel: int = DEFAULT_NOISE, minValue: float = DEFAULT_MIN_VALUE, maxValue: float = DEFAULT_MAX_VALUE, startHour: int = MIN_HOURS, endHour: int = MAX_HOURS, useSeconds = False, chunkSize: int = DEFAULT_CHUNK_SIZE, continuous: bool = False, streamID: int = None, noiseColor: int = WHITE_NOISE):
+		"""
+		Generates the same time-series data as generateDailySensorDataSet(), but
+		incrementally, one fixed-size chunk at a time. Each chunk is computed on
+		demand, so only 'chunkSize' entries are ever resident, regardless of the
+		hour range or granularity.
+		
+		The floor / ceiling re-scaling and noise magnitude are derived analytically
+		from the full [startHour, endHour] curve (without generating it), so the
+		concatenated chunks match the fully materialized data set.
+		
+		Composite curves have no closed form extents, so for those, a first pass
+		generates the curve chunk by chunk and only keeps its minimum, maximum
+		and mean; the random-walk drift is carried from one chunk to the next
+		(see SignalSynthesizer.createCurveStream()), so the chunks still match
+		the materialized data set.
+		
+		NOTE: Colored noise is filtered chunk by chunk (see ColoredNoiseStream),
+		so it has the same spectrum and magnitude as in the materialized data set,
+		but not the same values. White noise is identical.
+		
+		@param curveType The type of curve to implement - FULL_WAVE, CURVE_UP, CURVE_DOWN,
+		BELL_CURVE, INVERSE_CURVE, DAILY_WEEKLY_CURVE, TREND_CURVE or DRIFT_CURVE.
+		Defaults to FULL_WAVE.
+		@param: noiseLevel Any positive integer between 0 (no noise) and 100 (max noise).
+		@param: minValue The minimum value, or floor, of the data.
+		@param: maxValue The maximum value, or ceiling, of the data.
+		@param: startHour The beginning hour. Must be between MIN_HOURS and MAX_HOURS.
+		@param: endHour The ending hour. Must be between MIN_HOURS and MAX_HOURS.
+		@param: useSeconds Defaults to False. If True, one data pair will be generated
+		for every second between startHour and endHour.
+		@param: chunkSize The number of data pairs per chunk. Defaults to DEFAULT_CHUNK_SIZE.
+		The last chunk may be smaller if 'continuous' is False.
+		@param: continuous Defaults to False. If True, the generator never ends: the time
+		entries keep increasing past endHour, and the values replay the [startHour, endHour]
+		curve as a rolling stream.
+		@param: streamID The random stream to use for the noise (e.g. the sensor type ID).
+		If None, the next stream of this generator is used.
+		@param: noiseColor The noise spectrum - WHITE_NOISE (default), PINK_NOISE or BROWN_NOISE.
+		@return generator A generator yielding (timeEntries, dataEntries) ndarray tuples.
+		"""
+		channel = SensorDataChannel(curveType = curveType, noiseLevel = noiseLevel, minValue = minValue, maxValue = maxValue, noiseColor = noiseColor)
+		
+		# validate start and end hours
+		if startHour < self.MIN_HOURS or startHour > self.MAX_HOURS: startHour = self.MIN_HOURS
+		if endHour < 0 or endHour > self.MAX_HOURS: endHour = self.MAX_HOURS
+		if chunkSize < 1: chunkSize = self.DEFAULT_CHUNK_SIZE
+		if streamID is None: streamID = self._getNextStreamID()
+		
+		totalDataPoints = self._getTotalDataPoints(startHour = startHour, endHour = endHour, useSeconds = useSeconds)
+		timeStep = (endHour - startHour) / (totalDataPoints - 1) if totalDataPoints > 1 else 0.0
+		curveType = channel.getCurveType()
+		denominator = self._getCurveDenominator(curveType)
+		isSynthesized = curveType in self.SYNTHESIZED_CURVES
+		
+		# scale and offset are the same as those used by _generateChannelValues()
+		if isSynthesized:
+			curveMin, curveMax, curveMean = self._getSynthesizedCurveExtents( \
+				curveType = curveType, startHour = startHour, endHour = endHour, timeStep = timeStep, \
+				totalDataPoints = totalDataPoints, chunkSize = chunkSize, streamID = streamID)
+		else:
+			curveMin, curveMax, curveMean = self._getCurveExtents( \
+				startHour = startHour, endHour = endHour, timeStep = timeStep, totalDataPoints = totalDataPoints, denominator = denominator)
+		
+		curveSpan = curveMax - curveMin
+		scale = (channel.getMaxValue() - channel.getMinValue()) / curveSpan if curveSpan > 0 else 0.0
+		offset = channel.getMinValue() if curveSpan > 0 else channel.getMaxValue()
+		
+		noiseScale = 0.0
+		
+		if channel.getNoiseLevel() != self.NO_NOISE:
+			noiseScale = self._calculateNoiseScale(meanValue = (curveMean - curveMin) * scale + offset, noiseLevel = channel.getNoiseLevel())
+		
+		# the same stream as generateDailySensorDataSet(), drawn (and, if colored, filtered) chunk by chunk
+		noiseStream = ColoredNoiseStream(noiseColor = channel.getNoiseColor(), randomGenerator = self._getRandomGenerator(streamID = streamID))
+		curveStream = None
+		
+		chunkStart = 0
+		
+		while continuous or chunkStart < totalDataPoints:
+			indexes = calcLib.arange(chunkStart, chunkStart + chunkSize if continuous else min(chunkStart + chunkSize, totalDataPoints))
+			
+			timeEntries = self._getTimeEntriesAt(indexes = indexes, startHour = startHour, endHour = endHour, timeStep = timeStep, totalDataPoints = totalDataPoints)
+			
+			# replay the curve once the end of the [startHour, endHour] window is reached
+			if continuous and indexes[-1] >= totalDataPoints:
+				curveTimes = self._getTimeEntriesAt(indexes = indexes % totalDataPoints, startHour = startHour, endHour = endHour, timeStep = timeStep, totalDataPoints = totalDataPoints)
+			else:
+				curveTimes = timeEntries
+			
+			if isSynthesized:
+				dataEntries, curveStream = self._generateSynthesizedChunk( \
+					curveType = curveType, curveTimes = curveTimes, curveIndexes = indexes % totalDataPoints, \
+					curveStream = curveStream, startHour = startHour, totalDataPoints = totalDataPoints, streamID = streamID)
+			else:
+				dataEntries = calcLib.sin(curveTimes / denominator)
+			
+			dataEntries -= curveMin
+			dataEntries *= scale
+			dataEntries += offset
+			
+			if noiseScale:
+				noise = noiseStream.generateChunk(indexes.size)
+				noise *= noiseScale
+				
+				dataEntries += noise
+			
+			chunkStart += indexes.size
+			
+			yield (timeEntries, dataEntries)
 		
 	def generateOnScreenGraph(self, dataSet = None, chartTitle: str = "Sample Data", chartXLabel: str = "X Axis", chartYLabel: str = "Y Axis"):
 		"""
@@ -284,21 +550,409 @@ class SensorDataGenerator(object):
 		
 		This will generate a graph, so there must be a window manager
 		running on the system for this to function correctly.
+		For headless use (e.g. CI), see SensorDataPlotter.generateGraphFile().
 		
 		@param dataSet The SensorDataSet instance.
 		@param chartTitle The string representing the title of the chart. Should be no more than 100 characters.
 		@param chartXLabel The string to use for the X Label.
 		@param chartYLabel The string to use for the Y Label.
 		"""
+		# pyplot is by far the most expensive import, and only needed here
+		import matplotlib.pyplot as plotLib
+		
+		from programmingtheiot.cda.sim.SensorDataPlotter import SensorDataPlotter
+		
 		self.plotter = plotLib
 		
-		self.plotter.plot(dataSet.getTimeEntries(), dataSet.getDataEntries())
+		# only a few thousand points can be distinguished on screen anyway
+		timeEntries, dataEntries = SensorDataPlotter().downsample(dataSet.getTimeEntries(), dataSet.getDataEntries())
+		
+		self.plotter.plot(timeEntries, dataEntries)
 		self.plotter.title(chartTitle)
 		self.plotter.ylabel(chartYLabel)
 		self.plotter.xlabel(chartXLabel)
 		self.plotter.grid(True, which = 'both')
 		self.plotter.show()
 		
+	def _getNextStreamID(self) -> int:
+		"""
+		Returns the next unused random stream ID for this generator. Stream IDs
+		are handed out in call order, so a given sequence of calls on a seeded
+		generator is reproducible.
+		
+		@return int
+		"""
+		streamID = self.nextStreamID
+		self.nextStreamID += 1
+		
+		return streamID
+	
+	def _getRandomGenerator(self, streamID: int = 0, rowIndex: int = 0, purpose: int = NOISE_STREAM):
+		"""
+		Returns a new, independent numpy Generator for the given stream, row
+		(channel or device) and purpose. The child seed is derived from this
+		generator's seed using SeedSequence spawn keys, so the same arguments
+		always produce the same random values, in any process.
+		
+		@param streamID The stream ID (e.g. one per sensor).
+		@param rowIndex The channel or device index within the stream.
+		@param purpose NOISE_STREAM or JITTER_STREAM.
+		@return Generator
+		"""
+		return calcLib.random.default_rng(calcLib.random.SeedSequence(entropy = self.seed, spawn_key = (streamID, rowIndex, purpose)))
+	
+	def _generateFleetRows(self, timeEntries = None, dataValues = None, deviceStart: int = 0, deviceEnd: int = 1, fleetArgs: dict = None):
+		"""
+		Generates the rows for devices [deviceStart, deviceEnd) of a fleet into
+		'dataValues', which must have (deviceEnd - deviceStart) rows.
+		
+		The per-device jitter is drawn for the whole fleet from a single stream
+		(which is cheap), and then sliced, so it doesn't depend on the partition.
+		
+		@param timeEntries The 1-D array of time entries (in hours).
+		@param dataValues The 2-D array to write into.
+		@param deviceStart The first device index.
+		@param deviceEnd The index after the last device.
+		@param fleetArgs The (validated) fleet parameters.
+		"""
+		deviceCount = fleetArgs['deviceCount']
+		rangeJitter = fleetArgs['rangeJitter']
+		rowCount = deviceEnd - deviceStart
+		
+		# per-device phase offsets and floor / ceiling jitter
+		jitterGenerator = self._getRandomGenerator(streamID = fleetArgs['streamID'], rowIndex = 0, purpose = self.JITTER_STREAM)
+		valueRange = fleetArgs['maxValue'] - fleetArgs['minValue']
+		
+		phaseOffsets = jitterGenerator.uniform(0.0, fleetArgs['phaseJitter'], deviceCount)[deviceStart:deviceEnd]
+		minValues = fleetArgs['minValue'] + jitterGenerator.uniform(-rangeJitter, rangeJitter, deviceCount)[deviceStart:deviceEnd] * valueRange
+		maxValues = fleetArgs['maxValue'] + jitterGenerator.uniform(-rangeJitter, rangeJitter, deviceCount)[deviceStart:deviceEnd] * valueRange
+		
+		minValues, maxValues = calcLib.minimum(minValues, maxValues), calcLib.maximum(minValues, maxValues)
+		
+		curveTypes = calcLib.full(rowCount, fleetArgs['curveType'])
+		denominators = calcLib.full(rowCount, self._getCurveDenominator(fleetArgs['curveType']), dtype = float)
+		noiseLevels = calcLib.full(rowCount, fleetArgs['noiseLevel'])
+		noiseColors = calcLib.full(rowCount, fleetArgs['noiseColor'])
+		
+		self._generateCurveValues( \
+			timeEntries = timeEntries, denominators = denominators, minValues = minValues, maxValues = maxValues, \
+			noiseLevels = noiseLevels, phaseOffsets = phaseOffsets, dataValues = dataValues, \
+			streamID = fleetArgs['streamID'], rowOffset = deviceStart, curveTypes = curveTypes, noiseColors = noiseColors)
+		
+	def _getTotalDataPoints(self, startHour: int = MIN_HOURS, endHour: int = MAX_HOURS, useSeconds = False) -> int:
+		"""
+		Returns the number of data points between startHour and endHour.
+		
+		@param: startHour The (validated) beginning hour.
+		@param: endHour The (validated) ending hour.
+		@param: useSeconds If True, one entry per second will be counted; otherwise,
+		one entry per minute.
+		@return int
+		"""
+		# calc total data points to be generated
+		totalDataPoints = (endHour - startHour) * 60
+		
+		if useSeconds: totalDataPoints = totalDataPoints * 60
+		if totalDataPoints == 0: totalDataPoints = 1
+		
+		return totalDataPoints
+	
+	def _generateTimeEntries(self, startHour: int = MIN_HOURS, endHour: int = MAX_HOURS, useSeconds = False):
+		"""
+		Creates the evenly spaced time axis (in hours) between startHour and endHour.
+		
+		@param: startHour The (validated) beginning hour.
+		@param: endHour The (validated) ending hour.
+		@param: useSeconds If True, one entry per second will be generated; otherwise,
+		one entry per minute.
+		@return ndarray The 1-D array of time entries.
+		"""
+		totalDataPoints = self._getTotalDataPoints(startHour = startHour, endHour = endHour, useSeconds = useSeconds)
+		
+		# create evenly spaced number of 'totalDataPoints' between 'startHour' and 'endHour'
+		return calcLib.linspace(start = startHour, stop = endHour, num = totalDataPoints)
+	
+	def _getTimeEntriesAt(self, indexes = None, startHour: int = MIN_HOURS, endHour: int = MAX_HOURS, timeStep: float = 0.0, totalDataPoints: int = 1):
+		"""
+		Returns the time entries at the given indexes, using the same arithmetic
+		as numpy's linspace() so the values match _generateTimeEntries() exactly.
+		
+		@param indexes The ndarray of (integer) indexes.
+		@param: startHour The (validated) beginning hour.
+		@param: endHour The (validated) ending hour.
+		@param: timeStep The time step (in hours) between two entries.
+		@param: totalDataPoints The number of entries between startHour and endHour.
+		@return ndarray
+		"""
+		timeEntries = indexes * timeStep
+		timeEntries += startHour
+		
+		if totalDataPoints > 1:
+			timeEntries[indexes == totalDataPoints - 1] = endHour
+		
+		return timeEntries
+	
+	def _getCurveExtents(self, startHour: int = MIN_HOURS, endHour: int = MAX_HOURS, timeStep: float = 0.0, totalDataPoints: int = 1, denominator: float = 1.0) -> tuple:
+		"""
+		Returns the minimum, maximum and mean of the sampled (clean, unscaled)
+		sine curve over [startHour, endHour] without generating the curve.
+		
+		The extremes of a sampled sine are at the end points, or at the samples
+		adjacent to a peak / trough of the continuous curve, so only a handful
+		of samples need to be evaluated. The mean uses the closed form for the
+		sum of a sine over an arithmetic progression.
+		
+		@return tuple (min, max, mean)
+		"""
+		startAngle = startHour / denominator
+		angleStep = timeStep / denominator
+		endAngle = startAngle + (totalDataPoints - 1) * angleStep
+		
+		candidates = [0, totalDataPoints - 1]
+		
+		if angleStep > 0:
+			# peaks and troughs are at pi/2 + k * pi
+			firstPeak = math.ceil((startAngle - calcLib.pi / 2) / calcLib.pi)
+			lastPeak = math.floor((endAngle - calcLib.pi / 2) / calcLib.pi)
+			
+			peakAngles = calcLib.pi / 2 + calcLib.arange(firstPeak, lastPeak + 1) * calcLib.pi
+			peakIndexes = calcLib.floor((peakAngles - startAngle) / angleStep).astype(calcLib.int64)
+			
+			candidates = calcLib.concatenate((candidates, peakIndexes - 1, peakIndexes, peakIndexes + 1, peakIndexes + 2))
+		
+		candidates = calcLib.unique(calcLib.clip(candidates, 0, totalDataPoints - 1))
+		
+		timeEntries = self._getTimeEntriesAt(indexes = candidates, startHour = startHour, endHour = endHour, timeStep = timeStep, totalDataPoints = totalDataPoints)
+		sampledValues = calcLib.sin(timeEntries / denominator)
+		
+		# sum(sin(a + k * d)) for k in [0, n) = sin(n * d / 2) * sin(a + (n - 1) * d / 2) / sin(d / 2)
+		halfStep = angleStep / 2
+		
+		if math.sin(halfStep) != 0:
+			meanValue = math.sin(totalDataPoints * halfStep) * math.sin(startAngle + (totalDataPoints - 1) * halfStep) / math.sin(halfStep) / totalDataPoints
+		else:
+			meanValue = math.sin(startAngle)
+		
+		return (sampledValues.min(), sampledValues.max(), meanValue)
+
+	def _getSynthesizedCurveExtents(self, curveType: int = DAILY_WEEKLY_CURVE, startHour: int = MIN_HOURS, endHour: int = MAX_HOURS, timeStep: float = 0.0, totalDataPoints: int = 1, chunkSize: int = DEFAULT_CHUNK_SIZE, streamID: int = 0) -> tuple:
+		"""
+		Returns the minimum, maximum and mean of the (clean, unscaled) composite
+		curve over [startHour, endHour]. Unlike a sine, these have no closed form
+		(the random-walk drift in particular), so the curve is generated chunk by
+		chunk and reduced as it goes - no more than one chunk is ever resident.
+		
+		@return tuple (min, max, mean)
+		"""
+		curveStream = self._createCurveStream(curveType = curveType, startHour = startHour, totalDataPoints = totalDataPoints, streamID = streamID)
+		
+		curveMin = math.inf
+		curveMax = -math.inf
+		curveSum = 0.0
+		
+		for chunkStart in range(0, totalDataPoints, chunkSize):
+			indexes = calcLib.arange(chunkStart, min(chunkStart + chunkSize, totalDataPoints))
+			timeEntries = self._getTimeEntriesAt(indexes = indexes, startHour = startHour, endHour = endHour, timeStep = timeStep, totalDataPoints = totalDataPoints)
+			curveValues = curveStream.generateChunk(timeEntries)
+			
+			curveMin = min(curveMin, curveValues.min())
+			curveMax = max(curveMax, curveValues.max())
+			curveSum += curveValues.sum()
+		
+		return (curveMin, curveMax, curveSum / totalDataPoints)
+	
+	def _generateSynthesizedChunk(self, curveType: int = DAILY_WEEKLY_CURVE, curveTimes = None, curveIndexes = None, curveStream = None, startHour: int = MIN_HOURS, totalDataPoints: int = 1, streamID: int = 0) -> tuple:
+		"""
+		Generates the (clean, unscaled) composite curve for one chunk, continuing
+		'curveStream'. Wherever the curve index wraps around to 0 (i.e. the curve
+		is replayed), a new, identically seeded, CurveStream is started.
+		
+		@param curveType One of SYNTHESIZED_CURVES.
+		@param curveTimes The 1-D array of curve time entries (in hours) for the chunk.
+		@param curveIndexes The 1-D array of curve indexes (within [0, totalDataPoints)) for the chunk.
+		@param curveStream The CurveStream of the previous chunk, or None if this is the first chunk.
+		@param startHour The (validated) beginning hour.
+		@param totalDataPoints The number of entries between startHour and endHour.
+		@param streamID The random stream ID.
+		@return tuple (curve values, the CurveStream to continue with)
+		"""
+		curveValues = calcLib.empty(curveTimes.size)
+		
+		segmentStarts = [0] + (calcLib.flatnonzero(curveIndexes[1:] == 0) + 1).tolist()
+		segmentEnds = segmentStarts[1:] + [curveTimes.size]
+		
+		for segmentStart, segmentEnd in zip(segmentStarts, segmentEnds):
+			if curveIndexes[segmentStart] == 0:
+				curveStream = self._createCurveStream(curveType = curveType, startHour = startHour, totalDataPoints = totalDataPoints, streamID = streamID)
+			
+			curveValues[segmentStart:segmentEnd] = curveStream.generateChunk(curveTimes[segmentStart:segmentEnd])
+		
+		return (curveValues, curveStream)
+	
+	def _createCurveStream(self, curveType: int = DAILY_WEEKLY_CURVE, startHour: int = MIN_HOURS, totalDataPoints: int = 1, streamID: int = 0):
+		"""
+		Returns a new CurveStream for the given composite curve type, drawing from
+		the same random stream as _generateCurveValues().
+		
+		@param curveType One of SYNTHESIZED_CURVES.
+		@param startHour The (validated) beginning hour.
+		@param totalDataPoints The number of entries between startHour and endHour.
+		@param streamID The random stream ID.
+		@return CurveStream
+		"""
+		curveGenerator = self._getRandomGenerator(streamID = streamID, purpose = self.CURVE_STREAM)
+		
+		return self._getSignalSynthesizer(curveType).createCurveStream( \
+			startTime = startHour, totalCount = totalDataPoints, randomGenerator = curveGenerator)
+	
+	def _getSignalSynthesizer(self, curveType: int = DAILY_WEEKLY_CURVE) -> SignalSynthesizer:
+		"""
+		Returns the SignalSynthesizer for the given composite curve type.
+		
+		@param curveType One of SYNTHESIZED_CURVES.
+		@return SignalSynthesizer
+		"""
+		if curveType == self.TREND_CURVE:
+			return SignalSynthesizer(dailyAmplitude = 1.0, trendPerDay = 0.5)
+		elif curveType == self.DRIFT_CURVE:
+			return SignalSynthesizer(dailyAmplitude = 1.0, randomWalkAmplitude = 1.0)
+		else:
+			return SignalSynthesizer(dailyAmplitude = 1.0, weeklyAmplitude = 0.5)
+		
+	def _getCurveDenominator(self, curveType: int = FULL_WAVE) -> float:
+		"""
+		Returns the sine wave denominator for the given curve type, taking into
+		account whether or not the generator is aligned to a single day.
+		
+		@param curveType The type of curve to implement.
+		@return float
+		"""
+		# generate the distribution data for each point - quick ramp up curve
+		# followed by a more gradual ramp down
+		if self.alignGeneratorToDay:
+			if curveType > 0:
+				return (curveType + self.dayDenominator)
+			elif curveType == 0:
+				return self.dayDenominator
+			else:
+				return abs(curveType) * self.dayDenominator
+		else:
+			if curveType > 0:
+				return curveType
+			elif curveType == 0:
+				return 1
+			else:
+				return 1 / abs(curveType)
+	
+	def _generateChannelValues(self, timeEntries = None, channels: list = None, streamID: int = 0):
+		"""
+		Generates the values for all channels over the given time axis.
+		
+		@param timeEntries The 1-D array of time entries (in hours).
+		@param channels The list of SensorDataChannel instances.
+		@param streamID The random stream ID to use for the noise.
+		@return ndarray The 2-D array of data values - one row per channel.
+		"""
+		curveTypes = calcLib.array([channel.getCurveType() for channel in channels])
+		denominators = calcLib.array([self._getCurveDenominator(channel.getCurveType()) for channel in channels], dtype = float)
+		minValues = calcLib.array([channel.getMinValue() for channel in channels], dtype = float)
+		maxValues = calcLib.array([channel.getMaxValue() for channel in channels], dtype = float)
+		noiseLevels = calcLib.array([channel.getNoiseLevel() for channel in channels])
+		noiseColors = calcLib.array([channel.getNoiseColor() for channel in channels])
+		
+		return self._generateCurveValues( \
+			timeEntries = timeEntries, denominators = denominators, minValues = minValues, maxValues = maxValues, \
+			noiseLevels = noiseLevels, streamID = streamID, curveTypes = curveTypes, noiseColors = noiseColors)
+	
+	def _generateCurveValues(self, timeEntries = None, denominators = None, minValues = None, maxValues = None, noiseLevels = None, phaseOffsets = None, dataValues = None, streamID: int = 0, rowOffset: int = 0, curveTypes = None, noiseColors = None):
+		"""
+		Generates one curve per row over the given time axis. All parameters other
+		than timeEntries are 1-D arrays with one entry per row. The work is done in
+		place within a single (rows, time entries) array, so peak memory is bounded
+		by that array plus one row of noise.
+		
+		@param timeEntries The 1-D array of time entries (in hours).
+		@param denominators The sine wave denominator for each row.
+		@param minValues The floor for each row.
+		@param maxValues The ceiling for each row.
+		@param noiseLevels The (validated) noise level for each row.
+		@param phaseOffsets The optional time offset (in hours) for each row.
+		@param dataValues The optional (rows, time entries) array to write into.
+		@param streamID The random stream ID to use for the noise.
+		@param rowOffset The channel or device index of the first row, which selects
+		the per-row noise stream.
+		@param curveTypes The optional curve type for each row. Rows with one of the
+		SYNTHESIZED_CURVES are generated by SignalSynthesizer instead of a sine wave.
+		@param noiseColors The optional noise color for each row (defaults to WHITE_NOISE).
+		@return ndarray The 2-D array of data values - one row per curve.
+		"""
+		rowCount = denominators.size
+		
+		if dataValues is None:
+			dataValues = calcLib.empty((rowCount, timeEntries.size))
+		
+		if phaseOffsets is None:
+			calcLib.divide(timeEntries, denominators.reshape(rowCount, 1), out = dataValues)
+		else:
+			calcLib.add(timeEntries, phaseOffsets.reshape(rowCount, 1), out = dataValues)
+			dataValues /= denominators.reshape(rowCount, 1)
+		
+		calcLib.sin(dataValues, out = dataValues)
+		
+		if curveTypes is not None:
+			for row in calcLib.flatnonzero(calcLib.isin(curveTypes, self.SYNTHESIZED_CURVES)):
+				rowTimeEntries = timeEntries if phaseOffsets is None else timeEntries + phaseOffsets[row]
+				curveGenerator = self._getRandomGenerator(streamID = streamID, rowIndex = rowOffset + row, purpose = self.CURVE_STREAM)
+				
+				dataValues[row] = self._getSignalSynthesizer(curveTypes[row]).generateCurve(rowTimeEntries, curveGenerator)
+		
+		# re-scale each row with 'minValue' as floor and 'maxValue' as ceiling;
+		# a flat row is pinned to 'maxValue', which mirrors numpy's interp()
+		minValues = minValues.reshape(rowCount, 1)
+		maxValues = maxValues.reshape(rowCount, 1)
+		
+		rowMin = dataValues.min(axis = 1, keepdims = True)
+		rowSpan = dataValues.max(axis = 1, keepdims = True) - rowMin
+		hasSpan = rowSpan > 0
+		
+		scale = calcLib.divide(maxValues - minValues, rowSpan, out = calcLib.zeros_like(rowSpan), where = hasSpan)
+		offset = calcLib.where(hasSpan, minValues, maxValues)
+		
+		dataValues -= rowMin
+		dataValues *= scale
+		dataValues += offset
+		
+		# check if noise should be added - each row draws from its own stream
+		for row in calcLib.flatnonzero(noiseLevels != self.NO_NOISE):
+			noiseScale = self._calculateNoiseScale(meanValue = dataValues[row].mean(), noiseLevel = noiseLevels[row])
+			
+			noiseColor = self.WHITE_NOISE if noiseColors is None else noiseColors[row]
+			noiseGenerator = self._getRandomGenerator(streamID = streamID, rowIndex = rowOffset + row)
+			
+			noise = SignalSynthesizer.generateColoredNoise(timeEntries.size, noiseColor, noiseGenerator)
+			noise *= noiseScale
+			
+			dataValues[row] += noise
+		
+		return dataValues
+
+	def _calculateNoiseScale(self, meanValue: float = DEFAULT_MIN_VALUE, noiseLevel: int = DEFAULT_NOISE) -> float:
+		"""
+		Calculates the standard deviation of the noise to apply to a curve.
+		
+		@param meanValue The mean value of the clean (scaled) curve.
+		@param noiseLevel The noise level, between NO_NOISE and MAX_NOISE.
+		@return float
+		"""
+		# calc order of magnitude of mean value - this is necessary to ensure
+		# the generated noisyness aligns with the magnitude of the values
+		meanMag = int(math.log10(meanValue))
+		noiseScale = ((noiseLevel / 100) * ((10 ** meanMag) / 10))
+		
+		logging.debug("Noise=%f; Noise Scale=%f; Mean Magnitude=%f" % (noiseLevel, noiseScale, meanMag))
+		
+		return noiseScale
+		
 
 from time import time, ctime
 
@@ -383,6 +1037,19 @@ class SensorDataSet():
 		
 		return self.timeEntries[index]
 	
+	def getTimeStamps(self, indexes = None):
+		"""
+		Returns the times (in seconds since Epoch) of the entries selected by
+		'indexes', as a new float64 array.
+		
+		@param indexes A slice or an array of indexes. If None, all entries.
+		@return ndarray
+		"""
+		if indexes is None:
+			indexes = slice(None)
+		
+		return self.currentTime + self.timeEntries[indexes] * 3600.0
+	
 	def getDataEntries(self):
 		"""
 		Returns the dataEntries structure.
@@ -417,8 +1084,9 @@ class SensorDataSet():
 		(evenly spaced from start to end) that should correspond to dataEntries - element by element.
 		"""
 		if not timeEntries is None:
-			# data generator uses a single dimension array, so it's safe to flatten
-			self.timeEntries = timeEntries.flatten()
+			# data generator uses a single dimension array, so it's safe to ravel - this
+			# avoids a copy when the array is already contiguous
+			self.timeEntries = timeEntries.ravel()
 			logging.info("timeEntries tuple. Array Size: %s  ND Size: %s  Dimensions: %s  Shape: %s  Type: %s", self.timeEntries.size, timeEntries.size, timeEntries.ndim, timeEntries.shape, timeEntries.dtype)
 		
 	def setDataEntries(self, dataEntries):
@@ -429,10 +1097,506 @@ class SensorDataSet():
 		that should correspond to timeEntries - element by element.
 		"""
 		if not dataEntries is None:
-			# data generator uses a single dimension array, so it's safe to flatten
-			self.dataEntries = dataEntries.flatten()
+			# data generator uses a single dimension array, so it's safe to ravel - this
+			# avoids a copy when the array is already contiguous
+			self.dataEntries = dataEntries.ravel()
 			logging.info("dataEntries tuple. Array Size: %s  ND Size: %s  Dimensions: %s  Shape: %s  Type: %s", self.dataEntries.size, dataEntries.size, dataEntries.ndim, dataEntries.shape, dataEntries.dtype)
 		
+class MultiSensorDataSet(SensorDataSet):
+	"""
+	Class definition of the data structure that will hold a single set of time
+	entries along with multiple rows (channels) of corresponding data entries.
+	
+	The data entries are stored as a single 2-D array of shape (channels, time entries),
+	and each channel can be retrieved as a SensorDataSet view that shares its memory
+	with this instance.
+	"""
+	
+	def __init__(self, epochOffsetSeconds: float = 0.0, timeEntries = None, dataEntries = None, useCurrentTime: bool = True, channelNames: list = None, sharedMemory = None):
+		"""
+		Constructor.
+		
+		@param epochOffsetSeconds The float representing the start time - in seconds - for this data set.
+		@param timeEntries The ndarray representing time entries. It is expected this can
+		be converted to a single dim array.
+		@param dataEntries The 2-D ndarray representing data entries - one row per channel.
+		@param useCurrentTime If True (default), the current time (since Epoch) will be used as
+		the starting time, regardless of the startTime parameter.
+		@param channelNames The optional list of names for each channel.
+		@param sharedMemory The optional SharedMemory instance backing timeEntries and dataEntries.
+		A reference is kept so the block stays mapped for the life of this instance.
+		"""
+		self.channelNames = channelNames
+		self.sharedMemory = sharedMemory
+		
+		super(MultiSensorDataSet, self).__init__( \
+			epochOffsetSeconds = epochOffsetSeconds, timeEntries = timeEntries, dataEntries = dataEntries, useCurrentTime = useCurrentTime)
+	
+	@staticmethod
+	def createSharedMemory(rowCount: int = 1, dataEntryCount: int = 1, name: str = None) -> tuple:
+		"""
+		Creates a new shared memory block large enough for a (rowCount, dataEntryCount)
+		float64 array.
+		
+		@param rowCount The number of rows.
+		@param dataEntryCount The number of entries per row.
+		@param name The optional name of the block. If None, a unique name is generated.
+		@return tuple (SharedMemory, ndarray) The block and the array view onto it.
+		"""
+		from multiprocessing import shared_memory
+		
+		sharedMemory = shared_memory.SharedMemory(name = name, create = True, size = rowCount * dataEntryCount * calcLib.dtype(calcLib.float64).itemsize)
+		sharedEntries = calcLib.ndarray((rowCount, dataEntryCount), dtype = calcLib.float64, buffer = sharedMemory.buf)
+		
+		logging.info("Created shared memory block %s: %s rows x %s entries", sharedMemory.name, rowCount, dataEntryCount)
+		
+		return (sharedMemory, sharedEntries)
+	
+	@staticmethod
+	def attachSharedMemory(name: str = None, rowCount: int = 1, dataEntryCount: int = 1, epochOffsetSeconds: float = 0.0):
+		"""
+		Attaches to an existing shared memory block created by SensorDataGenerator
+		(e.g. from a worker process) without copying any data. The block layout is
+		one row of time entries, followed by 'rowCount' rows of data entries.
+		
+		@param name The name of the shared memory block.
+		@param rowCount The number of data rows (devices or channels) in the block.
+		@param dataEntryCount The number of entries per row.
+		@param epochOffsetSeconds The start time - in seconds since Epoch - for the data set.
+		@return MultiSensorDataSet
+		"""
+		from multiprocessing import shared_memory
+		
+		sharedMemory = shared_memory.SharedMemory(name = name)
+		sharedEntries = calcLib.ndarray((rowCount + 1, dataEntryCount), dtype = calcLib.float64, buffer = sharedMemory.buf)
+		
+		return MultiSensorDataSet( \
+			epochOffsetSeconds = epochOffsetSeconds, useCurrentTime = False, \
+			timeEntries = sharedEntries[0], dataEntries = sharedEntries[1:], sharedMemory = sharedMemory)
+	
+	def closeSharedMemory(self, unlink: bool = False):
+		"""
+		Releases this instance's mapping of the shared memory block, if any.
+		The time and data entries must not be used afterwards.
+		
+		@param unlink If True, the block itself is also destroyed. This should be
+		done exactly once, by the process that created it.
+		"""
+		if self.sharedMemory:
+			self.timeEntries = None
+			self.dataEntries = None
+			
+			self.sharedMemory.close()
+			
+			if unlink:
+				self.sharedMemory.unlink()
+			
+			self.sharedMemory = None
+
+	def getChannelCount(self) -> int:
+		"""
+		Returns the number of channels (rows) in the data entry array.
+		
+		@return int
+		"""
+		return self.dataEntries.shape[0]
+	
+	def getChannelNames(self) -> list:
+		"""
+		Returns the list of channel names, or None if not set.
+		
+		@return list
+		"""
+		return self.channelNames
+	
+	def getChannelDataSet(self, channelIndex: int = 0) -> SensorDataSet:
+		"""
+		Returns a SensorDataSet for the given channel. The returned instance
+		shares its time and data entries with this instance (no copy is made).
+		If channelIndex is < 0 or > channel count - 1, 0 will be used.
+		
+		@return SensorDataSet
+		"""
+		if channelIndex < 0 or channelIndex > self.getChannelCount() - 1:
+			channelIndex = 0
+		
+		return SensorDataSet( \
+			epochOffsetSeconds = self.currentTime, useCurrentTime = False, \
+			timeEntries = self.timeEntries, dataEntries = self.dataEntries[channelIndex])
+	
+	def getDataEntry(self, index: int = 0, channelIndex: int = 0) -> float:
+		"""
+		Returns the float value at 'index' in the data entries array for the given channel.
+		If either index is out of range, 0 will be used.
+		
+		@return float
+		"""
+		if index < 0 or index > self.getDataEntryCount() - 1:
+			index = 0
+		
+		if channelIndex < 0 or channelIndex > self.getChannelCount() - 1:
+			channelIndex = 0
+		
+		return self.dataEntries[channelIndex, index]
+	
+	def getDataEntryCount(self) -> int:
+		"""
+		Returns the number of data entries per channel.
+		
+		@return int
+		"""
+		return self.dataEntries.shape[-1]
+	
+	def getSharedMemoryName(self) -> str:
+		"""
+		Returns the name of the shared memory block backing this data set,
+		or None if the data set is not in shared memory.
+		
+		@return str
+		"""
+		if self.sharedMemory:
+			return self.sharedMemory.name
+		
+		return None
+
+	def setDataEntries(self, dataEntries):
+		"""
+		Setter for data entry values.
+		
+		@param: dataEntries The 2-D ndarray containing one row of data values per channel,
+		with each row corresponding to timeEntries - element by element. A single dim
+		array will be treated as a single channel.
+		"""
+		if not dataEntries is None:
+			self.dataEntries = calcLib.atleast_2d(dataEntries)
+			logging.info("dataEntries tuple. Channels: %s  Entries: %s  Type: %s", self.dataEntries.shape[0], self.dataEntries.shape[-1], self.dataEntries.dtype)
+		
+class ColumnarSensorDataSet(SensorDataSet):
+	"""
+	Class definition of a compact, columnar variant of SensorDataSet.
+	
+	Time entries are stored as an int64 column of millisecond offsets from the
+	data set's start time (see getCurrentTime()), and data entries as a float32
+	or float64 column of the same length. Both columns are contiguous, so indexing
+	is O(1) and slicing returns zero-copy views.
+	
+	A data set can be saved to, and memory-mapped from, a single file (a fixed
+	size header followed by the two columns). Any number of sim tasks or test
+	harnesses can load the same file read-only; they all share the OS page cache
+	instead of each loading a private copy.
+	"""
+	
+	MILLIS_PER_HOUR = 3600000
+	
+	FILE_MAGIC = b'PIOTSDS1'
+	FILE_HEADER_SIZE = 64
+	FILE_HEADER_TYPE = calcLib.dtype([ \
+		('magic', 'S8'), ('valueSize', '<u4'), ('reserved', '<u4'), ('entryCount', '<i8'), ('epochOffsetSeconds', '<f8')])
+	
+	def __init__(self, epochOffsetSeconds: float = 0.0, timeEntries = None, dataEntries = None, useCurrentTime: bool = True, dataType = calcLib.float32):
+		"""
+		Constructor.
+		
+		@param epochOffsetSeconds The float representing the start time - in seconds - for this data set.
+		@param timeEntries The ndarray representing time entries, in hours (as generated
+		by SensorDataGenerator). It is expected this can be converted to a single dim array.
+		@param dataEntries The ndarray representing data entries. Must be the same length
+		as timeEntries.
+		@param useCurrentTime If True (default), the current time (since Epoch) will be used as
+		the starting time, regardless of the startTime parameter.
+		@param dataType The value column type - numpy.float32 (default) or numpy.float64.
+		"""
+		self.dataType = calcLib.dtype(dataType)
+		
+		if self.dataType not in (calcLib.dtype(calcLib.float32), calcLib.dtype(calcLib.float64)):
+			raise ValueError("Unsupported data type (must be float32 or float64): " + str(self.dataType))
+		
+		self.timeOffsets = calcLib.empty(0, dtype = calcLib.int64)
+		self.dataEntries = calcLib.empty(0, dtype = self.dataType)
+		
+		super(ColumnarSensorDataSet, self).__init__( \
+			epochOffsetSeconds = epochOffsetSeconds, timeEntries = None, dataEntries = None, useCurrentTime = useCurrentTime)
+		
+		if timeEntries is not None or dataEntries is not None:
+			self.setEntries(timeEntries = timeEntries, dataEntries = dataEntries)
+	
+	@staticmethod
+	def fromSensorDataSet(dataSet: SensorDataSet = None, dataType = calcLib.float32):
+		"""
+		Creates a columnar copy of the given data set, keeping its start time.
+		
+		@param dataSet The SensorDataSet to convert.
+		@param dataType The value column type - numpy.float32 (default) or numpy.float64.
+		@return ColumnarSensorDataSet
+		"""
+		return ColumnarSensorDataSet( \
+			epochOffsetSeconds = dataSet.getCurrentTime(), useCurrentTime = False, \
+			timeEntries = dataSet.getTimeEntries(), dataEntries = dataSet.getDataEntries(), dataType = dataType)
+	
+	@staticmethod
+	def load(fileName: str = None, writable: bool = False):
+		"""
+		Memory-maps a data set previously written by save(). No data is read
+		until it's accessed.
+		
+		@param fileName The file to load.
+		@param writable Defaults to False. If True, changes to the data entries are
+		written back to the file (see flush()).
+		@return ColumnarSensorDataSet
+		"""
+		header = calcLib.fromfile(fileName, dtype = ColumnarSensorDataSet.FILE_HEADER_TYPE, count = 1)
+		
+		if header.size != 1 or header['magic'][0] != ColumnarSensorDataSet.FILE_MAGIC:
+			raise ValueError("Not a columnar sensor data set file: " + str(fileName))
+		
+		entryCount = int(header['entryCount'][0])
+		dataType = calcLib.dtype('<f4') if header['valueSize'][0] == 4 else calcLib.dtype('<f8')
+		fileMode = 'r+' if writable else 'r'
+		
+		dataSet = ColumnarSensorDataSet( \
+			epochOffsetSeconds = float(header['epochOffsetSeconds'][0]), useCurrentTime = False, dataType = dataType)
+		
+		if entryCount > 0:
+			timeOffsets = calcLib.memmap(fileName, dtype = '<i8', mode = fileMode, \
+				offset = ColumnarSensorDataSet.FILE_HEADER_SIZE, shape = (entryCount,))
+			dataEntries = calcLib.memmap(fileName, dtype = dataType, mode = fileMode, \
+				offset = ColumnarSensorDataSet.FILE_HEADER_SIZE + timeOffsets.nbytes, shape = (entryCount,))
+			
+			dataSet._setColumns(timeOffsets = timeOffsets, dataEntries = dataEntries)
+		
+		return dataSet
+	
+	def flush(self):
+		"""
+		Writes any changes to a writable, memory-mapped data set back to its file.
+		"""
+		for column in (self.timeOffsets, self.dataEntries):
+			if isinstance(column, calcLib.memmap):
+				column.flush()
+	
+	def getDataType(self):
+		"""
+		Returns the value column type.
+		
+		@return dtype
+		"""
+		return self.dataType
+	
+	def getSlice(self, startIndex: int = 0, endIndex: int = None):
+		"""
+		Returns the entries in [startIndex, endIndex) as a new data set that
+		shares its memory (and start time) with this instance.
+		
+		@param startIndex The first index.
+		@param endIndex The index after the last entry. If None, the end of the data set.
+		@return ColumnarSensorDataSet
+		"""
+		dataSet = ColumnarSensorDataSet( \
+			epochOffsetSeconds = self.currentTime, useCurrentTime = False, dataType = self.dataType)
+		
+		dataSet._setColumns(timeOffsets = self.timeOffsets[startIndex:endIndex], dataEntries = self.dataEntries[startIndex:endIndex])
+		
+		return dataSet
+	
+	def getTimeEntries(self):
+		"""
+		Returns the time entries in hours, as a new float64 array. Use
+		getTimeOffsets() for the (zero-copy) stored column.
+		"""
+		return self.timeOffsets / self.MILLIS_PER_HOUR
+	
+	def getTimeEntry(self, index: int = 0) -> float:
+		"""
+		Returns the time entry (in hours) at 'index'.
+		If index is < 0 or > timeEntries.size - 1, 0 will be used.
+		
+		@return float
+		"""
+		if index < 0 or index > self.timeOffsets.size - 1:
+			index = 0
+		
+		return self.timeOffsets[index] / self.MILLIS_PER_HOUR
+	
+	def getTimeOffsets(self):
+		"""
+		Returns the int64 column of millisecond offsets from the start time.
+		"""
+		return self.timeOffsets
+	
+	def getTimeStamp(self, index: int = 0) -> float:
+		"""
+		Returns the time (in seconds since Epoch) of the entry at 'index'.
+		
+		@return float
+		"""
+		if index < 0 or index > self.timeOffsets.size - 1:
+			index = 0
+		
+		return self.currentTime + self.timeOffsets[index] / 1000.0
+	
+	def getTimeStamps(self, indexes = None):
+		"""
+		Returns the times (in seconds since Epoch) of the entries selected by
+		'indexes', as a new float64 array.
+		
+		@param indexes A slice or an array of indexes. If None, all entries.
+		@return ndarray
+		"""
+		if indexes is None:
+			indexes = slice(None)
+		
+		return self.currentTime + self.timeOffsets[indexes] / 1000.0
+	
+	def save(self, fileName: str = None):
+		"""
+		Writes this data set to 'fileName' as a header followed by the time
+		offset and data entry columns, so it can be memory-mapped via load().
+		
+		@param fileName The file to write.
+		"""
+		header = calcLib.zeros(1, dtype = self.FILE_HEADER_TYPE)
+		header['magic'] = self.FILE_MAGIC
+		header['valueSize'] = self.dataType.itemsize
+		header['entryCount'] = self.timeOffsets.size
+		header['epochOffsetSeconds'] = self.currentTime
+		
+		with open(fileName, 'wb') as fileRef:
+			fileRef.write(header.tobytes().ljust(self.FILE_HEADER_SIZE, b'\0'))
+			fileRef.write(calcLib.ascontiguousarray(self.timeOffsets, dtype = '<i8').data)
+			fileRef.write(calcLib.ascontiguousarray(self.dataEntries, dtype = self.dataType.newbyteorder('<')).data)
+		
+		logging.info("Saved %s entries to %s", self.timeOffsets.size, fileName)
+	
+	def setEntries(self, timeEntries = None, dataEntries = None):
+		"""
+		Sets both the time entries (in hours) and data entries, which must be
+		the same length.
+		
+		@param timeEntries The ndarray of time entries, in hours.
+		@param dataEntries The ndarray of data entries.
+		"""
+		timeEntries = calcLib.ravel(calcLib.zeros(0) if timeEntries is None else timeEntries)
+		dataEntries = calcLib.ravel(calcLib.zeros(0) if dataEntries is None else dataEntries)
+		
+		timeOffsets = calcLib.rint(timeEntries * self.MILLIS_PER_HOUR).astype(calcLib.int64)
+		
+		self._setColumns(timeOffsets = timeOffsets, dataEntries = dataEntries.astype(self.dataType, copy = False))
+	
+	def setTimeEntries(self, timeEntries):
+		"""
+		Setter for time entry values, in hours. Must be the same length as the
+		current data entries; use setEntries() to change the length.
+		
+		@param: timeEntries The ndarray of time entries.
+		"""
+		if not timeEntries is None:
+			self.setEntries(timeEntries = timeEntries, dataEntries = self.dataEntries)
+	
+	def setDataEntries(self, dataEntries):
+		"""
+		Setter for data entry values. Must be the same length as the current
+		time entries; use setEntries() to change the length.
+		
+		@param: dataEntries The ndarray of data entries.
+		"""
+		if not dataEntries is None:
+			dataEntries = calcLib.ravel(dataEntries)
+			self._setColumns(timeOffsets = self.timeOffsets, dataEntries = dataEntries.astype(self.dataType, copy = False))
+	
+	def _setColumns(self, timeOffsets = None, dataEntries = None):
+		"""
+		Sets both columns without copying. They must be 1-D and the same length.
+		
+		@param timeOffsets The int64 ndarray of millisecond offsets.
+		@param dataEntries The ndarray of data entries (of this instance's data type).
+		"""
+		if timeOffsets.ndim != 1 or dataEntries.ndim != 1 or timeOffsets.size != dataEntries.size:
+			raise ValueError("Time and data entries must be 1-D and the same length: %s, %s" % (timeOffsets.shape, dataEntries.shape))
+		
+		self.timeOffsets = timeOffsets
+		self.dataEntries = dataEntries
+		
+class SensorDataChannel():
+	"""
+	Simple container describing a single channel to generate using
+	SensorDataGenerator.generateMultiChannelSensorDataSet().
+	
+	The values are validated the same way as generateDailySensorDataSet().
+	"""
+	
+	def __init__(self, curveType: int = SensorDataGenerator.FULL_WAVE, noiseLevel: int = SensorDataGenerator.DEFAULT_NOISE, minValue: float = SensorDataGenerator.DEFAULT_MIN_VALUE, maxValue: float = SensorDataGenerator.DEFAULT_MAX_VALUE, name: str = None, noiseColor: int = SensorDataGenerator.WHITE_NOISE):
+		"""
+		Constructor.
+		
+		@param curveType The type of curve to implement - FULL_WAVE, CURVE_UP, CURVE_DOWN,
+		BELL_CURVE, INVERSE_CURVE, or one of the SYNTHESIZED_CURVES. Defaults to FULL_WAVE.
+		@param: noiseLevel Any positive integer between 0 (no noise) and 100 (max noise).
+		@param: minValue The minimum value, or floor, of the data.
+		@param: maxValue The maximum value, or ceiling, of the data.
+		@param: name The optional name of the channel.
+		@param: noiseColor WHITE_NOISE (default), PINK_NOISE or BROWN_NOISE.
+		"""
+		# validate noise level - ensure it's between 1 and 100
+		if noiseLevel < SensorDataGenerator.NO_NOISE: noiseLevel = SensorDataGenerator.NO_NOISE
+		if noiseLevel > SensorDataGenerator.MAX_NOISE: noiseLevel = SensorDataGenerator.MAX_NOISE
+		
+		# validate noise color
+		if noiseColor < SensorDataGenerator.WHITE_NOISE or noiseColor > SensorDataGenerator.BROWN_NOISE: noiseColor = SensorDataGenerator.WHITE_NOISE
+		
+		# validate min and max values
+		if maxValue < minValue: maxValue = minValue
+		if minValue > maxValue: minValue = maxValue
+		
+		self.curveType = curveType
+		self.noiseLevel = noiseLevel
+		self.noiseColor = noiseColor
+		self.minValue = minValue
+		self.maxValue = maxValue
+		self.name = name
+	
+	def getCurveType(self) -> int:
+		return self.curveType
+	
+	def getMaxValue(self) -> float:
+		return self.maxValue
+	
+	def getMinValue(self) -> float:
+		return self.minValue
+	
+	def getName(self) -> str:
+		return self.name
+	
+	def getNoiseColor(self) -> int:
+		return self.noiseColor
+	
+	def getNoiseLevel(self) -> int:
+		return self.noiseLevel
+	
+def _generateFleetPartition(generatorArgs: dict = None, fleetArgs: dict = None, sharedMemoryName: str = None, partition: tuple = None):
+	"""
+	Worker process entry point for SensorDataGenerator.generateFleetSensorDataSet().
+	Attaches to the fleet's shared memory block and generates the rows for the
+	devices in 'partition' in place.
+	
+	@param generatorArgs The SensorDataGenerator constructor arguments (including the seed).
+	@param fleetArgs The (validated) fleet parameters.
+	@param sharedMemoryName The name of the fleet's shared memory block.
+	@param partition The (deviceStart, deviceEnd) tuple to generate.
+	"""
+	deviceStart, deviceEnd = partition
+	
+	generator = SensorDataGenerator(**generatorArgs)
+	totalDataPoints = generator._getTotalDataPoints(startHour = fleetArgs['startHour'], endHour = fleetArgs['endHour'], useSeconds = fleetArgs['useSeconds'])
+	
+	fleetDataSet = MultiSensorDataSet.attachSharedMemory( \
+		name = sharedMemoryName, rowCount = fleetArgs['deviceCount'], dataEntryCount = totalDataPoints)
+	
+	generator._generateFleetRows( \
+		timeEntries = fleetDataSet.getTimeEntries(), dataValues = fleetDataSet.getDataEntries()[deviceStart:deviceEnd], \
+		deviceStart = deviceStart, deviceEnd = deviceEnd, fleetArgs = fleetArgs)
+	
+	fleetDataSet.closeSharedMemory()
+
 def main():
 	"""
 	Main function definition for running as an application.
@@ -0,0 +1,198 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import os
+import numpy as calcLib
+
+class SensorDataPlotter():
+	"""
+	Headless chart generator for SensorDataSet and MultiSensorDataSet
+	instances. Charts are rendered via matplotlib's non-interactive Agg
+	backend (no window manager needed) and written as PNG or SVG files.
+	
+	Large data sets are downsampled before plotting - far fewer points than
+	the data set contains can be drawn at a given chart width - using either
+	min / max bucketing (default; keeps every local extreme, fully vectorized)
+	or largest-triangle-three-buckets (LTTB).
+	"""
+	
+	MIN_MAX = 0
+	LTTB = 1
+	
+	DEFAULT_MAX_POINTS = 4000
+	DEFAULT_WIDTH = 12.0
+	DEFAULT_HEIGHT = 6.0
+	DEFAULT_DPI = 100
+	
+	def __init__(self, maxPoints: int = DEFAULT_MAX_POINTS, downsampleMode: int = MIN_MAX):
+		"""
+		Constructor.
+		
+		@param maxPoints The maximum number of points plotted per channel. If 0,
+		no downsampling is done.
+		@param downsampleMode MIN_MAX (default) or LTTB.
+		"""
+		self.maxPoints = max(0, maxPoints)
+		self.downsampleMode = downsampleMode
+	
+	def downsample(self, timeEntries = None, dataEntries = None) -> tuple:
+		"""
+		Downsamples the given entries to at most maxPoints, using the configured mode.
+		
+		@param timeEntries The 1-D array of time entries.
+		@param dataEntries The 1-D array of data entries.
+		@return tuple The (timeEntries, dataEntries) to plot.
+		"""
+		if self.maxPoints < 3 or dataEntries.size <= self.maxPoints:
+			return (timeEntries, dataEntries)
+		
+		if self.downsampleMode == self.LTTB:
+			indexes = self._getLttbIndexes(timeEntries, dataEntries, self.maxPoints)
+		else:
+			indexes = self._getMinMaxIndexes(dataEntries, self.maxPoints)
+		
+		return (timeEntries[indexes], dataEntries[indexes])
+	
+	def generateGraphFile(self, fileName: str = None, dataSet = None, chartTitle: str = "Sample Data", chartXLabel: str = "X Axis", chartYLabel: str = "Y Axis", channelNames: list = None, width: float = DEFAULT_WIDTH, height: float = DEFAULT_HEIGHT, dpi: int = DEFAULT_DPI) -> str:
+		"""
+		Renders the given data set(s) to a single chart file. The format is
+		determined by the file extension (e.g. '.png' or '.svg').
+		
+		@param fileName The file to write.
+		@param dataSet A SensorDataSet, a MultiSensorDataSet (one line per channel),
+		or a list of SensorDataSet instances (one line each).
+		@param chartTitle The string representing the title of the chart.
+		@param chartXLabel The string to use for the X Label.
+		@param chartYLabel The string to use for the Y Label.
+		@param channelNames The optional legend names, one per line. If None, the
+		MultiSensorDataSet channel names are used (if any).
+		@param width The chart width, in inches.
+		@param height The chart height, in inches.
+		@param dpi The chart resolution (for raster formats).
+		@return str The file name.
+		"""
+		from matplotlib.figure import Figure
+		from matplotlib.backends.backend_agg import FigureCanvasAgg
+		
+		channels = self._getChannels(dataSet)
+		
+		if channelNames is None and hasattr(dataSet, 'getChannelNames'):
+			channelNames = dataSet.getChannelNames()
+		
+		figure = Figure(figsize = (width, height), dpi = dpi)
+		FigureCanvasAgg(figure)
+		
+		axes = figure.add_subplot(1, 1, 1)
+		
+		for index, (timeEntries, dataEntries) in enumerate(channels):
+			plotTimeEntries, plotDataEntries = self.downsample(timeEntries, dataEntries)
+			label = channelNames[index] if channelNames and index < len(channelNames) else None
+			
+			logging.debug("Plotting %s of %s points for channel %s", plotDataEntries.size, dataEntries.size, index)
+			
+			axes.plot(plotTimeEntries, plotDataEntries, linewidth = 1.0, label = label)
+		
+		axes.set_title(chartTitle)
+		axes.set_xlabel(chartXLabel)
+		axes.set_ylabel(chartYLabel)
+		axes.grid(True, which = 'both')
+		
+		if channelNames and any(channelNames):
+			axes.legend()
+		
+		figure.savefig(fileName, format = os.path.splitext(fileName)[1][1:].lower() or None)
+		
+		logging.info("Saved chart '%s' to %s", chartTitle, fileName)
+		
+		return fileName
+	
+	def _getChannels(self, dataSet = None) -> list:
+		"""
+		Returns a (timeEntries, dataEntries) tuple for each line to plot.
+		
+		@param dataSet A SensorDataSet, MultiSensorDataSet or list of SensorDataSet.
+		@return list
+		"""
+		if isinstance(dataSet, (list, tuple)):
+			return [(channelDataSet.getTimeEntries(), channelDataSet.getDataEntries()) for channelDataSet in dataSet]
+		
+		timeEntries = dataSet.getTimeEntries()
+		dataEntries = dataSet.getDataEntries()
+		
+		return [(timeEntries, channelEntries) for channelEntries in calcLib.atleast_2d(dataEntries)]
+	
+	def _getMinMaxIndexes(self, dataEntries = None, maxPoints: int = DEFAULT_MAX_POINTS):
+		"""
+		Splits the entries into maxPoints / 2 equal buckets, and returns the
+		(sorted) indexes of the minimum and maximum of each bucket, plus the
+		first and last entry.
+		
+		@param dataEntries The 1-D array of data entries.
+		@param maxPoints The maximum number of indexes to return.
+		@return ndarray
+		"""
+		entryCount = dataEntries.size
+		bucketCount = max(1, (maxPoints - 2) // 2)
+		bucketSize = -(-entryCount // bucketCount)
+		
+		# pad the last bucket with its final value so the buckets can be reshaped
+		buckets = calcLib.pad(dataEntries, (0, bucketCount * bucketSize - entryCount), mode = 'edge').reshape(bucketCount, bucketSize)
+		bucketOffsets = calcLib.arange(bucketCount) * bucketSize
+		
+		indexes = calcLib.concatenate(( \
+			[0, entryCount - 1], \
+			bucketOffsets + buckets.argmin(axis = 1), \
+			bucketOffsets + buckets.argmax(axis = 1)))
+		
+		return calcLib.unique(calcLib.minimum(indexes, entryCount - 1))
+	
+	def _getLttbIndexes(self, timeEntries = None, dataEntries = None, maxPoints: int = DEFAULT_MAX_POINTS):
+		"""
+		Returns the indexes selected by the largest-triangle-three-buckets
+		algorithm: the first and last entry, plus one entry per bucket - the
+		one forming the largest triangle with the previously selected entry and
+		the average of the next bucket.
+		
+		@param timeEntries The 1-D array of time entries.
+		@param dataEntries The 1-D array of data entries.
+		@param maxPoints The number of indexes to return.
+		@return ndarray
+		"""
+		entryCount = dataEntries.size
+		bucketEdges = calcLib.linspace(1, entryCount - 1, maxPoints - 1).astype(calcLib.int64)
+		
+		# the average point of each bucket (the last 'bucket' is the final entry)
+		bucketSizes = calcLib.diff(bucketEdges)
+		averageTimes = calcLib.append(calcLib.add.reduceat(timeEntries[:-1], bucketEdges[:-1]) / bucketSizes, timeEntries[-1])
+		averageValues = calcLib.append(calcLib.add.reduceat(dataEntries[:-1], bucketEdges[:-1]) / bucketSizes, dataEntries[-1])
+		
+		indexes = calcLib.empty(maxPoints, dtype = calcLib.int64)
+		indexes[0] = 0
+		indexes[-1] = entryCount - 1
+		
+		selectedIndex = 0
+		
+		for bucket in range(maxPoints - 2):
+			bucketStart = bucketEdges[bucket]
+			bucketEnd = bucketEdges[bucket + 1]
+			
+			selectedTime = timeEntries[selectedIndex]
+			selectedValue = dataEntries[selectedIndex]
+			
+			# twice the triangle area - the constant factor doesn't change the argmax
+			areas = calcLib.abs( \
+				(selectedTime - averageTimes[bucket + 1]) * (dataEntries[bucketStart:bucketEnd] - selectedValue) - \
+				(selectedTime - timeEntries[bucketStart:bucketEnd]) * (averageValues[bucket + 1] - selectedValue))
+			
+			selectedIndex = bucketStart + int(areas.argmax())
+			indexes[bucket + 1] = selectedIndex
+		
+		return indexes
+		
@@ -0,0 +1,105 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import numpy as calcLib
+
+from programmingtheiot.data.MultiSensorData import MultiSensorData
+
+class SensorTickSampler():
+	"""
+	Samples a set of sensor tasks together, one reading each per tick, as
+	a single MultiSensorData.
+	
+	The data sets of the tasks that just step through their data set (see
+	BaseSensorSimTask.isDataSetSampled()) are stacked into one table when
+	the sampler is created, so each tick reads all of them with a single
+	array lookup. The other tasks (e.g. emulated, randomized or plant model
+	based sensors) are sampled via generateTelemetry(), as usual.
+	
+	While sampling, the sampler keeps the data set indexes itself, and the
+	tasks' latest telemetry isn't updated. Call syncTasks() before using
+	the tasks directly again, and resetIndexes() afterwards.
+	
+	"""
+	
+	def __init__(self, sensorTasks: list = None):
+		"""
+		Constructor.
+		
+		@param sensorTasks The sensor tasks to sample, in column order.
+		"""
+		self.sensorTasks = list(sensorTasks) if sensorTasks else []
+		
+		self.names = [task.getName() for task in self.sensorTasks]
+		self.typeIDs = calcLib.array([task.getTypeID() for task in self.sensorTasks], dtype = calcLib.int64)
+		
+		self.tableRows = calcLib.array( \
+			[i for i, task in enumerate(self.sensorTasks) if task.isDataSetSampled()], dtype = calcLib.intp)
+		self.otherRows = sorted(set(range(len(self.sensorTasks))) - set(self.tableRows.tolist()))
+		
+		dataEntries = [self._getDataEntries(self.sensorTasks[i]) for i in self.tableRows]
+		
+		self.tableLengths = calcLib.array([entries.size for entries in dataEntries], dtype = calcLib.intp)
+		self.table = calcLib.zeros((len(dataEntries), max(self.tableLengths, default = 0)))
+		
+		for row, entries in enumerate(dataEntries):
+			self.table[row, :entries.size] = entries
+		
+		self.rowRange = calcLib.arange(len(dataEntries))
+		self.indexes = calcLib.zeros(len(dataEntries), dtype = calcLib.intp)
+		
+		self.resetIndexes()
+	
+	def getSensorTasks(self) -> list:
+		return self.sensorTasks
+	
+	def resetIndexes(self):
+		"""
+		Reloads the data set indexes from the tasks (e.g. after they've been
+		used directly).
+		"""
+		for row, i in enumerate(self.tableRows):
+			self.indexes[row] = self.sensorTasks[i].getDataSetIndex() % self.tableLengths[row]
+	
+	def sampleTick(self) -> MultiSensorData:
+		"""
+		Reads the next value from every sensor, and advances the data set
+		indexes (wrapping around at the end of each data set).
+		
+		@return MultiSensorData With one value per sensor task, time stamped now.
+		"""
+		values = calcLib.empty(len(self.sensorTasks))
+		
+		if self.rowRange.size > 0:
+			values[self.tableRows] = self.table[self.rowRange, self.indexes]
+			
+			self.indexes += 1
+			self.indexes[self.indexes >= self.tableLengths] = 0
+		
+		for i in self.otherRows:
+			values[i] = self.sensorTasks[i].generateTelemetry().getValue()
+		
+		return MultiSensorData(names = self.names, typeIDs = self.typeIDs, values = values)
+	
+	def syncTasks(self):
+		"""
+		Writes the sampler's data set indexes back to the tasks, so their
+		next reading follows on from the last tick.
+		"""
+		for row, i in enumerate(self.tableRows):
+			self.sensorTasks[i].setDataSetIndex(int(self.indexes[row]))
+	
+	def _getDataEntries(self, sensorTask):
+		dataEntries = calcLib.asarray(sensorTask.dataSet.getDataEntries(), dtype = calcLib.float64)
+		
+		# multi-channel data sets use the first channel, as generateTelemetry() does
+		if dataEntries.ndim > 1:
+			dataEntries = dataEntries[0]
+		
+		return dataEntries.ravel()
@@ -0,0 +1,289 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import numpy as calcLib
+
+class SignalSynthesizer():
+	"""
+	Synthesizes more realistic sensor signals than a single sine wave, by
+	summing a daily cycle, a weekly cycle, a linear trend and a random-walk
+	drift, each with its own amplitude (any of which can be 0).
+	
+	Also generates colored noise - white, pink (1/f) or brown (1/f^2) - by
+	shaping the spectrum of white noise with a single real FFT, so the cost
+	is O(n log n) with no per-sample Python loops.
+	
+	All random values are drawn from the numpy Generator passed in, so the
+	output is reproducible when used with a seeded SensorDataGenerator.
+	
+	To generate a long (or endless) signal with bounded memory, see
+	createCurveStream() and ColoredNoiseStream, which carry their state from
+	one chunk to the next.
+	"""
+	
+	WHITE_NOISE = 0
+	PINK_NOISE = 1
+	BROWN_NOISE = 2
+	
+	HOURS_PER_DAY = 24.0
+	HOURS_PER_WEEK = 24.0 * 7
+	
+	DEFAULT_PEAK_HOUR = 15.0
+	
+	def __init__(self, dailyAmplitude: float = 1.0, weeklyAmplitude: float = 0.0, trendPerDay: float = 0.0, randomWalkAmplitude: float = 0.0, peakHour: float = DEFAULT_PEAK_HOUR):
+		"""
+		Constructor. All amplitudes are relative; SensorDataGenerator re-scales
+		the resulting curve to the requested floor and ceiling.
+		
+		@param dailyAmplitude The amplitude of the 24 hour cycle.
+		@param weeklyAmplitude The amplitude of the 7 day cycle.
+		@param trendPerDay The linear change per day.
+		@param randomWalkAmplitude The expected (RMS) distance the random-walk drift
+		has moved by the end of the curve.
+		@param peakHour The hour of the day (and of the first day of the week) at which
+		the daily (and weekly) cycle peaks.
+		"""
+		self.dailyAmplitude = dailyAmplitude
+		self.weeklyAmplitude = weeklyAmplitude
+		self.trendPerDay = trendPerDay
+		self.randomWalkAmplitude = randomWalkAmplitude
+		self.peakHour = peakHour
+	
+	def generateCurve(self, timeEntries = None, randomGenerator = None):
+		"""
+		Generates the composite curve for the given time entries.
+		
+		@param timeEntries The 1-D array of time entries (in hours).
+		@param randomGenerator The numpy Generator for the random-walk drift. Only
+		needed if randomWalkAmplitude isn't 0.
+		@return ndarray
+		"""
+		curveStream = self.createCurveStream(startTime = timeEntries[0], totalCount = timeEntries.size, randomGenerator = randomGenerator)
+		
+		return curveStream.generateChunk(timeEntries)
+	
+	def createCurveStream(self, startTime: float = 0.0, totalCount: int = 1, randomGenerator = None):
+		"""
+		Returns a CurveStream that generates the composite curve one chunk of
+		time entries at a time. The concatenated chunks match (up to rounding)
+		a single generateCurve() call over all 'totalCount' time entries.
+		
+		@param startTime The first time entry (in hours), from which the linear trend starts.
+		@param totalCount The total number of time entries, which scales the random-walk drift.
+		@param randomGenerator The numpy Generator for the random-walk drift. Only
+		needed if randomWalkAmplitude isn't 0.
+		@return CurveStream
+		"""
+		return CurveStream(synthesizer = self, startTime = startTime, totalCount = totalCount, randomGenerator = randomGenerator)
+	
+	@staticmethod
+	def generateColoredNoise(count: int = 1, noiseColor: int = WHITE_NOISE, randomGenerator = None):
+		"""
+		Generates 'count' noise values with a power spectral density proportional
+		to 1 / f^noiseColor - i.e. WHITE_NOISE (flat), PINK_NOISE (1/f) or
+		BROWN_NOISE (1/f^2). The result has zero mean and unit standard deviation.
+		
+		White noise is drawn directly (and is identical to randomGenerator.standard_normal()).
+		Otherwise, white noise is transformed with a real FFT, each frequency bin is
+		scaled by f^(-noiseColor / 2), and the result is transformed back.
+		
+		@param count The number of values to generate.
+		@param noiseColor The spectral exponent - WHITE_NOISE, PINK_NOISE or BROWN_NOISE.
+		@param randomGenerator The numpy Generator to draw from.
+		@return ndarray
+		"""
+		noise = randomGenerator.standard_normal(count)
+		
+		if noiseColor == SignalSynthesizer.WHITE_NOISE or count < 3:
+			return noise
+		
+		spectrum = calcLib.fft.rfft(noise)
+		frequencies = calcLib.fft.rfftfreq(count)
+		
+		# drop the DC component (which would otherwise be infinitely scaled)
+		spectrum[0] = 0.0
+		spectrum[1:] *= frequencies[1:] ** (-noiseColor / 2.0)
+		
+		noise = calcLib.fft.irfft(spectrum, n = count)
+		noiseStd = noise.std()
+		
+		if noiseStd > 0:
+			noise /= noiseStd
+		
+		return noise
+	
+	def _generateCycle(self, timeEntries = None, periodHours: float = HOURS_PER_DAY, amplitude: float = 1.0):
+		"""
+		Returns a cosine with the given period and amplitude, peaking at peakHour.
+		
+		@param timeEntries The 1-D array of time entries (in hours).
+		@param periodHours The period, in hours.
+		@param amplitude The amplitude.
+		@return ndarray
+		"""
+		cycle = timeEntries - self.peakHour
+		cycle *= 2.0 * calcLib.pi / periodHours
+		
+		calcLib.cos(cycle, out = cycle)
+		cycle *= amplitude
+		
+		return cycle
+		
+class CurveStream():
+	"""
+	Generates a SignalSynthesizer curve one chunk of time entries at a time.
+	The cycles and trend only depend on the time entries themselves, and the
+	random-walk drift continues from where the previous chunk left off, so only
+	the current chunk is ever resident.
+	
+	Chunks must be requested in order, and together cover 'totalCount' time
+	entries (to replay the curve, create a new stream with a new, identically
+	seeded, Generator).
+	"""
+	
+	def __init__(self, synthesizer: SignalSynthesizer = None, startTime: float = 0.0, totalCount: int = 1, randomGenerator = None):
+		"""
+		Constructor.
+		
+		@param synthesizer The SignalSynthesizer whose curve to generate.
+		@param startTime The first time entry (in hours), from which the linear trend starts.
+		@param totalCount The total number of time entries, which scales the random-walk drift.
+		@param randomGenerator The numpy Generator for the random-walk drift.
+		"""
+		self.synthesizer = synthesizer
+		self.startTime = startTime
+		self.randomGenerator = randomGenerator
+		self.walkOffset = 0.0
+		self.walkScale = 0.0
+		
+		if synthesizer.randomWalkAmplitude and totalCount > 1:
+			self.walkScale = synthesizer.randomWalkAmplitude / calcLib.sqrt(totalCount)
+	
+	def generateChunk(self, timeEntries = None):
+		"""
+		Generates the composite curve for the next chunk of time entries.
+		
+		@param timeEntries The 1-D array of time entries (in hours).
+		@return ndarray
+		"""
+		synthesizer = self.synthesizer
+		curveValues = calcLib.zeros(timeEntries.size)
+		
+		if synthesizer.dailyAmplitude:
+			curveValues += synthesizer._generateCycle(timeEntries, synthesizer.HOURS_PER_DAY, synthesizer.dailyAmplitude)
+		
+		if synthesizer.weeklyAmplitude:
+			curveValues += synthesizer._generateCycle(timeEntries, synthesizer.HOURS_PER_WEEK, synthesizer.weeklyAmplitude)
+		
+		if synthesizer.trendPerDay:
+			trend = timeEntries - self.startTime
+			trend *= synthesizer.trendPerDay / synthesizer.HOURS_PER_DAY
+			
+			curveValues += trend
+		
+		if self.walkScale and timeEntries.size > 0:
+			randomWalk = calcLib.cumsum(self.randomGenerator.standard_normal(timeEntries.size))
+			randomWalk *= self.walkScale
+			
+			# continue from the end of the previous chunk
+			randomWalk += self.walkOffset
+			
+			self.walkOffset = randomWalk[-1]
+			curveValues += randomWalk
+		
+		return curveValues
+		
+class ColoredNoiseStream():
+	"""
+	Generates colored noise one chunk at a time, with bounded memory. This is
+	the streaming counterpart of SignalSynthesizer.generateColoredNoise(), which
+	has to shape the whole series at once.
+	
+	White noise is passed through a bank of first-order (AR(1)) low-pass
+	sections, whose state is carried from one chunk to the next:
+	
+	- BROWN_NOISE: a single leaky integrator, with its corner OCTAVE_COUNT
+	  octaves below the Nyquist frequency, so the spectrum falls off as 1/f^2
+	  above it (and is flat below, which keeps an endless stream bounded).
+	- PINK_NOISE: one section per octave over the same range, weighted so
+	  their sum falls off as 1/f.
+	
+	The filter state starts out drawn from its stationary distribution, so the
+	noise has zero mean and unit variance from the first value on. The result
+	has the same spectrum as generateColoredNoise(), but not the same values.
+	Within a chunk, each section is evaluated with a log-step prefix scan, so
+	the cost is O(n log n) with no per-sample Python loops.
+	"""
+	
+	OCTAVE_COUNT = 12
+	
+	def __init__(self, noiseColor: int = SignalSynthesizer.WHITE_NOISE, randomGenerator = None):
+		"""
+		Constructor.
+		
+		@param noiseColor WHITE_NOISE, PINK_NOISE or BROWN_NOISE.
+		@param randomGenerator The numpy Generator to draw from.
+		"""
+		self.randomGenerator = randomGenerator
+		
+		if noiseColor == SignalSynthesizer.PINK_NOISE:
+			cornerFrequencies = 0.5 ** calcLib.arange(1, self.OCTAVE_COUNT + 1)
+		elif noiseColor == SignalSynthesizer.BROWN_NOISE:
+			cornerFrequencies = calcLib.array([0.5 ** (self.OCTAVE_COUNT + 1)])
+		else:
+			cornerFrequencies = calcLib.empty(0)
+		
+		self.poles = calcLib.exp(-2.0 * calcLib.pi * cornerFrequencies)
+		
+		# each section's low frequency power is (weight / (1 - pole))^2, which must be ~1/f for pink noise
+		if noiseColor == SignalSynthesizer.PINK_NOISE:
+			self.weights = (1.0 - self.poles) / calcLib.sqrt(cornerFrequencies)
+		else:
+			self.weights = calcLib.ones(self.poles.size)
+		
+		self.noiseStd = 1.0
+		self.state = calcLib.empty(0)
+		
+		if self.poles.size:
+			# the (stationary) covariance of the sections, which share the same white noise
+			covariance = calcLib.outer(self.weights, self.weights) / (1.0 - calcLib.outer(self.poles, self.poles))
+			
+			self.noiseStd = calcLib.sqrt(covariance.sum())
+			self.state = randomGenerator.multivariate_normal(calcLib.zeros(self.poles.size), covariance, method = 'eigh')
+	
+	def generateChunk(self, count: int = 1):
+		"""
+		Generates the next 'count' noise values.
+		
+		@param count The number of values to generate.
+		@return ndarray
+		"""
+		noise = self.randomGenerator.standard_normal(count)
+		
+		if not self.poles.size or count < 1:
+			return noise
+		
+		# y[k] = pole * y[k - 1] + weight * x[k], for all sections at once
+		sections = calcLib.outer(self.weights, noise)
+		poles = self.poles.reshape(-1, 1)
+		stepPoles = poles.copy()
+		step = 1
+		
+		while step < count:
+			sections[:, step:] += stepPoles * sections[:, :-step]
+			stepPoles *= stepPoles
+			step *= 2
+		
+		sections += (poles ** calcLib.arange(1, count + 1)) * self.state.reshape(-1, 1)
+		self.state = sections[:, -1].copy()
+		
+		noise = sections.sum(axis = 0)
+		noise /= self.noiseStd
+		
+		return noise
@@ -0,0 +1,234 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import os
+import re
+
+from array import array
+from datetime import datetime
+
+import numpy as calcLib
+
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataSet
+
+class SimTestDataLoader():
+	"""
+	Loads recorded or simulated sensor data files (e.g. those in 'simTestData')
+	into SensorDataSet instances.
+	
+	The files contain a single 'sensorDataList' of fully expanded SensorData
+	objects. Instead of decoding each object into a dict, the file is scanned
+	in fixed-size blocks and only the 'timeOffsetSeconds' and 'value' fields
+	are extracted, straight into compact arrays - so memory use is bounded by
+	the block size plus the two result arrays, regardless of the file size.
+	
+	Optionally, the extracted arrays are saved to a compact .npz sidecar next
+	to the source file, which later loads use automatically as long as the
+	source file hasn't changed.
+	"""
+	
+	DEFAULT_BLOCK_SIZE = 1024 * 1024
+	SIDECAR_FILE_EXT = '.npz'
+	
+	TIME_OFFSET_FIELD = b'timeOffsetSeconds'
+	VALUE_FIELD = b'value'
+	TIME_STAMP_FIELD = b'timeStamp'
+	
+	# matches '"timeOffsetSeconds": <number>' and '"value": <number>'
+	FIELD_PATTERN = re.compile(rb'"(timeOffsetSeconds|value)"\s*:\s*(-?[0-9][0-9.eE+\-]*)')
+	TIME_STAMP_PATTERN = re.compile(rb'"timeStamp"\s*:\s*"([^"]*)"')
+	
+	def __init__(self, blockSize: int = DEFAULT_BLOCK_SIZE):
+		"""
+		Constructor.
+		
+		@param blockSize The number of bytes read from the file at once.
+		"""
+		self.blockSize = max(1024, blockSize)
+	
+	def loadSensorDataSet(self, fileName: str = None, useSidecar: bool = True, useCurrentTime: bool = True) -> SensorDataSet:
+		"""
+		Loads the given sensor data file as a SensorDataSet. The time entries are
+		in hours (timeOffsetSeconds / 3600), matching SensorDataGenerator.
+		
+		@param fileName The JSON file to load.
+		@param useSidecar Defaults to True. If True, an up-to-date .npz sidecar is
+		used if present, and created if not.
+		@param useCurrentTime If True (default), the current time (since Epoch) will
+		be used as the starting time. If False, the time stamp of the first entry
+		is used.
+		@return SensorDataSet
+		"""
+		timeOffsets = None
+		
+		if useSidecar:
+			timeOffsets, dataValues, epochOffsetSeconds = self._loadSidecar(fileName)
+		
+		if timeOffsets is None:
+			timeOffsets, dataValues, epochOffsetSeconds = self.parseSensorDataFile(fileName)
+			
+			if useSidecar:
+				self._saveSidecar(fileName, timeOffsets, dataValues, epochOffsetSeconds)
+		
+		timeEntries = timeOffsets / 3600.0
+		
+		return SensorDataSet( \
+			epochOffsetSeconds = epochOffsetSeconds, useCurrentTime = useCurrentTime, \
+			timeEntries = timeEntries, dataEntries = dataValues)
+	
+	def convertToSidecar(self, fileName: str = None) -> str:
+		"""
+		Parses the given sensor data file and (re-)writes its .npz sidecar.
+		
+		@param fileName The JSON file to convert.
+		@return str The sidecar file name, or None if it couldn't be written.
+		"""
+		timeOffsets, dataValues, epochOffsetSeconds = self.parseSensorDataFile(fileName)
+		
+		return self._saveSidecar(fileName, timeOffsets, dataValues, epochOffsetSeconds)
+	
+	def getSidecarFileName(self, fileName: str = None) -> str:
+		"""
+		Returns the sidecar file name for the given sensor data file.
+		
+		@param fileName The JSON file name.
+		@return str
+		"""
+		return os.path.splitext(fileName)[0] + self.SIDECAR_FILE_EXT
+	
+	def parseSensorDataFile(self, fileName: str = None) -> tuple:
+		"""
+		Incrementally extracts the time offsets and values from the given file.
+		
+		@param fileName The JSON file to parse.
+		@return tuple (timeOffsets, dataValues, epochOffsetSeconds) - two float64
+		ndarrays, and the time (in seconds since Epoch) of the first entry, or 0.0
+		if it has no time stamp.
+		"""
+		timeOffsets = array('d')
+		dataValues = array('d')
+		epochOffsetSeconds = None
+		remainder = b''
+		
+		with open(fileName, 'rb') as fileRef:
+			while True:
+				block = fileRef.read(self.blockSize)
+				buffer = remainder + block
+				
+				# only scan up to the last complete object - the rest is
+				# carried over, so no field is ever split across two blocks
+				endIndex = buffer.rfind(b'}') + 1 if block else len(buffer)
+				
+				if epochOffsetSeconds is None:
+					epochOffsetSeconds = self._parseTimeStamp(buffer[:endIndex])
+				
+				for fieldName, fieldValue in self.FIELD_PATTERN.findall(buffer, 0, endIndex):
+					if fieldName == self.TIME_OFFSET_FIELD:
+						timeOffsets.append(float(fieldValue))
+					else:
+						dataValues.append(float(fieldValue))
+				
+				remainder = buffer[endIndex:]
+				
+				if not block:
+					break
+		
+		if len(timeOffsets) != len(dataValues):
+			raise ValueError("Mismatched '%s' and '%s' field counts in %s: %s, %s" % \
+				(self.TIME_OFFSET_FIELD.decode(), self.VALUE_FIELD.decode(), fileName, len(timeOffsets), len(dataValues)))
+		
+		logging.info("Parsed %s sensor data entries from %s", len(dataValues), fileName)
+		
+		return ( \
+			calcLib.frombuffer(timeOffsets, dtype = calcLib.float64), \
+			calcLib.frombuffer(dataValues, dtype = calcLib.float64), \
+			epochOffsetSeconds or 0.0)
+	
+	def _loadSidecar(self, fileName: str = None) -> tuple:
+		"""
+		Loads the sidecar for the given file, if it exists and matches the
+		source file's current size and modification time.
+		
+		@param fileName The JSON file name.
+		@return tuple (timeOffsets, dataValues, epochOffsetSeconds), or (None, None, None).
+		"""
+		sidecarFileName = self.getSidecarFileName(fileName)
+		
+		if not os.path.isfile(sidecarFileName):
+			return (None, None, None)
+		
+		try:
+			sourceStat = os.stat(fileName)
+			
+			with calcLib.load(sidecarFileName) as sidecar:
+				if int(sidecar['sourceSize']) != sourceStat.st_size or int(sidecar['sourceModifiedTime']) != sourceStat.st_mtime_ns:
+					logging.info("Sidecar %s is out of date. Ignoring.", sidecarFileName)
+					return (None, None, None)
+				
+				logging.info("Loaded sensor data from sidecar %s", sidecarFileName)
+				
+				return (sidecar['timeOffsets'], sidecar['dataValues'], float(sidecar['epochOffsetSeconds']))
+		except Exception as e:
+			logging.warning("Failed to load sidecar %s. Ignoring: %s", sidecarFileName, e)
+		
+		return (None, None, None)
+	
+	def _parseTimeStamp(self, buffer: bytes = None) -> float:
+		"""
+		Returns the first time stamp in the buffer as seconds since Epoch.
+		
+		@param buffer The bytes to search.
+		@return float The time stamp, or None if not found (or invalid).
+		"""
+		match = self.TIME_STAMP_PATTERN.search(buffer)
+		
+		if match:
+			try:
+				return datetime.fromisoformat(match.group(1).decode('utf-8')).timestamp()
+			except ValueError:
+				logging.warning("Invalid time stamp: %s", match.group(1))
+		
+		return None
+	
+	def _saveSidecar(self, fileName: str = None, timeOffsets = None, dataValues = None, epochOffsetSeconds: float = 0.0) -> str:
+		"""
+		Writes the sidecar for the given file, tagged with the source file's
+		size and modification time.
+		
+		@param fileName The JSON file name.
+		@param timeOffsets The time offsets (in seconds).
+		@param dataValues The data values.
+		@param epochOffsetSeconds The time of the first entry (in seconds since Epoch).
+		@return str The sidecar file name, or None if it couldn't be written.
+		"""
+		sidecarFileName = self.getSidecarFileName(fileName)
+		tempFileName = sidecarFileName + '.' + str(os.getpid()) + '.tmp'
+		
+		try:
+			sourceStat = os.stat(fileName)
+			
+			with open(tempFileName, 'wb') as fileRef:
+				calcLib.savez(fileRef, \
+					timeOffsets = timeOffsets, dataValues = dataValues, epochOffsetSeconds = epochOffsetSeconds, \
+					sourceSize = sourceStat.st_size, sourceModifiedTime = sourceStat.st_mtime_ns)
+			
+			os.replace(tempFileName, sidecarFileName)
+			
+			logging.info("Saved sensor data sidecar %s", sidecarFileName)
+			
+			return sidecarFileName
+		except OSError as e:
+			logging.warning("Failed to save sidecar %s: %s", sidecarFileName, e)
+			
+			if os.path.exists(tempFileName):
+				os.remove(tempFileName)
+		
+		return None
+		
@@ -0,0 +1,281 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+
+import numpy as calcLib
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.data.ActuatorData import ActuatorData
+
+class ZonePlantModel():
+	"""
+	Vectorized thermal / humidity model of one or more zones (rooms), which
+	closes the loop between the actuator and sensor sim tasks: HVAC and
+	humidifier commands change the zone state, and the temperature and
+	humidity sensor sim tasks read it back.
+	
+	Each zone is a lumped thermal mass, coupled to the outside temperature
+	through a thermal resistance:
+	
+	  C * dT/dt = (outsideTemp - T) / R + hvacPower
+	
+	When its HVAC is on, a zone is driven towards the HVAC setpoint (the
+	ActuatorData value) with a proportional controller, saturated at
+	+/- maxHvacPower watts. Humidity relaxes towards the outside humidity
+	with a time constant, and an active humidifier adds moisture at a fixed
+	rate until its setpoint is reached.
+	
+	All zone state and parameters are arrays (parameters may also be scalars
+	shared by all zones), so step() advances every zone at once. The passive
+	part of each step is integrated exactly (exponential decay towards the
+	equilibrium temperature), so large time steps remain stable.
+	"""
+	
+	DEFAULT_ZONE_TEMP = 20.0
+	DEFAULT_ZONE_HUMIDITY = 40.0
+	DEFAULT_OUTSIDE_TEMP = 10.0
+	DEFAULT_OUTSIDE_HUMIDITY = 60.0
+	
+	# a small room: ~2 MJ/K thermal mass, ~100 W/K envelope loss (5.5 hour time constant)
+	DEFAULT_THERMAL_MASS = 2.0e6
+	DEFAULT_THERMAL_RESISTANCE = 0.01
+	DEFAULT_MAX_HVAC_POWER = 3000.0
+	DEFAULT_HVAC_GAIN = 1000.0
+	
+	DEFAULT_HUMIDITY_TIME_CONSTANT = 7200.0
+	DEFAULT_HUMIDIFIER_RATE = 10.0 / 3600.0
+	
+	MIN_HUMIDITY = 0.0
+	MAX_HUMIDITY = 100.0
+	
+	def __init__(self, zoneCount: int = 1, zoneTemp = DEFAULT_ZONE_TEMP, zoneHumidity = DEFAULT_ZONE_HUMIDITY, outsideTemp = DEFAULT_OUTSIDE_TEMP, outsideHumidity = DEFAULT_OUTSIDE_HUMIDITY, thermalMass = DEFAULT_THERMAL_MASS, thermalResistance = DEFAULT_THERMAL_RESISTANCE, maxHvacPower = DEFAULT_MAX_HVAC_POWER):
+		"""
+		Constructor.
+		
+		@param zoneCount The number of zones.
+		@param zoneTemp The initial zone temperature(s), in C.
+		@param zoneHumidity The initial zone relative humidity(s), in %.
+		@param outsideTemp The outside temperature(s), in C.
+		@param outsideHumidity The outside relative humidity(s), in %.
+		@param thermalMass The zone thermal mass(es), in J/K.
+		@param thermalResistance The zone thermal resistance(s) to the outside, in K/W.
+		@param maxHvacPower The maximum HVAC heating / cooling power(s), in W.
+		"""
+		self.zoneCount = max(1, int(zoneCount))
+		
+		self.zoneTemps = self._createZoneArray(zoneTemp)
+		self.zoneHumidities = self._createZoneArray(zoneHumidity)
+		
+		self.hvacEnabled = calcLib.zeros(self.zoneCount, dtype = bool)
+		self.hvacSetpoints = self.zoneTemps.copy()
+		self.humidifierEnabled = calcLib.zeros(self.zoneCount, dtype = bool)
+		self.humidifierSetpoints = self.zoneHumidities.copy()
+		
+		self.setOutsideConditions(outsideTemp = outsideTemp, outsideHumidity = outsideHumidity)
+		
+		self.thermalMass = calcLib.asarray(thermalMass, dtype = calcLib.float64)
+		self.thermalResistance = calcLib.asarray(thermalResistance, dtype = calcLib.float64)
+		self.maxHvacPower = calcLib.asarray(maxHvacPower, dtype = calcLib.float64)
+		self.hvacGain = self.DEFAULT_HVAC_GAIN
+		self.humidityTimeConstant = self.DEFAULT_HUMIDITY_TIME_CONSTANT
+		self.humidifierRate = self.DEFAULT_HUMIDIFIER_RATE
+		
+		self.elapsedSeconds = 0.0
+		
+		logging.info("Created zone plant model with %d zones.", self.zoneCount)
+	
+	def applyActuatorData(self, data: ActuatorData = None, zoneIndexes = 0) -> bool:
+		"""
+		Applies an HVAC or humidifier command to the given zone(s). A COMMAND_ON
+		enables the actuator with the ActuatorData value as its setpoint, and
+		a COMMAND_OFF disables it. Other actuator types are ignored.
+		
+		@param data The ActuatorData command.
+		@param zoneIndexes The zone index, or an array (or slice) of zone indexes.
+		@return bool True if the command was applied; False otherwise.
+		"""
+		if not data:
+			return False
+		
+		isOn = data.getCommand() == ConfigConst.COMMAND_ON
+		
+		if data.getTypeID() == ConfigConst.HVAC_ACTUATOR_TYPE:
+			self.hvacEnabled[zoneIndexes] = isOn
+			
+			if isOn:
+				self.hvacSetpoints[zoneIndexes] = data.getValue()
+		elif data.getTypeID() == ConfigConst.HUMIDIFIER_ACTUATOR_TYPE:
+			self.humidifierEnabled[zoneIndexes] = isOn
+			
+			if isOn:
+				self.humidifierSetpoints[zoneIndexes] = data.getValue()
+		else:
+			logging.debug("Ignoring actuator type for zone plant model: %s", str(data.getTypeID()))
+			return False
+		
+		return True
+	
+	def getElapsedSeconds(self) -> float:
+		"""
+		Returns the simulated time, in seconds, that the model has been stepped.
+		
+		@return float
+		"""
+		return self.elapsedSeconds
+	
+	def getHumidities(self):
+		"""
+		Returns the zone relative humidity array (not a copy).
+		"""
+		return self.zoneHumidities
+	
+	def getHvacEnabled(self):
+		"""
+		Returns the boolean array of zones whose HVAC is on (not a copy).
+		"""
+		return self.hvacEnabled
+	
+	def getSensorValue(self, typeID: int = ConfigConst.TEMP_SENSOR_TYPE, zoneIndex: int = 0) -> float:
+		"""
+		Returns the current value a sensor of 'typeID' reads in the given zone.
+		
+		@param typeID ConfigConst.TEMP_SENSOR_TYPE or ConfigConst.HUMIDITY_SENSOR_TYPE.
+		@param zoneIndex The zone index.
+		@return float, or None if the model doesn't provide the sensor type.
+		"""
+		sensorValues = self.getSensorValues(typeID)
+		
+		if sensorValues is None:
+			return None
+		
+		return float(sensorValues[zoneIndex])
+	
+	def getSensorValues(self, typeID: int = ConfigConst.TEMP_SENSOR_TYPE):
+		"""
+		Returns the zone array read by sensors of 'typeID' (not a copy).
+		
+		@param typeID ConfigConst.TEMP_SENSOR_TYPE or ConfigConst.HUMIDITY_SENSOR_TYPE.
+		@return ndarray, or None if the model doesn't provide the sensor type.
+		"""
+		if typeID == ConfigConst.TEMP_SENSOR_TYPE:
+			return self.zoneTemps
+		
+		if typeID == ConfigConst.HUMIDITY_SENSOR_TYPE:
+			return self.zoneHumidities
+		
+		return None
+	
+	def getTemperatures(self):
+		"""
+		Returns the zone temperature array (not a copy).
+		"""
+		return self.zoneTemps
+	
+	def getZoneCount(self) -> int:
+		return self.zoneCount
+	
+	def runControlLoop(self, tempFloor: float = 18.0, tempCeiling: float = 20.0, timeStep: float = 60.0, stepCount: int = 1) -> int:
+		"""
+		Runs the on-device HVAC control loop (see updateHvacControl()) for all
+		zones, followed by step(), 'stepCount' times.
+		
+		@param tempFloor The temperature below which the HVAC is turned on.
+		@param tempCeiling The temperature above which the HVAC is turned on.
+		@param timeStep The time step, in seconds.
+		@param stepCount The number of control loop iterations.
+		@return int The total number of HVAC commands (ON or OFF) issued.
+		"""
+		commandCount = 0
+		
+		for _ in range(stepCount):
+			commandCount += int(calcLib.count_nonzero(self.updateHvacControl(tempFloor = tempFloor, tempCeiling = tempCeiling)))
+			self.step(timeStep)
+		
+		return commandCount
+	
+	def setOutsideConditions(self, outsideTemp = None, outsideHumidity = None):
+		"""
+		Sets the outside temperature and / or humidity (scalars, or one value per zone).
+		
+		@param outsideTemp The outside temperature(s), in C. If None, unchanged.
+		@param outsideHumidity The outside relative humidity(s), in %. If None, unchanged.
+		"""
+		if outsideTemp is not None:
+			self.outsideTemp = calcLib.asarray(outsideTemp, dtype = calcLib.float64)
+		
+		if outsideHumidity is not None:
+			self.outsideHumidity = calcLib.asarray(outsideHumidity, dtype = calcLib.float64)
+	
+	def step(self, timeStep: float = 60.0):
+		"""
+		Advances all zones by 'timeStep' seconds. The HVAC power is evaluated
+		at the start of the step and held constant during it.
+		
+		@param timeStep The time step, in seconds.
+		"""
+		hvacPower = calcLib.where( \
+			self.hvacEnabled, \
+			calcLib.clip(self.hvacGain * (self.hvacSetpoints - self.zoneTemps), -self.maxHvacPower, self.maxHvacPower), \
+			0.0)
+		
+		# exact solution for constant power: exponential decay towards
+		# the equilibrium temperature, with time constant R * C
+		equilibriumTemps = self.outsideTemp + hvacPower * self.thermalResistance
+		tempDecay = calcLib.exp(-timeStep / (self.thermalResistance * self.thermalMass))
+		
+		self.zoneTemps *= tempDecay
+		self.zoneTemps += equilibriumTemps * (1.0 - tempDecay)
+		
+		humidityDecay = calcLib.exp(-timeStep / self.humidityTimeConstant)
+		
+		self.zoneHumidities *= humidityDecay
+		self.zoneHumidities += self.outsideHumidity * (1.0 - humidityDecay)
+		
+		# an active humidifier adds moisture, but won't overshoot its setpoint
+		humidifying = self.humidifierEnabled & (self.zoneHumidities < self.humidifierSetpoints)
+		
+		self.zoneHumidities += \
+			calcLib.where(humidifying, calcLib.minimum(self.humidifierRate * timeStep, self.humidifierSetpoints - self.zoneHumidities), 0.0)
+		
+		calcLib.clip(self.zoneHumidities, self.MIN_HUMIDITY, self.MAX_HUMIDITY, out = self.zoneHumidities)
+		
+		self.elapsedSeconds += timeStep
+	
+	def updateHvacControl(self, tempFloor: float = 18.0, tempCeiling: float = 20.0):
+		"""
+		Applies the on-device HVAC rule (see the 'triggerHvacTempFloor' and
+		'triggerHvacTempCeiling' properties) to all zones at once: zones outside
+		[tempFloor, tempCeiling] turn their HVAC on, with a setpoint halfway
+		between the two, and zones back within range turn it off.
+		
+		@param tempFloor The temperature below which the HVAC is turned on.
+		@param tempCeiling The temperature above which the HVAC is turned on.
+		@return ndarray The boolean array of zones whose HVAC command changed.
+		"""
+		outOfRange = (self.zoneTemps < tempFloor) | (self.zoneTemps > tempCeiling)
+		
+		turnOn = outOfRange & ~self.hvacEnabled
+		turnOff = ~outOfRange & self.hvacEnabled
+		
+		# keep running until the setpoint is (nearly) reached, to avoid
+		# cycling the HVAC at the edges of the range
+		targetTemp = (tempFloor + tempCeiling) / 2.0
+		turnOff &= calcLib.abs(self.zoneTemps - targetTemp) <= (tempCeiling - tempFloor) / 4.0
+		
+		self.hvacSetpoints[turnOn] = targetTemp
+		self.hvacEnabled[turnOn] = True
+		self.hvacEnabled[turnOff] = False
+		
+		return turnOn | turnOff
+	
+	def _createZoneArray(self, initialValue):
+		return calcLib.array(calcLib.broadcast_to(calcLib.asarray(initialValue, dtype = calcLib.float64), (self.zoneCount,)))
+	
@@ -1,15 +1,14 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
 import logging
-
-from importlib import import_module
+import threading
 
 import programmingtheiot.common.ConfigConst as ConfigConst
 from programmingtheiot.common.ConfigUtil import ConfigUtil
@@ -17,20 +16,170 @@ from programmingtheiot.common.IDataMessageListener import IDataMessageListener
 
 from programmingtheiot.data.ActuatorData import ActuatorData
 
-from programmingtheiot.cda.sim.HvacActuatorSimTask import HvacActuatorSimTask
-from programmingtheiot.cda.sim.HumidifierActuatorSimTask import HumidifierActuatorSimTask
+from programmingtheiot.cda.system.ActuatorDispatchQueue import ActuatorDispatchQueue
+from programmingtheiot.cda.system.TaskRegistry import TaskRegistry
 
 class ActuatorAdapterManager(object):
 	"""
-	Shell representation of class for student implementation.
+	Routes actuator commands to the HVAC, humidifier and (if emulated) LED
+	display actuator tasks.
+	
+	Each actuator task has its own bounded ActuatorDispatchQueue and worker
+	thread, so sendActuatorCommand() only queues the command and returns;
+	it never blocks the caller (e.g. the MQTT or CoAP network thread) on a
+	slow actuator. Responses are passed to the data message listener's
+	handleActuatorCommandResponse() from the actuator's worker thread.
+	
+	The actuator tasks are loaded via a TaskRegistry, and each one (along
+	with its dispatch queue) is only created when its first command arrives.
+	
+	The worker threads only run between startManager() and stopManager()
+	(called by DeviceDataManager), and commands are rejected otherwise.
 	
 	"""
 	
 	def __init__(self):
-		pass
-
+		configUtil = ConfigUtil()
+		
+		self.useEmulator = \
+			configUtil.getBoolean( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.ENABLE_EMULATOR_KEY)
+		
+		self.queueSize = \
+			configUtil.getInteger( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.ACTUATOR_QUEUE_SIZE_KEY, defaultVal = ConfigConst.DEFAULT_ACTUATOR_QUEUE_SIZE)
+		
+		self.dataMsgListener = None
+		self.isRunning = False
+		
+		self.taskRegistry = TaskRegistry(useEmulator = self.useEmulator)
+		
+		self.dispatchQueues = {}
+		self.dispatchLock = threading.Lock()
+	
+	def getActuatorMetrics(self) -> dict:
+		"""
+		Returns the dispatch metrics for each actuator that has received a
+		command, keyed by actuator name. See ActuatorDispatchQueue.getMetrics()
+		for the individual metrics.
+		
+		@return dict
+		"""
+		with self.dispatchLock:
+			dispatchQueues = list(self.dispatchQueues.values())
+		
+		return {dispatchQueue.getName(): dispatchQueue.getMetrics() for dispatchQueue in dispatchQueues}
+	
+	def getActuatorTask(self, typeID: int):
+		"""
+		Returns the actuator task for 'typeID', loading it if needed.
+		
+		@param typeID The actuator type ID.
+		@return The actuator task, or None if there's no actuator for 'typeID'.
+		"""
+		return self.taskRegistry.getTask(typeID)
+	
 	def sendActuatorCommand(self, data: ActuatorData) -> bool:
-		pass
+		"""
+		Queues the command in 'data' for its actuator task. This doesn't wait
+		for the command to be applied; see the class description.
+		
+		@param data The ActuatorData command.
+		@return bool True if queued; False if 'data' is invalid, a response,
+		or has no matching actuator.
+		"""
+		if not data:
+			logging.warning("Actuator command is None. Ignoring.")
+			return False
+		
+		if data.isResponseFlagEnabled():
+			logging.warning("Actuator command is a response. Ignoring: %s", data.getName())
+			return False
+		
+		if not self.taskRegistry.hasTask(data.getTypeID()):
+			logging.warning("No actuator for type ID %s. Ignoring command.", str(data.getTypeID()))
+			return False
+		
+		dispatchQueue = self._getDispatchQueue(data.getTypeID())
+		
+		if not dispatchQueue:
+			return False
+		
+		return dispatchQueue.enqueue(data)
 	
 	def setDataMessageListener(self, listener: IDataMessageListener) -> bool:
-		pass
+		if listener:
+			self.dataMsgListener = listener
+			return True
+		
+		return False
+	
+	def startManager(self) -> bool:
+		with self.dispatchLock:
+			if self.isRunning:
+				logging.warning("ActuatorAdapterManager already started. Ignoring.")
+				return False
+			
+			self.isRunning = True
+			
+			for dispatchQueue in self.dispatchQueues.values():
+				dispatchQueue.startWorker()
+		
+		logging.info("Started ActuatorAdapterManager.")
+		return True
+	
+	def stopManager(self) -> bool:
+		with self.dispatchLock:
+			if not self.isRunning:
+				logging.warning("ActuatorAdapterManager already stopped. Ignoring.")
+				return False
+			
+			self.isRunning = False
+			dispatchQueues = list(self.dispatchQueues.values())
+		
+		for dispatchQueue in dispatchQueues:
+			dispatchQueue.stopWorker()
+		
+		logging.info("Stopped ActuatorAdapterManager.")
+		return True
+	
+	def _handleActuatorResponse(self, response: ActuatorData):
+		logging.debug("Actuator response received: %s", str(response))
+		
+		if self.dataMsgListener:
+			self.dataMsgListener.handleActuatorCommandResponse(response)
+	
+	def _getDispatchQueue(self, typeID: int) -> ActuatorDispatchQueue:
+		"""
+		Returns the dispatch queue for 'typeID', creating it (and loading its
+		actuator task) if this is the first command for 'typeID'.
+		
+		@param typeID The actuator type ID.
+		@return ActuatorDispatchQueue, or None if the actuator task couldn't be loaded.
+		"""
+		with self.dispatchLock:
+			dispatchQueue = self.dispatchQueues.get(typeID)
+		
+		if dispatchQueue:
+			return dispatchQueue
+		
+		try:
+			actuatorTask = self.taskRegistry.getTask(typeID)
+		except Exception as e:
+			logging.exception("Failed to load actuator for type ID %d: %s", typeID, str(e))
+			return None
+		
+		with self.dispatchLock:
+			dispatchQueue = self.dispatchQueues.get(typeID)
+			
+			if not dispatchQueue:
+				dispatchQueue = \
+					ActuatorDispatchQueue( \
+						actuatorTask = actuatorTask, responseHandler = self._handleActuatorResponse, maxSize = self.queueSize)
+				
+				self.dispatchQueues[typeID] = dispatchQueue
+				
+				if self.isRunning:
+					dispatchQueue.startWorker()
+			
+			return dispatchQueue
@@ -0,0 +1,256 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import queue
+import threading
+
+from time import monotonic
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.data.ActuatorData import ActuatorData
+
+class ActuatorDispatchQueue():
+	"""
+	A bounded command queue, and worker thread, for a single actuator task.
+	
+	Commands are queued by enqueue() - which never blocks - and applied in
+	order by the worker thread, which passes each response to the
+	'responseHandler' callback. If the queue is full, the oldest queued
+	command is dropped in favor of the newest.
+	
+	If the actuator task holds back a debounced or rate limited command
+	(see BaseActuatorSimTask), the worker applies it once it's due. The
+	responses to suppressed (no-op, debounced or rate limited) commands are
+	passed to 'responseHandler' too, and counted per status code.
+	
+	A command that raises is logged and counted as failed, and the worker
+	carries on with the next one. stopWorker() never drops queued commands:
+	new commands are rejected once it's called, and the worker stops after
+	applying the ones already queued.
+	
+	"""
+	
+	SUPPRESSED_STATUS_CODES = ( \
+		ConfigConst.ACTUATOR_NO_OP_STATUS, \
+		ConfigConst.ACTUATOR_DEBOUNCED_STATUS, \
+		ConfigConst.ACTUATOR_RATE_LIMITED_STATUS)
+	
+	def __init__(self, actuatorTask = None, responseHandler = None, maxSize: int = ConfigConst.DEFAULT_ACTUATOR_QUEUE_SIZE):
+		"""
+		Constructor for ActuatorDispatchQueue.
+		
+		@param actuatorTask The actuator task that applies the commands.
+		@param responseHandler The callable invoked (on the worker thread) with each response.
+		@param maxSize The max number of queued commands.
+		"""
+		if maxSize <= 0:
+			maxSize = ConfigConst.DEFAULT_ACTUATOR_QUEUE_SIZE
+		
+		self.actuatorTask = actuatorTask
+		self.responseHandler = responseHandler
+		self.maxSize = maxSize
+		
+		self.commandQueue = queue.Queue(maxsize = maxSize)
+		self.enqueueLock = threading.Lock()
+		self.metricsLock = threading.Lock()
+		self.workerThread = None
+		self.stopEvent = threading.Event()
+		
+		self.enqueuedCount = 0
+		self.droppedCount = 0
+		self.processedCount = 0
+		self.failedCount = 0
+		self.suppressedCounts = {}
+		self.maxQueueDepth = 0
+		self.lastLatency = 0.0
+		self.maxLatency = 0.0
+		self.totalLatency = 0.0
+	
+	def enqueue(self, data: ActuatorData) -> bool:
+		"""
+		Queues a copy of 'data' for the worker thread, dropping the oldest
+		queued command if the queue is full. This never blocks.
+		
+		@param data The ActuatorData command.
+		@return bool True if queued; False if the worker isn't running (or is stopping).
+		"""
+		command = ActuatorData(typeID = data.getTypeID(), name = data.getName())
+		command.updateData(data)
+		
+		# checked under the enqueue lock, so nothing is queued after stopWorker()'s sentinel
+		with self.enqueueLock:
+			if not self.isRunning() or self.stopEvent.is_set():
+				logging.warning("Dispatch queue for %s isn't running. Ignoring command.", self.getName())
+				return False
+			
+			self._offer((monotonic(), command))
+		
+		with self.metricsLock:
+			self.enqueuedCount += 1
+			self.maxQueueDepth = max(self.maxQueueDepth, self.commandQueue.qsize())
+		
+		return True
+	
+	def getMetrics(self) -> dict:
+		"""
+		Returns a snapshot of the dispatch metrics. Latencies are in seconds,
+		measured from enqueue() to the actuator task returning its response.
+		
+		@return dict With keys 'queueDepth', 'maxQueueDepth', 'enqueuedCount',
+		'droppedCount', 'processedCount', 'failedCount', 'suppressedCounts'
+		(a dict of suppressed status code to count), 'lastLatency', 'avgLatency'
+		and 'maxLatency'.
+		"""
+		with self.metricsLock:
+			avgLatency = self.totalLatency / self.processedCount if self.processedCount > 0 else 0.0
+			
+			return { \
+				'queueDepth': self.commandQueue.qsize(), \
+				'maxQueueDepth': self.maxQueueDepth, \
+				'enqueuedCount': self.enqueuedCount, \
+				'droppedCount': self.droppedCount, \
+				'processedCount': self.processedCount, \
+				'failedCount': self.failedCount, \
+				'suppressedCounts': dict(self.suppressedCounts), \
+				'lastLatency': self.lastLatency, \
+				'avgLatency': avgLatency, \
+				'maxLatency': self.maxLatency }
+	
+	def getName(self) -> str:
+		return self.actuatorTask.getName()
+	
+	def isRunning(self) -> bool:
+		return self.workerThread is not None and self.workerThread.is_alive()
+	
+	def startWorker(self) -> bool:
+		if self.isRunning():
+			logging.warning("Dispatch worker for %s already started. Ignoring.", self.getName())
+			return False
+		
+		self.stopEvent.clear()
+		self.workerThread = threading.Thread( \
+			target = self._runWorker, name = self.getName() + '-dispatch', daemon = True)
+		self.workerThread.start()
+		
+		return True
+	
+	def stopWorker(self, timeout: float = ConfigConst.DEFAULT_TIMEOUT) -> bool:
+		"""
+		Stops the worker thread once it has applied the commands already queued.
+		
+		@param timeout The max time, in seconds, to wait for the worker to finish.
+		@return bool True if the worker was stopped; False if it wasn't running.
+		"""
+		if not self.isRunning():
+			return False
+		
+		with self.enqueueLock:
+			self.stopEvent.set()
+		
+		# the sentinel just wakes the worker - it's a blocking put, so it
+		# never evicts a queued command, and no more can be queued after it
+		try:
+			self.commandQueue.put(None, timeout = timeout)
+		except queue.Full:
+			logging.warning("Dispatch queue for %s is still full. Worker not stopped.", self.getName())
+			return False
+		
+		self.workerThread.join(timeout)
+		
+		return not self.workerThread.is_alive()
+	
+	def _handleResponse(self, response: ActuatorData):
+		if not response:
+			return
+		
+		statusCode = response.getStatusCode()
+		
+		if statusCode in self.SUPPRESSED_STATUS_CODES:
+			logging.debug("%s command suppressed (status %d). Forwarding response.", self.getName(), statusCode)
+			
+			with self.metricsLock:
+				self.suppressedCounts[statusCode] = self.suppressedCounts.get(statusCode, 0) + 1
+		
+		if self.responseHandler:
+			try:
+				self.responseHandler(response)
+			except Exception as e:
+				logging.exception("Failed to handle %s response: %s", self.getName(), str(e))
+	
+	def _handleFailure(self, action: str, e: Exception):
+		logging.exception("Failed to %s %s command: %s", action, self.getName(), str(e))
+		
+		with self.metricsLock:
+			self.failedCount += 1
+	
+	def _offer(self, item):
+		# enqueue() may be called from several threads (MQTT, CoAP, ...), so
+		# this is only called under the enqueue lock, which makes dropping the
+		# oldest entry and adding the new one atomic
+		while True:
+			try:
+				self.commandQueue.put_nowait(item)
+				return
+			except queue.Full:
+				try:
+					self.commandQueue.get_nowait()
+				except queue.Empty:
+					continue
+				
+				with self.metricsLock:
+					self.droppedCount += 1
+				
+				logging.warning("Dispatch queue for %s is full. Dropped oldest command.", self.getName())
+	
+	def _runWorker(self):
+		while True:
+			# a failure here (or in applyPendingCommand()) mustn't kill the worker,
+			# so it's handled as for updateActuator(); with no delay, the worker
+			# just waits for the next command
+			try:
+				pendingDelay = self.actuatorTask.getPendingCommandDelay()
+			except Exception as e:
+				self._handleFailure('check pending', e)
+				pendingDelay = None
+			
+			try:
+				item = self.commandQueue.get(timeout = pendingDelay)
+			except queue.Empty:
+				try:
+					self._handleResponse(self.actuatorTask.applyPendingCommand())
+				except Exception as e:
+					self._handleFailure('apply pending', e)
+				
+				continue
+			
+			if item is None:
+				if self.stopEvent.is_set():
+					break
+				
+				continue
+			
+			enqueueTime, command = item
+			
+			try:
+				response = self.actuatorTask.updateActuator(command)
+			except Exception as e:
+				self._handleFailure('apply', e)
+				continue
+			
+			latency = monotonic() - enqueueTime
+			
+			with self.metricsLock:
+				self.processedCount += 1
+				self.lastLatency = latency
+				self.maxLatency = max(self.maxLatency, latency)
+				self.totalLatency += latency
+			
+			self._handleResponse(response)
@@ -1,29 +1,55 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
 import programmingtheiot.common.ConfigConst as ConfigConst
 
 class BaseSystemUtilTask():
 	"""
-	Shell implementation representation of class for student implementation.
+	Base class for the system utilization tasks, which hold a name and
+	type ID, and report a single utilization percent via getTelemetryValue().
 	
 	"""
 	
-	def __init__(self, name = ConfigConst.NOT_SET, typeID = ConfigConst.DEFAULT_SENSOR_TYPE):
-		pass
+	def __init__(self, name = ConfigConst.NOT_SET, typeID = ConfigConst.DEFAULT_SENSOR_TYPE, useProcFs: bool = True):
+		"""
+		Constructor.
+		
+		@param name The task name.
+		@param typeID The task type ID.
+		@param useProcFs If True, the subclass reads its value directly from the
+		Linux /proc file system (see ProcFsReader) where it's available, and from
+		psutil otherwise. If False, psutil is always used.
+		"""
+		self.name = name
+		self.typeID = typeID
+		self.useProcFs = useProcFs
 	
 	def getName(self) -> str:
-		pass
+		return self.name
 	
 	def getTypeID(self) -> int:
-		pass
+		return self.typeID
+	
+	def isProcFsEnabled(self) -> bool:
+		"""
+		Returns True if the /proc file system is used (i.e. it was requested,
+		and is available). Implemented by the subclasses.
+		
+		@return bool
+		"""
+		return False
 	
 	def getTelemetryValue(self) -> float:
+		"""
+		Returns the current utilization, as a percent. Implemented by the
+		subclasses.
+		
+		@return float
+		"""
 		pass
-	
\ No newline at end of file
@@ -0,0 +1,155 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+
+from threading import Lock
+
+from programmingtheiot.cda.system.ProcFsReader import ProcFsReader
+
+class CpuUtilSampler():
+	"""
+	Non-blocking CPU utilization sampler. Each call to sample() reads the
+	cumulative CPU times (in jiffies) from /proc/stat (see ProcFsReader)
+	and returns the utilization since the previous call, using the change
+	in those times. The first call returns the utilization since boot.
+	
+	The total and per core utilization, iowait and steal are kept, as a
+	percent of the elapsed CPU time. iowait and steal aren't included in
+	the utilization (the CPU isn't busy while waiting on I/O, and steal is
+	time taken by the hypervisor).
+	
+	If /proc/stat isn't available (i.e. not Linux), or 'useProcFs' is
+	False, psutil.cpu_times() is used instead, which doesn't block either
+	(but may not report iowait or steal). psutil is only imported then.
+	
+	"""
+	
+	# /proc/stat CPU time columns - guest and guest_nice are already counted in user and nice
+	IDLE_COL    = 3
+	IOWAIT_COL  = 4
+	STEAL_COL   = 7
+	NUM_COLS    = 8
+	
+	def __init__(self, statPath: str = ProcFsReader.PROC_STAT_PATH, useProcFs: bool = True):
+		"""
+		Constructor.
+		
+		@param statPath The path of the kernel CPU statistics file.
+		@param useProcFs If False, psutil is used even if 'statPath' is available.
+		"""
+		self.statReader = None
+		
+		if useProcFs and ProcFsReader.isAvailable(statPath):
+			self.statReader = ProcFsReader(statPath)
+		else:
+			logging.info("Using psutil CPU times (%s not used).", statPath)
+		
+		self.lastCpuTimes = None
+		self.sampleLock = Lock()
+		
+		self.cpuUtil = 0.0
+		self.ioWait = 0.0
+		self.steal = 0.0
+		self.cpuUtilPerCore = []
+		self.ioWaitPerCore = []
+		self.stealPerCore = []
+	
+	def getCpuUtilization(self) -> float:
+		return self.cpuUtil
+	
+	def getCpuUtilizationPerCore(self) -> list:
+		return self.cpuUtilPerCore
+	
+	def getIoWait(self) -> float:
+		return self.ioWait
+	
+	def getIoWaitPerCore(self) -> list:
+		return self.ioWaitPerCore
+	
+	def getSteal(self) -> float:
+		return self.steal
+	
+	def getStealPerCore(self) -> list:
+		return self.stealPerCore
+	
+	def isProcFsEnabled(self) -> bool:
+		return self.statReader is not None
+	
+	def sample(self) -> float:
+		"""
+		Updates the total and per core utilization, iowait and steal, from
+		the change in CPU times since the last call.
+		
+		@return float The total CPU utilization, as a percent.
+		"""
+		cpuTimes = self._readCpuTimes()
+		
+		with self.sampleLock:
+			lastCpuTimes = self.lastCpuTimes
+			
+			# start over if the number of cores changed (e.g. a core went offline)
+			if not lastCpuTimes or len(lastCpuTimes) != len(cpuTimes):
+				lastCpuTimes = [(0, 0, 0, 0)] * len(cpuTimes)
+			
+			results = [self._getUtilization(times, lastTimes) for times, lastTimes in zip(cpuTimes, lastCpuTimes)]
+			
+			self.lastCpuTimes = cpuTimes
+			
+			self.cpuUtil, self.ioWait, self.steal = results[0]
+			self.cpuUtilPerCore = [result[0] for result in results[1:]]
+			self.ioWaitPerCore = [result[1] for result in results[1:]]
+			self.stealPerCore = [result[2] for result in results[1:]]
+			
+			return self.cpuUtil
+	
+	def _getUtilization(self, times: tuple, lastTimes: tuple) -> tuple:
+		total, idle, ioWait, steal = (count - lastCount for count, lastCount in zip(times, lastTimes))
+		
+		if total <= 0:
+			return (0.0, 0.0, 0.0)
+		
+		busy = total - idle - ioWait - steal
+		
+		return (100.0 * max(0, busy) / total, 100.0 * max(0, ioWait) / total, 100.0 * max(0, steal) / total)
+	
+	def _readCpuTimes(self) -> list:
+		"""
+		Returns the total, idle, iowait and steal times of all CPUs, then of
+		each core.
+		
+		@return list Of (total, idle, iowait, steal) tuples.
+		"""
+		if self.statReader:
+			return self._parseProcStat(self.statReader.read())
+		
+		import psutil
+		
+		return [self._toCpuTimes(times) for times in [psutil.cpu_times()] + psutil.cpu_times(percpu = True)]
+	
+	def _parseProcStat(self, statData: bytes) -> list:
+		cpuTimes = []
+		
+		for line in statData.splitlines():
+			if not line.startswith(b'cpu'):
+				# the cpu lines come first
+				break
+			
+			cols = [int(col) for col in line.split()[1:self.NUM_COLS + 1]]
+			cols += [0] * (self.NUM_COLS - len(cols))
+			
+			cpuTimes.append((sum(cols), cols[self.IDLE_COL], cols[self.IOWAIT_COL], cols[self.STEAL_COL]))
+		
+		return cpuTimes
+	
+	def _toCpuTimes(self, times) -> tuple:
+		# psutil counts guest time in user time too (on Linux)
+		total = sum(times) - getattr(times, 'guest', 0.0) - getattr(times, 'guest_nice', 0.0)
+		
+		return (total, times.idle, getattr(times, 'iowait', 0.0), getattr(times, 'steal', 0.0))
@@ -0,0 +1,159 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+from time import monotonic
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.common.ConfigUtil import ConfigUtil
+
+class DeadbandFilter():
+	"""
+	Report-on-change filter for a single sensor. A reading is reportable if:
+	 - it's the first reading, or
+	 - it differs from the last reported value by more than the deadband, or
+	 - at least 'maxSilenceSecs' have passed since the last reported value.
+	
+	The deadband is the larger of 'deadband' (absolute) and 'deadbandPercent'
+	(percent of the last reported value). If 'hysteresis' is set, a change in
+	the opposite direction to the last reported change must also exceed the
+	deadband by 'hysteresis', which stops noise around a value from being
+	reported back and forth. A value of 0.0 disables each setting.
+	
+	"""
+	
+	def __init__(self, deadband: float = 0.0, deadbandPercent: float = 0.0, maxSilenceSecs: float = 0.0, hysteresis: float = 0.0):
+		"""
+		Constructor.
+		
+		@param deadband The absolute change required to report a reading.
+		@param deadbandPercent The change, as a percent of the last reported value, required to report a reading.
+		@param maxSilenceSecs The max time, in seconds, between reported readings.
+		@param hysteresis The additional change required when the direction of change reverses.
+		"""
+		self.deadband = max(0.0, deadband)
+		self.deadbandPercent = max(0.0, deadbandPercent)
+		self.maxSilenceSecs = max(0.0, maxSilenceSecs)
+		self.hysteresis = max(0.0, hysteresis)
+		
+		self.lastReportedValue = None
+		self.lastReportedTime = None
+		self.lastDirection = 0
+		
+		self.reportedCount = 0
+		self.suppressedCount = 0
+	
+	@classmethod
+	def fromConfig(cls, section: str = None, configUtil: ConfigUtil = None):
+		"""
+		Creates a DeadbandFilter from the 'deadband', 'deadbandPercent',
+		'maxSilenceSecs' and 'hysteresis' properties in 'section' - e.g.
+		'ConstrainedDevice.PressureSensor'.
+		
+		@param section The config section.
+		@param configUtil The ConfigUtil to use. If None, the default is used.
+		@return DeadbandFilter, or None if no deadband is configured (i.e.
+		every reading would be reported anyway).
+		"""
+		if not configUtil:
+			configUtil = ConfigUtil()
+		
+		deadband = configUtil.getFloat(section, ConfigConst.SENSOR_DEADBAND_KEY, ConfigConst.DEFAULT_SENSOR_DEADBAND)
+		deadbandPercent = configUtil.getFloat(section, ConfigConst.SENSOR_DEADBAND_PERCENT_KEY, ConfigConst.DEFAULT_SENSOR_DEADBAND)
+		maxSilenceSecs = configUtil.getFloat(section, ConfigConst.SENSOR_MAX_SILENCE_SECS_KEY, 0.0)
+		hysteresis = configUtil.getFloat(section, ConfigConst.SENSOR_HYSTERESIS_KEY, 0.0)
+		
+		if deadband <= 0.0 and deadbandPercent <= 0.0:
+			return None
+		
+		return cls( \
+			deadband = deadband, deadbandPercent = deadbandPercent, \
+			maxSilenceSecs = maxSilenceSecs, hysteresis = hysteresis)
+	
+	def filterValue(self, value: float, now: float = None) -> bool:
+		"""
+		Checks if 'value' is reportable and, if so, marks it as reported.
+		
+		@param value The sensor reading.
+		@param now The current (monotonic) time, in seconds. If None, monotonic() is used.
+		@return bool True if 'value' should be reported; False if it should be suppressed.
+		"""
+		if now is None:
+			now = monotonic()
+		
+		if self.isReportable(value, now):
+			self.markReported(value, now)
+			return True
+		
+		self.markSuppressed()
+		return False
+	
+	def getReportedCount(self) -> int:
+		return self.reportedCount
+	
+	def getSuppressedCount(self) -> int:
+		return self.suppressedCount
+	
+	def isReportable(self, value: float, now: float = None) -> bool:
+		"""
+		Checks if 'value' is reportable (see the class description), without
+		changing the filter state.
+		
+		@param value The sensor reading.
+		@param now The current (monotonic) time, in seconds. If None, monotonic() is used.
+		@return bool
+		"""
+		if self.lastReportedValue is None:
+			return True
+		
+		if now is None:
+			now = monotonic()
+		
+		if self.maxSilenceSecs > 0.0 and now - self.lastReportedTime >= self.maxSilenceSecs:
+			return True
+		
+		change = value - self.lastReportedValue
+		threshold = max(self.deadband, abs(self.lastReportedValue) * self.deadbandPercent / 100.0)
+		
+		if self.lastDirection * change < 0.0:
+			threshold += self.hysteresis
+		
+		return abs(change) > threshold
+	
+	def markReported(self, value: float, now: float = None):
+		"""
+		Records 'value' as the last reported value (e.g. when it's sent along
+		with other readings, regardless of this filter).
+		
+		@param value The sensor reading.
+		@param now The current (monotonic) time, in seconds. If None, monotonic() is used.
+		"""
+		if now is None:
+			now = monotonic()
+		
+		if self.lastReportedValue is not None and value != self.lastReportedValue:
+			self.lastDirection = 1 if value > self.lastReportedValue else -1
+		
+		self.lastReportedValue = value
+		self.lastReportedTime = now
+		self.reportedCount += 1
+	
+	def markSuppressed(self):
+		"""
+		Records that a reading was suppressed (for the suppressed count).
+		"""
+		self.suppressedCount += 1
+	
+	def reset(self):
+		"""
+		Clears the last reported value, so the next reading is reported.
+		"""
+		self.lastReportedValue = None
+		self.lastReportedTime = None
+		self.lastDirection = 0
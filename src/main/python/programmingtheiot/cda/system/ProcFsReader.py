@@ -0,0 +1,83 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import os
+
+class ProcFsReader():
+	"""
+	Reads a Linux /proc file (e.g. /proc/stat) from a file descriptor that's
+	opened once, when the reader is created. Each read() uses os.pread()
+	from offset 0, so the kernel regenerates the file contents without the
+	cost of opening and closing it, and without a shared file position
+	(so concurrent reads are safe).
+	
+	"""
+	
+	PROC_STAT_PATH        = '/proc/stat'
+	PROC_MEMINFO_PATH     = '/proc/meminfo'
+	PROC_DISKSTATS_PATH   = '/proc/diskstats'
+	PROC_SELF_STATUS_PATH = '/proc/self/status'
+	PROC_SELF_FD_PATH     = '/proc/self/fd'
+	
+	DEFAULT_BUFFER_SIZE = 8192
+	
+	def __init__(self, path: str = PROC_STAT_PATH, bufferSize: int = DEFAULT_BUFFER_SIZE):
+		"""
+		Constructor.
+		
+		@param path The path of the /proc file.
+		@param bufferSize The initial read size. Larger files take more than one read.
+		@raise OSError If 'path' can't be opened.
+		"""
+		self.path = path
+		self.bufferSize = max(1, bufferSize)
+		self.fd = os.open(path, os.O_RDONLY)
+	
+	@classmethod
+	def isAvailable(cls, path: str = PROC_STAT_PATH) -> bool:
+		"""
+		Checks if 'path' can be read via a ProcFsReader - i.e. it exists and
+		os.pread() is supported (on Linux, but not e.g. Windows).
+		
+		@param path The path of the /proc file.
+		@return bool
+		"""
+		return hasattr(os, 'pread') and os.access(path, os.R_OK)
+	
+	def close(self):
+		if self.fd is not None:
+			os.close(self.fd)
+			self.fd = None
+	
+	def getPath(self) -> str:
+		return self.path
+	
+	def read(self) -> bytes:
+		"""
+		Reads the whole file.
+		
+		@return bytes
+		"""
+		data = os.pread(self.fd, self.bufferSize, 0)
+		
+		if len(data) < self.bufferSize:
+			return data
+		
+		chunks = [data]
+		offset = len(data)
+		
+		while data:
+			data = os.pread(self.fd, self.bufferSize, offset)
+			chunks.append(data)
+			offset += len(data)
+		
+		# read the whole file in one go from now on
+		self.bufferSize = offset + self.DEFAULT_BUFFER_SIZE
+		
+		return b''.join(chunks)
@@ -0,0 +1,249 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import gc
+import logging
+import os
+
+from threading import Lock
+from time import monotonic, perf_counter
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.cda.system.BaseSystemUtilTask import BaseSystemUtilTask
+from programmingtheiot.cda.system.ProcFsReader import ProcFsReader
+from programmingtheiot.data.ProcessHealthData import ProcessHealthData
+
+class ProcessHealthTask(BaseSystemUtilTask):
+	"""
+	Reports the health of the CDA process itself: its RSS, CPU time and
+	utilization, thread count, open file descriptors, GC collections and
+	pause times, and the depth of any internal queues registered via
+	addQueueDepthSource() - as a ProcessHealthData (see getHealthData()).
+	
+	The RSS and thread count are read from /proc/self/status (see
+	ProcFsReader), and the open file descriptors from /proc/self/fd, where
+	they're available (unless 'useProcFs' is False), and from psutil
+	otherwise. The CPU time is from os.times().
+	
+	GC pauses are timed by a gc.callbacks hook, which is only added by
+	startGcMonitoring(), and removed by stopGcMonitoring() (or close()).
+	SystemPerformanceManager does so when it's started and stopped.
+	
+	"""
+	
+	# /proc/self/status fields
+	VM_RSS_FIELD  = b'VmRSS:'
+	THREADS_FIELD = b'Threads:'
+	
+	def __init__(self, statusPath: str = ProcFsReader.PROC_SELF_STATUS_PATH, fdPath: str = ProcFsReader.PROC_SELF_FD_PATH, useProcFs: bool = True):
+		"""
+		Constructor.
+		
+		@param statusPath The path of the process status file.
+		@param fdPath The path of the process file descriptor directory.
+		@param useProcFs If False, psutil is used even if 'statusPath' is available.
+		"""
+		super(ProcessHealthTask, self).__init__(name = ConfigConst.PROCESS_HEALTH_NAME, typeID = ConfigConst.SYSTEM_MGMT_TYPE, useProcFs = useProcFs)
+		
+		self.statusReader = None
+		self.fdPath = fdPath if useProcFs and os.path.isdir(fdPath) else None
+		
+		if useProcFs and ProcFsReader.isAvailable(statusPath):
+			self.statusReader = ProcFsReader(statusPath)
+		else:
+			logging.info("Using psutil process stats (%s not used).", statusPath)
+		
+		self.cpuCount = os.cpu_count() or 1
+		self.totalMemory = self._getTotalMemory()
+		
+		self.lastCpuTime = self._getCpuTime()
+		self.lastSampleTime = monotonic()
+		self.sampleLock = Lock()
+		
+		self.queueDepthSources = {}
+		
+		# no lock here - the GC can run (and call back) at any allocation,
+		# including while the lock is held, so these are plain attributes
+		self.gcStartTime = None
+		self.gcPauseTotal = 0.0
+		self.gcPauseMax = 0.0
+	
+	def addQueueDepthSource(self, name: str, getQueueDepth):
+		"""
+		Adds (or replaces) an internal queue to report the depth of.
+		
+		@param name The queue name, as reported.
+		@param getQueueDepth A callable that returns the current queue depth.
+		"""
+		self.queueDepthSources[name] = getQueueDepth
+	
+	def close(self):
+		"""
+		Removes the GC hook, and closes the /proc status file.
+		"""
+		self.stopGcMonitoring()
+		
+		if self.statusReader:
+			self.statusReader.close()
+	
+	def getHealthData(self) -> ProcessHealthData:
+		"""
+		Takes a snapshot of the process health. The CPU utilization and GC
+		pause times are since the previous snapshot (or getTelemetryValue()
+		call, for the CPU utilization).
+		
+		@return ProcessHealthData
+		"""
+		rssBytes, threadCount = self._getRssAndThreads()
+		
+		# a pause that ends between these two lines is lost, which is fine for a health metric
+		pauseTotal, pauseMax = self.gcPauseTotal, self.gcPauseMax
+		self.gcPauseTotal, self.gcPauseMax = 0.0, 0.0
+		
+		healthData = ProcessHealthData()
+		healthData.setCpuUtilization(self.getTelemetryValue())
+		healthData.setCpuTime(self.lastCpuTime)
+		healthData.setRssBytes(rssBytes)
+		healthData.setMemoryUtilization(100.0 * rssBytes / self.totalMemory if self.totalMemory else 0.0)
+		healthData.setThreadCount(threadCount)
+		healthData.setOpenFdCount(self._getOpenFdCount())
+		healthData.setGcMetrics([stats.get('collections', 0) for stats in gc.get_stats()], pauseTotal, pauseMax)
+		healthData.setQueueDepths(self._getQueueDepths())
+		
+		return healthData
+	
+	def isGcMonitoring(self) -> bool:
+		return self._handleGcEvent in gc.callbacks
+	
+	def startGcMonitoring(self) -> bool:
+		"""
+		Adds the gc.callbacks hook that times GC pauses.
+		
+		@return bool True if it was added; False if it was already added.
+		"""
+		if self.isGcMonitoring():
+			return False
+		
+		gc.callbacks.append(self._handleGcEvent)
+		return True
+	
+	def stopGcMonitoring(self) -> bool:
+		"""
+		Removes the gc.callbacks hook that times GC pauses.
+		
+		@return bool True if it was removed; False if it wasn't added.
+		"""
+		if not self.isGcMonitoring():
+			return False
+		
+		gc.callbacks.remove(self._handleGcEvent)
+		
+		# a collection in progress won't be timed
+		self.gcStartTime = None
+		return True
+	
+	def getTelemetryValue(self) -> float:
+		"""
+		Returns the process CPU utilization since the previous call, as a
+		percent of the total CPU capacity (all cores).
+		
+		@return float
+		"""
+		with self.sampleLock:
+			cpuTime = self._getCpuTime()
+			sampleTime = monotonic()
+			
+			elapsed = (sampleTime - self.lastSampleTime) * self.cpuCount
+			cpuUtil = 100.0 * max(0.0, cpuTime - self.lastCpuTime) / elapsed if elapsed > 0.0 else 0.0
+			
+			self.lastCpuTime = cpuTime
+			self.lastSampleTime = sampleTime
+			
+			return min(100.0, cpuUtil)
+	
+	def isProcFsEnabled(self) -> bool:
+		return self.statusReader is not None
+	
+	def removeQueueDepthSource(self, name: str) -> bool:
+		return self.queueDepthSources.pop(name, None) is not None
+	
+	def _getCpuTime(self) -> float:
+		times = os.times()
+		
+		return times.user + times.system
+	
+	def _getOpenFdCount(self) -> int:
+		if self.fdPath:
+			try:
+				return len(os.listdir(self.fdPath))
+			except OSError as e:
+				logging.warning("Failed to list %s: %s", self.fdPath, str(e))
+		
+		import psutil
+		
+		process = psutil.Process()
+		
+		# Windows has handles rather than file descriptors
+		return process.num_fds() if hasattr(process, 'num_fds') else process.num_handles()
+	
+	def _getQueueDepths(self) -> dict:
+		queueDepths = {}
+		
+		for name, getQueueDepth in list(self.queueDepthSources.items()):
+			try:
+				queueDepths[name] = getQueueDepth()
+			except Exception as e:
+				logging.warning("Failed to get queue depth of %s: %s", name, str(e))
+		
+		return queueDepths
+	
+	def _getRssAndThreads(self) -> tuple:
+		if self.statusReader:
+			return self._parseStatus(self.statusReader.read())
+		
+		import psutil
+		
+		process = psutil.Process()
+		
+		return (process.memory_info().rss, process.num_threads())
+	
+	def _getTotalMemory(self) -> int:
+		try:
+			return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES')
+		except (AttributeError, ValueError, OSError):
+			import psutil
+			
+			return psutil.virtual_memory().total
+	
+	def _handleGcEvent(self, phase: str, info: dict):
+		if phase == 'start':
+			self.gcStartTime = perf_counter()
+		elif self.gcStartTime is not None:
+			pause = perf_counter() - self.gcStartTime
+			
+			self.gcStartTime = None
+			self.gcPauseTotal += pause
+			self.gcPauseMax = max(self.gcPauseMax, pause)
+	
+	def _parseStatus(self, statusData: bytes) -> tuple:
+		rssBytes = 0
+		threadCount = 0
+		
+		for line in statusData.splitlines():
+			if line.startswith(self.VM_RSS_FIELD):
+				# in kB
+				rssBytes = int(line.split()[1]) * 1024
+			elif line.startswith(self.THREADS_FIELD):
+				threadCount = int(line.split()[1])
+				
+				# Threads comes after VmRSS
+				break
+		
+		return (rssBytes, threadCount)
@@ -0,0 +1,138 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import math
+
+from collections import deque
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+class RollingWindow():
+	"""
+	Rolling aggregates (min, max, mean, EWMA and percentiles) of the last
+	'size' values of a metric. The window's values are kept (memory use is
+	fixed at 'size' values), and adding a value is O(1) (amortized, for the
+	min and max):
+	 - the min and max are kept in monotonic deques,
+	 - the mean from a running sum,
+	 - the EWMA over every value added (not just the window), and
+	 - the percentiles are exact (nearest rank), from a sorted copy of the
+	   window. That's O(size log size) per call, which is fine for the
+	   small windows (and once per publish calls) this is used for, and
+	   needs no memory beyond the window itself - so no (approximate)
+	   quantile sketch is kept alongside it.
+	
+	"""
+	
+	DEFAULT_EWMA_ALPHA = 0.2
+	
+	def __init__(self, size: int = 60, ewmaAlpha: float = DEFAULT_EWMA_ALPHA):
+		"""
+		Constructor.
+		
+		@param size The number of values in the window.
+		@param ewmaAlpha The weight of each new value in the EWMA (0.0 - 1.0).
+		"""
+		if size <= 0:
+			raise ValueError("Invalid rolling window size: %s" % str(size))
+		
+		self.size = size
+		self.ewmaAlpha = min(1.0, max(0.0, ewmaAlpha))
+		
+		self.reset()
+	
+	def addValue(self, value: float):
+		"""
+		Adds 'value' to the window, dropping the oldest value if it's full.
+		
+		@param value The new value.
+		"""
+		if len(self.values) == self.size:
+			oldValue = self.values.popleft()
+			
+			self.valueSum -= oldValue
+		
+		index = self.addedCount
+		
+		self.values.append(value)
+		self.valueSum += value
+		self.ewma = value if self.ewma is None else self.ewmaAlpha * value + (1.0 - self.ewmaAlpha) * self.ewma
+		self.addedCount += 1
+		
+		self._pushExtreme(self.minValues, index, value, lambda last: last >= value)
+		self._pushExtreme(self.maxValues, index, value, lambda last: last <= value)
+		
+		# the running sum can drift, so it's recalculated once per window
+		if self.addedCount % self.size == 0:
+			self.valueSum = math.fsum(self.values)
+	
+	def getCount(self) -> int:
+		return len(self.values)
+	
+	def getEwma(self) -> float:
+		return self.ewma
+	
+	def getMax(self) -> float:
+		return self.maxValues[0][1] if self.maxValues else None
+	
+	def getMean(self) -> float:
+		return self.valueSum / len(self.values) if self.values else None
+	
+	def getMin(self) -> float:
+		return self.minValues[0][1] if self.minValues else None
+	
+	def getPercentile(self, percent: float = 95.0) -> float:
+		"""
+		Returns the smallest value in the window that 'percent' of the window
+		is at or below (i.e. the nearest rank percentile).
+		
+		@param percent The percentile (0.0 - 100.0).
+		@return float, or None if the window is empty.
+		"""
+		if not self.values:
+			return None
+		
+		rank = min(len(self.values), max(1, math.ceil(percent / 100.0 * len(self.values))))
+		
+		return sorted(self.values)[rank - 1]
+	
+	def getStats(self) -> dict:
+		"""
+		Returns the min, max, mean, EWMA and 95th percentile of the window.
+		
+		@return dict Keyed by ConfigConst.MIN_PROP, MAX_PROP, MEAN_PROP, EWMA_PROP and P95_PROP.
+		"""
+		return { \
+			ConfigConst.MIN_PROP: self.getMin(), \
+			ConfigConst.MAX_PROP: self.getMax(), \
+			ConfigConst.MEAN_PROP: self.getMean(), \
+			ConfigConst.EWMA_PROP: self.getEwma(), \
+			ConfigConst.P95_PROP: self.getPercentile(95.0) }
+	
+	def reset(self):
+		"""
+		Clears the window and the EWMA.
+		"""
+		self.values = deque()
+		self.valueSum = 0.0
+		self.ewma = None
+		self.addedCount = 0
+		
+		# (index, value) pairs, in order of index, with increasing (min) or decreasing (max) values
+		self.minValues = deque()
+		self.maxValues = deque()
+	
+	def _pushExtreme(self, extremes: deque, index: int, value: float, isReplaced):
+		while extremes and isReplaced(extremes[-1][1]):
+			extremes.pop()
+		
+		extremes.append((index, value))
+		
+		if extremes[0][0] <= index - self.size:
+			extremes.popleft()
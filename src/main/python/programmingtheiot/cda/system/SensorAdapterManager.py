@@ -1,45 +1,406 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
 import logging
 
-from importlib import import_module
+from functools import partial
 
-from apscheduler.schedulers.background import BackgroundScheduler
+from time import monotonic
 
 import programmingtheiot.common.ConfigConst as ConfigConst
 
 from programmingtheiot.common.ConfigUtil import ConfigUtil
 from programmingtheiot.common.IDataMessageListener import IDataMessageListener
+from programmingtheiot.common.PollScheduler import PollScheduler
+from programmingtheiot.data.MultiSensorData import MultiSensorData
 
+from programmingtheiot.cda.sim.SensorDataCache import SensorDataCache
 from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
-from programmingtheiot.cda.sim.HumiditySensorSimTask import HumiditySensorSimTask
-from programmingtheiot.cda.sim.TemperatureSensorSimTask import TemperatureSensorSimTask
-from programmingtheiot.cda.sim.PressureSensorSimTask import PressureSensorSimTask
+from programmingtheiot.cda.sim.SensorTickSampler import SensorTickSampler
+from programmingtheiot.cda.system.DeadbandFilter import DeadbandFilter
+from programmingtheiot.cda.system.TaskRegistry import TaskRegistry
 
 class SensorAdapterManager(object):
 	"""
-	Shell representation of class for student implementation.
+	Polls the humidity, pressure and temperature sensor tasks (simulated
+	or emulated), and passes each reading to the data message listener.
+	
+	Each sensor is polled at its own rate - 'pollCycleSecs' in its own
+	section (e.g. 'ConstrainedDevice.PressureSensor'), or the global
+	'pollCycleSecs' if it isn't set - on the shared PollScheduler.
+	
+	If polling falls behind (i.e. one or more polls were missed), the
+	'pollCatchUpPolicy' applies: 'skip' drops them, 'burst' polls once for
+	each, and 'batch' (the default) generates the missed readings as a
+	SensorDataBatch, passed to the listener's handleSensorMessageBatch()
+	before the current reading.
+	
+	The sensor tasks are loaded (once) via a TaskRegistry - in parallel
+	when the manager is started, or otherwise on first use. A sensor whose
+	task fails to load is logged and left out, rather than stopping the
+	others.
+	
+	In tick mode ('enableSensorTickMode'), each poll instead samples all of
+	the sensors at once (see SensorTickSampler), and passes the readings to
+	the listener's handleMultiSensorMessage() as a single MultiSensorData,
+	with one time stamp for the lot. All of the sensors are then polled at
+	the global rate.
+	
+	Each sensor may have a report-on-change DeadbandFilter, configured in
+	its own section (e.g. 'ConstrainedDevice.PressureSensor'). Readings it
+	suppresses are passed to the listener's handleSuppressedSensorMessage()
+	instead, so local state is still updated. In tick mode, the tick is sent
+	if any reading passes its filter.
 	
 	"""
+	
+	SENSOR_TYPES = [ConfigConst.HUMIDITY_SENSOR_TYPE, ConfigConst.PRESSURE_SENSOR_TYPE, ConfigConst.TEMP_SENSOR_TYPE]
+	
+	# sim data set per sensor type: (floor key, ceiling key, default floor, default ceiling, min, max, curve type)
+	SIM_DATA_SETS = { \
+		ConfigConst.HUMIDITY_SENSOR_TYPE: ( \
+			ConfigConst.HUMIDITY_SIM_FLOOR_KEY, ConfigConst.HUMIDITY_SIM_CEILING_KEY, \
+			SensorDataGenerator.LOW_NORMAL_ENV_HUMIDITY, SensorDataGenerator.HI_NORMAL_ENV_HUMIDITY, \
+			SensorDataGenerator.MIN_ENV_HUMIDITY, SensorDataGenerator.MAX_ENV_HUMIDITY, SensorDataGenerator.DEFAULT_HUMIDITY_CURVE), \
+		ConfigConst.PRESSURE_SENSOR_TYPE: ( \
+			ConfigConst.PRESSURE_SIM_FLOOR_KEY, ConfigConst.PRESSURE_SIM_CEILING_KEY, \
+			SensorDataGenerator.LOW_NORMAL_ENV_PRESSURE, SensorDataGenerator.HI_NORMAL_ENV_PRESSURE, \
+			SensorDataGenerator.MIN_ENV_PRESSURE, SensorDataGenerator.MAX_ENV_PRESSURE, SensorDataGenerator.DEFAULT_PRESSURE_CURVE), \
+		ConfigConst.TEMP_SENSOR_TYPE: ( \
+			ConfigConst.TEMP_SIM_FLOOR_KEY, ConfigConst.TEMP_SIM_CEILING_KEY, \
+			SensorDataGenerator.LOW_NORMAL_INDOOR_TEMP, SensorDataGenerator.HI_NORMAL_INDOOR_TEMP, \
+			SensorDataGenerator.MIN_ENV_TEMP, SensorDataGenerator.MAX_ENV_TEMP, SensorDataGenerator.DEFAULT_TEMP_CURVE) }
 
 	def __init__(self):
-		pass
+		self.configUtil = ConfigUtil()
+		
+		self.pollRate = \
+			self.configUtil.getInteger( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.POLL_CYCLES_KEY, defaultVal = ConfigConst.DEFAULT_POLL_CYCLES)
+		
+		self.useEmulator = \
+			self.configUtil.getBoolean( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.ENABLE_EMULATOR_KEY)
+		
+		self.locationID = \
+			self.configUtil.getProperty( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.DEVICE_LOCATION_ID_KEY, defaultVal = ConfigConst.NOT_SET)
+		
+		self.useTickMode = \
+			self.configUtil.getBoolean( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.ENABLE_SENSOR_TICK_MODE_KEY)
+		
+		self.catchUpPolicy = \
+			self.configUtil.getProperty( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.POLL_CATCH_UP_POLICY_KEY, defaultVal = ConfigConst.CATCH_UP_BATCH)
+		
+		if self.pollRate <= 0:
+			self.pollRate = ConfigConst.DEFAULT_POLL_CYCLES
+		
+		if self.catchUpPolicy not in PollScheduler.CATCH_UP_POLICIES:
+			logging.warning("Invalid poll catch up policy %s. Using %s.", self.catchUpPolicy, ConfigConst.CATCH_UP_BATCH)
+			self.catchUpPolicy = ConfigConst.CATCH_UP_BATCH
+		
+		simDataSeed = \
+			self.configUtil.getInteger( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.SIM_DATA_SEED_KEY, defaultVal = ConfigConst.DEFAULT_SIM_DATA_SEED)
+		
+		self.simDataChunkSize = \
+			self.configUtil.getInteger( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.SIM_DATA_CHUNK_SIZE_KEY, defaultVal = ConfigConst.DEFAULT_SIM_DATA_CHUNK_SIZE)
+		
+		self.dataMsgListener = None
+		self.tickSampler = None
+		
+		# the sim data sets are generated on the first start, and loaded (memory-mapped) from the cache after that
+		self.simDataSeed = simDataSeed if simDataSeed >= 0 else None
+		self.sensorDataCache = None if self.useEmulator else SensorDataCache()
+		self.sensorFilters = {}
+		
+		self.pollScheduler = PollScheduler()
+		self.jobIDPrefix = 'SensorAdapterManager@%x' % id(self)
+		self.jobIDs = []
+		
+		self.taskRegistry = \
+			TaskRegistry(useEmulator = self.useEmulator, taskArgsFactory = self._createSensorTaskArgs)
+		self.sensorTasks = None
 
-	def handleTelemetry(self):
-		pass
+	def handleTelemetry(self, missedPolls: int = 0):
+		"""
+		Generates (and sends to the listener) one reading from each sensor task,
+		after first backfilling 'missedPolls' readings from each. In tick mode,
+		the readings are sent together (see handleTelemetryTick()).
+		
+		@param missedPolls The number of polls missed since the last call.
+		"""
+		if missedPolls > 0:
+			logging.warning("Sensor polling fell behind by %d cycles. Backfilling.", missedPolls)
+			self.handleTelemetryBatch(missedPolls)
+		
+		if self.useTickMode:
+			self.handleTelemetryTick()
+			return
+		
+		for sensorTask in self.getSensorTasks():
+			self.handleSensorTelemetry(sensorTask)
+	
+	def handleSensorTelemetry(self, sensorTask, missedPolls: int = 0):
+		"""
+		Generates (and sends to the listener) one reading from 'sensorTask',
+		after first backfilling 'missedPolls' readings from it.
+		
+		@param sensorTask The sensor task to poll.
+		@param missedPolls The number of polls missed since the last call.
+		"""
+		if missedPolls > 0:
+			logging.warning("%s polling fell behind by %d cycles. Backfilling.", sensorTask.getName(), missedPolls)
+			self.handleTelemetryBatch(missedPolls, [sensorTask])
+		
+		sensorTask.generateTelemetry()
+		
+		# listeners may keep the reading, so they get a copy rather than the (possibly pooled) instance
+		sensorData = sensorTask.getLatestTelemetry(copy = True)
+		sensorData.setLocationID(self.locationID)
+		
+		logging.debug("Generated %s data: %f", sensorTask.getName(), sensorData.getValue())
+		
+		sensorFilter = self.getSensorFilter(sensorTask.getName())
+		
+		if sensorFilter and not sensorFilter.filterValue(sensorData.getValue()):
+			if self.dataMsgListener:
+				self.dataMsgListener.handleSuppressedSensorMessage(sensorData)
+		elif self.dataMsgListener:
+			self.dataMsgListener.handleSensorMessage(sensorData)
+	
+	def handleTelemetryBatch(self, count: int = 1, sensorTasks: list = None) -> list:
+		"""
+		Generates (and sends to the listener) the next 'count' readings from
+		each sensor task, as one SensorDataBatch per task.
+		
+		@param count The number of readings per sensor task.
+		@param sensorTasks The sensor tasks to use. If None, all of them are used.
+		@return list The SensorDataBatch instances, one per sensor task.
+		"""
+		if sensorTasks is None:
+			sensorTasks = self.getSensorTasks()
+		
+		batches = []
+		
+		# the tick sampler keeps its own data set indexes, so hand them back
+		# to the tasks for the batch, and pick them up again afterwards
+		if self.tickSampler:
+			self.tickSampler.syncTasks()
+		
+		for sensorTask in sensorTasks:
+			batch = sensorTask.generateTelemetryBatch(count)
+			batch.setLocationID(self.locationID)
+			batches.append(batch)
+			
+			logging.debug("Generated %s batch of %d readings.", sensorTask.getName(), batch.getCount())
+			
+			sensorFilter = self.getSensorFilter(sensorTask.getName())
+			
+			if sensorFilter and batch.getCount() > 0:
+				sensorFilter.markReported(float(batch.getValues()[-1]))
+			
+			if self.dataMsgListener:
+				self.dataMsgListener.handleSensorMessageBatch(batch)
+		
+		if self.tickSampler:
+			self.tickSampler.resetIndexes()
+		
+		return batches
+	
+	def handleTelemetryTick(self) -> MultiSensorData:
+		"""
+		Samples all of the sensor tasks at once, and sends the readings to the
+		listener as a single MultiSensorData - or, if none of the readings
+		passes its sensor's filter, as suppressed SensorData messages.
+		
+		@return MultiSensorData
+		"""
+		if not self.tickSampler:
+			self.tickSampler = SensorTickSampler(self.getSensorTasks())
 		
+		multiSensorData = self.tickSampler.sampleTick()
+		multiSensorData.setLocationID(self.locationID)
+		
+		logging.debug("Generated tick of %d readings.", multiSensorData.getCount())
+		
+		tickTime = monotonic()
+		values = multiSensorData.getValues().tolist()
+		sensorFilters = [self.getSensorFilter(name) for name in multiSensorData.getNames()]
+		
+		isReportable = any( \
+			not sensorFilter or sensorFilter.isReportable(value, tickTime) \
+			for sensorFilter, value in zip(sensorFilters, values))
+		
+		# all of the readings are sent with the tick, so they're all 'reported'
+		for sensorFilter, value in zip(sensorFilters, values):
+			if sensorFilter:
+				if isReportable:
+					sensorFilter.markReported(value, tickTime)
+				else:
+					sensorFilter.markSuppressed()
+		
+		if self.dataMsgListener:
+			if isReportable:
+				self.dataMsgListener.handleMultiSensorMessage(multiSensorData)
+			else:
+				for index in range(multiSensorData.getCount()):
+					self.dataMsgListener.handleSuppressedSensorMessage(multiSensorData.getSensorData(index))
+		
+		return multiSensorData
+	
+	def getSensorFilter(self, name: str = None) -> DeadbandFilter:
+		"""
+		Returns the report-on-change filter for the sensor named 'name',
+		creating it from the sensor's config section on first use.
+		
+		@param name The sensor name - e.g. ConfigConst.PRESSURE_SENSOR_NAME.
+		@return DeadbandFilter, or None if no filtering is configured for 'name'.
+		"""
+		if name not in self.sensorFilters:
+			self.sensorFilters[name] = \
+				DeadbandFilter.fromConfig(section = self._getSensorSection(name), configUtil = self.configUtil)
+		
+		return self.sensorFilters[name]
+	
+	def getSensorPollRate(self, name: str = None) -> float:
+		"""
+		Returns the poll rate of the sensor named 'name' - i.e. 'pollCycleSecs'
+		in the sensor's config section, or the global rate if it isn't set.
+		
+		@param name The sensor name - e.g. ConfigConst.PRESSURE_SENSOR_NAME.
+		@return float The poll rate, in seconds.
+		"""
+		pollRate = self.configUtil.getFloat(self._getSensorSection(name), ConfigConst.POLL_CYCLES_KEY, self.pollRate)
+		
+		return pollRate if pollRate > 0.0 else float(self.pollRate)
+	
+	def getSensorTasks(self) -> list:
+		"""
+		Returns the humidity, pressure and temperature sensor tasks (in that
+		order) that loaded successfully, loading them if this is the first call.
+		
+		@return list
+		"""
+		if self.sensorTasks is None:
+			self.sensorTasks = self.taskRegistry.loadTasks(self.SENSOR_TYPES)
+		
+		return list(self.sensorTasks)
+		
+	def isTickModeEnabled(self) -> bool:
+		return self.useTickMode
+	
 	def setDataMessageListener(self, listener: IDataMessageListener) -> bool:
-		pass
+		if listener:
+			self.dataMsgListener = listener
+			return True
+		
+		return False
+	
+	def setTickMode(self, enable: bool = True):
+		"""
+		Enables or disables tick mode (see the class description). When it's
+		disabled, the sensor tasks continue from the last tick.
+		
+		@param enable True to enable tick mode; False to disable it.
+		"""
+		if not enable and self.tickSampler:
+			self.tickSampler.syncTasks()
+			self.tickSampler = None
+		
+		self.useTickMode = enable
+	
+	def startManager(self) -> bool:
+		if self.jobIDs:
+			logging.warning("SensorAdapterManager already started. Ignoring.")
+			return False
+		
+		sensorTasks = self.getSensorTasks()
+		
+		if self.useTickMode:
+			self._addPollJob('tick', self.handleTelemetry, self.pollRate)
+		else:
+			for sensorTask in sensorTasks:
+				self._addPollJob( \
+					sensorTask.getName(), partial(self.handleSensorTelemetry, sensorTask), \
+					self.getSensorPollRate(sensorTask.getName()))
+		
+		logging.info("Started SensorAdapterManager.")
+		return True
+		
+	def stopManager(self) -> bool:
+		if not self.jobIDs:
+			logging.warning("SensorAdapterManager already stopped. Ignoring.")
+			return False
+		
+		for jobID in self.jobIDs:
+			self.pollScheduler.removeJob(jobID)
+		
+		self.jobIDs = []
+		
+		logging.info("Stopped SensorAdapterManager.")
+		return True
 	
-	def startManager(self):
-		pass
+	def _addPollJob(self, name: str, callback, pollRate: float):
+		jobID = self.jobIDPrefix + '.' + name
+		
+		if self.pollScheduler.addJob( \
+			jobID = jobID, callback = callback, intervalSecs = pollRate, catchUpPolicy = self.catchUpPolicy):
+			
+			self.jobIDs.append(jobID)
 		
-	def stopManager(self):
-		pass
+	def _createSensorTaskArgs(self, typeID: int) -> dict:
+		"""
+		Returns the keyword args used by the TaskRegistry to create the sensor
+		task for 'typeID'. The emulator tasks take no args; the sim tasks get a
+		daily data set between the configured sim floor and ceiling, via the
+		SensorDataCache. If 'simDataSeed' is set, the data set is generated on
+		the first start only, and memory-mapped from the cache after that.
+		
+		If 'simDataChunkSize' is set, the sim tasks get a continuous stream of
+		data chunks of that size instead (which bypasses the cache), so only one
+		chunk per sensor is resident, and nothing is generated up front.
+		
+		@param typeID The sensor type ID.
+		@return dict The keyword args, or None if there are none.
+		"""
+		if self.useEmulator or typeID not in self.SIM_DATA_SETS:
+			return None
+		
+		section = ConfigConst.CONSTRAINED_DEVICE
+		floorKey, ceilingKey, defaultFloor, defaultCeiling, minValue, maxValue, curveType = self.SIM_DATA_SETS[typeID]
+		
+		floor = self.configUtil.getFloat(section, floorKey, defaultFloor)
+		ceiling = self.configUtil.getFloat(section, ceilingKey, defaultCeiling)
+		
+		# same limits as e.g. SensorDataGenerator.generateDailyEnvironmentHumidityDataSet()
+		if ceiling < minValue or ceiling > maxValue: ceiling = maxValue
+		if floor < minValue or floor >= ceiling: floor = ceiling - 1
+		
+		dataGenerator = SensorDataGenerator(seed = self.simDataSeed)
+		
+		if self.simDataChunkSize > 0:
+			dataChunks = dataGenerator.generateSensorDataChunks( \
+				curveType = curveType, minValue = floor, maxValue = ceiling, startHour = 0, endHour = 24, useSeconds = False, \
+				chunkSize = self.simDataChunkSize, continuous = True, streamID = typeID)
+			
+			return {'dataChunks': dataChunks}
+		
+		# the type ID is the noise stream, so each sensor's data set is the same on every start
+		dataSet = self.sensorDataCache.generateDailySensorDataSet( \
+			dataGenerator = dataGenerator, curveType = curveType, \
+			minValue = floor, maxValue = ceiling, startHour = 0, endHour = 24, useSeconds = False, streamID = typeID)
+		
+		return {'dataSet': dataSet}
+	
+	def _getSensorSection(self, name: str) -> str:
+		return ConfigConst.CONSTRAINED_DEVICE + '.' + str(name)
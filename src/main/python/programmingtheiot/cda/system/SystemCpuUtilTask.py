@@ -1,26 +1,39 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
 import logging
-import psutil
+
+import programmingtheiot.common.ConfigConst as ConfigConst
 
 from programmingtheiot.cda.system.BaseSystemUtilTask import BaseSystemUtilTask
+from programmingtheiot.cda.system.CpuUtilSampler import CpuUtilSampler
 
 class SystemCpuUtilTask(BaseSystemUtilTask):
 	"""
-	Shell representation of class for student implementation.
+	Reports the CPU utilization (as a percent) since the previous call, via
+	a CpuUtilSampler, so a reading never blocks.
 	
 	"""
 
-	def __init__(self):
-		pass
+	def __init__(self, useProcFs: bool = True):
+		super(SystemCpuUtilTask, self).__init__(name = ConfigConst.CPU_UTIL_NAME, typeID = ConfigConst.CPU_UTIL_TYPE, useProcFs = useProcFs)
+		
+		self.cpuSampler = CpuUtilSampler(useProcFs = useProcFs)
 	
 	def getTelemetryValue(self) -> float:
-		pass
-		
\ No newline at end of file
+		"""
+		Returns the CPU utilization since the last call (or since boot, for
+		the first call). This doesn't block.
+		
+		@return float
+		"""
+		return self.cpuSampler.sample()
+	
+	def isProcFsEnabled(self) -> bool:
+		return self.cpuSampler.isProcFsEnabled()
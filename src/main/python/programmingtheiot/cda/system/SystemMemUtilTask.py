@@ -1,26 +1,82 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
 import logging
-import psutil
+
+import programmingtheiot.common.ConfigConst as ConfigConst
 
 from programmingtheiot.cda.system.BaseSystemUtilTask import BaseSystemUtilTask
+from programmingtheiot.cda.system.ProcFsReader import ProcFsReader
 
 class SystemMemUtilTask(BaseSystemUtilTask):
 	"""
-	Shell representation of class for student implementation.
+	Reports the memory utilization - the percent of memory that isn't
+	available to new processes (as psutil.virtual_memory().percent) - from
+	/proc/meminfo (see ProcFsReader) where it's available, or psutil.
 	
 	"""
+	
+	# /proc/meminfo fields, in kB
+	MEM_TOTAL_FIELD     = b'MemTotal:'
+	MEM_AVAILABLE_FIELD = b'MemAvailable:'
+	
+	# used to estimate the available memory on kernels without MemAvailable (before 3.14)
+	MEM_FREE_FIELDS = (b'MemFree:', b'Buffers:', b'Cached:')
 
-	def __init__(self):
-		pass
+	def __init__(self, memInfoPath: str = ProcFsReader.PROC_MEMINFO_PATH, useProcFs: bool = True):
+		"""
+		Constructor.
+		
+		@param memInfoPath The path of the kernel memory statistics file.
+		@param useProcFs If False, psutil is used even if 'memInfoPath' is available.
+		"""
+		super(SystemMemUtilTask, self).__init__(name = ConfigConst.MEM_UTIL_NAME, typeID = ConfigConst.MEM_UTIL_TYPE, useProcFs = useProcFs)
+		
+		self.memInfoReader = None
+		
+		if useProcFs and ProcFsReader.isAvailable(memInfoPath):
+			self.memInfoReader = ProcFsReader(memInfoPath)
+		else:
+			logging.info("Using psutil memory stats (%s not used).", memInfoPath)
 	
 	def getTelemetryValue(self) -> float:
-		pass
-		
\ No newline at end of file
+		if self.memInfoReader:
+			return self._parseMemInfo(self.memInfoReader.read())
+		
+		import psutil
+		
+		return psutil.virtual_memory().percent
+	
+	def isProcFsEnabled(self) -> bool:
+		return self.memInfoReader is not None
+	
+	def _parseMemInfo(self, memInfoData: bytes) -> float:
+		fields = {}
+		
+		for line in memInfoData.splitlines():
+			cols = line.split(None, 2)
+			
+			if len(cols) > 1:
+				fields[cols[0]] = int(cols[1])
+			
+			# MemTotal and MemAvailable are at the top, so the rest can be skipped
+			if self.MEM_AVAILABLE_FIELD in fields:
+				break
+		
+		memTotal = fields.get(self.MEM_TOTAL_FIELD, 0)
+		
+		if memTotal <= 0:
+			return 0.0
+		
+		memAvailable = fields.get(self.MEM_AVAILABLE_FIELD)
+		
+		if memAvailable is None:
+			memAvailable = sum(fields.get(field, 0) for field in self.MEM_FREE_FIELDS)
+		
+		return round(100.0 * (memTotal - memAvailable) / memTotal, 1)
@@ -0,0 +1,161 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import os
+import psutil
+
+from time import monotonic
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.cda.system.CpuUtilSampler import CpuUtilSampler
+from programmingtheiot.cda.system.ProcFsReader import ProcFsReader
+from programmingtheiot.cda.system.SystemMemUtilTask import SystemMemUtilTask
+from programmingtheiot.data.ExtendedSystemPerformanceData import ExtendedSystemPerformanceData
+
+class SystemMetricsCollector():
+	"""
+	Collects the CPU (total and per core utilization, iowait and steal),
+	memory, disk (utilization and I/O rates), network (byte and packet
+	rates) and load average metrics together, as a single
+	ExtendedSystemPerformanceData per snapshot.
+	
+	Each counter set is read once per snapshot, and none of the reads
+	block. The CPU metrics (see CpuUtilSampler) and the disk and network
+	rates are from the change in their counters since the previous
+	snapshot. For the first, the CPU metrics are since boot, and the rates
+	are 0.0.
+	
+	The CPU, memory and disk I/O metrics are read directly from /proc
+	(see ProcFsReader) where it's available, unless 'useProcFs' is False,
+	and from psutil otherwise.
+	
+	"""
+	
+	# /proc/diskstats sector counts are always in 512 byte units
+	DISK_SECTOR_SIZE = 512
+	SYS_BLOCK_PATH   = '/sys/block/'
+	
+	def __init__(self, diskPath: str = ConfigConst.DEFAULT_SYSTEM_DISK_PATH, useProcFs: bool = True):
+		"""
+		Constructor.
+		
+		@param diskPath The path of the file system to report the disk utilization of.
+		@param useProcFs If False, psutil is used even where /proc is available.
+		"""
+		self.diskPath = diskPath
+		
+		self.lastSnapshotTime = None
+		self.lastDiskIo = None
+		self.lastNetIo = None
+		
+		self.cpuSampler = CpuUtilSampler(useProcFs = useProcFs)
+		self.memUtilTask = SystemMemUtilTask(useProcFs = useProcFs)
+		
+		self.diskStatsReader = None
+		self.diskNames = {}
+		
+		if useProcFs and ProcFsReader.isAvailable(ProcFsReader.PROC_DISKSTATS_PATH):
+			self.diskStatsReader = ProcFsReader(ProcFsReader.PROC_DISKSTATS_PATH)
+	
+	def collectMetrics(self) -> ExtendedSystemPerformanceData:
+		"""
+		Takes a snapshot of the system metrics.
+		
+		@return ExtendedSystemPerformanceData
+		"""
+		snapshotTime = monotonic()
+		
+		cpuUtil = self.cpuSampler.sample()
+		memUtil = self.memUtilTask.getTelemetryValue()
+		diskUtil = self._getDiskUtilization()
+		diskIo = self._getDiskIoCounters()
+		netIo = psutil.net_io_counters()
+		loadAvg = psutil.getloadavg()
+		
+		sysPerfData = ExtendedSystemPerformanceData()
+		sysPerfData.setCpuUtilization(cpuUtil)
+		sysPerfData.setCpuUtilizationPerCore(self.cpuSampler.getCpuUtilizationPerCore())
+		sysPerfData.setCpuIoWait(self.cpuSampler.getIoWait())
+		sysPerfData.setCpuSteal(self.cpuSampler.getSteal())
+		sysPerfData.setMemoryUtilization(memUtil)
+		sysPerfData.setDiskUtilization(diskUtil)
+		sysPerfData.setLoadAverage(loadAvg)
+		
+		if self.lastSnapshotTime is not None:
+			elapsed = snapshotTime - self.lastSnapshotTime
+			
+			if elapsed > 0.0:
+				# disk I/O counters aren't available on some hosts (e.g. containers)
+				if diskIo and self.lastDiskIo:
+					sysPerfData.setDiskIoRates( \
+						self._getRate(diskIo[0], self.lastDiskIo[0], elapsed), \
+						self._getRate(diskIo[1], self.lastDiskIo[1], elapsed))
+				
+				if netIo and self.lastNetIo:
+					sysPerfData.setNetworkRates( \
+						self._getRate(netIo.bytes_recv, self.lastNetIo.bytes_recv, elapsed), \
+						self._getRate(netIo.bytes_sent, self.lastNetIo.bytes_sent, elapsed), \
+						self._getRate(netIo.packets_recv, self.lastNetIo.packets_recv, elapsed), \
+						self._getRate(netIo.packets_sent, self.lastNetIo.packets_sent, elapsed))
+		
+		self.lastSnapshotTime = snapshotTime
+		self.lastDiskIo = diskIo
+		self.lastNetIo = netIo
+		
+		return sysPerfData
+	
+	def _getDiskIoCounters(self) -> tuple:
+		"""
+		Returns the total bytes read from and written to all disks.
+		
+		@return tuple Of (read bytes, written bytes), or None if they aren't available.
+		"""
+		if self.diskStatsReader:
+			return self._parseDiskStats(self.diskStatsReader.read())
+		
+		diskIo = psutil.disk_io_counters()
+		
+		return (diskIo.read_bytes, diskIo.write_bytes) if diskIo else None
+	
+	def _getDiskUtilization(self) -> float:
+		try:
+			return psutil.disk_usage(self.diskPath).percent
+		except OSError as e:
+			logging.warning("Failed to get disk utilization for %s: %s", self.diskPath, str(e))
+			return 0.0
+	
+	def _getRate(self, count: int, lastCount: int, elapsed: float) -> float:
+		# a counter that went backwards was reset (e.g. an interface went down)
+		return max(0, count - lastCount) / elapsed
+	
+	def _isDisk(self, name: bytes) -> bool:
+		# whole disks (as opposed to partitions) are listed in /sys/block, as psutil counts them
+		isDisk = self.diskNames.get(name)
+		
+		if isDisk is None:
+			isDisk = os.path.exists(self.SYS_BLOCK_PATH + name.decode().replace('/', '!'))
+			self.diskNames[name] = isDisk
+		
+		return isDisk
+	
+	def _parseDiskStats(self, diskStatsData: bytes) -> tuple:
+		readBytes = 0
+		writeBytes = 0
+		
+		for line in diskStatsData.splitlines():
+			# major minor name reads reads_merged sectors_read read_time writes writes_merged sectors_written ...
+			cols = line.split()
+			
+			if len(cols) >= 10 and self._isDisk(cols[2]):
+				readBytes += int(cols[5]) * self.DISK_SECTOR_SIZE
+				writeBytes += int(cols[9]) * self.DISK_SECTOR_SIZE
+		
+		return (readBytes, writeBytes)
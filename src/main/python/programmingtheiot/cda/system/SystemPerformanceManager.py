@@ -1,43 +1,256 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
 import logging
+import math
 
-from apscheduler.schedulers.background import BackgroundScheduler
+from threading import Lock
 
 import programmingtheiot.common.ConfigConst as ConfigConst
 
 from programmingtheiot.common.ConfigUtil import ConfigUtil
 from programmingtheiot.common.IDataMessageListener import IDataMessageListener
+from programmingtheiot.common.PollScheduler import PollScheduler
 
-from programmingtheiot.cda.system.SystemCpuUtilTask import SystemCpuUtilTask
-from programmingtheiot.cda.system.SystemMemUtilTask import SystemMemUtilTask
-
-from programmingtheiot.data.SystemPerformanceData import SystemPerformanceData
+from programmingtheiot.cda.system.ProcessHealthTask import ProcessHealthTask
+from programmingtheiot.cda.system.RollingWindow import RollingWindow
+from programmingtheiot.cda.system.SystemMetricsCollector import SystemMetricsCollector
+from programmingtheiot.data.ExtendedSystemPerformanceData import ExtendedSystemPerformanceData
 
 class SystemPerformanceManager(object):
 	"""
-	Shell representation of class for student implementation.
+	Takes a snapshot of the system metrics (see SystemMetricsCollector)
+	every 'pollCycleSecs', and passes it to the data message listener as a
+	single ExtendedSystemPerformanceData.
+	
+	If 'systemPerfSampleSecs' is set (and less than 'pollCycleSecs'), the
+	snapshots are instead taken every 'systemPerfSampleSecs', and added to
+	a RollingWindow per utilization metric that spans 'pollCycleSecs'. Only
+	the aggregate is passed to the listener, every 'pollCycleSecs': the
+	utilization metrics are the window means, their min, max, mean, EWMA
+	and 95th percentile are in the aggregates, and the other metrics are
+	from the latest snapshot.
+	
+	If 'enableProcessHealth' is True, the CDA process's own health (see
+	ProcessHealthTask) is also passed to the listener every 'pollCycleSecs',
+	as a ProcessHealthData. Internal queues can be added to it via
+	addQueueDepthSource().
+	
+	Polling (and sampling) runs on the shared PollScheduler. Missed polls
+	aren't backfilled (the current utilization is all that's of interest).
 	
 	"""
+	
+	# the utilization metrics (all percentages) that are aggregated
+	AGGREGATED_METRICS = ( \
+		ConfigConst.CPU_UTIL_PROP, ConfigConst.MEM_UTIL_PROP, ConfigConst.DISK_UTIL_PROP, \
+		ConfigConst.CPU_IOWAIT_PROP, ConfigConst.CPU_STEAL_PROP)
 
 	def __init__(self):
-		pass
-
+		configUtil = ConfigUtil()
+		
+		self.pollRate = \
+			configUtil.getInteger( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.POLL_CYCLES_KEY, defaultVal = ConfigConst.DEFAULT_POLL_CYCLES)
+		
+		self.locationID = \
+			configUtil.getProperty( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.DEVICE_LOCATION_ID_KEY, defaultVal = ConfigConst.NOT_SET)
+		
+		diskPath = \
+			configUtil.getProperty( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.SYSTEM_DISK_PATH_KEY, defaultVal = ConfigConst.DEFAULT_SYSTEM_DISK_PATH)
+		
+		useProcFs = \
+			configUtil.getBoolean( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.ENABLE_PROC_FS_KEY)
+		
+		sampleRate = \
+			configUtil.getFloat( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.SYSTEM_PERF_SAMPLE_SECS_KEY, defaultVal = ConfigConst.DEFAULT_SYSTEM_PERF_SAMPLE_SECS)
+		
+		self.ewmaAlpha = \
+			configUtil.getFloat( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.SYSTEM_PERF_EWMA_ALPHA_KEY, defaultVal = RollingWindow.DEFAULT_EWMA_ALPHA)
+		
+		enableProcessHealth = \
+			configUtil.getBoolean( \
+				section = ConfigConst.CONSTRAINED_DEVICE, key = ConfigConst.ENABLE_PROCESS_HEALTH_KEY)
+		
+		if self.pollRate <= 0:
+			self.pollRate = ConfigConst.DEFAULT_POLL_CYCLES
+		
+		self.dataMsgListener = None
+		
+		self.metricsCollector = SystemMetricsCollector(diskPath = diskPath, useProcFs = useProcFs)
+		self.processHealthTask = ProcessHealthTask(useProcFs = useProcFs) if enableProcessHealth else None
+		
+		self.pollScheduler = PollScheduler()
+		self.jobID = 'SystemPerformanceManager@%x' % id(self)
+		self.sampleJobID = self.jobID + '.sample'
+		
+		self.sampleLock = Lock()
+		self.setSampleRate(sampleRate)
+	
+	def addQueueDepthSource(self, name: str, getQueueDepth) -> bool:
+		"""
+		Adds an internal queue to report the depth of in the process health.
+		
+		@param name The queue name, as reported.
+		@param getQueueDepth A callable that returns the current queue depth.
+		@return bool True if added; False if process health is disabled.
+		"""
+		if self.processHealthTask:
+			self.processHealthTask.addQueueDepthSource(name, getQueueDepth)
+			return True
+		
+		return False
+	
+	def getSampleRate(self) -> float:
+		"""
+		Returns the sample rate, in seconds, or 0.0 if snapshots aren't
+		aggregated.
+		
+		@return float
+		"""
+		return self.sampleRate
+	
 	def handleTelemetry(self):
-		pass
+		"""
+		Passes the aggregate of the samples in the rolling windows to the
+		listener, or if sampling is disabled, takes and passes a snapshot.
+		Then passes the process health, if it's enabled.
+		"""
+		if self.sampleRate > 0.0:
+			sysPerfData = self._getAggregatedData()
+		else:
+			sysPerfData = self.metricsCollector.collectMetrics()
+		
+		sysPerfData.setLocationID(self.locationID)
+		
+		logging.debug( \
+			"CPU utilization is %s percent, memory utilization is %s percent, and disk utilization is %s percent (%s samples).", \
+			str(sysPerfData.getCpuUtilization()), str(sysPerfData.getMemoryUtilization()), str(sysPerfData.getDiskUtilization()), \
+			str(sysPerfData.getSampleCount()))
+		
+		if self.dataMsgListener:
+			self.dataMsgListener.handleSystemPerformanceMessage(sysPerfData)
+		
+		if self.processHealthTask:
+			healthData = self.processHealthTask.getHealthData()
+			healthData.setLocationID(self.locationID)
+			
+			logging.debug( \
+				"CDA RSS is %s bytes, with %s threads, %s open file descriptors, and %s seconds GC pause time.", \
+				str(healthData.getRssBytes()), str(healthData.getThreadCount()), str(healthData.getOpenFdCount()), \
+				str(healthData.getGcPauseTotal()))
+			
+			if self.dataMsgListener:
+				self.dataMsgListener.handleSystemPerformanceMessage(healthData)
+	
+	def sampleTelemetry(self):
+		"""
+		Takes a snapshot of the system metrics, and adds its utilization
+		metrics to the rolling windows.
+		"""
+		sysPerfData = self.metricsCollector.collectMetrics()
+		metricValues = self._getMetricValues(sysPerfData)
+		
+		with self.sampleLock:
+			self.latestData = sysPerfData
+			
+			for metric, window in self.windows.items():
+				window.addValue(metricValues[metric])
 		
 	def setDataMessageListener(self, listener: IDataMessageListener) -> bool:
-		pass
+		if listener:
+			self.dataMsgListener = listener
+			return True
+		
+		return False
+	
+	def setSampleRate(self, sampleRate: float):
+		"""
+		Sets the sample rate, and clears the rolling windows. Takes effect
+		the next time the manager is started.
+		
+		@param sampleRate The sample rate, in seconds. If 0.0, or not less
+		than the poll rate, snapshots aren't aggregated.
+		"""
+		if sampleRate <= 0.0 or sampleRate >= self.pollRate:
+			sampleRate = 0.0
+		
+		windowSize = math.ceil(self.pollRate / sampleRate) if sampleRate > 0.0 else 1
+		
+		with self.sampleLock:
+			self.sampleRate = sampleRate
+			self.latestData = None
+			self.windows = {metric: RollingWindow(size = windowSize, ewmaAlpha = self.ewmaAlpha) for metric in self.AGGREGATED_METRICS}
 	
-	def startManager(self):
-		pass
+	def startManager(self) -> bool:
+		if self.pollScheduler.addJob( \
+			jobID = self.jobID, callback = self.handleTelemetry, \
+			intervalSecs = self.pollRate, catchUpPolicy = ConfigConst.CATCH_UP_SKIP):
+			
+			if self.sampleRate > 0.0:
+				self.pollScheduler.addJob( \
+					jobID = self.sampleJobID, callback = self.sampleTelemetry, \
+					intervalSecs = self.sampleRate, catchUpPolicy = ConfigConst.CATCH_UP_SKIP, startDelaySecs = 0.0)
+			
+			if self.processHealthTask:
+				self.processHealthTask.startGcMonitoring()
+			
+			logging.info("Started SystemPerformanceManager.")
+			return True
 		
-	def stopManager(self):
-		pass
+		logging.warning("SystemPerformanceManager already started. Ignoring.")
+		return False
+		
+	def stopManager(self) -> bool:
+		if self.pollScheduler.removeJob(self.jobID):
+			self.pollScheduler.removeJob(self.sampleJobID)
+			
+			if self.processHealthTask:
+				self.processHealthTask.stopGcMonitoring()
+			
+			logging.info("Stopped SystemPerformanceManager.")
+			return True
+		
+		logging.warning("SystemPerformanceManager already stopped. Ignoring.")
+		return False
+	
+	def _getAggregatedData(self) -> ExtendedSystemPerformanceData:
+		# nothing's been sampled yet if the manager was just started
+		if self.latestData is None:
+			self.sampleTelemetry()
+		
+		sysPerfData = ExtendedSystemPerformanceData()
+		
+		with self.sampleLock:
+			sysPerfData.updateData(self.latestData)
+			
+			aggregates = {metric: window.getStats() for metric, window in self.windows.items()}
+			sampleCount = self.windows[ConfigConst.CPU_UTIL_PROP].getCount()
+		
+		sysPerfData.setCpuUtilization(aggregates[ConfigConst.CPU_UTIL_PROP][ConfigConst.MEAN_PROP])
+		sysPerfData.setMemoryUtilization(aggregates[ConfigConst.MEM_UTIL_PROP][ConfigConst.MEAN_PROP])
+		sysPerfData.setDiskUtilization(aggregates[ConfigConst.DISK_UTIL_PROP][ConfigConst.MEAN_PROP])
+		sysPerfData.setCpuIoWait(aggregates[ConfigConst.CPU_IOWAIT_PROP][ConfigConst.MEAN_PROP])
+		sysPerfData.setCpuSteal(aggregates[ConfigConst.CPU_STEAL_PROP][ConfigConst.MEAN_PROP])
+		sysPerfData.setAggregates(sampleCount, aggregates)
+		
+		return sysPerfData
+	
+	def _getMetricValues(self, sysPerfData: ExtendedSystemPerformanceData) -> dict:
+		return { \
+			ConfigConst.CPU_UTIL_PROP: sysPerfData.getCpuUtilization(), \
+			ConfigConst.MEM_UTIL_PROP: sysPerfData.getMemoryUtilization(), \
+			ConfigConst.DISK_UTIL_PROP: sysPerfData.getDiskUtilization(), \
+			ConfigConst.CPU_IOWAIT_PROP: sysPerfData.getCpuIoWait(), \
+			ConfigConst.CPU_STEAL_PROP: sysPerfData.getCpuSteal() }
@@ -0,0 +1,191 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+class TaskRegistry():
+	"""
+	Maps type IDs (see ConfigConst) to the sensor and actuator task classes
+	that implement them, for either simulated or emulated devices.
+	
+	Nothing is imported or created up front. A task's module is imported
+	the first time its class is needed, and the resolved class is cached
+	for every registry. The task itself is created on the first call to
+	getTask(). This keeps optional drivers (e.g. pisense, used by the
+	emulators) from being imported unless their tasks are actually used.
+	
+	Modules are named by their fully qualified name, and (as with all
+	tasks in this project) the class has the same name as its module.
+	
+	"""
+	
+	SIM_TASK_MODULES = { \
+		ConfigConst.HVAC_ACTUATOR_TYPE:       'programmingtheiot.cda.sim.HvacActuatorSimTask', \
+		ConfigConst.HUMIDIFIER_ACTUATOR_TYPE: 'programmingtheiot.cda.sim.HumidifierActuatorSimTask', \
+		ConfigConst.HUMIDITY_SENSOR_TYPE:     'programmingtheiot.cda.sim.HumiditySensorSimTask', \
+		ConfigConst.PRESSURE_SENSOR_TYPE:     'programmingtheiot.cda.sim.PressureSensorSimTask', \
+		ConfigConst.TEMP_SENSOR_TYPE:         'programmingtheiot.cda.sim.TemperatureSensorSimTask' }
+	
+	EMULATED_TASK_MODULES = { \
+		ConfigConst.HVAC_ACTUATOR_TYPE:        'programmingtheiot.cda.emulated.HvacEmulatorTask', \
+		ConfigConst.HUMIDIFIER_ACTUATOR_TYPE:  'programmingtheiot.cda.emulated.HumidifierEmulatorTask', \
+		ConfigConst.LED_DISPLAY_ACTUATOR_TYPE: 'programmingtheiot.cda.emulated.LedDisplayEmulatorTask', \
+		ConfigConst.HUMIDITY_SENSOR_TYPE:      'programmingtheiot.cda.emulated.HumiditySensorEmulatorTask', \
+		ConfigConst.PRESSURE_SENSOR_TYPE:      'programmingtheiot.cda.emulated.PressureSensorEmulatorTask', \
+		ConfigConst.TEMP_SENSOR_TYPE:          'programmingtheiot.cda.emulated.TemperatureSensorEmulatorTask' }
+	
+	# resolved classes, keyed by module name, shared by all registries
+	_taskClasses = {}
+	_taskClassLock = threading.Lock()
+	
+	def __init__(self, useEmulator: bool = False, taskArgsFactory = None, taskModules: dict = None):
+		"""
+		Constructor for TaskRegistry.
+		
+		@param useEmulator If True, the emulated tasks are used; otherwise the simulated tasks.
+		@param taskArgsFactory Optional callable that takes a type ID and returns the
+		dict of keyword args to create that task with (or None for no args).
+		@param taskModules Optional dict of type ID to module name, which replaces the
+		default (simulated or emulated) mapping.
+		"""
+		if taskModules is None:
+			taskModules = self.EMULATED_TASK_MODULES if useEmulator else self.SIM_TASK_MODULES
+		
+		self.useEmulator = useEmulator
+		self.taskArgsFactory = taskArgsFactory
+		self.taskModules = dict(taskModules)
+		
+		self.tasks = {}
+		self.taskLocks = {}
+		self.registryLock = threading.Lock()
+	
+	def getLoadedTasks(self) -> dict:
+		"""
+		Returns the tasks created so far, keyed by type ID.
+		
+		@return dict
+		"""
+		with self.registryLock:
+			return dict(self.tasks)
+	
+	def getTask(self, typeID: int):
+		"""
+		Returns the task for 'typeID', importing its module and creating it
+		if this is the first call for 'typeID'.
+		
+		@param typeID The sensor or actuator type ID.
+		@return The task, or None if no task is registered for 'typeID'.
+		"""
+		with self.registryLock:
+			task = self.tasks.get(typeID)
+			
+			if task or typeID not in self.taskModules:
+				return task
+			
+			taskLock = self.taskLocks.setdefault(typeID, threading.Lock())
+		
+		# create the task outside the registry lock, so different tasks can be
+		# created in parallel (see loadTasks())
+		with taskLock:
+			with self.registryLock:
+				task = self.tasks.get(typeID)
+			
+			if not task:
+				taskClass = self.getTaskClass(typeID)
+				taskArgs = self.taskArgsFactory(typeID) if self.taskArgsFactory else None
+				
+				task = taskClass(**taskArgs) if taskArgs else taskClass()
+				
+				with self.registryLock:
+					self.tasks[typeID] = task
+				
+				logging.info("Created task %s for type ID %d.", taskClass.__name__, typeID)
+			
+			return task
+	
+	def getTaskClass(self, typeID: int):
+		"""
+		Returns the task class for 'typeID', importing its module if needed.
+		
+		@param typeID The sensor or actuator type ID.
+		@return The task class, or None if no task is registered for 'typeID'.
+		"""
+		moduleName = self.taskModules.get(typeID)
+		
+		if not moduleName:
+			return None
+		
+		with self._taskClassLock:
+			taskClass = self._taskClasses.get(moduleName)
+		
+		if not taskClass:
+			# import_module() is thread safe, so it's not held under the lock
+			className = moduleName.rpartition('.')[2]
+			taskClass = getattr(import_module(moduleName), className)
+			
+			with self._taskClassLock:
+				self._taskClasses[moduleName] = taskClass
+		
+		return taskClass
+	
+	def getTaskTypes(self) -> list:
+		return list(self.taskModules.keys())
+	
+	def hasTask(self, typeID: int) -> bool:
+		return typeID in self.taskModules
+	
+	def isTaskLoaded(self, typeID: int) -> bool:
+		with self.registryLock:
+			return typeID in self.tasks
+	
+	def loadTasks(self, typeIDs: list = None, parallel: bool = True) -> list:
+		"""
+		Creates the tasks for 'typeIDs' (or all registered type IDs) now,
+		rather than on first use. Any that fail are logged and skipped.
+		
+		@param typeIDs The type IDs to load. Unregistered type IDs are skipped.
+		@param parallel If True, the tasks are created on a thread pool.
+		@return list The loaded tasks, in the order of 'typeIDs'.
+		"""
+		if typeIDs is None:
+			typeIDs = self.getTaskTypes()
+		
+		typeIDs = [typeID for typeID in typeIDs if self.hasTask(typeID)]
+		
+		if parallel and len(typeIDs) > 1:
+			with ThreadPoolExecutor(max_workers = len(typeIDs)) as executor:
+				results = list(executor.map(self._loadTask, typeIDs))
+		else:
+			results = [self._loadTask(typeID) for typeID in typeIDs]
+		
+		return [task for task in results if task]
+	
+	def registerTask(self, typeID: int, moduleName: str):
+		"""
+		Registers (or replaces) the task module for 'typeID'. This has no
+		effect on a task that has already been created.
+		
+		@param typeID The sensor or actuator type ID.
+		@param moduleName The fully qualified module name - e.g. 'programmingtheiot.cda.sim.HvacActuatorSimTask'.
+		"""
+		with self.registryLock:
+			self.taskModules[typeID] = moduleName
+	
+	def _loadTask(self, typeID: int):
+		try:
+			return self.getTask(typeID)
+		except Exception as e:
+			logging.exception("Failed to load task for type ID %d: %s", typeID, str(e))
+			return None
@@ -33,6 +33,22 @@ DEFAULT_STATUS           = 0
 DEFAULT_TIMEOUT          = 5
 DEFAULT_TTL              = 300
 DEFAULT_QOS              = 0
+DEFAULT_ACTUATOR_QUEUE_SIZE = 16
+DEFAULT_SYSTEM_DISK_PATH    = '/'
+DEFAULT_SIM_DATA_SEED       = -1
+DEFAULT_SIM_DATA_CHUNK_SIZE = 0
+DEFAULT_SENSOR_DEADBAND     = 0.0
+DEFAULT_SYSTEM_PERF_SAMPLE_SECS = 0.0
+
+# catch up policies for missed poll ticks (see PollScheduler)
+CATCH_UP_SKIP  = 'skip'
+CATCH_UP_BURST = 'burst'
+CATCH_UP_BATCH = 'batch'
+
+# positive (non-error) status codes for suppressed actuator commands
+ACTUATOR_NO_OP_STATUS        = 1
+ACTUATOR_DEBOUNCED_STATUS    = 2
+ACTUATOR_RATE_LIMITED_STATUS = 3
 
 # for purposes of this library, float precision is more then sufficient
 DEFAULT_LAT = DEFAULT_VAL
@@ -84,12 +100,46 @@ ELEVATION_PROP   = 'elevation'
 COMMAND_PROP     = 'command'
 STATE_DATA_PROP  = 'stateData'
 VALUE_PROP       = 'value'
+VALUES_PROP      = 'values'
+TIMESTAMPS_PROP  = 'timeStamps'
+NAMES_PROP       = 'names'
+TYPE_IDS_PROP    = 'typeIDs'
 IS_RESPONSE_PROP = 'isResponse'
 
 CPU_UTIL_PROP    = 'cpuUtil'
 DISK_UTIL_PROP   = 'diskUtil'
 MEM_UTIL_PROP    = 'memUtil'
 
+CPU_UTIL_PER_CORE_PROP     = 'cpuUtilPerCore'
+CPU_IOWAIT_PROP            = 'cpuIoWait'
+CPU_STEAL_PROP             = 'cpuSteal'
+DISK_READ_RATE_PROP        = 'diskReadRate'
+DISK_WRITE_RATE_PROP       = 'diskWriteRate'
+NET_BYTES_RECV_RATE_PROP   = 'netBytesRecvRate'
+NET_BYTES_SENT_RATE_PROP   = 'netBytesSentRate'
+NET_PACKETS_RECV_RATE_PROP = 'netPacketsRecvRate'
+NET_PACKETS_SENT_RATE_PROP = 'netPacketsSentRate'
+LOAD_AVG_PROP              = 'loadAvg'
+SAMPLE_COUNT_PROP          = 'sampleCount'
+AGGREGATES_PROP            = 'aggregates'
+
+# rolling window aggregate names (see RollingWindow)
+MIN_PROP  = 'min'
+MAX_PROP  = 'max'
+MEAN_PROP = 'mean'
+EWMA_PROP = 'ewma'
+P95_PROP  = 'p95'
+
+# process health props (see ProcessHealthData)
+RSS_BYTES_PROP      = 'rssBytes'
+CPU_TIME_PROP       = 'cpuTime'
+THREAD_COUNT_PROP   = 'threadCount'
+OPEN_FD_COUNT_PROP  = 'openFdCount'
+GC_COLLECTIONS_PROP = 'gcCollections'
+GC_PAUSE_TOTAL_PROP = 'gcPauseTotal'
+GC_PAUSE_MAX_PROP   = 'gcPauseMax'
+QUEUE_DEPTHS_PROP   = 'queueDepths'
+
 ACTION_ID_PROP             = 'actionID'
 DATA_URI_PROP              = 'dataURI'
 MESSAGE_PROP               = 'message'
@@ -125,7 +175,9 @@ HVAC_ACTUATOR_NAME       = 'HvacActuator'
 HUMIDITY_SENSOR_NAME = 'HumiditySensor'
 PRESSURE_SENSOR_NAME = 'PressureSensor'
 TEMP_SENSOR_NAME     = 'TempSensor'
+MULTI_SENSOR_NAME    = 'MultiSensor'
 SYSTEM_PERF_NAME     = 'SystemPerfMsg'
+PROCESS_HEALTH_NAME  = 'CdaProcessHealth'
 CAMERA_SENSOR_NAME   = 'CameraSensor'
 
 COMMAND_OFF = DEFAULT_COMMAND
@@ -202,6 +254,23 @@ DEFAULT_CRED_FILE_NAME   = '../../../../../../../cred/PiotCred.props'
 TEST_GDA_DATA_PATH_KEY = 'testGdaDataPath'
 TEST_CDA_DATA_PATH_KEY = 'testCdaDataPath'
 
+SIM_DATA_CACHE_PATH_KEY     = 'simDataCachePath'
+SIM_DATA_CACHE_MAX_SIZE_KEY = 'simDataCacheMaxSizeMB'
+SIM_DATA_SEED_KEY           = 'simDataSeed'
+SIM_DATA_CHUNK_SIZE_KEY     = 'simDataChunkSize'
+
+SENSOR_DATA_POOL_SIZE_KEY   = 'sensorDataPoolSize'
+SIM_PLAYBACK_SPEED_KEY      = 'simPlaybackSpeed'
+ENABLE_SENSOR_TICK_MODE_KEY = 'enableSensorTickMode'
+POLL_CATCH_UP_POLICY_KEY    = 'pollCatchUpPolicy'
+
+# per sensor poll rate (POLL_CYCLES_KEY) and deadband filtering - these are read from
+# a section named CONSTRAINED_DEVICE + '.' + the sensor name, e.g. 'ConstrainedDevice.TempSensor'
+SENSOR_DEADBAND_KEY         = 'deadband'
+SENSOR_DEADBAND_PERCENT_KEY = 'deadbandPercent'
+SENSOR_MAX_SILENCE_SECS_KEY = 'maxSilenceSecs'
+SENSOR_HYSTERESIS_KEY       = 'hysteresis'
+
 LOCAL   = 'Local'
 MQTT    = 'Mqtt'
 COAP    = 'Coap'
@@ -260,8 +329,14 @@ ENABLE_COAP_CLIENT_KEY = 'enableCoapClient'
 ENABLE_COAP_SERVER_KEY = 'enableCoapServer'
 
 ENABLE_SYSTEM_PERF_KEY = 'enableSystemPerformance'
+SYSTEM_DISK_PATH_KEY   = 'systemDiskPath'
+ENABLE_PROC_FS_KEY     = 'enableProcFs'
 ENABLE_SENSING_KEY     = 'enableSensing'
 
+SYSTEM_PERF_SAMPLE_SECS_KEY = 'systemPerfSampleSecs'
+SYSTEM_PERF_EWMA_ALPHA_KEY  = 'systemPerfEwmaAlpha'
+ENABLE_PROCESS_HEALTH_KEY   = 'enableProcessHealth'
+
 HUMIDITY_SIM_FLOOR_KEY   = 'humiditySimFloor'
 HUMIDITY_SIM_CEILING_KEY = 'humiditySimCeiling'
 PRESSURE_SIM_FLOOR_KEY   = 'pressureSimFloor'
@@ -273,6 +348,10 @@ HANDLE_TEMP_CHANGE_ON_DEVICE_KEY = 'handleTempChangeOnDevice'
 TRIGGER_HVAC_TEMP_FLOOR_KEY   = 'triggerHvacTempFloor'
 TRIGGER_HVAC_TEMP_CEILING_KEY = 'triggerHvacTempCeiling'
 
+ACTUATOR_DEBOUNCE_SECS_KEY     = 'actuatorDebounceSecs'
+ACTUATOR_MIN_INTERVAL_SECS_KEY = 'actuatorMinIntervalSecs'
+ACTUATOR_QUEUE_SIZE_KEY        = 'actuatorQueueSize'
+
 RUN_FOREVER_KEY    = 'runForever'
 TEST_EMPTY_APP_KEY = 'testEmptyApp'
 
@@ -12,7 +12,9 @@ import logging
 from programmingtheiot.common.ResourceNameEnum import ResourceNameEnum
 from programmingtheiot.common.IDataMessageListener import IDataMessageListener
 from programmingtheiot.data.ActuatorData import ActuatorData
+from programmingtheiot.data.MultiSensorData import MultiSensorData
 from programmingtheiot.data.SensorData import SensorData
+from programmingtheiot.data.SensorDataBatch import SensorDataBatch
 from programmingtheiot.data.SystemPerformanceData import SystemPerformanceData
 from programmingtheiot.common.ITelemetryDataListener import ITelemetryDataListener
 from programmingtheiot.common.ISystemPerformanceDataListener import ISystemPerformanceDataListener
@@ -98,6 +100,24 @@ class DefaultDataMessageListener(IDataMessageListener):
 		logging.info('Topic: %s  Message: %s', resourceEnum.value(), msg)
 		return True
 
+	def handleMultiSensorMessage(self, data: MultiSensorData) -> bool:
+		"""
+		Callback function to handle one reading from each of several sensors,
+		packaged as a MultiSensorData object. Telemetry listeners are notified
+		with the reading from their sensor.
+		
+		@param data The MultiSensorData message received.
+		@return bool True on success; False otherwise.
+		"""
+		if data:
+			logging.info('Multi Sensor Message: ' + str(data))
+			
+			for index, name in enumerate(data.getNames()):
+				if name in self.telemetryDataListeners:
+					self.telemetryDataListeners[name].onSensorDataUpdate(data.getSensorData(index))
+			
+		return True
+	
 	def handleSensorMessage(self, data: SensorData) -> bool:
 		"""
 		Callback function to handle a sensor message packaged as a SensorData object.
@@ -113,6 +133,40 @@ class DefaultDataMessageListener(IDataMessageListener):
 			
 		return True
 	
+	def handleSensorMessageBatch(self, data: SensorDataBatch) -> bool:
+		"""
+		Callback function to handle a batch of sensor messages packaged as a
+		SensorDataBatch object. Telemetry listeners are notified with the
+		latest reading in the batch.
+		
+		@param data The SensorDataBatch message received.
+		@return bool True on success; False otherwise.
+		"""
+		if data:
+			logging.info('Sensor Message Batch: ' + str(data))
+			
+			if data.getCount() > 0 and data.getName() in self.telemetryDataListeners:
+				self.telemetryDataListeners[data.getName()].onSensorDataUpdate(data.getSensorData())
+			
+		return True
+	
+	def handleSuppressedSensorMessage(self, data: SensorData) -> bool:
+		"""
+		Callback function to handle a sensor message that was suppressed by the
+		sensor manager's report-on-change filter. Telemetry listeners are still
+		notified, since they're local.
+		
+		@param data The SensorData message received.
+		@return bool True on success; False otherwise.
+		"""
+		if data:
+			logging.debug('Suppressed Sensor Message: ' + str(data))
+			
+			if data.getName() in self.telemetryDataListeners:
+				self.telemetryDataListeners[data.getName()].onSensorDataUpdate(data)
+			
+		return True
+	
 	def handleSystemPerformanceMessage(self, data: SystemPerformanceData) -> bool:
 		"""
 		Callback function to handle a system performance message packaged as
@@ -10,7 +10,9 @@
 from programmingtheiot.common.ResourceNameEnum import ResourceNameEnum
 
 from programmingtheiot.data.ActuatorData import ActuatorData
+from programmingtheiot.data.MultiSensorData import MultiSensorData
 from programmingtheiot.data.SensorData import SensorData
+from programmingtheiot.data.SensorDataBatch import SensorDataBatch
 from programmingtheiot.data.SystemPerformanceData import SystemPerformanceData
 from programmingtheiot.common.ITelemetryDataListener import ITelemetryDataListener
 from programmingtheiot.common.ISystemPerformanceDataListener import ISystemPerformanceDataListener
@@ -78,6 +80,16 @@ class IDataMessageListener():
 		"""
 		pass
 
+	def handleMultiSensorMessage(self, data: MultiSensorData) -> bool:
+		"""
+		Callback function to handle one reading from each of several sensors,
+		taken at the same time, packaged as a MultiSensorData object.
+		
+		@param data The MultiSensorData message received.
+		@return bool True on success; False otherwise.
+		"""
+		pass
+	
 	def handleSensorMessage(self, data: SensorData) -> bool:
 		"""
 		Callback function to handle a sensor message packaged as a SensorData object.
@@ -87,6 +99,28 @@ class IDataMessageListener():
 		"""
 		pass
 	
+	def handleSensorMessageBatch(self, data: SensorDataBatch) -> bool:
+		"""
+		Callback function to handle a batch of sensor messages packaged as a
+		SensorDataBatch object (e.g. when backfilling missed polls).
+		
+		@param data The SensorDataBatch message received.
+		@return bool True on success; False otherwise.
+		"""
+		pass
+	
+	def handleSuppressedSensorMessage(self, data: SensorData) -> bool:
+		"""
+		Callback function to handle a sensor message packaged as a SensorData
+		object, which was suppressed by the sensor manager's report-on-change
+		filter. It should update local state (e.g. the cache) only, and not be
+		sent upstream.
+		
+		@param data The SensorData message received.
+		@return bool True on success; False otherwise.
+		"""
+		pass
+	
 	def handleSystemPerformanceMessage(self, data: SystemPerformanceData) -> bool:
 		"""
 		Callback function to handle a system performance message packaged as
@@ -0,0 +1,198 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+#
+
+import heapq
+import itertools
+import logging
+import threading
+
+from time import monotonic
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.common.Singleton import Singleton
+
+class PollScheduler(metaclass = Singleton):
+	"""
+	Runs periodic jobs (e.g. sensor and system performance polls) on a
+	single, shared timer thread, using a min-heap of job deadlines.
+	
+	Each job runs on a fixed grid (its first deadline plus a whole number
+	of intervals), so the cadence doesn't drift with callback run time. If
+	one or more ticks of a job are missed (e.g. because another callback
+	ran long), its catch-up policy decides what happens:
+	 - CATCH_UP_SKIP: the callback is called once, and the missed ticks are dropped.
+	 - CATCH_UP_BURST: the callback is called once per missed tick, then once more.
+	 - CATCH_UP_BATCH: the callback is called once, with the number of missed ticks.
+	
+	Callbacks run on the timer thread, so they should be short. The thread
+	is started when the first job is added, and exits when the last job is
+	removed.
+	
+	Implemented as a Singleton using the Singleton metaclass.
+	
+	"""
+	
+	CATCH_UP_POLICIES = (ConfigConst.CATCH_UP_SKIP, ConfigConst.CATCH_UP_BURST, ConfigConst.CATCH_UP_BATCH)
+	
+	def __init__(self):
+		self.jobs = {}
+		self.jobHeap = []
+		self.jobSequence = itertools.count()
+		self.condition = threading.Condition()
+		self.timerThread = None
+	
+	def addJob(self, jobID: str, callback, intervalSecs: float, catchUpPolicy: str = ConfigConst.CATCH_UP_SKIP, startDelaySecs: float = None) -> bool:
+		"""
+		Adds a periodic job.
+		
+		@param jobID The unique ID of the job.
+		@param callback The callable to run. For CATCH_UP_BATCH it's passed the
+		number of missed ticks; otherwise it's called with no args.
+		@param intervalSecs The time between runs, in seconds.
+		@param catchUpPolicy One of CATCH_UP_SKIP, CATCH_UP_BURST or CATCH_UP_BATCH.
+		@param startDelaySecs The time until the first run, in seconds. If None, 'intervalSecs' is used.
+		@return bool True if the job was added; False if 'jobID' already exists.
+		"""
+		if intervalSecs <= 0.0:
+			raise ValueError("Poll interval must be > 0: %s" % str(intervalSecs))
+		
+		if catchUpPolicy not in self.CATCH_UP_POLICIES:
+			raise ValueError("Invalid catch up policy: %s" % str(catchUpPolicy))
+		
+		if startDelaySecs is None:
+			startDelaySecs = intervalSecs
+		
+		with self.condition:
+			if jobID in self.jobs:
+				logging.warning("Poll job %s already exists. Ignoring.", jobID)
+				return False
+			
+			job = _PollJob(jobID, callback, intervalSecs, catchUpPolicy)
+			
+			self.jobs[jobID] = job
+			heapq.heappush(self.jobHeap, (monotonic() + max(0.0, startDelaySecs), next(self.jobSequence), job))
+			
+			if not self.timerThread:
+				self.timerThread = threading.Thread(target = self._runTimer, name = 'PollScheduler', daemon = True)
+				self.timerThread.start()
+			
+			self.condition.notify()
+		
+		logging.info("Added poll job %s every %s secs (catch up policy: %s).", jobID, str(intervalSecs), catchUpPolicy)
+		return True
+	
+	def getJobIDs(self) -> list:
+		with self.condition:
+			return list(self.jobs.keys())
+	
+	def getJobStats(self, jobID: str) -> dict:
+		"""
+		Returns the run and missed tick counts of a job.
+		
+		@param jobID The ID of the job.
+		@return dict With keys 'runCount' and 'missedCount', or None if there's no such job.
+		"""
+		with self.condition:
+			job = self.jobs.get(jobID)
+			
+			if not job:
+				return None
+			
+			return {'runCount': job.runCount, 'missedCount': job.missedCount}
+	
+	def hasJob(self, jobID: str) -> bool:
+		with self.condition:
+			return jobID in self.jobs
+	
+	def isRunning(self) -> bool:
+		with self.condition:
+			return self.timerThread is not None
+	
+	def removeJob(self, jobID: str) -> bool:
+		"""
+		Removes a job. If the job is running, that run completes.
+		
+		@param jobID The ID of the job.
+		@return bool True if the job was removed; False if there's no such job.
+		"""
+		with self.condition:
+			job = self.jobs.pop(jobID, None)
+			
+			if not job:
+				return False
+			
+			# the heap entry is dropped when it reaches the top
+			job.isCancelled = True
+			self.condition.notify()
+		
+		logging.info("Removed poll job %s.", jobID)
+		return True
+	
+	def _runJob(self, job, missedTicks: int):
+		try:
+			if job.catchUpPolicy == ConfigConst.CATCH_UP_BATCH:
+				job.callback(missedTicks)
+			elif job.catchUpPolicy == ConfigConst.CATCH_UP_BURST:
+				for _ in range(missedTicks + 1):
+					job.callback()
+			else:
+				job.callback()
+		except Exception as e:
+			logging.exception("Poll job %s failed: %s", job.jobID, str(e))
+	
+	def _runTimer(self):
+		while True:
+			with self.condition:
+				while True:
+					if not self.jobs:
+						self.jobHeap.clear()
+						self.timerThread = None
+						return
+					
+					deadline, _, job = self.jobHeap[0]
+					
+					if job.isCancelled:
+						heapq.heappop(self.jobHeap)
+						continue
+					
+					waitTime = deadline - monotonic()
+					
+					if waitTime <= 0.0:
+						heapq.heappop(self.jobHeap)
+						break
+					
+					self.condition.wait(waitTime)
+				
+				missedTicks = int((monotonic() - deadline) // job.intervalSecs)
+				
+				if missedTicks > 0:
+					logging.debug("Poll job %s missed %d ticks.", job.jobID, missedTicks)
+				
+				job.runCount += 1
+				job.missedCount += missedTicks
+				
+				heapq.heappush(self.jobHeap, (deadline + (missedTicks + 1) * job.intervalSecs, next(self.jobSequence), job))
+			
+			self._runJob(job, missedTicks)
+
+class _PollJob():
+	"""
+	A periodic job managed by PollScheduler.
+	
+	"""
+	
+	def __init__(self, jobID: str, callback, intervalSecs: float, catchUpPolicy: str):
+		self.jobID = jobID
+		self.callback = callback
+		self.intervalSecs = intervalSecs
+		self.catchUpPolicy = catchUpPolicy
+		self.isCancelled = False
+		self.runCount = 0
+		self.missedCount = 0
@@ -1,11 +1,11 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
 import programmingtheiot.common.ConfigConst as ConfigConst
 
@@ -13,38 +13,64 @@ from programmingtheiot.data.BaseIotData import BaseIotData
 
 class ActuatorData(BaseIotData):
 	"""
-	Shell representation of class for student implementation.
+	Data container for an actuator command or - once setAsResponse() is
+	called - the actuator's response to it. Adds the command, value and
+	state data to the name, type ID, status and time stamp stored by
+	BaseIotData.
 	
 	"""
 
 	def __init__(self, typeID: int = ConfigConst.DEFAULT_ACTUATOR_TYPE, name = ConfigConst.NOT_SET, d = None):
 		super(ActuatorData, self).__init__(name = name, typeID = typeID, d = d)
-		pass
+		
+		self.value = ConfigConst.DEFAULT_VAL
+		self.command = ConfigConst.DEFAULT_COMMAND
+		self.stateData = ""
+		self.isResponse = False
+		
+		if d:
+			self.value = d.get(ConfigConst.VALUE_PROP, ConfigConst.DEFAULT_VAL)
+			self.command = d.get(ConfigConst.COMMAND_PROP, ConfigConst.DEFAULT_COMMAND)
+			self.stateData = d.get(ConfigConst.STATE_DATA_PROP, "")
+			self.isResponse = d.get(ConfigConst.IS_RESPONSE_PROP, False)
 	
 	def getCommand(self) -> int:
-		pass
+		return self.command
 	
 	def getStateData(self) -> str:
-		pass
+		return self.stateData
 	
 	def getValue(self) -> float:
-		pass
+		return self.value
 	
 	def isResponseFlagEnabled(self) -> bool:
-		return False
+		return self.isResponse
 	
 	def setCommand(self, command: int):
-		pass
+		self.command = command
+		self.updateTimeStamp()
 	
 	def setAsResponse(self):
-		pass
+		self.isResponse = True
+		self.updateTimeStamp()
 		
 	def setStateData(self, stateData: str):
-		pass
+		if stateData:
+			self.stateData = stateData
+			self.updateTimeStamp()
 	
 	def setValue(self, val: float):
-		pass
+		self.value = val
+		self.updateTimeStamp()
 		
 	def _handleUpdateData(self, data):
-		pass
-		
\ No newline at end of file
+		"""
+		Copies the command, state data, value and response flag from 'data'.
+		
+		@param data The ActuatorData to apply to this instance.
+		"""
+		if data and isinstance(data, ActuatorData):
+			self.command = data.getCommand()
+			self.stateData = data.getStateData()
+			self.value = data.getValue()
+			self.isResponse = data.isResponseFlagEnabled()
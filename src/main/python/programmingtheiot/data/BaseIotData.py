@@ -223,9 +223,10 @@ class BaseIotData(object):
 			
 			self._handleUpdateData(data)
 		
-	def updateTimeStamp(self):
+	def updateTimeStamp(self, epochSeconds: float = None):
 		"""
 		Updates the internal time stamp to the current date / time
+		(or to 'epochSeconds', if given - e.g. for simulated time)
 		in Zulu time.
 		This retrieves the time since Epoch and converts to an ISO 8601
 		string, with second granularity, as follows:
@@ -235,8 +236,13 @@ class BaseIotData(object):
 		NOTE: the '+00:00' is the offset from GMT, and can be replaced
 		with 'Z' if desired. In testing, the format above is
 		compatible with the GDA's parsing logic.
+		
+		@param epochSeconds The optional time, in seconds since Epoch.
 		"""
-		self.timeStamp = str(datetime.now(timezone.utc).isoformat())
+		if epochSeconds is None:
+			self.timeStamp = str(datetime.now(timezone.utc).isoformat())
+		else:
+			self.timeStamp = str(datetime.fromtimestamp(epochSeconds, timezone.utc).isoformat())
 	
 	def __str__(self):
 		"""
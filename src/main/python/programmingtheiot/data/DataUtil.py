@@ -1,51 +1,245 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import json
+import logging
 
 from json import JSONEncoder
 
+import numpy as calcLib
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
 from programmingtheiot.data.ActuatorData import ActuatorData
+from programmingtheiot.data.ExtendedSystemPerformanceData import ExtendedSystemPerformanceData
+from programmingtheiot.data.ProcessHealthData import ProcessHealthData
+from programmingtheiot.data.MultiSensorData import MultiSensorData
 from programmingtheiot.data.SensorData import SensorData
+from programmingtheiot.data.SensorDataBatch import SensorDataBatch
 from programmingtheiot.data.SystemPerformanceData import SystemPerformanceData
 
 class DataUtil():
 	"""
-	Shell representation of class for student implementation.
+	Utility class to convert the IoT data containers to and from JSON.
 	
 	"""
 
 	def __init__(self, encodeToUtf8 = False):
-		pass
+		"""
+		Constructor.
+		
+		@param encodeToUtf8 If True, the JSON output will be UTF-8 encoded bytes.
+		"""
+		self.encodeToUtf8 = encodeToUtf8
+		
+		logging.info("Created DataUtil instance.")
 	
 	def actuatorDataToJson(self, data: ActuatorData = None):
-		pass
+		if not data:
+			logging.debug("ActuatorData is null. Returning None.")
+			return None
+		
+		return self._generateJsonData(data)
+	
+	def extendedSystemPerformanceDataToJson(self, data: ExtendedSystemPerformanceData = None):
+		"""
+		Converts 'data' to JSON. The per core CPU utilization and load average
+		are written as JSON arrays, under 'cpuUtilPerCore' and 'loadAvg'.
+		
+		@param data The ExtendedSystemPerformanceData to convert.
+		@return The JSON string (or UTF-8 bytes), or None if 'data' is invalid.
+		"""
+		if not data:
+			logging.debug("ExtendedSystemPerformanceData is null. Returning None.")
+			return None
+		
+		return self._generateJsonData(data)
+	
+	def multiSensorDataToJson(self, data: MultiSensorData = None):
+		"""
+		Converts 'data' to JSON. The sensor name, type ID and value columns
+		are written as JSON arrays, under 'names', 'typeIDs' and 'values'.
+		
+		@param data The MultiSensorData to convert.
+		@return The JSON string (or UTF-8 bytes), or None if 'data' is invalid.
+		"""
+		if not data:
+			logging.debug("MultiSensorData is null. Returning None.")
+			return None
+		
+		return self._generateJsonData(data)
+	
+	def processHealthDataToJson(self, data: ProcessHealthData = None):
+		"""
+		Converts 'data' to JSON. The GC collection counts are written as a
+		JSON array, and the queue depths as a JSON object.
+		
+		@param data The ProcessHealthData to convert.
+		@return The JSON string (or UTF-8 bytes), or None if 'data' is invalid.
+		"""
+		if not data:
+			logging.debug("ProcessHealthData is null. Returning None.")
+			return None
+		
+		return self._generateJsonData(data)
 	
 	def sensorDataToJson(self, data: SensorData = None):
-		pass
+		if not data:
+			logging.debug("SensorData is null. Returning None.")
+			return None
+		
+		return self._generateJsonData(data)
+	
+	def sensorDataBatchToJson(self, data: SensorDataBatch = None):
+		"""
+		Converts 'data' to JSON. The time stamp and value arrays are written
+		as JSON arrays, under 'timeStamps' and 'values' respectively.
+		
+		@param data The SensorDataBatch to convert.
+		@return The JSON string (or UTF-8 bytes), or None if 'data' is invalid.
+		"""
+		if not data:
+			logging.debug("SensorDataBatch is null. Returning None.")
+			return None
+		
+		return self._generateJsonData(data)
 
 	def systemPerformanceDataToJson(self, data: SystemPerformanceData = None):
-		pass
+		if not data:
+			logging.debug("SystemPerformanceData is null. Returning None.")
+			return None
+		
+		return self._generateJsonData(data)
 	
 	def jsonToActuatorData(self, jsonData: str = None):
-		pass
+		if not jsonData:
+			logging.warning("JSON data is empty or null. Returning None.")
+			return None
+		
+		return self._updateIotData(self._loadDictionary(jsonData), ActuatorData())
+	
+	def jsonToExtendedSystemPerformanceData(self, jsonData: str = None):
+		"""
+		Converts 'jsonData' to an ExtendedSystemPerformanceData.
+		
+		@param jsonData The JSON string (or UTF-8 bytes).
+		@return ExtendedSystemPerformanceData, or None if 'jsonData' is invalid.
+		"""
+		if not jsonData:
+			logging.warning("JSON data is empty or null. Returning None.")
+			return None
+		
+		return self._updateIotData(self._loadDictionary(jsonData), ExtendedSystemPerformanceData())
+	
+	def jsonToMultiSensorData(self, jsonData: str = None):
+		"""
+		Converts 'jsonData' to a MultiSensorData.
+		
+		@param jsonData The JSON string (or UTF-8 bytes).
+		@return MultiSensorData, or None if 'jsonData' is invalid.
+		"""
+		if not jsonData:
+			logging.warning("JSON data is empty or null. Returning None.")
+			return None
+		
+		jsonStruct = self._loadDictionary(jsonData)
+		
+		names = jsonStruct.pop(ConfigConst.NAMES_PROP, None)
+		typeIDs = jsonStruct.pop(ConfigConst.TYPE_IDS_PROP, None)
+		values = jsonStruct.pop(ConfigConst.VALUES_PROP, None)
+		
+		multiSensorData = self._updateIotData(jsonStruct, MultiSensorData())
+		multiSensorData.setEntries(names = names, typeIDs = typeIDs, values = values)
+		
+		return multiSensorData
+	
+	def jsonToProcessHealthData(self, jsonData: str = None):
+		"""
+		Converts 'jsonData' to a ProcessHealthData.
+		
+		@param jsonData The JSON string (or UTF-8 bytes).
+		@return ProcessHealthData, or None if 'jsonData' is invalid.
+		"""
+		if not jsonData:
+			logging.warning("JSON data is empty or null. Returning None.")
+			return None
+		
+		return self._updateIotData(self._loadDictionary(jsonData), ProcessHealthData())
 	
 	def jsonToSensorData(self, jsonData: str = None):
-		pass
+		if not jsonData:
+			logging.warning("JSON data is empty or null. Returning None.")
+			return None
+		
+		return self._updateIotData(self._loadDictionary(jsonData), SensorData())
+	
+	def jsonToSensorDataBatch(self, jsonData: str = None):
+		"""
+		Converts 'jsonData' to a SensorDataBatch.
+		
+		@param jsonData The JSON string (or UTF-8 bytes).
+		@return SensorDataBatch, or None if 'jsonData' is invalid.
+		"""
+		if not jsonData:
+			logging.warning("JSON data is empty or null. Returning None.")
+			return None
+		
+		jsonStruct = self._loadDictionary(jsonData)
+		
+		timeStamps = jsonStruct.pop(ConfigConst.TIMESTAMPS_PROP, None)
+		values = jsonStruct.pop(ConfigConst.VALUES_PROP, None)
+		
+		batch = self._updateIotData(jsonStruct, SensorDataBatch())
+		batch.setEntries(timeStamps = timeStamps, values = values)
+		
+		return batch
 	
 	def jsonToSystemPerformanceData(self, jsonData: str = None):
-		pass
+		if not jsonData:
+			logging.warning("JSON data is empty or null. Returning None.")
+			return None
+		
+		return self._updateIotData(self._loadDictionary(jsonData), SystemPerformanceData())
+	
+	def _generateJsonData(self, obj) -> str:
+		if self.encodeToUtf8:
+			return json.dumps(obj, cls = JsonDataEncoder).encode('utf8')
+		
+		return json.dumps(obj, cls = JsonDataEncoder, indent = 4)
+	
+	def _loadDictionary(self, jsonData) -> dict:
+		if isinstance(jsonData, (bytes, bytearray)):
+			jsonData = jsonData.decode('utf8')
+		
+		return json.loads(jsonData)
+	
+	def _updateIotData(self, jsonStruct: dict, obj):
+		varStruct = vars(obj)
+		
+		for key in jsonStruct:
+			if key in varStruct:
+				setattr(obj, key, jsonStruct[key])
+			else:
+				logging.warning("JSON data contains key not mappable to object: %s", key)
+		
+		return obj
 	
 class JsonDataEncoder(JSONEncoder):
 	"""
 	Convenience class to facilitate JSON encoding of an object that
-	can be converted to a dict.
+	can be converted to a dict. numpy arrays and scalars (e.g. the
+	columns of a SensorDataBatch) are converted to lists and numbers.
 	
 	"""
 	def default(self, o):
+		if isinstance(o, (calcLib.ndarray, calcLib.generic)):
+			return o.tolist()
+		
 		return o.__dict__
-	
\ No newline at end of file
+	
@@ -0,0 +1,197 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+#
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.data.SystemPerformanceData import SystemPerformanceData
+
+class ExtendedSystemPerformanceData(SystemPerformanceData):
+	"""
+	SystemPerformanceData with additional device health metrics, all taken
+	from the same snapshot: per core CPU utilization, CPU iowait and steal
+	(as a percent of CPU time), disk I/O rates,
+	network byte and packet rates, and the 1, 5 and 15 minute load average.
+	
+	Rates are per second, and averaged since the previous snapshot.
+	
+	If the record aggregates several snapshots (see SystemPerformanceManager),
+	'sampleCount' is the number of snapshots, and 'aggregates' maps each
+	aggregated metric (e.g. 'cpuUtil') to its min, max, mean, EWMA and 95th
+	percentile. The metric itself is then the mean, and the other fields
+	are from the latest snapshot.
+	
+	"""
+	
+	def __init__(self, d = None):
+		super(ExtendedSystemPerformanceData, self).__init__(d = d)
+		
+		self.cpuUtilPerCore = []
+		self.cpuIoWait = self.DEFAULT_VAL
+		self.cpuSteal = self.DEFAULT_VAL
+		self.diskReadRate = self.DEFAULT_VAL
+		self.diskWriteRate = self.DEFAULT_VAL
+		self.netBytesRecvRate = self.DEFAULT_VAL
+		self.netBytesSentRate = self.DEFAULT_VAL
+		self.netPacketsRecvRate = self.DEFAULT_VAL
+		self.netPacketsSentRate = self.DEFAULT_VAL
+		self.loadAvg = []
+		self.sampleCount = 1
+		self.aggregates = {}
+		
+		if d:
+			self.cpuUtilPerCore = list(d.get(ConfigConst.CPU_UTIL_PER_CORE_PROP, []))
+			self.cpuIoWait = d.get(ConfigConst.CPU_IOWAIT_PROP, self.DEFAULT_VAL)
+			self.cpuSteal = d.get(ConfigConst.CPU_STEAL_PROP, self.DEFAULT_VAL)
+			self.diskReadRate = d.get(ConfigConst.DISK_READ_RATE_PROP, self.DEFAULT_VAL)
+			self.diskWriteRate = d.get(ConfigConst.DISK_WRITE_RATE_PROP, self.DEFAULT_VAL)
+			self.netBytesRecvRate = d.get(ConfigConst.NET_BYTES_RECV_RATE_PROP, self.DEFAULT_VAL)
+			self.netBytesSentRate = d.get(ConfigConst.NET_BYTES_SENT_RATE_PROP, self.DEFAULT_VAL)
+			self.netPacketsRecvRate = d.get(ConfigConst.NET_PACKETS_RECV_RATE_PROP, self.DEFAULT_VAL)
+			self.netPacketsSentRate = d.get(ConfigConst.NET_PACKETS_SENT_RATE_PROP, self.DEFAULT_VAL)
+			self.loadAvg = list(d.get(ConfigConst.LOAD_AVG_PROP, []))
+			self.sampleCount = d.get(ConfigConst.SAMPLE_COUNT_PROP, 1)
+			self.aggregates = dict(d.get(ConfigConst.AGGREGATES_PROP, {}))
+	
+	def getAggregates(self, metric: str = None) -> dict:
+		"""
+		Returns the aggregates of 'metric', or of every aggregated metric.
+		
+		@param metric The metric name - e.g. ConfigConst.CPU_UTIL_PROP.
+		@return dict Of aggregate name (e.g. ConfigConst.P95_PROP) to value, or
+		(if 'metric' is None) of metric name to aggregates. Empty if there are none.
+		"""
+		if metric is None:
+			return self.aggregates
+		
+		return self.aggregates.get(metric, {})
+	
+	def getCpuIoWait(self) -> float:
+		return self.cpuIoWait
+	
+	def getCpuSteal(self) -> float:
+		return self.cpuSteal
+	
+	def getCpuUtilizationPerCore(self) -> list:
+		return self.cpuUtilPerCore
+	
+	def getDiskReadRate(self) -> float:
+		"""
+		Returns the disk read rate, in bytes per second.
+		
+		@return float
+		"""
+		return self.diskReadRate
+	
+	def getDiskWriteRate(self) -> float:
+		"""
+		Returns the disk write rate, in bytes per second.
+		
+		@return float
+		"""
+		return self.diskWriteRate
+	
+	def getLoadAverage(self) -> list:
+		"""
+		Returns the 1, 5 and 15 minute load average.
+		
+		@return list
+		"""
+		return self.loadAvg
+	
+	def getNetworkBytesRecvRate(self) -> float:
+		return self.netBytesRecvRate
+	
+	def getNetworkBytesSentRate(self) -> float:
+		return self.netBytesSentRate
+	
+	def getNetworkPacketsRecvRate(self) -> float:
+		return self.netPacketsRecvRate
+	
+	def getNetworkPacketsSentRate(self) -> float:
+		return self.netPacketsSentRate
+	
+	def getSampleCount(self) -> int:
+		return self.sampleCount
+	
+	def setAggregates(self, sampleCount: int, aggregates: dict):
+		"""
+		Sets the number of snapshots aggregated, and their aggregates, and
+		updates the time stamp.
+		
+		@param sampleCount The number of snapshots.
+		@param aggregates Dict of metric name to aggregates (see getAggregates()).
+		"""
+		self.sampleCount = sampleCount
+		self.aggregates = dict(aggregates)
+		self.updateTimeStamp()
+	
+	def setCpuIoWait(self, cpuIoWait: float):
+		self.cpuIoWait = cpuIoWait
+		self.updateTimeStamp()
+	
+	def setCpuSteal(self, cpuSteal: float):
+		self.cpuSteal = cpuSteal
+		self.updateTimeStamp()
+	
+	def setCpuUtilizationPerCore(self, cpuUtilPerCore: list):
+		self.cpuUtilPerCore = list(cpuUtilPerCore)
+		self.updateTimeStamp()
+	
+	def setDiskIoRates(self, readRate: float, writeRate: float):
+		"""
+		Sets the disk read and write rates, and updates the time stamp.
+		
+		@param readRate The read rate, in bytes per second.
+		@param writeRate The write rate, in bytes per second.
+		"""
+		self.diskReadRate = readRate
+		self.diskWriteRate = writeRate
+		self.updateTimeStamp()
+	
+	def setLoadAverage(self, loadAvg: list):
+		self.loadAvg = list(loadAvg)
+		self.updateTimeStamp()
+	
+	def setNetworkRates(self, bytesRecvRate: float, bytesSentRate: float, packetsRecvRate: float, packetsSentRate: float):
+		"""
+		Sets the network byte and packet rates, and updates the time stamp.
+		
+		@param bytesRecvRate The receive rate, in bytes per second.
+		@param bytesSentRate The send rate, in bytes per second.
+		@param packetsRecvRate The receive rate, in packets per second.
+		@param packetsSentRate The send rate, in packets per second.
+		"""
+		self.netBytesRecvRate = bytesRecvRate
+		self.netBytesSentRate = bytesSentRate
+		self.netPacketsRecvRate = packetsRecvRate
+		self.netPacketsSentRate = packetsSentRate
+		self.updateTimeStamp()
+	
+	def _handleUpdateData(self, data):
+		"""
+		Copies the system performance metrics from 'data'. If 'data' is a
+		(non extended) SystemPerformanceData, only its metrics are copied.
+		
+		@param data The SystemPerformanceData to apply to this instance.
+		"""
+		super(ExtendedSystemPerformanceData, self)._handleUpdateData(data)
+		
+		if data and isinstance(data, ExtendedSystemPerformanceData):
+			self.cpuUtilPerCore = list(data.getCpuUtilizationPerCore())
+			self.cpuIoWait = data.getCpuIoWait()
+			self.cpuSteal = data.getCpuSteal()
+			self.diskReadRate = data.getDiskReadRate()
+			self.diskWriteRate = data.getDiskWriteRate()
+			self.netBytesRecvRate = data.getNetworkBytesRecvRate()
+			self.netBytesSentRate = data.getNetworkBytesSentRate()
+			self.netPacketsRecvRate = data.getNetworkPacketsRecvRate()
+			self.netPacketsSentRate = data.getNetworkPacketsSentRate()
+			self.loadAvg = list(data.getLoadAverage())
+			self.sampleCount = data.getSampleCount()
+			self.aggregates = dict(data.getAggregates())
@@ -0,0 +1,141 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+#
+
+import numpy as calcLib
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.data.BaseIotData import BaseIotData
+from programmingtheiot.data.SensorData import SensorData
+
+class MultiSensorData(BaseIotData):
+	"""
+	Columnar container for one reading from each of several sensors, all
+	taken at the same time. The metadata (name, type ID, location, status)
+	and the time stamp describe the whole set of readings (e.g. the device),
+	and the readings themselves are stored as three equal length columns:
+	the sensor names, the sensor type IDs and the values.
+	
+	"""
+	
+	def __init__(self, typeID: int = ConfigConst.ENV_DEVICE_TYPE, name = ConfigConst.MULTI_SENSOR_NAME, names = None, typeIDs = None, values = None, d = None):
+		"""
+		Constructor.
+		
+		@param typeID The type ID of the set of readings (e.g. the device type).
+		@param name The name of the set of readings.
+		@param names The sensor names, one per value.
+		@param typeIDs The sensor type IDs, one per value.
+		@param values The sensor values.
+		@param d Defaults to None. The data (dict) to use for setting all parameters.
+		"""
+		super(MultiSensorData, self).__init__(name = name, typeID = typeID, d = d)
+		
+		if d:
+			names = d.get(ConfigConst.NAMES_PROP, names)
+			typeIDs = d.get(ConfigConst.TYPE_IDS_PROP, typeIDs)
+			values = d.get(ConfigConst.VALUES_PROP, values)
+		
+		self.setEntries(names = names, typeIDs = typeIDs, values = values)
+	
+	def getCount(self) -> int:
+		"""
+		Returns the number of readings (i.e. sensors).
+		
+		@return int
+		"""
+		return self.values.size
+	
+	def getNames(self) -> list:
+		"""
+		Returns the list of sensor names.
+		"""
+		return self.names
+	
+	def getSensorData(self, index: int = 0) -> SensorData:
+		"""
+		Creates a SensorData instance for the reading at 'index', with the
+		sensor's name and type ID, and the location, status and time stamp
+		of this instance.
+		
+		@param index The index of the reading.
+		@return SensorData, or None if there are no readings.
+		"""
+		if self.values.size == 0:
+			return None
+		
+		sensorData = SensorData()
+		sensorData.updateData(self)
+		sensorData.setName(self.names[index])
+		sensorData.setTypeID(int(self.typeIDs[index]))
+		sensorData.value = float(self.values[index])
+		sensorData.timeStamp = self.timeStamp
+		
+		return sensorData
+	
+	def getTypeIDs(self):
+		"""
+		Returns the sensor type ID array.
+		"""
+		return self.typeIDs
+	
+	def getValue(self, name: str = None) -> float:
+		"""
+		Returns the value of the reading from the sensor named 'name'.
+		
+		@param name The sensor name.
+		@return float, or None if there's no reading from 'name'.
+		"""
+		if name not in self.names:
+			return None
+		
+		return float(self.values[self.names.index(name)])
+	
+	def getValues(self):
+		"""
+		Returns the value array.
+		"""
+		return self.values
+	
+	def setEntries(self, names = None, typeIDs = None, values = None):
+		"""
+		Sets the sensor name, type ID and value columns. Array input is used
+		as is (no copy is made); lists and other sequences are converted.
+		
+		@param names The sensor names.
+		@param typeIDs The sensor type IDs, one per name.
+		@param values The values, one per name.
+		"""
+		names = list(names) if names is not None else []
+		typeIDs = calcLib.asarray(typeIDs if typeIDs is not None else [], dtype = calcLib.int64).ravel()
+		values = calcLib.asarray(values if values is not None else [], dtype = calcLib.float64).ravel()
+		
+		if len(names) != values.size or typeIDs.size != values.size:
+			raise ValueError("Name count %d and type ID count %d must match value count %d." % (len(names), typeIDs.size, values.size))
+		
+		self.names = names
+		self.typeIDs = typeIDs
+		self.values = values
+	
+	def __str__(self):
+		"""
+		Returns a string representation of this instance.
+		
+		@return The string representing this instance, returned in CSV 'key=value' format.
+		"""
+		return '{},count={}'.format(super(MultiSensorData, self).__str__(), self.getCount())
+	
+	def _handleUpdateData(self, data):
+		"""
+		Copies the name, type ID and value columns from 'data'.
+		
+		@param data The MultiSensorData to apply to this instance.
+		"""
+		if data and isinstance(data, MultiSensorData):
+			self.setEntries(names = data.getNames(), typeIDs = data.getTypeIDs().copy(), values = data.getValues().copy())
@@ -0,0 +1,131 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.data.SystemPerformanceData import SystemPerformanceData
+
+class ProcessHealthData(SystemPerformanceData):
+	"""
+	The health of the CDA process itself (as opposed to the device), as a
+	SystemPerformanceData with the SYSTEM_MGMT_TYPE type ID, so it can be
+	handled (and charted) alongside the device's system performance.
+	
+	The CPU utilization is the process's share of the total CPU capacity
+	since the previous snapshot, and the memory utilization is its RSS as
+	a percent of the total memory. The disk utilization isn't used.
+	
+	The GC pause times are in seconds, since the previous snapshot. The GC
+	collection counts are per generation, since the process started.
+	
+	"""
+	
+	def __init__(self, d = None):
+		super(ProcessHealthData, self).__init__( \
+			d = d, name = ConfigConst.PROCESS_HEALTH_NAME, typeID = ConfigConst.SYSTEM_MGMT_TYPE)
+		
+		self.rssBytes = 0
+		self.cpuTime = self.DEFAULT_VAL
+		self.threadCount = 0
+		self.openFdCount = 0
+		self.gcCollections = []
+		self.gcPauseTotal = self.DEFAULT_VAL
+		self.gcPauseMax = self.DEFAULT_VAL
+		self.queueDepths = {}
+		
+		if d:
+			self.rssBytes = d.get(ConfigConst.RSS_BYTES_PROP, 0)
+			self.cpuTime = d.get(ConfigConst.CPU_TIME_PROP, self.DEFAULT_VAL)
+			self.threadCount = d.get(ConfigConst.THREAD_COUNT_PROP, 0)
+			self.openFdCount = d.get(ConfigConst.OPEN_FD_COUNT_PROP, 0)
+			self.gcCollections = list(d.get(ConfigConst.GC_COLLECTIONS_PROP, []))
+			self.gcPauseTotal = d.get(ConfigConst.GC_PAUSE_TOTAL_PROP, self.DEFAULT_VAL)
+			self.gcPauseMax = d.get(ConfigConst.GC_PAUSE_MAX_PROP, self.DEFAULT_VAL)
+			self.queueDepths = dict(d.get(ConfigConst.QUEUE_DEPTHS_PROP, {}))
+	
+	def getCpuTime(self) -> float:
+		"""
+		Returns the user and system CPU time used by the process, in seconds.
+		
+		@return float
+		"""
+		return self.cpuTime
+	
+	def getGcCollections(self) -> list:
+		return self.gcCollections
+	
+	def getGcPauseMax(self) -> float:
+		return self.gcPauseMax
+	
+	def getGcPauseTotal(self) -> float:
+		return self.gcPauseTotal
+	
+	def getOpenFdCount(self) -> int:
+		return self.openFdCount
+	
+	def getQueueDepths(self) -> dict:
+		return self.queueDepths
+	
+	def getRssBytes(self) -> int:
+		return self.rssBytes
+	
+	def getThreadCount(self) -> int:
+		return self.threadCount
+	
+	def setCpuTime(self, cpuTime: float):
+		self.cpuTime = cpuTime
+		self.updateTimeStamp()
+	
+	def setGcMetrics(self, collections: list, pauseTotal: float, pauseMax: float):
+		"""
+		Sets the GC metrics, and updates the time stamp.
+		
+		@param collections The number of collections of each generation.
+		@param pauseTotal The total GC pause time, in seconds.
+		@param pauseMax The longest GC pause, in seconds.
+		"""
+		self.gcCollections = list(collections)
+		self.gcPauseTotal = pauseTotal
+		self.gcPauseMax = pauseMax
+		self.updateTimeStamp()
+	
+	def setOpenFdCount(self, openFdCount: int):
+		self.openFdCount = openFdCount
+		self.updateTimeStamp()
+	
+	def setQueueDepths(self, queueDepths: dict):
+		self.queueDepths = dict(queueDepths)
+		self.updateTimeStamp()
+	
+	def setRssBytes(self, rssBytes: int):
+		self.rssBytes = rssBytes
+		self.updateTimeStamp()
+	
+	def setThreadCount(self, threadCount: int):
+		self.threadCount = threadCount
+		self.updateTimeStamp()
+	
+	def _handleUpdateData(self, data):
+		"""
+		Copies the process health metrics from 'data'. If 'data' is a
+		(non process health) SystemPerformanceData, only its metrics are copied.
+		
+		@param data The SystemPerformanceData to apply to this instance.
+		"""
+		super(ProcessHealthData, self)._handleUpdateData(data)
+		
+		if data and isinstance(data, ProcessHealthData):
+			self.rssBytes = data.getRssBytes()
+			self.cpuTime = data.getCpuTime()
+			self.threadCount = data.getThreadCount()
+			self.openFdCount = data.getOpenFdCount()
+			self.gcCollections = list(data.getGcCollections())
+			self.gcPauseTotal = data.getGcPauseTotal()
+			self.gcPauseMax = data.getGcPauseMax()
+			self.queueDepths = dict(data.getQueueDepths())
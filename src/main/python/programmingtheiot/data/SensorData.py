@@ -1,11 +1,11 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
 import programmingtheiot.common.ConfigConst as ConfigConst
 
@@ -13,13 +13,18 @@ from programmingtheiot.data.BaseIotData import BaseIotData
 
 class SensorData(BaseIotData):
 	"""
-	Shell representation of class for student implementation.
+	Data container for a single sensor reading. Adds the sensor value to
+	the name, type ID, status and time stamp stored by BaseIotData.
 	
 	"""
 		
 	def __init__(self, typeID: int = ConfigConst.DEFAULT_SENSOR_TYPE, name = ConfigConst.NOT_SET, d = None):
 		super(SensorData, self).__init__(name = name, typeID = typeID, d = d)
-		pass
+		
+		self.value = ConfigConst.DEFAULT_VAL
+		
+		if d:
+			self.value = d.get(ConfigConst.VALUE_PROP, ConfigConst.DEFAULT_VAL)
 	
 	def getSensorType(self) -> int:
 		"""
@@ -30,10 +35,27 @@ class SensorData(BaseIotData):
 		return self.sensorType
 	
 	def getValue(self) -> float:
-		pass
+		"""
+		Returns the sensor value.
+		
+		@return float
+		"""
+		return self.value
 	
 	def setValue(self, newVal: float):
-		pass
+		"""
+		Sets the sensor value, and updates the time stamp.
+		
+		@param newVal The new value as a float.
+		"""
+		self.value = newVal
+		self.updateTimeStamp()
 		
 	def _handleUpdateData(self, data):
-		pass
+		"""
+		Copies the sensor value from 'data'.
+		
+		@param data The SensorData to apply to this instance.
+		"""
+		if data and isinstance(data, SensorData):
+			self.value = data.getValue()
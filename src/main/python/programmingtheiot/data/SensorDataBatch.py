@@ -0,0 +1,126 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import numpy as calcLib
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.data.BaseIotData import BaseIotData
+from programmingtheiot.data.SensorData import SensorData
+
+class SensorDataBatch(BaseIotData):
+	"""
+	Columnar container for a batch of readings from a single sensor. The
+	metadata (name, type ID, location, status) is shared by all readings,
+	and the readings themselves are stored as two equal length arrays:
+	the time stamps (in seconds since Epoch, as float64) and the values.
+	
+	Batches created by the sensor sim tasks may be views into the
+	underlying SensorDataSet arrays, so they should be treated as
+	read-only by consumers.
+	
+	"""
+	
+	def __init__(self, typeID: int = ConfigConst.DEFAULT_SENSOR_TYPE, name = ConfigConst.NOT_SET, timeStamps = None, values = None, d = None):
+		"""
+		Constructor.
+		
+		@param typeID The sensor type ID.
+		@param name The sensor name.
+		@param timeStamps The time stamps (in seconds since Epoch), one per value.
+		@param values The sensor values.
+		@param d Defaults to None. The data (dict) to use for setting all parameters.
+		"""
+		super(SensorDataBatch, self).__init__(name = name, typeID = typeID, d = d)
+		
+		if d:
+			timeStamps = d.get(ConfigConst.TIMESTAMPS_PROP, timeStamps)
+			values = d.get(ConfigConst.VALUES_PROP, values)
+		
+		self.setEntries(timeStamps = timeStamps, values = values)
+	
+	def getCount(self) -> int:
+		"""
+		Returns the number of readings in this batch.
+		
+		@return int
+		"""
+		return self.values.size
+	
+	def getSensorData(self, index: int = -1) -> SensorData:
+		"""
+		Creates a SensorData instance for the reading at 'index', with the
+		metadata of this batch. Negative indexes count from the end, so the
+		default is the latest reading.
+		
+		@param index The index of the reading.
+		@return SensorData, or None if the batch is empty.
+		"""
+		if self.values.size == 0:
+			return None
+		
+		sensorData = SensorData(typeID = self.typeID, name = self.name)
+		sensorData.updateData(self)
+		sensorData.value = float(self.values[index])
+		sensorData.updateTimeStamp(float(self.timeStamps[index]))
+		
+		return sensorData
+	
+	def getTimeStamps(self):
+		"""
+		Returns the time stamp array (in seconds since Epoch).
+		"""
+		return self.timeStamps
+	
+	def getValues(self):
+		"""
+		Returns the value array.
+		"""
+		return self.values
+	
+	def setEntries(self, timeStamps = None, values = None):
+		"""
+		Sets the time stamp and value arrays. Array input is used as is (no copy
+		is made); lists and other sequences are converted.
+		
+		@param timeStamps The time stamps (in seconds since Epoch).
+		@param values The values, one per time stamp.
+		"""
+		if timeStamps is None:
+			timeStamps = calcLib.empty(0)
+		
+		if values is None:
+			values = calcLib.empty(0)
+		
+		timeStamps = calcLib.asarray(timeStamps, dtype = calcLib.float64).ravel()
+		values = calcLib.asarray(values).ravel()
+		
+		if timeStamps.size != values.size:
+			raise ValueError("Time stamp count %d doesn't match value count %d." % (timeStamps.size, values.size))
+		
+		self.timeStamps = timeStamps
+		self.values = values
+	
+	def __str__(self):
+		"""
+		Returns a string representation of this instance.
+		
+		@return The string representing this instance, returned in CSV 'key=value' format.
+		"""
+		return '{},count={}'.format(super(SensorDataBatch, self).__str__(), self.getCount())
+	
+	def _handleUpdateData(self, data):
+		"""
+		Copies the time stamp and value arrays from 'data'.
+		
+		@param data The SensorDataBatch to apply to this instance.
+		"""
+		if data and isinstance(data, SensorDataBatch):
+			self.setEntries(timeStamps = data.getTimeStamps().copy(), values = data.getValues().copy())
+	
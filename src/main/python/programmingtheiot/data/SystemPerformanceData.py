@@ -1,11 +1,11 @@
 #####
 # 
-# This class is part of the Programming the Internet of Things project.
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
 # 
-# It is provided as a simple shell to guide the student and assist with
-# implementation for the Programming the Internet of Things exercises,
-# and designed to be modified by the student as needed.
-#
 
 import programmingtheiot.common.ConfigConst as ConfigConst
 
@@ -13,32 +13,53 @@ from programmingtheiot.data.BaseIotData import BaseIotData
 
 class SystemPerformanceData(BaseIotData):
 	"""
-	Shell representation of class for student implementation.
+	Data container for a system performance snapshot. Adds the CPU, disk
+	and memory utilization to the name, type ID, status and time stamp
+	stored by BaseIotData.
 	
 	"""
 	DEFAULT_VAL = 0.0
 	
-	def __init__(self, d = None):
-		super(SystemPerformanceData, self).__init__(name = ConfigConst.SYSTEM_PERF_MSG, typeID = ConfigConst.SYSTEM_PERF_TYPE, d = d)
-		pass
+	def __init__(self, d = None, name = ConfigConst.SYSTEM_PERF_MSG, typeID = ConfigConst.SYSTEM_PERF_TYPE):
+		super(SystemPerformanceData, self).__init__(name = name, typeID = typeID, d = d)
+		
+		self.cpuUtil = self.DEFAULT_VAL
+		self.diskUtil = self.DEFAULT_VAL
+		self.memUtil = self.DEFAULT_VAL
+		
+		if d:
+			self.cpuUtil = d.get(ConfigConst.CPU_UTIL_PROP, self.DEFAULT_VAL)
+			self.diskUtil = d.get(ConfigConst.DISK_UTIL_PROP, self.DEFAULT_VAL)
+			self.memUtil = d.get(ConfigConst.MEM_UTIL_PROP, self.DEFAULT_VAL)
 	
-	def getCpuUtilization(self):
-		pass
+	def getCpuUtilization(self) -> float:
+		return self.cpuUtil
 	
-	def getDiskUtilization(self):
-		pass
+	def getDiskUtilization(self) -> float:
+		return self.diskUtil
 	
-	def getMemoryUtilization(self):
-		pass
+	def getMemoryUtilization(self) -> float:
+		return self.memUtil
 	
-	def setCpuUtilization(self, cpuUtil):
-		pass
+	def setCpuUtilization(self, cpuUtil: float):
+		self.cpuUtil = cpuUtil
+		self.updateTimeStamp()
 	
-	def setDiskUtilization(self, diskUtil):
-		pass
+	def setDiskUtilization(self, diskUtil: float):
+		self.diskUtil = diskUtil
+		self.updateTimeStamp()
 	
-	def setMemoryUtilization(self, memUtil):
-		pass
+	def setMemoryUtilization(self, memUtil: float):
+		self.memUtil = memUtil
+		self.updateTimeStamp()
 	
 	def _handleUpdateData(self, data):
-		pass
+		"""
+		Copies the CPU, disk and memory utilization from 'data'.
+		
+		@param data The SystemPerformanceData to apply to this instance.
+		"""
+		if data and isinstance(data, SystemPerformanceData):
+			self.cpuUtil = data.getCpuUtilization()
+			self.diskUtil = data.getDiskUtilization()
+			self.memUtil = data.getMemoryUtilization()
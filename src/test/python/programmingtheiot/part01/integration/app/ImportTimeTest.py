@@ -0,0 +1,88 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import os
+import re
+import subprocess
+import sys
+import unittest
+
+class ImportTimeTest(unittest.TestCase):
+	"""
+	This test case class checks the cold-start import cost of the main CDA
+	modules. Each module is imported in a fresh interpreter with
+	'-X importtime', and must:
+	
+	1) stay within its cumulative import time budget, and
+	2) not import any of the optional, heavyweight dependencies - these are
+	   only loaded when the feature that needs them is enabled.
+	
+	NOTE: The budgets are deliberately generous (roughly 2 - 3x a typical
+	desktop measurement) to absorb slower CI hardware; the forbidden module
+	check is exact.
+	"""
+	
+	MAIN_PYTHON_PATH = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '../../../../../../main/python'))
+	
+	# cumulative import time budget, in milliseconds, per module
+	IMPORT_TIME_BUDGETS = { \
+		'programmingtheiot.cda.sim.SensorDataGenerator': 300, \
+		'programmingtheiot.cda.system.ActuatorAdapterManager': 150, \
+		'programmingtheiot.cda.system.SensorAdapterManager': 350, \
+		'programmingtheiot.cda.system.SystemPerformanceManager': 200, \
+		'programmingtheiot.cda.app.DeviceDataManager': 400 }
+	
+	LAZY_MODULES = ('matplotlib', 'apscheduler', 'paho', 'coapthon', 'pisense')
+	
+	# 'import time: <self us> | <cumulative us> | <indent><module>'
+	IMPORT_TIME_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$', re.MULTILINE)
+	
+	# best of N runs - the first may include compiling .pyc files
+	RUN_COUNT = 3
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing CDA module import times...")
+	
+	def setUp(self):
+		pass
+	
+	def tearDown(self):
+		pass
+	
+	def testImportTimeBudgets(self):
+		for moduleName, budgetMillis in self.IMPORT_TIME_BUDGETS.items():
+			with self.subTest(module = moduleName):
+				importTimes = min((self._getImportTimes(moduleName) for run in range(self.RUN_COUNT)), key = lambda times: times[moduleName])
+				importMillis = importTimes[moduleName] / 1000.0
+				
+				logging.info("Imported %s in %.1f ms (budget: %s ms)", moduleName, importMillis, budgetMillis)
+				
+				lazyModules = [name for name in importTimes if name.split('.')[0] in self.LAZY_MODULES]
+				
+				self.assertEqual(lazyModules, [], "Optional dependencies imported eagerly by " + moduleName)
+				self.assertLessEqual(importMillis, budgetMillis)
+	
+	def _getImportTimes(self, moduleName: str = None) -> dict:
+		"""
+		Imports the module in a new interpreter, and returns the cumulative
+		import time (in microseconds) of every module that was loaded.
+		"""
+		env = dict(os.environ, PYTHONPATH = self.MAIN_PYTHON_PATH)
+		
+		result = subprocess.run( \
+			[sys.executable, '-X', 'importtime', '-c', 'import ' + moduleName], \
+			env = env, capture_output = True, text = True, check = True)
+		
+		return {name: int(cumulative) for selfTime, cumulative, indent, name in self.IMPORT_TIME_PATTERN.findall(result.stderr)}
+
+if __name__ == "__main__":
+	unittest.main()
@@ -12,8 +12,24 @@ import unittest
 
 from time import sleep
 
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.cda.system.ProcessHealthTask import ProcessHealthTask
 from programmingtheiot.cda.system.SystemPerformanceManager import SystemPerformanceManager
 from programmingtheiot.common.DefaultDataMessageListener import DefaultDataMessageListener
+from programmingtheiot.data.SystemPerformanceData import SystemPerformanceData
+
+class SystemPerformanceDataCapture(DefaultDataMessageListener):
+	
+	def __init__(self):
+		super(SystemPerformanceDataCapture, self).__init__()
+		
+		self.sysPerfDataList = []
+		
+	def handleSystemPerformanceMessage(self, data: SystemPerformanceData) -> bool:
+		self.sysPerfDataList.append(data)
+		
+		return super(SystemPerformanceDataCapture, self).handleSystemPerformanceMessage(data)
 
 class SystemPerformanceManagerTest(unittest.TestCase):
 	"""
@@ -55,6 +71,79 @@ class SystemPerformanceManagerTest(unittest.TestCase):
 		sleep(60)
 		
 		self.spMgr.stopManager()
+		
+	def testAggregatedTelemetry(self):
+		spMgr = SystemPerformanceManager()
+		msgListener = SystemPerformanceDataCapture()
+		spMgr.setDataMessageListener(msgListener)
+		spMgr.setSampleRate(spMgr.pollRate / 4)
+		
+		# fill the windows (size 4), then add one more sample to roll the oldest off
+		for i in range(5):
+			spMgr.sampleTelemetry()
+			sleep(0.05)
+		
+		spMgr.handleTelemetry()
+		
+		sysPerfDataList = self._getSystemPerformanceData(msgListener)
+		
+		self.assertEqual(len(sysPerfDataList), 1)
+		
+		sysPerfData = sysPerfDataList[0]
+		cpuStats = sysPerfData.getAggregates(ConfigConst.CPU_UTIL_PROP)
+		
+		logging.info("Aggregated CPU utilization: %s", str(cpuStats))
+		
+		self.assertEqual(sysPerfData.getSampleCount(), 4)
+		self.assertEqual(sysPerfData.getCpuUtilization(), cpuStats[ConfigConst.MEAN_PROP])
+		self.assertLessEqual(cpuStats[ConfigConst.MIN_PROP], cpuStats[ConfigConst.MEAN_PROP])
+		self.assertLessEqual(cpuStats[ConfigConst.MEAN_PROP], cpuStats[ConfigConst.MAX_PROP])
+		self.assertLessEqual(cpuStats[ConfigConst.P95_PROP], cpuStats[ConfigConst.MAX_PROP])
+		
+		for metric in spMgr.AGGREGATED_METRICS:
+			self.assertIn(metric, sysPerfData.getAggregates())
+		
+		# without sampling, each snapshot is passed on as is
+		spMgr.setSampleRate(0.0)
+		spMgr.handleTelemetry()
+		
+		sysPerfDataList = self._getSystemPerformanceData(msgListener)
+		
+		self.assertEqual(sysPerfDataList[1].getSampleCount(), 1)
+		self.assertEqual(sysPerfDataList[1].getAggregates(), {})
+
+	def testProcessHealthTelemetry(self):
+		spMgr = SystemPerformanceManager()
+		
+		# it's disabled by default ('enableProcessHealth')
+		if not spMgr.processHealthTask:
+			spMgr.processHealthTask = ProcessHealthTask()
+		
+		msgListener = SystemPerformanceDataCapture()
+		spMgr.setDataMessageListener(msgListener)
+		spMgr.addQueueDepthSource('TestQueue', lambda: 4)
+		spMgr.handleTelemetry()
+		
+		healthDataList = [data for data in msgListener.sysPerfDataList if data.getTypeID() == ConfigConst.SYSTEM_MGMT_TYPE]
+		
+		self.assertEqual(len(healthDataList), 1)
+		self.assertGreater(healthDataList[0].getRssBytes(), 0)
+		self.assertEqual(healthDataList[0].getQueueDepths(), {'TestQueue': 4})
+		
+		# the GC hook is only in place while the manager is running
+		healthTask = spMgr.processHealthTask
+		
+		self.assertFalse(healthTask.isGcMonitoring())
+		self.assertTrue(spMgr.startManager())
+		self.assertTrue(healthTask.isGcMonitoring())
+		self.assertTrue(spMgr.stopManager())
+		self.assertFalse(healthTask.isGcMonitoring())
+		
+		healthTask.close()
+	
+	def _getSystemPerformanceData(self, msgListener: SystemPerformanceDataCapture) -> list:
+		# the process health (if enabled) is passed to the same listener
+		return [data for data in msgListener.sysPerfDataList if data.getTypeID() == ConfigConst.SYSTEM_PERF_TYPE]
 
 if __name__ == "__main__":
 	unittest.main()
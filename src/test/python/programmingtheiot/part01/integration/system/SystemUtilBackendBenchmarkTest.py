@@ -0,0 +1,102 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import unittest
+
+from time import perf_counter
+
+from programmingtheiot.cda.system.ProcFsReader import ProcFsReader
+from programmingtheiot.cda.system.SystemCpuUtilTask import SystemCpuUtilTask
+from programmingtheiot.cda.system.SystemMemUtilTask import SystemMemUtilTask
+from programmingtheiot.cda.system.SystemMetricsCollector import SystemMetricsCollector
+
+@unittest.skipUnless(ProcFsReader.isAvailable(ProcFsReader.PROC_STAT_PATH), "/proc not available.")
+class SystemUtilBackendBenchmarkTest(unittest.TestCase):
+	"""
+	This test case class is a microbenchmark of the /proc and psutil
+	backends of the system utilization tasks. For each, it logs the mean
+	time per call of each backend, and checks that they agree.
+	
+	NOTE: The timings are logged, not asserted, since they depend on the
+	hardware. Run this on the target device (e.g. an ARM board) to compare.
+	"""
+	
+	CALL_COUNT = 2000
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.INFO)
+		logging.info("Benchmarking system utilization backends...")
+		
+	def setUp(self):
+		pass
+
+	def tearDown(self):
+		pass
+
+	def testCpuUtilBackends(self):
+		procTask = SystemCpuUtilTask(useProcFs = True)
+		psutilTask = SystemCpuUtilTask(useProcFs = False)
+		
+		self.assertTrue(procTask.isProcFsEnabled())
+		self.assertFalse(psutilTask.isProcFsEnabled())
+		
+		self._compareBackends("CPU utilization", procTask.getTelemetryValue, psutilTask.getTelemetryValue)
+		
+		for val in (procTask.getTelemetryValue(), psutilTask.getTelemetryValue()):
+			self.assertGreaterEqual(val, 0.0)
+			self.assertLessEqual(val, 100.0)
+
+	def testMemUtilBackends(self):
+		procTask = SystemMemUtilTask(useProcFs = True)
+		psutilTask = SystemMemUtilTask(useProcFs = False)
+		
+		self.assertTrue(procTask.isProcFsEnabled())
+		
+		self._compareBackends("Memory utilization", procTask.getTelemetryValue, psutilTask.getTelemetryValue)
+		
+		self.assertAlmostEqual(procTask.getTelemetryValue(), psutilTask.getTelemetryValue(), delta = 1.0)
+
+	def testDiskIoBackends(self):
+		procCollector = SystemMetricsCollector(useProcFs = True)
+		psutilCollector = SystemMetricsCollector(useProcFs = False)
+		
+		procDiskIo = procCollector._getDiskIoCounters()
+		psutilDiskIo = psutilCollector._getDiskIoCounters()
+		
+		if not psutilDiskIo:
+			self.skipTest("Disk I/O counters not available.")
+		
+		self._compareBackends("Disk I/O counters", procCollector._getDiskIoCounters, psutilCollector._getDiskIoCounters)
+		
+		# the counters keep going up, so allow for I/O between the reads
+		self.assertAlmostEqual(procDiskIo[0], psutilDiskIo[0], delta = 1024 * 1024)
+	
+	def _compareBackends(self, label: str, procCall, psutilCall):
+		procMicros = self._getMicrosPerCall(procCall)
+		psutilMicros = self._getMicrosPerCall(psutilCall)
+		
+		logging.info( \
+			"%s: /proc %.1f us per call, psutil %.1f us per call (%.1fx)", \
+			label, procMicros, psutilMicros, psutilMicros / procMicros)
+	
+	def _getMicrosPerCall(self, call) -> float:
+		# warm up (e.g. the first psutil call imports it)
+		call()
+		
+		startTime = perf_counter()
+		
+		for _ in range(self.CALL_COUNT):
+			call()
+		
+		return (perf_counter() - startTime) * 1000000.0 / self.CALL_COUNT
+
+if __name__ == "__main__":
+	unittest.main()
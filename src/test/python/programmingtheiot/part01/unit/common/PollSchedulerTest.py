@@ -0,0 +1,128 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+#
+
+import logging
+import unittest
+
+from time import monotonic, sleep
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.common.PollScheduler import PollScheduler
+
+class PollSchedulerTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	PollScheduler. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	INTERVAL = 0.05
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing PollScheduler class...")
+		
+		self.pollScheduler = PollScheduler()
+	
+	def setUp(self):
+		self.callTimes = []
+		self.callArgs = []
+	
+	def tearDown(self):
+		for jobID in self.pollScheduler.getJobIDs():
+			self.pollScheduler.removeJob(jobID)
+	
+	def testAddAndRemoveJob(self):
+		self.assertTrue(self.pollScheduler.addJob('testJob', self._handlePoll, 60.0))
+		self.assertFalse(self.pollScheduler.addJob('testJob', self._handlePoll, 60.0))
+		self.assertTrue(self.pollScheduler.isRunning())
+		
+		self.assertRaises(ValueError, self.pollScheduler.addJob, 'badJob', self._handlePoll, 0.0)
+		self.assertRaises(ValueError, self.pollScheduler.addJob, 'badJob', self._handlePoll, 1.0, 'bogus')
+		
+		self.assertTrue(self.pollScheduler.removeJob('testJob'))
+		self.assertFalse(self.pollScheduler.removeJob('testJob'))
+		
+		# the timer thread exits once there are no jobs
+		sleep(0.1)
+		self.assertFalse(self.pollScheduler.isRunning())
+	
+	def testDriftFreeCadence(self):
+		# each run takes 40% of the interval, which mustn't push the next one back
+		self.pollScheduler.addJob('cadenceJob', lambda: self._handlePoll(runSecs = self.INTERVAL * 0.4), self.INTERVAL)
+		self._waitForCalls('cadenceJob', 10)
+		
+		for i, callTime in enumerate(self.callTimes[0:10]):
+			self.assertAlmostEqual(callTime - self.callTimes[0], i * self.INTERVAL, delta = self.INTERVAL / 2)
+	
+	def testInterleavedJobs(self):
+		self.pollScheduler.addJob('fastJob', lambda: self.callArgs.append('fast'), self.INTERVAL)
+		self.pollScheduler.addJob('slowJob', lambda: self.callArgs.append('slow'), self.INTERVAL * 4)
+		
+		sleep(self.INTERVAL * 8.5)
+		
+		self.assertAlmostEqual(self.callArgs.count('fast'), 8, delta = 1)
+		self.assertAlmostEqual(self.callArgs.count('slow'), 2, delta = 1)
+	
+	def testCatchUpSkip(self):
+		self.pollScheduler.addJob('skipJob', self._handleSlowPoll, self.INTERVAL, ConfigConst.CATCH_UP_SKIP)
+		stats = self._waitForCalls('skipJob', 3)
+		
+		self.assertGreaterEqual(stats['missedCount'], 3)
+		self.assertEqual(len(self.callTimes), stats['runCount'])
+	
+	def testCatchUpBurst(self):
+		self.pollScheduler.addJob('burstJob', self._handleSlowPoll, self.INTERVAL, ConfigConst.CATCH_UP_BURST)
+		stats = self._waitForCalls('burstJob', 5)
+		
+		self.assertGreaterEqual(stats['missedCount'], 3)
+		self.assertEqual(len(self.callTimes), stats['runCount'] + stats['missedCount'])
+		
+		# the missed runs follow the late one straight away
+		self.assertLess(self.callTimes[4] - self.callTimes[1], self.INTERVAL)
+	
+	def testCatchUpBatch(self):
+		self.pollScheduler.addJob('batchJob', self._handleSlowPoll, self.INTERVAL, ConfigConst.CATCH_UP_BATCH)
+		stats = self._waitForCalls('batchJob', 3)
+		
+		self.assertEqual(self.callArgs[0], 0)
+		self.assertGreaterEqual(self.callArgs[1], 3)
+		self.assertEqual(sum(self.callArgs), stats['missedCount'])
+	
+	def _handlePoll(self, missedPolls: int = 0, runSecs: float = 0.0):
+		self.callTimes.append(monotonic())
+		self.callArgs.append(missedPolls)
+		
+		if runSecs > 0.0:
+			sleep(runSecs)
+	
+	def _handleSlowPoll(self, missedPolls: int = 0):
+		# the first run overruns by more than 3 intervals
+		self._handlePoll(missedPolls, runSecs = self.INTERVAL * 4.2 if not self.callTimes else 0.0)
+	
+	def _waitForCalls(self, jobID: str, count: int) -> dict:
+		waitUntil = monotonic() + 5.0
+		
+		while len(self.callTimes) < count and monotonic() < waitUntil:
+			sleep(0.01)
+		
+		stats = self.pollScheduler.getJobStats(jobID)
+		self.pollScheduler.removeJob(jobID)
+		
+		# let a run that's in progress (e.g. a burst) finish
+		sleep(self.INTERVAL)
+		
+		return stats
+
+if __name__ == "__main__":
+	unittest.main()
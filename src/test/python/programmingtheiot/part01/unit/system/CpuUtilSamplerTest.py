@@ -0,0 +1,117 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import os
+import tempfile
+import unittest
+
+from time import perf_counter
+
+from programmingtheiot.cda.system.CpuUtilSampler import CpuUtilSampler
+
+class CpuUtilSamplerTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	CpuUtilSampler. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	# user nice system idle iowait irq softirq steal guest guest_nice
+	STAT_DATA_1 = \
+		"cpu  100 0 100 700 50 0 0 50 0 0\n" + \
+		"cpu0 50 0 50 350 25 0 0 25 0 0\n" + \
+		"cpu1 50 0 50 350 25 0 0 25 0 0\n" + \
+		"intr 12345\n"
+	
+	STAT_DATA_2 = \
+		"cpu  400 0 100 1200 150 0 0 150 100 0\n" + \
+		"cpu0 350 0 50 350 25 0 0 25 100 0\n" + \
+		"cpu1 50 0 50 850 125 0 0 125 0 0\n" + \
+		"intr 12346\n"
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing CpuUtilSampler class...")
+		
+	def setUp(self):
+		self.statFile = tempfile.NamedTemporaryFile(mode = 'w', suffix = '.stat', delete = False)
+		self.statFile.close()
+
+	def tearDown(self):
+		os.remove(self.statFile.name)
+
+	def testSample(self):
+		cpuSampler = CpuUtilSampler()
+		cpuSampler.sample()
+		
+		cpuUtil = cpuSampler.sample()
+		
+		self.assertGreaterEqual(cpuUtil, 0.0)
+		self.assertLessEqual(cpuUtil, 100.0)
+		self.assertGreaterEqual(len(cpuSampler.getCpuUtilizationPerCore()), 1)
+		
+		logging.info("CPU utilization: %s, per core: %s", str(cpuUtil), str(cpuSampler.getCpuUtilizationPerCore()))
+
+	def testSampleDeltas(self):
+		cpuSampler = CpuUtilSampler(statPath = self.statFile.name)
+		
+		# the first sample is since boot
+		self._writeStatData(self.STAT_DATA_1)
+		
+		self.assertEqual(cpuSampler.sample(), 20.0)
+		self.assertEqual(cpuSampler.getIoWait(), 5.0)
+		self.assertEqual(cpuSampler.getSteal(), 5.0)
+		
+		# then since the last sample: 1000 jiffies, 300 busy, 100 iowait, 100 steal
+		self._writeStatData(self.STAT_DATA_2)
+		
+		self.assertEqual(cpuSampler.sample(), 30.0)
+		self.assertEqual(cpuSampler.getIoWait(), 10.0)
+		self.assertEqual(cpuSampler.getSteal(), 10.0)
+		
+		self.assertEqual(cpuSampler.getCpuUtilizationPerCore(), [100.0, 0.0])
+		self.assertEqual(cpuSampler.getIoWaitPerCore(), [0.0, 14.285714285714286])
+		self.assertEqual(cpuSampler.getStealPerCore(), [0.0, 14.285714285714286])
+		
+		# no elapsed time
+		self.assertEqual(cpuSampler.sample(), 0.0)
+
+	def testSampleIsNonBlocking(self):
+		cpuSampler = CpuUtilSampler()
+		
+		startTime = perf_counter()
+		
+		for _ in range(100):
+			cpuSampler.sample()
+		
+		elapsed = perf_counter() - startTime
+		
+		logging.info("Average sample time: %.1f us", elapsed * 10000.0)
+		self.assertLess(elapsed, 1.0)
+
+	def testPsutilFallback(self):
+		cpuSampler = CpuUtilSampler(statPath = '/no/such/path')
+		cpuSampler.sample()
+		
+		cpuUtil = cpuSampler.sample()
+		
+		self.assertGreaterEqual(cpuUtil, 0.0)
+		self.assertLessEqual(cpuUtil, 100.0)
+		self.assertGreaterEqual(len(cpuSampler.getCpuUtilizationPerCore()), 1)
+	
+	def _writeStatData(self, statData: str):
+		with open(self.statFile.name, 'w') as statFile:
+			statFile.write(statData)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,75 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import os
+import tempfile
+import unittest
+
+from programmingtheiot.cda.system.ProcFsReader import ProcFsReader
+
+class ProcFsReaderTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	ProcFsReader. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing ProcFsReader class...")
+		
+	def setUp(self):
+		self.testFile = tempfile.NamedTemporaryFile(mode = 'w', delete = False)
+		self.testFile.close()
+
+	def tearDown(self):
+		os.remove(self.testFile.name)
+
+	def testIsAvailable(self):
+		self.assertTrue(ProcFsReader.isAvailable(self.testFile.name))
+		self.assertFalse(ProcFsReader.isAvailable('/no/such/path'))
+
+	@unittest.skipUnless(hasattr(os, 'pread'), "os.pread() not supported.")
+	def testReadReusesDescriptor(self):
+		self._writeTestData("cpu  1 2 3 4\n")
+		
+		reader = ProcFsReader(self.testFile.name)
+		
+		self.assertEqual(reader.read(), b"cpu  1 2 3 4\n")
+		
+		# the file is read again from the start, via the same descriptor
+		self._writeTestData("cpu  5 6 7 8\n")
+		
+		self.assertEqual(reader.read(), b"cpu  5 6 7 8\n")
+		
+		reader.close()
+
+	@unittest.skipUnless(hasattr(os, 'pread'), "os.pread() not supported.")
+	def testReadLargerThanBuffer(self):
+		testData = "".join("line %d\n" % i for i in range(100))
+		self._writeTestData(testData)
+		
+		reader = ProcFsReader(self.testFile.name, bufferSize = 16)
+		
+		self.assertEqual(reader.read(), testData.encode())
+		self.assertGreater(reader.bufferSize, len(testData))
+		self.assertEqual(reader.read(), testData.encode())
+		
+		reader.close()
+	
+	def _writeTestData(self, testData: str):
+		with open(self.testFile.name, 'w') as testFile:
+			testFile.write(testData)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,99 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import gc
+import logging
+import threading
+import unittest
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.cda.system.ProcessHealthTask import ProcessHealthTask
+
+class ProcessHealthTaskTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	ProcessHealthTask. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	STATUS_DATA = \
+		b"Name:\tpython\n" + \
+		b"VmRSS:\t   20480 kB\n" + \
+		b"RssAnon:\t   10240 kB\n" + \
+		b"Threads:\t7\n" + \
+		b"SigQ:\t0/31405\n"
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing ProcessHealthTask class...")
+		
+	def setUp(self):
+		self.healthTask = ProcessHealthTask()
+		self.healthTask.startGcMonitoring()
+
+	def tearDown(self):
+		self.healthTask.close()
+
+	def testGetHealthData(self):
+		healthData = self.healthTask.getHealthData()
+		
+		logging.info("Process health: %s", str(vars(healthData)))
+		
+		self.assertEqual(healthData.getName(), ConfigConst.PROCESS_HEALTH_NAME)
+		self.assertEqual(healthData.getTypeID(), ConfigConst.SYSTEM_MGMT_TYPE)
+		self.assertGreater(healthData.getRssBytes(), 0)
+		self.assertGreater(healthData.getCpuTime(), 0.0)
+		self.assertGreaterEqual(healthData.getThreadCount(), threading.active_count())
+		self.assertGreater(healthData.getOpenFdCount(), 0)
+		self.assertEqual(len(healthData.getGcCollections()), len(gc.get_stats()))
+		self.assertGreaterEqual(healthData.getCpuUtilization(), 0.0)
+		self.assertLessEqual(healthData.getCpuUtilization(), 100.0)
+		self.assertGreater(healthData.getMemoryUtilization(), 0.0)
+
+	def testGcPauses(self):
+		self.healthTask.getHealthData()
+		
+		gc.collect()
+		
+		healthData = self.healthTask.getHealthData()
+		
+		self.assertGreater(healthData.getGcPauseTotal(), 0.0)
+		self.assertGreaterEqual(healthData.getGcPauseTotal(), healthData.getGcPauseMax())
+		
+		# the hook is only added once, and is removed on close
+		self.assertFalse(self.healthTask.startGcMonitoring())
+		
+		self.healthTask.close()
+		
+		self.assertNotIn(self.healthTask._handleGcEvent, gc.callbacks)
+		self.assertFalse(self.healthTask.stopGcMonitoring())
+
+	def testParseStatus(self):
+		self.assertEqual(self.healthTask._parseStatus(self.STATUS_DATA), (20480 * 1024, 7))
+
+	def testQueueDepths(self):
+		queueDepth = [3]
+		
+		self.healthTask.addQueueDepthSource('TestQueue', lambda: queueDepth[0])
+		self.healthTask.addQueueDepthSource('BrokenQueue', lambda: 1 / 0)
+		
+		self.assertEqual(self.healthTask.getHealthData().getQueueDepths(), {'TestQueue': 3})
+		
+		queueDepth[0] = 5
+		
+		self.assertEqual(self.healthTask.getHealthData().getQueueDepths()['TestQueue'], 5)
+		self.assertTrue(self.healthTask.removeQueueDepthSource('TestQueue'))
+		self.assertFalse(self.healthTask.removeQueueDepthSource('TestQueue'))
+
+if __name__ == "__main__":
+	unittest.main()
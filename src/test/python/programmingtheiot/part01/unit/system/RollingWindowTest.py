@@ -0,0 +1,105 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import random
+import statistics
+import unittest
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.cda.system.RollingWindow import RollingWindow
+
+class RollingWindowTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	RollingWindow. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing RollingWindow class...")
+		
+	def setUp(self):
+		pass
+
+	def tearDown(self):
+		pass
+
+	def testEmptyWindow(self):
+		window = RollingWindow(size = 10)
+		stats = window.getStats()
+		
+		self.assertEqual(window.getCount(), 0)
+		
+		for name in (ConfigConst.MIN_PROP, ConfigConst.MAX_PROP, ConfigConst.MEAN_PROP, ConfigConst.EWMA_PROP, ConfigConst.P95_PROP):
+			self.assertIsNone(stats[name])
+		
+	def testInvalidWindow(self):
+		self.assertRaises(ValueError, RollingWindow, size = 0)
+		
+	def testEwma(self):
+		window = RollingWindow(size = 3, ewmaAlpha = 0.5)
+		
+		for value in (10.0, 20.0, 30.0, 40.0):
+			window.addValue(value)
+		
+		# the EWMA includes values that have left the window
+		self.assertAlmostEqual(window.getEwma(), 31.25)
+		
+	def testRollingAggregates(self):
+		size = 20
+		window = RollingWindow(size = size)
+		values = [random.uniform(0.0, 100.0) for i in range(500)]
+		
+		for i, value in enumerate(values):
+			window.addValue(value)
+			
+			windowValues = values[max(0, i + 1 - size):i + 1]
+			
+			self.assertEqual(window.getCount(), len(windowValues))
+			self.assertEqual(window.getMin(), min(windowValues))
+			self.assertEqual(window.getMax(), max(windowValues))
+			self.assertAlmostEqual(window.getMean(), statistics.mean(windowValues))
+		
+	def testPercentile(self):
+		window = RollingWindow(size = 100)
+		
+		for value in random.sample(range(1, 101), 100):
+			window.addValue(float(value))
+		
+		# percentiles are exact (nearest rank), for any range of values
+		self.assertEqual(window.getPercentile(95.0), 95.0)
+		self.assertEqual(window.getPercentile(50.0), 50.0)
+		self.assertEqual(window.getPercentile(100.0), 100.0)
+		self.assertEqual(window.getPercentile(0.0), 1.0)
+		
+		window.reset()
+		
+		for value in (-5.0, 150.0, 1.0e6):
+			window.addValue(value)
+		
+		self.assertEqual(window.getPercentile(95.0), 1.0e6)
+		self.assertEqual(window.getPercentile(10.0), -5.0)
+		
+		# only the values in the window count
+		window = RollingWindow(size = 20)
+		
+		for value in range(1000, 0, -1):
+			window.addValue(float(value))
+		
+		self.assertEqual(window.getPercentile(95.0), 19.0)
+		self.assertEqual(window.getPercentile(100.0), 20.0)
+		
+if __name__ == "__main__":
+	unittest.main()
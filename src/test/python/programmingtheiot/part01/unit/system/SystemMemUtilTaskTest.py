@@ -39,6 +39,16 @@ class SystemMemUtilTaskTest(unittest.TestCase):
 		self.assertGreaterEqual(val, 0.0)
 		logging.info("Virtual memory utilization: %s", str(val))
 
+	def testParseMemInfo(self):
+		memInfoData = b"MemTotal:        1000 kB\nMemFree:          100 kB\nMemAvailable:     250 kB\nBuffers:           50 kB\nCached:           100 kB\n"
+		
+		self.assertEqual(self.memUtilTask._parseMemInfo(memInfoData), 75.0)
+		
+		# older kernels don't report MemAvailable
+		memInfoData = b"MemTotal:        1000 kB\nMemFree:          100 kB\nBuffers:           50 kB\nCached:           100 kB\n"
+		
+		self.assertEqual(self.memUtilTask._parseMemInfo(memInfoData), 75.0)
+
 if __name__ == "__main__":
 	unittest.main()
 	
\ No newline at end of file
@@ -0,0 +1,77 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import psutil
+import unittest
+
+from time import sleep
+
+from programmingtheiot.cda.system.SystemMetricsCollector import SystemMetricsCollector
+
+class SystemMetricsCollectorTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	SystemMetricsCollector. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing SystemMetricsCollector class...")
+		
+	def setUp(self):
+		pass
+
+	def tearDown(self):
+		pass
+
+	def testCollectMetrics(self):
+		metricsCollector = SystemMetricsCollector()
+		
+		sleep(0.1)
+		sysPerfData = metricsCollector.collectMetrics()
+		
+		self.assertEqual(len(sysPerfData.getCpuUtilizationPerCore()), psutil.cpu_count())
+		self.assertGreaterEqual(sysPerfData.getCpuUtilization(), 0.0)
+		self.assertGreater(sysPerfData.getMemoryUtilization(), 0.0)
+		self.assertGreater(sysPerfData.getDiskUtilization(), 0.0)
+		self.assertEqual(len(sysPerfData.getLoadAverage()), 3)
+		
+		# no rates until there's a previous snapshot
+		self.assertEqual(sysPerfData.getNetworkBytesRecvRate(), 0.0)
+		
+		logging.info("Extended system perf data: %s", str(vars(sysPerfData)))
+
+	def testRates(self):
+		metricsCollector = SystemMetricsCollector()
+		metricsCollector.collectMetrics()
+		
+		sleep(0.1)
+		sysPerfData = metricsCollector.collectMetrics()
+		
+		for rate in ( \
+			sysPerfData.getDiskReadRate(), sysPerfData.getDiskWriteRate(), \
+			sysPerfData.getNetworkBytesRecvRate(), sysPerfData.getNetworkBytesSentRate(), \
+			sysPerfData.getNetworkPacketsRecvRate(), sysPerfData.getNetworkPacketsSentRate()):
+			
+			self.assertGreaterEqual(rate, 0.0)
+		
+		logging.info("Extended system perf data: %s", str(vars(sysPerfData)))
+
+	def testMissingDiskPath(self):
+		metricsCollector = SystemMetricsCollector(diskPath = '/no/such/path')
+		
+		self.assertEqual(metricsCollector.collectMetrics().getDiskUtilization(), 0.0)
+
+if __name__ == "__main__":
+	unittest.main()
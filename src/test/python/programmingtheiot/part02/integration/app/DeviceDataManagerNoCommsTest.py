@@ -10,9 +10,16 @@
 import logging
 import unittest
 
-from time import sleep
+from time import monotonic, sleep
+
+import programmingtheiot.common.ConfigConst as ConfigConst
 
 from programmingtheiot.cda.app.DeviceDataManager import DeviceDataManager
+from programmingtheiot.common.ConfigUtil import ConfigUtil
+from programmingtheiot.data.ActuatorData import ActuatorData
+from programmingtheiot.data.MultiSensorData import MultiSensorData
+from programmingtheiot.data.SensorData import SensorData
+from programmingtheiot.data.SensorDataBatch import SensorDataBatch
 
 class DeviceDataManagerNoCommsTest(unittest.TestCase):
 	"""
@@ -60,7 +67,70 @@ class DeviceDataManagerNoCommsTest(unittest.TestCase):
 		sleep(120) # 2 minutes
 		
 		ddMgr.stopManager()
+		
+	def testSensorDataCache(self):
+		ddMgr = DeviceDataManager()
+		
+		self.assertIsNone(ddMgr.getLatestSensorDataFromCache(ConfigConst.TEMP_SENSOR_NAME))
+		
+		# suppressed readings aren't sent upstream, but still update the cache
+		sensorData = SensorData(typeID = ConfigConst.TEMP_SENSOR_TYPE, name = ConfigConst.TEMP_SENSOR_NAME)
+		sensorData.setValue(21.5)
+		
+		self.assertTrue(ddMgr.handleSuppressedSensorMessage(sensorData))
+		self.assertEqual(ddMgr.getLatestSensorDataFromCache(ConfigConst.TEMP_SENSOR_NAME).getValue(), 21.5)
+		
+		# batches update it with their latest reading, and ticks with every reading
+		batch = SensorDataBatch(typeID = ConfigConst.TEMP_SENSOR_TYPE, name = ConfigConst.TEMP_SENSOR_NAME)
+		batch.setEntries(timeStamps = [1.0, 2.0], values = [22.0, 22.5])
+		
+		self.assertTrue(ddMgr.handleSensorMessageBatch(batch))
+		self.assertEqual(ddMgr.getLatestSensorDataFromCache(ConfigConst.TEMP_SENSOR_NAME).getValue(), 22.5)
+		
+		tick = MultiSensorData( \
+			names = [ConfigConst.HUMIDITY_SENSOR_NAME, ConfigConst.TEMP_SENSOR_NAME], \
+			typeIDs = [ConfigConst.HUMIDITY_SENSOR_TYPE, ConfigConst.TEMP_SENSOR_TYPE], \
+			values = [40.0, 23.0])
+		
+		self.assertTrue(ddMgr.handleMultiSensorMessage(tick))
+		self.assertEqual(ddMgr.getLatestSensorDataFromCache(ConfigConst.HUMIDITY_SENSOR_NAME).getValue(), 40.0)
+		self.assertEqual(ddMgr.getLatestSensorDataFromCache(ConfigConst.TEMP_SENSOR_NAME).getValue(), 23.0)
 
+	def testConnectorsLoadedIfEnabled(self):
+		ddMgr = DeviceDataManager()
+		configUtil = ConfigUtil()
+		
+		self.assertEqual( \
+			ddMgr.mqttClient is not None, \
+			configUtil.getBoolean(ConfigConst.CONSTRAINED_DEVICE, ConfigConst.ENABLE_MQTT_CLIENT_KEY))
+		self.assertEqual( \
+			ddMgr.coapClient is not None, \
+			configUtil.getBoolean(ConfigConst.CONSTRAINED_DEVICE, ConfigConst.ENABLE_COAP_CLIENT_KEY))
+		
+	def testActuatorResponseCache(self):
+		ddMgr = DeviceDataManager()
+		ddMgr.startManager()
+		
+		actuatorData = ActuatorData(typeID = ConfigConst.HVAC_ACTUATOR_TYPE, name = ConfigConst.HVAC_ACTUATOR_NAME)
+		actuatorData.setCommand(ConfigConst.COMMAND_ON)
+		actuatorData.setValue(22.0)
+		
+		self.assertTrue(ddMgr.handleActuatorCommandMessage(actuatorData))
+		
+		# the response is delivered (and cached) asynchronously, by the actuator's dispatch worker
+		endTime = monotonic() + 5.0
+		
+		while not ddMgr.getLatestActuatorDataResponseFromCache(ConfigConst.HVAC_ACTUATOR_NAME) and monotonic() < endTime:
+			sleep(0.01)
+		
+		ddMgr.stopManager()
+		
+		response = ddMgr.getLatestActuatorDataResponseFromCache(ConfigConst.HVAC_ACTUATOR_NAME)
+		
+		self.assertIsNotNone(response)
+		self.assertTrue(response.isResponseFlagEnabled())
+		self.assertEqual(response.getValue(), 22.0)
+		
 if __name__ == "__main__":
 	unittest.main()
 	
\ No newline at end of file
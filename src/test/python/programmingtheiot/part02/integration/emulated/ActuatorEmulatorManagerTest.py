@@ -45,6 +45,11 @@ class ActuatorEmulatorManagerTest(unittest.TestCase):
 		self.defaultMsgListener = DefaultDataMessageListener()
 		self.actuatorAdapterMgr = ActuatorAdapterManager()
 		self.actuatorAdapterMgr.setDataMessageListener(self.defaultMsgListener)
+		self.actuatorAdapterMgr.startManager()
+		
+	@classmethod
+	def tearDownClass(self):
+		self.actuatorAdapterMgr.stopManager()
 		
 	def setUp(self):
 		pass
@@ -8,6 +8,8 @@
 # 
 
 import logging
+import threading
+import time
 import unittest
 
 import programmingtheiot.common.ConfigConst as ConfigConst
@@ -34,6 +36,11 @@ class ActuatorAdapterManagerTest(unittest.TestCase):
 		self.defaultMsgListener = DefaultDataMessageListener()
 		self.actuatorAdapterMgr = ActuatorAdapterManager()
 		self.actuatorAdapterMgr.setDataMessageListener(self.defaultMsgListener)
+		self.actuatorAdapterMgr.startManager()
+		
+	@classmethod
+	def tearDownClass(self):
+		self.actuatorAdapterMgr.stopManager()
 		
 	def setUp(self):
 		pass
@@ -60,6 +67,254 @@ class ActuatorAdapterManagerTest(unittest.TestCase):
 		
 		ad.setCommand(ConfigConst.COMMAND_OFF)
 		self.actuatorAdapterMgr.sendActuatorCommand(ad)
+	
+	def testSlowActuatorDoesNotBlock(self):
+		responseListener = ResponseCaptureListener(expectedCount = 3)
+		actuatorAdapterMgr = ActuatorAdapterManager()
+		actuatorAdapterMgr.setDataMessageListener(responseListener)
+		actuatorAdapterMgr.startManager()
+		
+		# make the HVAC actuator slow - the humidifier must not be held up by it
+		hvacActivate = actuatorAdapterMgr.getActuatorTask(ConfigConst.HVAC_ACTUATOR_TYPE)._activateActuator
+		
+		def slowActivate(val, stateData = None):
+			time.sleep(0.2)
+			return hvacActivate(val, stateData)
+		
+		actuatorAdapterMgr.getActuatorTask(ConfigConst.HVAC_ACTUATOR_TYPE)._activateActuator = slowActivate
+		
+		ad = ActuatorData(typeID = ConfigConst.HVAC_ACTUATOR_TYPE)
+		ad.setCommand(ConfigConst.COMMAND_ON)
+		
+		startTime = time.monotonic()
+		
+		for val in [20.0, 21.0]:
+			ad.setValue(val)
+			self.assertTrue(actuatorAdapterMgr.sendActuatorCommand(ad))
+		
+		humidifierData = ActuatorData(typeID = ConfigConst.HUMIDIFIER_ACTUATOR_TYPE)
+		humidifierData.setCommand(ConfigConst.COMMAND_ON)
+		humidifierData.setValue(40.0)
+		
+		self.assertTrue(actuatorAdapterMgr.sendActuatorCommand(humidifierData))
+		self.assertLess(time.monotonic() - startTime, 0.1)
+		
+		self.assertTrue(responseListener.responsesReceived.wait(5.0))
+		self.assertTrue(actuatorAdapterMgr.stopManager())
+		
+		# the humidifier response isn't queued behind the slow HVAC commands
+		self.assertEqual(responseListener.responses[0].getTypeID(), ConfigConst.HUMIDIFIER_ACTUATOR_TYPE)
+		self.assertEqual([r.getValue() for r in responseListener.responses[1:]], [20.0, 21.0])
+		
+		metrics = actuatorAdapterMgr.getActuatorMetrics()
+		hvacMetrics = metrics[ConfigConst.HVAC_ACTUATOR_NAME]
+		
+		logging.info("Actuator metrics: %s", str(metrics))
+		
+		self.assertEqual(hvacMetrics['processedCount'], 2)
+		self.assertEqual(hvacMetrics['queueDepth'], 0)
+		self.assertGreaterEqual(hvacMetrics['maxLatency'], 0.4)
+		self.assertEqual(metrics[ConfigConst.HUMIDIFIER_ACTUATOR_NAME]['processedCount'], 1)
+	
+	def testQueueOverflowDropsOldest(self):
+		actuatorAdapterMgr = ActuatorAdapterManager()
+		actuatorAdapterMgr.startManager()
+		dispatchQueue = actuatorAdapterMgr._getDispatchQueue(ConfigConst.HVAC_ACTUATOR_TYPE)
+		queueSize = dispatchQueue.maxSize
+		
+		responseListener = ResponseCaptureListener(expectedCount = queueSize + 1)
+		actuatorAdapterMgr.setDataMessageListener(responseListener)
+		
+		# hold the HVAC worker on the first command, so the rest fill the queue
+		releaseActuator = threading.Event()
+		hvacActivate = actuatorAdapterMgr.getActuatorTask(ConfigConst.HVAC_ACTUATOR_TYPE)._activateActuator
+		
+		def blockedActivate(val, stateData = None):
+			releaseActuator.wait(5.0)
+			return hvacActivate(val, stateData)
+		
+		actuatorAdapterMgr.getActuatorTask(ConfigConst.HVAC_ACTUATOR_TYPE)._activateActuator = blockedActivate
+		
+		ad = ActuatorData(typeID = ConfigConst.HVAC_ACTUATOR_TYPE)
+		ad.setCommand(ConfigConst.COMMAND_ON)
+		ad.setValue(0.0)
+		
+		self.assertTrue(actuatorAdapterMgr.sendActuatorCommand(ad))
+		
+		while dispatchQueue.getMetrics()['queueDepth'] > 0:
+			time.sleep(0.01)
+		
+		for i in range(1, queueSize + 2):
+			ad.setValue(float(i))
+			self.assertTrue(actuatorAdapterMgr.sendActuatorCommand(ad))
+		
+		self.assertEqual(dispatchQueue.getMetrics()['queueDepth'], queueSize)
+		self.assertEqual(dispatchQueue.getMetrics()['droppedCount'], 1)
+		
+		releaseActuator.set()
+		
+		self.assertTrue(responseListener.responsesReceived.wait(5.0))
+		self.assertTrue(actuatorAdapterMgr.stopManager())
+		
+		# command 1 was dropped; the rest are applied in order
+		self.assertEqual( \
+			[r.getValue() for r in responseListener.responses], \
+			[0.0] + [float(i) for i in range(2, queueSize + 2)])
+		
+		self.assertFalse(actuatorAdapterMgr.sendActuatorCommand(ad))
+		self.assertFalse(actuatorAdapterMgr.sendActuatorCommand(ActuatorData(typeID = ConfigConst.LED_DISPLAY_ACTUATOR_TYPE)))
+
+	def testExplicitLifecycle(self):
+		actuatorAdapterMgr = ActuatorAdapterManager()
+		
+		ad = ActuatorData(typeID = ConfigConst.HVAC_ACTUATOR_TYPE)
+		ad.setCommand(ConfigConst.COMMAND_ON)
+		ad.setValue(21.0)
+		
+		# nothing runs (or is accepted) until the manager is started
+		self.assertFalse(actuatorAdapterMgr.isRunning)
+		self.assertFalse(actuatorAdapterMgr.sendActuatorCommand(ad))
+		self.assertTrue(actuatorAdapterMgr.startManager())
+		self.assertTrue(actuatorAdapterMgr.stopManager())
+	
+	def testSuppressedResponsesForwarded(self):
+		responseListener = ResponseCaptureListener(expectedCount = 2)
+		actuatorAdapterMgr = ActuatorAdapterManager()
+		actuatorAdapterMgr.setDataMessageListener(responseListener)
+		actuatorAdapterMgr.startManager()
+		
+		# the same command twice - the second is a no-op
+		ad = ActuatorData(typeID = ConfigConst.HUMIDIFIER_ACTUATOR_TYPE)
+		ad.setCommand(ConfigConst.COMMAND_ON)
+		ad.setValue(45.0)
+		
+		self.assertTrue(actuatorAdapterMgr.sendActuatorCommand(ad))
+		self.assertTrue(actuatorAdapterMgr.sendActuatorCommand(ad))
+		self.assertTrue(responseListener.responsesReceived.wait(5.0))
+		self.assertTrue(actuatorAdapterMgr.stopManager())
+		
+		self.assertEqual(responseListener.responses[1].getStatusCode(), ConfigConst.ACTUATOR_NO_OP_STATUS)
+		
+		metrics = actuatorAdapterMgr.getActuatorMetrics()[ConfigConst.HUMIDIFIER_ACTUATOR_NAME]
+		
+		self.assertEqual(metrics['suppressedCounts'], {ConfigConst.ACTUATOR_NO_OP_STATUS: 1})
+	
+	def testStopKeepsQueuedCommands(self):
+		actuatorAdapterMgr = ActuatorAdapterManager()
+		actuatorAdapterMgr.startManager()
+		dispatchQueue = actuatorAdapterMgr._getDispatchQueue(ConfigConst.HVAC_ACTUATOR_TYPE)
+		queueSize = dispatchQueue.maxSize
+		
+		responseListener = ResponseCaptureListener(expectedCount = queueSize + 1)
+		actuatorAdapterMgr.setDataMessageListener(responseListener)
+		
+		# hold the HVAC worker on the first command, and fill the queue behind it
+		releaseActuator = threading.Event()
+		hvacActivate = actuatorAdapterMgr.getActuatorTask(ConfigConst.HVAC_ACTUATOR_TYPE)._activateActuator
+		
+		def blockedActivate(val, stateData = None):
+			releaseActuator.wait(5.0)
+			return hvacActivate(val, stateData)
+		
+		actuatorAdapterMgr.getActuatorTask(ConfigConst.HVAC_ACTUATOR_TYPE)._activateActuator = blockedActivate
+		
+		ad = ActuatorData(typeID = ConfigConst.HVAC_ACTUATOR_TYPE)
+		ad.setCommand(ConfigConst.COMMAND_ON)
+		
+		for i in range(queueSize + 1):
+			ad.setValue(float(i))
+			self.assertTrue(actuatorAdapterMgr.sendActuatorCommand(ad))
+		
+			while i == 0 and dispatchQueue.getMetrics()['queueDepth'] > 0:
+				time.sleep(0.01)
+		
+		# stopping a busy actuator waits for (and doesn't drop) the queued commands
+		stopThread = threading.Thread(target = actuatorAdapterMgr.stopManager)
+		stopThread.start()
+		
+		time.sleep(0.1)
+		
+		self.assertFalse(actuatorAdapterMgr.sendActuatorCommand(ad))
+		
+		releaseActuator.set()
+		stopThread.join(5.0)
+		
+		self.assertFalse(dispatchQueue.isRunning())
+		self.assertEqual([r.getValue() for r in responseListener.responses], [float(i) for i in range(queueSize + 1)])
+		self.assertEqual(dispatchQueue.getMetrics()['droppedCount'], 0)
+	
+	def testPendingCommandFailures(self):
+		responseListener = ResponseCaptureListener(expectedCount = 2)
+		actuatorAdapterMgr = ActuatorAdapterManager()
+		actuatorAdapterMgr.setDataMessageListener(responseListener)
+		
+		# the first pending command check fails, then the (due) pending command fails to apply
+		hvacTask = actuatorAdapterMgr.getActuatorTask(ConfigConst.HVAC_ACTUATOR_TYPE)
+		getPendingCommandDelay = hvacTask.getPendingCommandDelay
+		applyPendingCommand = hvacTask.applyPendingCommand
+		failures = ['check', 'apply']
+		
+		def failingGetPendingCommandDelay():
+			if failures and failures[0] == 'check':
+				failures.pop(0)
+				raise RuntimeError("Pending command check failed.")
+		
+			return 0.0 if failures else getPendingCommandDelay()
+		
+		def failingApplyPendingCommand():
+			if failures:
+				failures.pop(0)
+				raise RuntimeError("Pending command failed.")
+		
+			return applyPendingCommand()
+		
+		hvacTask.getPendingCommandDelay = failingGetPendingCommandDelay
+		hvacTask.applyPendingCommand = failingApplyPendingCommand
+		
+		actuatorAdapterMgr.startManager()
+		
+		ad = ActuatorData(typeID = ConfigConst.HVAC_ACTUATOR_TYPE)
+		ad.setCommand(ConfigConst.COMMAND_ON)
+		
+		# the worker survives both failures, and carries on with the next command
+		for val in [20.0, 21.0]:
+			ad.setValue(val)
+			self.assertTrue(actuatorAdapterMgr.sendActuatorCommand(ad))
+		
+		self.assertTrue(responseListener.responsesReceived.wait(5.0))
+		
+		# the pending command is only tried once the worker is idle
+		while failures:
+			time.sleep(0.01)
+		
+		self.assertTrue(actuatorAdapterMgr.stopManager())
+		
+		metrics = actuatorAdapterMgr.getActuatorMetrics()[ConfigConst.HVAC_ACTUATOR_NAME]
+		
+		self.assertEqual(metrics['failedCount'], 2)
+		self.assertEqual(metrics['processedCount'], 2)
+	
+class ResponseCaptureListener(DefaultDataMessageListener):
+	"""
+	Captures actuator responses, and sets 'responsesReceived' once
+	'expectedCount' responses have been received.
+	
+	"""
+	
+	def __init__(self, expectedCount: int = 1):
+		super(ResponseCaptureListener, self).__init__()
+		
+		self.expectedCount = expectedCount
+		self.responses = []
+		self.responsesReceived = threading.Event()
+		
+	def handleActuatorCommandResponse(self, data: ActuatorData) -> bool:
+		self.responses.append(data)
+		
+		if len(self.responses) >= self.expectedCount:
+			self.responsesReceived.set()
+		
+		return True
 
 if __name__ == "__main__":
 	unittest.main()
@@ -8,11 +8,20 @@
 # 
 
 import logging
+import numpy
+import os
+import tempfile
 import unittest
 
 from time import sleep
 
+import programmingtheiot.common.ConfigConst as ConfigConst
+
 from programmingtheiot.common.DefaultDataMessageListener import DefaultDataMessageListener
+from programmingtheiot.cda.sim.SensorDataCache import SensorDataCache
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.sim.TemperatureSensorSimTask import TemperatureSensorSimTask
+from programmingtheiot.cda.system.DeadbandFilter import DeadbandFilter
 from programmingtheiot.cda.system.SensorAdapterManager import SensorAdapterManager
 
 class SensorAdapterManagerTest(unittest.TestCase):
@@ -46,6 +55,222 @@ class SensorAdapterManagerTest(unittest.TestCase):
 		
 		self.sensorAdapterMgr.stopManager()
 
+	def testWarmStartFromCache(self):
+		with tempfile.TemporaryDirectory() as cachePath:
+			dataEntries = []
+			
+			for start in range(2):
+				sensorAdapterMgr = SensorAdapterManager()
+				
+				if sensorAdapterMgr.useEmulator:
+					self.skipTest("Sim data isn't used with the emulator ('enableEmulator').")
+				
+				# a seed is needed for the sim data to be cached
+				sensorAdapterMgr.simDataSeed = 42
+				sensorAdapterMgr.sensorDataCache = SensorDataCache(cachePath = cachePath)
+				
+				sensorAdapterMgr.startManager()
+				sensorAdapterMgr.stopManager()
+				
+				dataEntries.append([sensorTask.dataSet.getDataEntries() for sensorTask in sensorAdapterMgr.getSensorTasks()])
+			
+			self.assertEqual(len(os.listdir(cachePath)), len(SensorAdapterManager.SENSOR_TYPES))
+			
+			# the first start generates the data sets, and the second memory-maps them from the cache
+			for generatedEntries, cachedEntries in zip(dataEntries[0], dataEntries[1]):
+				self.assertNotIsInstance(generatedEntries, numpy.memmap)
+				self.assertIsInstance(cachedEntries, numpy.memmap)
+				self.assertTrue(numpy.array_equal(generatedEntries, cachedEntries))
+		
+	def testChunkedSimData(self):
+		sensorAdapterMgr = SensorAdapterManager()
+		
+		if sensorAdapterMgr.useEmulator:
+			self.skipTest("Sim data isn't used with the emulator ('enableEmulator').")
+		
+		sensorAdapterMgr.simDataChunkSize = 60
+		sensorAdapterMgr.sensorDataCache = None
+		
+		# the sim tasks get a stream of chunks (so the cache isn't needed), and only the current chunk is resident
+		for sensorTask in sensorAdapterMgr.getSensorTasks():
+			self.assertIsNone(sensorTask.dataSet)
+			self.assertTrue(sensorTask.isChunked())
+			
+			self.assertEqual(sensorTask.generateTelemetryBatch(100).getCount(), 100)
+			self.assertEqual(sensorTask.chunkDataEntries.size, 60)
+		
+	def testHandleTelemetryBatch(self):
+		batches = self.sensorAdapterMgr.handleTelemetryBatch(10)
+		
+		self.assertEqual(len(batches), 3)
+		
+		for batch in batches:
+			self.assertEqual(batch.getCount(), 10)
+			logging.info("SensorDataBatch: %s", str(batch))
+
+	def testHandleTelemetryTick(self):
+		sensorAdapterMgr = SensorAdapterManager()
+		sensorAdapterMgr.setDataMessageListener(self.defaultMsgListener)
+		sensorAdapterMgr.setTickMode(True)
+		
+		tempTask = sensorAdapterMgr.getSensorTasks()[2]
+		tempEntries = tempTask.dataSet.getDataEntries()
+		
+		ticks = [sensorAdapterMgr.handleTelemetryTick() for _ in range(3)]
+		
+		for tick in ticks:
+			self.assertEqual(tick.getCount(), 3)
+			self.assertEqual(tick.getTypeIDs().tolist(), sensorAdapterMgr.SENSOR_TYPES)
+			logging.info("MultiSensorData: %s", str(tick))
+		
+		self.assertEqual( \
+			[tick.getValue(ConfigConst.TEMP_SENSOR_NAME) for tick in ticks], tempEntries[0:3].tolist())
+		
+		# backfilled batches, and the tasks once tick mode is off, carry on from the last tick
+		batches = sensorAdapterMgr.handleTelemetryBatch(2)
+		
+		self.assertEqual(batches[2].getValues().tolist(), tempEntries[3:5].tolist())
+		self.assertEqual(sensorAdapterMgr.handleTelemetryTick().getValue(ConfigConst.TEMP_SENSOR_NAME), tempEntries[5])
+		
+		sensorAdapterMgr.setTickMode(False)
+		
+		self.assertEqual(tempTask.generateTelemetry().getValue(), tempEntries[6])
+
+	def testReportOnChange(self):
+		messageCounter = SensorMessageCounter()
+		
+		sensorAdapterMgr = SensorAdapterManager()
+		sensorAdapterMgr.setDataMessageListener(messageCounter)
+		
+		# no filtering for humidity; temperature is always reported, pressure never changes enough
+		sensorAdapterMgr.sensorFilters[ConfigConst.HUMIDITY_SENSOR_NAME] = None
+		sensorAdapterMgr.sensorFilters[ConfigConst.PRESSURE_SENSOR_NAME] = DeadbandFilter(deadband = 1000.0)
+		sensorAdapterMgr.sensorFilters[ConfigConst.TEMP_SENSOR_NAME] = DeadbandFilter(deadband = 1000.0, maxSilenceSecs = 0.000001)
+		
+		for _ in range(10):
+			sensorAdapterMgr.handleTelemetry()
+		
+		self.assertEqual(messageCounter.reportedCounts[ConfigConst.HUMIDITY_SENSOR_NAME], 10)
+		self.assertEqual(messageCounter.reportedCounts[ConfigConst.PRESSURE_SENSOR_NAME], 1)
+		self.assertEqual(messageCounter.suppressedCounts[ConfigConst.PRESSURE_SENSOR_NAME], 9)
+		self.assertEqual(messageCounter.reportedCounts[ConfigConst.TEMP_SENSOR_NAME], 10)
+		
+		# in tick mode, a tick is sent if any reading passes its filter
+		sensorAdapterMgr.sensorFilters[ConfigConst.TEMP_SENSOR_NAME] = DeadbandFilter(deadband = 1000.0)
+		sensorAdapterMgr.sensorFilters[ConfigConst.HUMIDITY_SENSOR_NAME] = DeadbandFilter(deadband = 1000.0)
+		sensorAdapterMgr.setTickMode(True)
+		
+		for _ in range(3):
+			sensorAdapterMgr.handleTelemetryTick()
+		
+		self.assertEqual(messageCounter.tickCount, 1)
+		self.assertEqual(messageCounter.suppressedCounts[ConfigConst.PRESSURE_SENSOR_NAME], 11)
+
+	def testPooledSensorDataCopies(self):
+		messageCounter = SensorMessageCounter()
+		
+		sensorAdapterMgr = SensorAdapterManager()
+		sensorAdapterMgr.setDataMessageListener(messageCounter)
+		
+		dataSet = SensorDataGenerator(seed = 42).generateDailyIndoorTemperatureDataSet(streamID = 1)
+		pooledTask = TemperatureSensorSimTask(dataSet = dataSet, poolSize = 1, playbackSpeed = 0.0)
+		
+		for _ in range(3):
+			sensorAdapterMgr.handleSensorTelemetry(pooledTask)
+		
+		# listeners own what they're sent - the single pooled instance isn't shared, or overwritten
+		sensorMessages = messageCounter.sensorMessages
+		
+		self.assertEqual(len(sensorMessages), 3)
+		self.assertEqual(len(set(id(data) for data in sensorMessages)), 3)
+		self.assertNotIn(pooledTask.getLatestTelemetry(copy = False), sensorMessages)
+		self.assertEqual([data.getValue() for data in sensorMessages], dataSet.getDataEntries()[0:3].tolist())
+
+	def testPerSensorPolling(self):
+		messageCounter = SensorMessageCounter()
+		
+		sensorAdapterMgr = SensorAdapterManager()
+		sensorAdapterMgr.setDataMessageListener(messageCounter)
+		
+		# one poll job per sensor
+		self.assertTrue(sensorAdapterMgr.startManager())
+		self.assertFalse(sensorAdapterMgr.startManager())
+		self.assertEqual(len(sensorAdapterMgr.jobIDs), 3)
+		
+		for jobID in sensorAdapterMgr.jobIDs:
+			self.assertTrue(sensorAdapterMgr.pollScheduler.hasJob(jobID))
+		
+		self.assertTrue(sensorAdapterMgr.stopManager())
+		self.assertFalse(sensorAdapterMgr.stopManager())
+		
+		# missed polls of one sensor are backfilled for that sensor only
+		sensorAdapterMgr.sensorFilters[ConfigConst.TEMP_SENSOR_NAME] = None
+		sensorAdapterMgr.handleSensorTelemetry(sensorAdapterMgr.getSensorTasks()[2], missedPolls = 2)
+		
+		self.assertEqual(messageCounter.batchCounts, {ConfigConst.TEMP_SENSOR_NAME: 2})
+		self.assertEqual(messageCounter.reportedCounts, {ConfigConst.TEMP_SENSOR_NAME: 1})
+
+	def testSensorTaskLoadFailure(self):
+		messageCounter = SensorMessageCounter()
+		
+		sensorAdapterMgr = SensorAdapterManager()
+		sensorAdapterMgr.setDataMessageListener(messageCounter)
+		
+		# the pressure sensor's module can't be imported
+		sensorAdapterMgr.taskRegistry.registerTask( \
+			ConfigConst.PRESSURE_SENSOR_TYPE, 'programmingtheiot.cda.sim.MissingSensorSimTask')
+		
+		sensorTasks = sensorAdapterMgr.getSensorTasks()
+		
+		self.assertEqual( \
+			[sensorTask.getName() for sensorTask in sensorTasks], \
+			[ConfigConst.HUMIDITY_SENSOR_NAME, ConfigConst.TEMP_SENSOR_NAME])
+		
+		# the others are still polled
+		self.assertTrue(sensorAdapterMgr.startManager())
+		self.assertEqual(len(sensorAdapterMgr.jobIDs), 2)
+		self.assertTrue(sensorAdapterMgr.stopManager())
+		
+		sensorAdapterMgr.setTickMode(False)
+		sensorAdapterMgr.handleTelemetry()
+		
+		self.assertEqual( \
+			sorted(data.getName() for data in messageCounter.sensorMessages), \
+			[ConfigConst.HUMIDITY_SENSOR_NAME, ConfigConst.TEMP_SENSOR_NAME])
+
+class SensorMessageCounter(DefaultDataMessageListener):
+	"""
+	Counts the reported and suppressed sensor messages per sensor name.
+	
+	"""
+	
+	def __init__(self):
+		super(SensorMessageCounter, self).__init__()
+		
+		self.batchCounts = {}
+		self.sensorMessages = []
+		self.reportedCounts = {}
+		self.suppressedCounts = {}
+		self.tickCount = 0
+		
+	def handleMultiSensorMessage(self, data) -> bool:
+		self.tickCount += 1
+		return True
+		
+	def handleSensorMessageBatch(self, data) -> bool:
+		self.batchCounts[data.getName()] = self.batchCounts.get(data.getName(), 0) + data.getCount()
+		return True
+		
+	def handleSensorMessage(self, data) -> bool:
+		self.reportedCounts[data.getName()] = self.reportedCounts.get(data.getName(), 0) + 1
+		self.sensorMessages.append(data)
+		return True
+		
+	def handleSuppressedSensorMessage(self, data) -> bool:
+		self.suppressedCounts[data.getName()] = self.suppressedCounts.get(data.getName(), 0) + 1
+		self.sensorMessages.append(data)
+		return True
+
 if __name__ == "__main__":
 	unittest.main()
 	
\ No newline at end of file
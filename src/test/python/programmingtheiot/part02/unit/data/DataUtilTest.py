@@ -10,10 +10,16 @@
 import logging
 import unittest
 
+import programmingtheiot.common.ConfigConst as ConfigConst
+
 from programmingtheiot.data.DataUtil import DataUtil
 
 from programmingtheiot.data.ActuatorData import ActuatorData
+from programmingtheiot.data.ExtendedSystemPerformanceData import ExtendedSystemPerformanceData
+from programmingtheiot.data.MultiSensorData import MultiSensorData
+from programmingtheiot.data.ProcessHealthData import ProcessHealthData
 from programmingtheiot.data.SensorData import SensorData
+from programmingtheiot.data.SensorDataBatch import SensorDataBatch
 from programmingtheiot.data.SystemPerformanceData import SystemPerformanceData
 
 class DataUtilTest(unittest.TestCase):
@@ -138,6 +144,97 @@ class DataUtilTest(unittest.TestCase):
 		self.assertEqual(sdObj1.getTimeStamp(), sdObj2.getTimeStamp())
 		self.assertEqual(sdObj1Str, sdObj2Str)
 
+	#@unittest.skip("Ignore for now.")
+	def testSensorDataBatchConversions(self):
+		logging.info("\n\n----- [SensorDataBatch Conversions] -----")
+		
+		self.assertIsNone(self.dataUtil.jsonToSensorDataBatch(None))
+		self.assertIsNone(self.dataUtil.jsonToSensorDataBatch(""))
+		
+		batchObj1 = SensorDataBatch(name = self.sdName, timeStamps = [1600000000.0, 1600000060.0], values = [20.5, 21.5])
+		
+		batchObj1Str = self.dataUtil.sensorDataBatchToJson(batchObj1)
+		batchObj2    = self.dataUtil.jsonToSensorDataBatch(batchObj1Str)
+		batchObj2Str = self.dataUtil.sensorDataBatchToJson(batchObj2)
+		
+		logging.info("SensorDataBatch to JSON: " + str(batchObj1Str))
+		logging.info("JSON back to SensorDataBatch: " + str(batchObj2))
+		
+		self.assertEqual(self.sdName, batchObj2.getName())
+		self.assertEqual(batchObj1.getTimeStamp(), batchObj2.getTimeStamp())
+		self.assertEqual(batchObj2.getValues().tolist(), [20.5, 21.5])
+		self.assertEqual(batchObj2.getTimeStamps().tolist(), [1600000000.0, 1600000060.0])
+		self.assertEqual(batchObj1Str, batchObj2Str)
+
+	#@unittest.skip("Ignore for now.")
+	def testMultiSensorDataConversions(self):
+		logging.info("\n\n----- [MultiSensorData Conversions] -----")
+		
+		self.assertIsNone(self.dataUtil.jsonToMultiSensorData(None))
+		self.assertIsNone(self.dataUtil.jsonToMultiSensorData(""))
+		
+		msdObj1 = MultiSensorData(names = ["Humidity", "Temp"], typeIDs = [1010, 1013], values = [40.5, 21.5])
+		
+		msdObj1Str = self.dataUtil.multiSensorDataToJson(msdObj1)
+		msdObj2    = self.dataUtil.jsonToMultiSensorData(msdObj1Str)
+		msdObj2Str = self.dataUtil.multiSensorDataToJson(msdObj2)
+		
+		logging.info("MultiSensorData to JSON: " + str(msdObj1Str))
+		logging.info("JSON back to MultiSensorData: " + str(msdObj2))
+		
+		self.assertEqual(msdObj1.getTimeStamp(), msdObj2.getTimeStamp())
+		self.assertEqual(msdObj2.getNames(), ["Humidity", "Temp"])
+		self.assertEqual(msdObj2.getTypeIDs().tolist(), [1010, 1013])
+		self.assertEqual(msdObj2.getValues().tolist(), [40.5, 21.5])
+		self.assertEqual(msdObj1Str, msdObj2Str)
+
+	#@unittest.skip("Ignore for now.")
+	def testExtendedSystemPerformanceDataConversions(self):
+		logging.info("\n\n----- [ExtendedSystemPerformanceData Conversions] -----")
+		
+		self.assertIsNone(self.dataUtil.jsonToExtendedSystemPerformanceData(None))
+		self.assertIsNone(self.dataUtil.jsonToExtendedSystemPerformanceData(""))
+		
+		espdObj1 = ExtendedSystemPerformanceData()
+		espdObj1.setCpuUtilizationPerCore([10.0, 30.0])
+		espdObj1.setNetworkRates(1024.0, 512.0, 8.0, 4.0)
+		espdObj1.setLoadAverage([0.5, 0.25, 0.125])
+		
+		espdObj1Str = self.dataUtil.extendedSystemPerformanceDataToJson(espdObj1)
+		espdObj2    = self.dataUtil.jsonToExtendedSystemPerformanceData(espdObj1Str)
+		espdObj2Str = self.dataUtil.extendedSystemPerformanceDataToJson(espdObj2)
+		
+		logging.info("ExtendedSystemPerformanceData to JSON: " + str(espdObj1Str))
+		
+		self.assertEqual(espdObj1.getTimeStamp(), espdObj2.getTimeStamp())
+		self.assertEqual(espdObj2.getCpuUtilizationPerCore(), [10.0, 30.0])
+		self.assertEqual(espdObj2.getNetworkBytesRecvRate(), 1024.0)
+		self.assertEqual(espdObj2.getLoadAverage(), [0.5, 0.25, 0.125])
+		self.assertEqual(espdObj1Str, espdObj2Str)
+
+	def testProcessHealthDataConversions(self):
+		logging.info("\n\n----- [ProcessHealthData Conversions] -----")
+		
+		self.assertIsNone(self.dataUtil.jsonToProcessHealthData(None))
+		self.assertIsNone(self.dataUtil.jsonToProcessHealthData(""))
+		
+		phdObj1 = ProcessHealthData()
+		phdObj1.setRssBytes(1048576)
+		phdObj1.setGcMetrics([100, 10, 1], 0.02, 0.01)
+		phdObj1.setQueueDepths({'HvacActuator': 2})
+		
+		phdObj1Str = self.dataUtil.processHealthDataToJson(phdObj1)
+		phdObj2    = self.dataUtil.jsonToProcessHealthData(phdObj1Str)
+		phdObj2Str = self.dataUtil.processHealthDataToJson(phdObj2)
+		
+		logging.info("ProcessHealthData to JSON: " + str(phdObj1Str))
+		
+		self.assertEqual(phdObj2.getTypeID(), ConfigConst.SYSTEM_MGMT_TYPE)
+		self.assertEqual(phdObj2.getRssBytes(), 1048576)
+		self.assertEqual(phdObj2.getGcCollections(), [100, 10, 1])
+		self.assertEqual(phdObj2.getQueueDepths(), {'HvacActuator': 2})
+		self.assertEqual(phdObj1Str, phdObj2Str)
+
 	#@unittest.skip("Ignore for now.")
 	def testSystemPerformanceConversionsFromJson(self):
 		logging.info("\n\n----- [SystemPerformanceData Conversions from JSON] -----")
@@ -0,0 +1,104 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import unittest
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.data.ExtendedSystemPerformanceData import ExtendedSystemPerformanceData
+from programmingtheiot.data.SystemPerformanceData import SystemPerformanceData
+
+class ExtendedSystemPerformanceDataTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	ExtendedSystemPerformanceData. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	DEFAULT_NAME = "ExtendedSystemPerformanceDataFooBar"
+	DEFAULT_CPU_UTIL_PER_CORE = [10.0, 30.0]
+	DEFAULT_LOAD_AVG = [0.5, 0.25, 0.125]
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing ExtendedSystemPerformanceData class...")
+		
+	def setUp(self):
+		pass
+
+	def tearDown(self):
+		pass
+	
+	def testDefaultValues(self):
+		espd = ExtendedSystemPerformanceData()
+		
+		self.assertEqual(espd.getName(), ConfigConst.SYSTEM_PERF_NAME)
+		self.assertEqual(espd.getTypeID(), ConfigConst.SYSTEM_PERF_TYPE)
+		
+		self.assertEqual(espd.getCpuUtilizationPerCore(), [])
+		self.assertEqual(espd.getDiskReadRate(), ConfigConst.DEFAULT_VAL)
+		self.assertEqual(espd.getNetworkBytesRecvRate(), ConfigConst.DEFAULT_VAL)
+		self.assertEqual(espd.getLoadAverage(), [])
+		self.assertEqual(espd.getSampleCount(), 1)
+		self.assertEqual(espd.getAggregates(), {})
+
+	def testFullUpdate(self):
+		espd = ExtendedSystemPerformanceData()
+		espd2 = self._createTestExtendedSystemPerformanceData()
+		
+		espd.updateData(espd2)
+		
+		self.assertEqual(espd.getName(), self.DEFAULT_NAME)
+		self.assertEqual(espd.getCpuUtilization(), 20.0)
+		self.assertEqual(espd.getCpuUtilizationPerCore(), self.DEFAULT_CPU_UTIL_PER_CORE)
+		self.assertEqual(espd.getCpuIoWait(), 5.0)
+		self.assertEqual(espd.getCpuSteal(), 2.5)
+		self.assertEqual(espd.getDiskReadRate(), 100.0)
+		self.assertEqual(espd.getDiskWriteRate(), 200.0)
+		self.assertEqual(espd.getNetworkPacketsSentRate(), 4.0)
+		self.assertEqual(espd.getLoadAverage(), self.DEFAULT_LOAD_AVG)
+		self.assertEqual(espd.getSampleCount(), 10)
+		self.assertEqual(espd.getAggregates(ConfigConst.CPU_UTIL_PROP)[ConfigConst.P95_PROP], 30.0)
+		self.assertEqual(espd.getAggregates(ConfigConst.MEM_UTIL_PROP), {})
+
+	def testUpdateFromSystemPerformanceData(self):
+		espd = self._createTestExtendedSystemPerformanceData()
+		
+		spd = SystemPerformanceData()
+		spd.setCpuUtilization(50.0)
+		
+		espd.updateData(spd)
+		
+		# only the base metrics are copied
+		self.assertEqual(espd.getCpuUtilization(), 50.0)
+		self.assertEqual(espd.getCpuUtilizationPerCore(), self.DEFAULT_CPU_UTIL_PER_CORE)
+	
+	def _createTestExtendedSystemPerformanceData(self):
+		espd = ExtendedSystemPerformanceData()
+		espd.setName(self.DEFAULT_NAME)
+		
+		espd.setCpuUtilization(20.0)
+		espd.setCpuUtilizationPerCore(self.DEFAULT_CPU_UTIL_PER_CORE)
+		espd.setCpuIoWait(5.0)
+		espd.setCpuSteal(2.5)
+		espd.setDiskIoRates(100.0, 200.0)
+		espd.setNetworkRates(1.0, 2.0, 3.0, 4.0)
+		espd.setLoadAverage(self.DEFAULT_LOAD_AVG)
+		espd.setAggregates(10, {ConfigConst.CPU_UTIL_PROP: {ConfigConst.MEAN_PROP: 20.0, ConfigConst.P95_PROP: 30.0}})
+		
+		logging.info("Extended system perf data as string: " + str(espd))
+		
+		return espd
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,93 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import unittest
+
+import numpy as calcLib
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.data.MultiSensorData import MultiSensorData
+
+class MultiSensorDataTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	MultiSensorData. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	DEFAULT_LOCATION = "MultiSensorDataFooBar"
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing MultiSensorData class...")
+		
+	def setUp(self):
+		pass
+
+	def tearDown(self):
+		pass
+	
+	def testDefaultValues(self):
+		msd = MultiSensorData()
+		
+		self.assertEqual(msd.getName(), ConfigConst.MULTI_SENSOR_NAME)
+		self.assertEqual(msd.getTypeID(), ConfigConst.ENV_DEVICE_TYPE)
+		self.assertEqual(msd.getCount(), 0)
+		self.assertIsNone(msd.getSensorData())
+		
+		logging.info("Multi sensor data as string: " + str(msd))
+
+	def testGetSensorData(self):
+		msd = self._createTestMultiSensorData()
+		
+		self.assertEqual(msd.getCount(), 2)
+		self.assertEqual(msd.getValue(ConfigConst.TEMP_SENSOR_NAME), 21.5)
+		self.assertIsNone(msd.getValue(ConfigConst.PRESSURE_SENSOR_NAME))
+		
+		sd = msd.getSensorData(1)
+		
+		self.assertEqual(sd.getName(), ConfigConst.TEMP_SENSOR_NAME)
+		self.assertEqual(sd.getTypeID(), ConfigConst.TEMP_SENSOR_TYPE)
+		self.assertEqual(sd.getLocationID(), self.DEFAULT_LOCATION)
+		self.assertEqual(sd.getTimeStamp(), msd.getTimeStamp())
+		self.assertEqual(sd.getValue(), 21.5)
+
+	def testMismatchedEntries(self):
+		with self.assertRaises(ValueError):
+			MultiSensorData(names = [ConfigConst.TEMP_SENSOR_NAME], typeIDs = [ConfigConst.TEMP_SENSOR_TYPE], values = [1.0, 2.0])
+
+	def testFullUpdate(self):
+		msd = MultiSensorData()
+		msd2 = self._createTestMultiSensorData()
+		
+		msd.updateData(msd2)
+		
+		self.assertEqual(msd.getLocationID(), self.DEFAULT_LOCATION)
+		self.assertEqual(msd.getNames(), msd2.getNames())
+		self.assertTrue(calcLib.array_equal(msd.getValues(), msd2.getValues()))
+		self.assertFalse(calcLib.shares_memory(msd.getValues(), msd2.getValues()))
+	
+	def _createTestMultiSensorData(self):
+		msd = MultiSensorData( \
+			names = [ConfigConst.HUMIDITY_SENSOR_NAME, ConfigConst.TEMP_SENSOR_NAME], \
+			typeIDs = [ConfigConst.HUMIDITY_SENSOR_TYPE, ConfigConst.TEMP_SENSOR_TYPE], \
+			values = [40.5, 21.5])
+		msd.setLocationID(self.DEFAULT_LOCATION)
+		
+		logging.info("Multi sensor data as string: " + str(msd))
+		
+		return msd
+
+if __name__ == "__main__":
+	unittest.main()
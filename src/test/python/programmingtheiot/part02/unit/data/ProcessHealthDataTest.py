@@ -0,0 +1,99 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import unittest
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.data.ProcessHealthData import ProcessHealthData
+from programmingtheiot.data.SystemPerformanceData import SystemPerformanceData
+
+class ProcessHealthDataTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	ProcessHealthData. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	DEFAULT_NAME = "ProcessHealthDataFooBar"
+	DEFAULT_GC_COLLECTIONS = [100, 10, 1]
+	DEFAULT_QUEUE_DEPTHS = {'HvacActuator': 2}
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing ProcessHealthData class...")
+		
+	def setUp(self):
+		pass
+
+	def tearDown(self):
+		pass
+	
+	def testDefaultValues(self):
+		phd = ProcessHealthData()
+		
+		self.assertEqual(phd.getName(), ConfigConst.PROCESS_HEALTH_NAME)
+		self.assertEqual(phd.getTypeID(), ConfigConst.SYSTEM_MGMT_TYPE)
+		
+		self.assertEqual(phd.getRssBytes(), 0)
+		self.assertEqual(phd.getThreadCount(), 0)
+		self.assertEqual(phd.getGcCollections(), [])
+		self.assertEqual(phd.getQueueDepths(), {})
+
+	def testFullUpdate(self):
+		phd = ProcessHealthData()
+		phd2 = self._createTestProcessHealthData()
+		
+		phd.updateData(phd2)
+		
+		self.assertEqual(phd.getName(), self.DEFAULT_NAME)
+		self.assertEqual(phd.getCpuUtilization(), 5.0)
+		self.assertEqual(phd.getRssBytes(), 1048576)
+		self.assertEqual(phd.getCpuTime(), 12.5)
+		self.assertEqual(phd.getThreadCount(), 8)
+		self.assertEqual(phd.getOpenFdCount(), 16)
+		self.assertEqual(phd.getGcCollections(), self.DEFAULT_GC_COLLECTIONS)
+		self.assertEqual(phd.getGcPauseTotal(), 0.02)
+		self.assertEqual(phd.getGcPauseMax(), 0.01)
+		self.assertEqual(phd.getQueueDepths(), self.DEFAULT_QUEUE_DEPTHS)
+
+	def testUpdateFromSystemPerformanceData(self):
+		phd = self._createTestProcessHealthData()
+		
+		spd = SystemPerformanceData()
+		spd.setCpuUtilization(50.0)
+		
+		phd.updateData(spd)
+		
+		# only the base metrics are copied
+		self.assertEqual(phd.getCpuUtilization(), 50.0)
+		self.assertEqual(phd.getRssBytes(), 1048576)
+	
+	def _createTestProcessHealthData(self):
+		phd = ProcessHealthData()
+		phd.setName(self.DEFAULT_NAME)
+		
+		phd.setCpuUtilization(5.0)
+		phd.setRssBytes(1048576)
+		phd.setCpuTime(12.5)
+		phd.setThreadCount(8)
+		phd.setOpenFdCount(16)
+		phd.setGcMetrics(self.DEFAULT_GC_COLLECTIONS, 0.02, 0.01)
+		phd.setQueueDepths(self.DEFAULT_QUEUE_DEPTHS)
+		
+		logging.info("Process health data as string: " + str(phd))
+		
+		return phd
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,89 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import unittest
+
+import numpy as calcLib
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.data.SensorDataBatch import SensorDataBatch
+
+class SensorDataBatchTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	SensorDataBatch. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	DEFAULT_NAME = "SensorDataBatchFooBar"
+	START_TIME = 1600000000.0
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing SensorDataBatch class...")
+		
+	def setUp(self):
+		pass
+
+	def tearDown(self):
+		pass
+	
+	def testDefaultValues(self):
+		batch = SensorDataBatch()
+		
+		self.assertEqual(batch.getName(), ConfigConst.NOT_SET)
+		self.assertEqual(batch.getCount(), 0)
+		self.assertIsNone(batch.getSensorData())
+		
+		logging.info("Sensor data batch as string: " + str(batch))
+
+	def testGetSensorData(self):
+		batch = self._createTestSensorDataBatch()
+		
+		self.assertEqual(batch.getCount(), 3)
+		
+		sd = batch.getSensorData()
+		
+		self.assertEqual(sd.getName(), self.DEFAULT_NAME)
+		self.assertEqual(sd.getTypeID(), ConfigConst.TEMP_SENSOR_TYPE)
+		self.assertEqual(sd.getValue(), 22.0)
+		self.assertEqual(sd.getTimeStamp(), '2020-09-13T12:28:40+00:00')
+		
+		self.assertEqual(batch.getSensorData(0).getValue(), 20.0)
+
+	def testMismatchedEntries(self):
+		with self.assertRaises(ValueError):
+			SensorDataBatch(timeStamps = [self.START_TIME], values = [1.0, 2.0])
+
+	def testFullUpdate(self):
+		batch = SensorDataBatch()
+		batch2 = self._createTestSensorDataBatch()
+		
+		batch.updateData(batch2)
+		
+		self.assertEqual(batch.getName(), self.DEFAULT_NAME)
+		self.assertTrue(calcLib.array_equal(batch.getValues(), batch2.getValues()))
+		self.assertFalse(calcLib.shares_memory(batch.getValues(), batch2.getValues()))
+	
+	def _createTestSensorDataBatch(self):
+		batch = SensorDataBatch( \
+			typeID = ConfigConst.TEMP_SENSOR_TYPE, name = self.DEFAULT_NAME, \
+			timeStamps = self.START_TIME + calcLib.arange(3) * 60.0, values = [20.0, 21.0, 22.0])
+		
+		logging.info("Sensor data batch as string: " + str(batch))
+		
+		return batch
+
+if __name__ == "__main__":
+	unittest.main()
@@ -79,13 +79,13 @@ class HumidifierActuatorSimTaskTest(unittest.TestCase):
 		self.assertEqual(adr.getValue(), self.DEFAULT_VAL_A)
 		logging.info("ActuatorData: " + str(adr))
 		
-		# same command ON with same value - should fail
+		# same command ON with same value - should be suppressed
 		ad.setCommand(ConfigConst.COMMAND_ON)
 		ad.setValue(self.DEFAULT_VAL_A)
 		
 		adr = self.hSimTask.updateActuator(ad)
 		
-		self.assertIsNone(adr)
+		self.assertEqual(adr.getStatusCode(), ConfigConst.ACTUATOR_NO_OP_STATUS)
 		logging.info("ActuatorData: " + str(adr))
 		
 		# new command OFF with same value - should succeed
@@ -135,13 +135,13 @@ class HumidifierActuatorSimTaskTest(unittest.TestCase):
 		self.assertEqual(adr.getValue(), self.DEFAULT_VAL_A)
 		logging.info("ActuatorData: " + str(adr))
 		
-		# same command OFF with same value - should fail
+		# same command OFF with same value - should be suppressed
 		ad.setCommand(ConfigConst.COMMAND_OFF)
 		ad.setValue(self.DEFAULT_VAL_A)
 		
 		adr = self.hSimTask.updateActuator(ad)
 		
-		self.assertIsNone(adr)
+		self.assertEqual(adr.getStatusCode(), ConfigConst.ACTUATOR_NO_OP_STATUS)
 		logging.info("ActuatorData: " + str(adr))
 		
 if __name__ == "__main__":
@@ -79,13 +79,13 @@ class HvacActuatorSimTaskTest(unittest.TestCase):
 		self.assertEqual(adr.getValue(), self.DEFAULT_VAL_A)
 		logging.info("ActuatorData: " + str(adr))
 		
-		# same command ON with same value - should fail
+		# same command ON with same value - should be suppressed
 		ad.setCommand(ConfigConst.COMMAND_ON)
 		ad.setValue(self.DEFAULT_VAL_A)
 		
 		adr = self.hSimTask.updateActuator(ad)
 		
-		self.assertIsNone(adr)
+		self.assertEqual(adr.getStatusCode(), ConfigConst.ACTUATOR_NO_OP_STATUS)
 		logging.info("ActuatorData: " + str(adr))
 		
 		# new command OFF with same value - should succeed
@@ -135,15 +135,76 @@ class HvacActuatorSimTaskTest(unittest.TestCase):
 		self.assertEqual(adr.getValue(), self.DEFAULT_VAL_A)
 		logging.info("ActuatorData: " + str(adr))
 		
-		# same command OFF with same value - should fail
+		# same command OFF with same value - should be suppressed
 		ad.setCommand(ConfigConst.COMMAND_OFF)
 		ad.setValue(self.DEFAULT_VAL_A)
 		
 		adr = self.hSimTask.updateActuator(ad)
 		
-		self.assertIsNone(adr)
+		self.assertEqual(adr.getStatusCode(), ConfigConst.ACTUATOR_NO_OP_STATUS)
 		logging.info("ActuatorData: " + str(adr))
 		
+	def testCoalesceCommands(self):
+		hSimTask = HvacActuatorSimTask(debounceSecs = 0.0, minIntervalSecs = 0.0)
+		
+		ad = ActuatorData(typeID = ConfigConst.HVAC_ACTUATOR_TYPE)
+		ad.setCommand(ConfigConst.COMMAND_ON)
+		ad.setValue(self.DEFAULT_VAL_A)
+		
+		self.assertEqual(hSimTask.updateActuator(ad).getStatusCode(), ConfigConst.DEFAULT_STATUS)
+		
+		# repeating the current state is a no-op
+		adr = hSimTask.updateActuator(ad)
+		
+		self.assertEqual(adr.getStatusCode(), ConfigConst.ACTUATOR_NO_OP_STATUS)
+		self.assertFalse(adr.hasErrorFlag())
+		self.assertTrue(adr.isResponseFlagEnabled())
+		
+		# within the debounce window, a burst of ON / OFF commands is suppressed...
+		hSimTask.debounceSecs = 60.0
+		
+		for command, value in ((ConfigConst.COMMAND_OFF, self.DEFAULT_VAL_A), (ConfigConst.COMMAND_ON, self.DEFAULT_VAL_B), (ConfigConst.COMMAND_OFF, self.DEFAULT_VAL_B)):
+			ad.setCommand(command)
+			ad.setValue(value)
+			
+			self.assertEqual(hSimTask.updateActuator(ad).getStatusCode(), ConfigConst.ACTUATOR_DEBOUNCED_STATUS)
+		
+		self.assertEqual(hSimTask.getSuppressedCommandCount(), 4)
+		self.assertEqual(hSimTask.getLatestActuatorResponse().getCommand(), ConfigConst.COMMAND_ON)
+		self.assertIsNone(hSimTask.applyPendingCommand())
+		self.assertGreater(hSimTask.getPendingCommandDelay(), 0.0)
+		
+		# ... and the last one is applied once the window has passed
+		hSimTask.lastReceivedTime -= 60.0
+		
+		self.assertEqual(hSimTask.getPendingCommandDelay(), 0.0)
+		self.assertEqual(hSimTask.applyPendingCommand().getCommand(), ConfigConst.COMMAND_OFF)
+		self.assertIsNone(hSimTask.getPendingCommandDelay())
+		
+	def testRateLimitCommands(self):
+		hSimTask = HvacActuatorSimTask(debounceSecs = 0.0, minIntervalSecs = 60.0)
+		
+		ad = ActuatorData(typeID = ConfigConst.HVAC_ACTUATOR_TYPE)
+		ad.setCommand(ConfigConst.COMMAND_ON)
+		ad.setValue(self.DEFAULT_VAL_A)
+		
+		self.assertEqual(hSimTask.updateActuator(ad).getStatusCode(), ConfigConst.DEFAULT_STATUS)
+		
+		ad.setCommand(ConfigConst.COMMAND_OFF)
+		
+		self.assertEqual(hSimTask.updateActuator(ad).getStatusCode(), ConfigConst.ACTUATOR_RATE_LIMITED_STATUS)
+		
+		# a command that restores the current state cancels the pending one
+		ad.setCommand(ConfigConst.COMMAND_ON)
+		
+		self.assertEqual(hSimTask.updateActuator(ad).getStatusCode(), ConfigConst.ACTUATOR_NO_OP_STATUS)
+		self.assertIsNone(hSimTask.getPendingCommandDelay())
+		
+		hSimTask.lastAppliedTime -= 60.0
+		ad.setCommand(ConfigConst.COMMAND_OFF)
+		
+		self.assertEqual(hSimTask.updateActuator(ad).getStatusCode(), ConfigConst.DEFAULT_STATUS)
+
 if __name__ == "__main__":
 	unittest.main()
 	
\ No newline at end of file
@@ -0,0 +1,104 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from concurrent.futures import ThreadPoolExecutor
+
+from programmingtheiot.cda.sim.SensorDataCache import SensorDataCache
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+
+class SensorDataCacheTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	SensorDataCache. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing SensorDataCache class...")
+	
+	def setUp(self):
+		self.cachePath = tempfile.mkdtemp(prefix = 'sim-cache-')
+		self.dataCache = SensorDataCache(cachePath = self.cachePath, maxCacheSizeMB = 1)
+	
+	def tearDown(self):
+		shutil.rmtree(self.cachePath, ignore_errors = True)
+	
+	def testCachedSensorDataSet(self):
+		dataSet = self.dataCache.generateDailySensorDataSet( \
+			dataGenerator = SensorDataGenerator(seed = 42), minValue = 15.0, maxValue = 25.0, startHour = 0, endHour = 24, streamID = 1)
+		
+		self.assertGreater(self.dataCache.getCacheSize(), 0)
+		
+		cachedDataSet = self.dataCache.generateDailySensorDataSet( \
+			dataGenerator = SensorDataGenerator(seed = 42), minValue = 15.0, maxValue = 25.0, startHour = 0, endHour = 24, streamID = 1)
+		
+		# the cached copy is memory-mapped, and identical to the generated one
+		self.assertIsInstance(cachedDataSet.getDataEntries().base, numpy.memmap)
+		self.assertTrue(numpy.array_equal(dataSet.getTimeEntries(), cachedDataSet.getTimeEntries()))
+		self.assertTrue(numpy.array_equal(dataSet.getDataEntries(), cachedDataSet.getDataEntries()))
+		
+		# a different seed is a different cache entry
+		otherDataSet = self.dataCache.generateDailySensorDataSet( \
+			dataGenerator = SensorDataGenerator(seed = 7), minValue = 15.0, maxValue = 25.0, startHour = 0, endHour = 24, streamID = 1)
+		
+		self.assertFalse(numpy.array_equal(dataSet.getDataEntries(), otherDataSet.getDataEntries()))
+	
+	def testConcurrentCacheMisses(self):
+		def generateDataSet(_):
+			return self.dataCache.generateDailySensorDataSet( \
+				dataGenerator = SensorDataGenerator(seed = 42), minValue = 15.0, maxValue = 25.0, startHour = 0, endHour = 24, streamID = 1)
+		
+		# threads that miss the same entry each write their own temp file, so the cache file is never torn
+		with ThreadPoolExecutor(max_workers = 8) as executor:
+			dataSets = list(executor.map(generateDataSet, range(8)))
+		
+		self.assertEqual(os.listdir(self.cachePath), [name for name in os.listdir(self.cachePath) if name.endswith(SensorDataCache.CACHE_FILE_EXT)])
+		self.assertEqual(len(os.listdir(self.cachePath)), 1)
+		
+		cachedDataSet = generateDataSet(0)
+		
+		self.assertIsInstance(cachedDataSet.getDataEntries().base, numpy.memmap)
+		
+		for dataSet in dataSets:
+			self.assertTrue(numpy.array_equal(dataSet.getDataEntries(), cachedDataSet.getDataEntries()))
+	
+	def testUnseededSensorDataSetNotCached(self):
+		self.dataCache.generateDailySensorDataSet(dataGenerator = SensorDataGenerator(), startHour = 0, endHour = 24)
+		
+		self.assertEqual(self.dataCache.getCacheSize(), 0)
+	
+	def testCacheEviction(self):
+		dataGenerator = SensorDataGenerator()
+		
+		# each per-second hour is 3600 x 2 x 8 bytes (~56 KB), so the 1 MB cap holds ~18 of them
+		for hour in range(24):
+			self.dataCache.generateDailySensorDataSet( \
+				dataGenerator = dataGenerator, noiseLevel = SensorDataGenerator.NO_NOISE, startHour = hour, endHour = hour + 1, useSeconds = True)
+		
+		self.assertLessEqual(self.dataCache.getCacheSize(), 1024 * 1024)
+		self.assertGreater(self.dataCache.getCacheSize(), 0)
+		
+		self.dataCache.clearCache()
+		
+		self.assertEqual(self.dataCache.getCacheSize(), 0)
+
+if __name__ == "__main__":
+	unittest.main()
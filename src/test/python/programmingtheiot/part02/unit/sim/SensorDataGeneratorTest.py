@@ -0,0 +1,277 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import os
+import tempfile
+import unittest
+
+import numpy
+
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataChannel
+from programmingtheiot.cda.sim.SensorDataGenerator import MultiSensorDataSet
+from programmingtheiot.cda.sim.SensorDataGenerator import ColumnarSensorDataSet
+
+class SensorDataGeneratorTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	SensorDataGenerator. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing SensorDataGenerator class...")
+		self.dataGenerator = SensorDataGenerator()
+	
+	def setUp(self):
+		pass
+	
+	def tearDown(self):
+		pass
+	
+	def testGenerateMultiChannelSensorDataSet(self):
+		channels = [ \
+			SensorDataChannel(curveType = SensorDataGenerator.DEFAULT_TEMP_CURVE, noiseLevel = SensorDataGenerator.NO_NOISE, minValue = 15.0, maxValue = 25.0, name = "Temp"), \
+			SensorDataChannel(curveType = SensorDataGenerator.DEFAULT_HUMIDITY_CURVE, noiseLevel = SensorDataGenerator.NO_NOISE, minValue = 35.0, maxValue = 45.0, name = "Humidity"), \
+			SensorDataChannel(curveType = SensorDataGenerator.DEFAULT_PRESSURE_CURVE, noiseLevel = SensorDataGenerator.NO_NOISE, minValue = 990.0, maxValue = 1010.0, name = "Pressure")]
+		
+		multiDataSet = self.dataGenerator.generateMultiChannelSensorDataSet(channels = channels, startHour = 0, endHour = 24)
+		dataEntries = multiDataSet.getDataEntries()
+		
+		self.assertEqual(dataEntries.shape, (3, 24 * 60))
+		self.assertEqual(multiDataSet.getChannelCount(), 3)
+		self.assertEqual(multiDataSet.getChannelNames(), ["Temp", "Humidity", "Pressure"])
+		
+		for index, channel in enumerate(channels):
+			self.assertAlmostEqual(dataEntries[index].min(), channel.getMinValue())
+			self.assertAlmostEqual(dataEntries[index].max(), channel.getMaxValue())
+			
+			# a single channel must match the single curve generator
+			dataSet = self.dataGenerator.generateDailySensorDataSet( \
+				curveType = channel.getCurveType(), noiseLevel = channel.getNoiseLevel(), \
+				minValue = channel.getMinValue(), maxValue = channel.getMaxValue(), startHour = 0, endHour = 24)
+			
+			self.assertTrue(numpy.allclose(dataEntries[index], dataSet.getDataEntries()))
+	
+	def testGetChannelDataSet(self):
+		channels = [SensorDataChannel(minValue = 10.0, maxValue = 20.0), SensorDataChannel(minValue = 30.0, maxValue = 40.0)]
+		
+		multiDataSet = self.dataGenerator.generateMultiChannelSensorDataSet(channels = channels, startHour = 0, endHour = 1, useSeconds = True)
+		channelDataSet = multiDataSet.getChannelDataSet(1)
+		
+		self.assertEqual(channelDataSet.getDataEntryCount(), 3600)
+		self.assertEqual(channelDataSet.getDataEntry(10), multiDataSet.getDataEntry(index = 10, channelIndex = 1))
+		
+		# the channel data set is a view, not a copy
+		self.assertTrue(numpy.shares_memory(channelDataSet.getDataEntries(), multiDataSet.getDataEntries()))
+		self.assertTrue(numpy.shares_memory(channelDataSet.getTimeEntries(), multiDataSet.getTimeEntries()))
+		
+	def testInvalidStartHour(self):
+		# an out of range start hour falls back to MIN_HOURS, as for the other generators
+		dataSet = self.dataGenerator.generateDailySensorDataSet( \
+			noiseLevel = SensorDataGenerator.NO_NOISE, startHour = SensorDataGenerator.MAX_HOURS + 1, endHour = 1, useSeconds = True)
+		
+		self.assertEqual(dataSet.getDataEntryCount(), 3600)
+		
+		multiDataSet = self.dataGenerator.generateMultiChannelSensorDataSet( \
+			channels = [SensorDataChannel()], startHour = SensorDataGenerator.MAX_HOURS + 1, endHour = 1, useSeconds = True)
+		
+		self.assertEqual(multiDataSet.getDataEntryCount(), dataSet.getDataEntryCount())
+		
+	def testGenerateSensorDataChunks(self):
+		dataSet = self.dataGenerator.generateDailySensorDataSet( \
+			curveType = SensorDataGenerator.BELL_CURVE, noiseLevel = SensorDataGenerator.NO_NOISE, \
+			minValue = 35.0, maxValue = 45.0, startHour = 0, endHour = 24, useSeconds = True)
+		
+		chunks = list(self.dataGenerator.generateSensorDataChunks( \
+			curveType = SensorDataGenerator.BELL_CURVE, noiseLevel = SensorDataGenerator.NO_NOISE, \
+			minValue = 35.0, maxValue = 45.0, startHour = 0, endHour = 24, useSeconds = True, chunkSize = 5000))
+		
+		self.assertEqual(len(chunks), 18)
+		self.assertEqual(chunks[0][0].size, 5000)
+		self.assertEqual(chunks[-1][0].size, (24 * 3600) % 5000)
+		
+		timeEntries = numpy.concatenate([chunk[0] for chunk in chunks])
+		dataEntries = numpy.concatenate([chunk[1] for chunk in chunks])
+		
+		# the chunked curve must match the fully materialized curve
+		self.assertTrue(numpy.array_equal(timeEntries, dataSet.getTimeEntries()))
+		self.assertTrue(numpy.allclose(dataEntries, dataSet.getDataEntries(), rtol = 0.0, atol = 1e-9))
+	
+	def testGenerateContinuousSensorDataChunks(self):
+		chunkStream = self.dataGenerator.generateSensorDataChunks( \
+			noiseLevel = SensorDataGenerator.NO_NOISE, minValue = 10.0, maxValue = 20.0, \
+			startHour = 0, endHour = 24, chunkSize = 1000, continuous = True)
+		
+		# 10 chunks of 1000 minutes is well past the 24 hour window
+		for count in range(10):
+			timeEntries, dataEntries = next(chunkStream)
+			
+			self.assertEqual(timeEntries.size, 1000)
+			self.assertGreaterEqual(dataEntries.min(), 10.0 - 1e-9)
+			self.assertLessEqual(dataEntries.max(), 20.0 + 1e-9)
+		
+		self.assertGreater(timeEntries[-1], 24.0 * 6)
+		
+	def testGenerateFleetSensorDataSet(self):
+		fleetDataSet = self.dataGenerator.generateFleetSensorDataSet( \
+			deviceCount = 200, noiseLevel = SensorDataGenerator.NO_NOISE, minValue = 15.0, maxValue = 25.0, \
+			startHour = 0, endHour = 24, phaseJitter = 2.0, rangeJitter = 0.1)
+		
+		dataEntries = fleetDataSet.getDataEntries()
+		
+		self.assertEqual(dataEntries.shape, (200, 24 * 60))
+		
+		# each device has its own (jittered) floor and ceiling
+		self.assertGreaterEqual(dataEntries.min(), 15.0 - 1.0 - 1e-9)
+		self.assertLessEqual(dataEntries.max(), 25.0 + 1.0 + 1e-9)
+		self.assertGreater(numpy.unique(dataEntries.min(axis = 1)).size, 1)
+		
+		# ... and its own phase offset
+		self.assertGreater(numpy.unique(dataEntries.argmax(axis = 1)).size, 1)
+	
+	def testFleetSensorDataSetInSharedMemory(self):
+		fleetDataSet = self.dataGenerator.generateFleetSensorDataSet( \
+			deviceCount = 10, minValue = 15.0, maxValue = 25.0, startHour = 0, endHour = 24, useSharedMemory = True)
+		
+		sharedName = fleetDataSet.getSharedMemoryName()
+		self.assertIsNotNone(sharedName)
+		
+		attachedDataSet = MultiSensorDataSet.attachSharedMemory( \
+			name = sharedName, rowCount = 10, dataEntryCount = fleetDataSet.getDataEntryCount())
+		
+		self.assertTrue(numpy.array_equal(attachedDataSet.getTimeEntries(), fleetDataSet.getTimeEntries()))
+		self.assertTrue(numpy.array_equal(attachedDataSet.getDataEntries(), fleetDataSet.getDataEntries()))
+		
+		attachedDataSet.closeSharedMemory()
+		fleetDataSet.closeSharedMemory(unlink = True)
+	
+	def testSeededSensorDataSet(self):
+		dataSet = SensorDataGenerator(seed = 42).generateDailySensorDataSet(startHour = 0, endHour = 24, streamID = 1)
+		sameDataSet = SensorDataGenerator(seed = 42).generateDailySensorDataSet(startHour = 0, endHour = 24, streamID = 1)
+		otherDataSet = SensorDataGenerator(seed = 42).generateDailySensorDataSet(startHour = 0, endHour = 24, streamID = 2)
+		
+		self.assertTrue(numpy.array_equal(dataSet.getDataEntries(), sameDataSet.getDataEntries()))
+		self.assertFalse(numpy.array_equal(dataSet.getDataEntries(), otherDataSet.getDataEntries()))
+		
+		# the chunked generator draws the same noise stream
+		chunks = SensorDataGenerator(seed = 42).generateSensorDataChunks(startHour = 0, endHour = 24, chunkSize = 100, streamID = 1)
+		chunkedEntries = numpy.concatenate([dataEntries for timeEntries, dataEntries in chunks])
+		
+		self.assertTrue(numpy.allclose(chunkedEntries, dataSet.getDataEntries(), rtol = 0.0, atol = 1e-9))
+	
+	def testFleetSensorDataSetWithWorkers(self):
+		dataGenerator = SensorDataGenerator(seed = 42)
+		
+		fleetDataSet = dataGenerator.generateFleetSensorDataSet( \
+			deviceCount = 9, minValue = 15.0, maxValue = 25.0, startHour = 0, endHour = 24, streamID = 1)
+		workerDataSet = dataGenerator.generateFleetSensorDataSet( \
+			deviceCount = 9, minValue = 15.0, maxValue = 25.0, startHour = 0, endHour = 24, streamID = 1, workerCount = 2)
+		
+		# partitioning the devices across processes must not change the data
+		self.assertIsNone(workerDataSet.getSharedMemoryName())
+		self.assertTrue(numpy.array_equal(fleetDataSet.getDataEntries(), workerDataSet.getDataEntries()))
+	
+	def testColumnarSensorDataSet(self):
+		dataSet = SensorDataGenerator(seed = 42).generateDailySensorDataSet(startHour = 0, endHour = 24, streamID = 1)
+		columnarDataSet = ColumnarSensorDataSet.fromSensorDataSet(dataSet = dataSet)
+		
+		self.assertEqual(columnarDataSet.getTimeOffsets().dtype, numpy.int64)
+		self.assertEqual(columnarDataSet.getDataEntries().dtype, numpy.float32)
+		self.assertEqual(columnarDataSet.getDataEntryCount(), dataSet.getDataEntryCount())
+		self.assertTrue(numpy.allclose(columnarDataSet.getTimeEntries(), dataSet.getTimeEntries()))
+		self.assertTrue(numpy.allclose(columnarDataSet.getDataEntries(), dataSet.getDataEntries()))
+		
+		# slices are views
+		sliceDataSet = columnarDataSet.getSlice(60, 120)
+		
+		self.assertEqual(sliceDataSet.getDataEntryCount(), 60)
+		self.assertTrue(numpy.shares_memory(sliceDataSet.getDataEntries(), columnarDataSet.getDataEntries()))
+		self.assertAlmostEqual(sliceDataSet.getTimeEntry(0), dataSet.getTimeEntry(60), places = 6)
+		
+		with self.assertRaises(ValueError):
+			ColumnarSensorDataSet(timeEntries = numpy.zeros(3), dataEntries = numpy.zeros(4))
+	
+	def testMemoryMappedColumnarSensorDataSet(self):
+		dataSet = SensorDataGenerator(seed = 42).generateDailySensorDataSet(startHour = 0, endHour = 24, streamID = 1)
+		columnarDataSet = ColumnarSensorDataSet.fromSensorDataSet(dataSet = dataSet, dataType = numpy.float64)
+		
+		with tempfile.TemporaryDirectory() as dataPath:
+			fileName = os.path.join(dataPath, 'sensorData.sds')
+			columnarDataSet.save(fileName)
+			
+			loadedDataSet = ColumnarSensorDataSet.load(fileName)
+			
+			self.assertIsInstance(loadedDataSet.getDataEntries(), numpy.memmap)
+			self.assertEqual(loadedDataSet.getCurrentTime(), columnarDataSet.getCurrentTime())
+			self.assertTrue(numpy.array_equal(loadedDataSet.getTimeOffsets(), columnarDataSet.getTimeOffsets()))
+			self.assertTrue(numpy.array_equal(loadedDataSet.getDataEntries(), dataSet.getDataEntries()))
+			
+			del loadedDataSet
+	
+	def testSynthesizedCurveTypes(self):
+		dataGenerator = SensorDataGenerator(seed = 42)
+		
+		for curveType in SensorDataGenerator.SYNTHESIZED_CURVES:
+			dataSet = dataGenerator.generateDailySensorDataSet( \
+				curveType = curveType, noiseLevel = SensorDataGenerator.NO_NOISE, minValue = 15.0, maxValue = 25.0, startHour = 0, endHour = 168, streamID = 1)
+			
+			self.assertAlmostEqual(dataSet.getDataEntries().min(), 15.0)
+			self.assertAlmostEqual(dataSet.getDataEntries().max(), 25.0)
+		
+		pinkDataSet = dataGenerator.generateDailySensorDataSet( \
+			curveType = SensorDataGenerator.DRIFT_CURVE, noiseColor = SensorDataGenerator.PINK_NOISE, startHour = 0, endHour = 24, streamID = 1)
+		samePinkDataSet = SensorDataGenerator(seed = 42).generateDailySensorDataSet( \
+			curveType = SensorDataGenerator.DRIFT_CURVE, noiseColor = SensorDataGenerator.PINK_NOISE, startHour = 0, endHour = 24, streamID = 1)
+		
+		self.assertTrue(numpy.array_equal(pinkDataSet.getDataEntries(), samePinkDataSet.getDataEntries()))
+	
+	def testSynthesizedCurveChunks(self):
+		for curveType in SensorDataGenerator.SYNTHESIZED_CURVES:
+			dataSet = SensorDataGenerator(seed = 42).generateDailySensorDataSet( \
+				curveType = curveType, minValue = 15.0, maxValue = 25.0, startHour = 0, endHour = 168, streamID = 1)
+			chunks = SensorDataGenerator(seed = 42).generateSensorDataChunks( \
+				curveType = curveType, minValue = 15.0, maxValue = 25.0, startHour = 0, endHour = 168, chunkSize = 1000, streamID = 1)
+			
+			# the curve (and drift) is generated chunk by chunk, but still matches the full data set
+			chunkedEntries = numpy.concatenate([dataEntries for timeEntries, dataEntries in chunks])
+			
+			self.assertTrue(numpy.allclose(chunkedEntries, dataSet.getDataEntries(), rtol = 0.0, atol = 1e-9))
+		
+		# continuous chunks replay the curve
+		chunks = SensorDataGenerator(seed = 42).generateSensorDataChunks( \
+			curveType = SensorDataGenerator.DRIFT_CURVE, noiseLevel = SensorDataGenerator.NO_NOISE, \
+			startHour = 0, endHour = 1, chunkSize = 45, continuous = True, streamID = 1)
+		chunkedEntries = numpy.concatenate([next(chunks)[1] for _ in range(4)])
+		
+		self.assertTrue(numpy.allclose(chunkedEntries[0:60], chunkedEntries[60:120], rtol = 0.0, atol = 1e-9))
+	
+	def testColoredNoiseChunks(self):
+		dataSet = SensorDataGenerator(seed = 42).generateDailySensorDataSet( \
+			curveType = SensorDataGenerator.DAILY_WEEKLY_CURVE, noiseColor = SensorDataGenerator.BROWN_NOISE, \
+			noiseLevel = SensorDataGenerator.MAX_NOISE, startHour = 0, endHour = 168, streamID = 1)
+		chunks = SensorDataGenerator(seed = 42).generateSensorDataChunks( \
+			curveType = SensorDataGenerator.DAILY_WEEKLY_CURVE, noiseColor = SensorDataGenerator.BROWN_NOISE, \
+			noiseLevel = SensorDataGenerator.MAX_NOISE, startHour = 0, endHour = 168, chunkSize = 1000, streamID = 1)
+		
+		chunkedEntries = numpy.concatenate([dataEntries for timeEntries, dataEntries in chunks])
+		
+		# the colored noise is filtered chunk by chunk, so only its magnitude matches
+		self.assertEqual(chunkedEntries.size, dataSet.getDataEntryCount())
+		self.assertAlmostEqual(chunkedEntries.mean(), dataSet.getDataEntries().mean(), delta = 1.0)
+		self.assertAlmostEqual(chunkedEntries.std(), dataSet.getDataEntries().std(), delta = 1.0)
+
+if __name__ == "__main__":
+	unittest.main()
+
@@ -0,0 +1,85 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import os
+import tempfile
+import unittest
+
+import numpy
+
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataChannel
+from programmingtheiot.cda.sim.SensorDataPlotter import SensorDataPlotter
+
+class SensorDataPlotterTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	SensorDataPlotter. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing SensorDataPlotter class...")
+		
+		channels = [ \
+			SensorDataChannel(minValue = 15.0, maxValue = 25.0, name = "Temp"), \
+			SensorDataChannel(curveType = SensorDataGenerator.BELL_CURVE, minValue = 35.0, maxValue = 45.0, name = "Humidity")]
+		
+		self.dataSet = SensorDataGenerator(seed = 42).generateMultiChannelSensorDataSet( \
+			channels = channels, startHour = 0, endHour = 168, useSeconds = True, streamID = 1)
+	
+	def setUp(self):
+		pass
+	
+	def tearDown(self):
+		pass
+	
+	def testMinMaxDownsample(self):
+		timeEntries = self.dataSet.getTimeEntries()
+		dataEntries = self.dataSet.getDataEntries()[0]
+		
+		plotTimeEntries, plotDataEntries = SensorDataPlotter(maxPoints = 1000).downsample(timeEntries, dataEntries)
+		
+		# extremes and end points are always kept
+		self.assertLessEqual(plotDataEntries.size, 1000)
+		self.assertEqual(plotDataEntries.min(), dataEntries.min())
+		self.assertEqual(plotDataEntries.max(), dataEntries.max())
+		self.assertEqual(plotTimeEntries[0], timeEntries[0])
+		self.assertEqual(plotTimeEntries[-1], timeEntries[-1])
+		self.assertTrue(numpy.all(numpy.diff(plotTimeEntries) > 0))
+	
+	def testLttbDownsample(self):
+		timeEntries = self.dataSet.getTimeEntries()
+		dataEntries = self.dataSet.getDataEntries()[0]
+		
+		plotTimeEntries, plotDataEntries = SensorDataPlotter(maxPoints = 1000, downsampleMode = SensorDataPlotter.LTTB).downsample(timeEntries, dataEntries)
+		
+		self.assertEqual(plotDataEntries.size, 1000)
+		self.assertEqual(plotTimeEntries[0], timeEntries[0])
+		self.assertEqual(plotTimeEntries[-1], timeEntries[-1])
+		self.assertTrue(numpy.all(numpy.diff(plotTimeEntries) > 0))
+	
+	def testGenerateGraphFile(self):
+		dataPlotter = SensorDataPlotter()
+		
+		with tempfile.TemporaryDirectory() as chartPath:
+			for fileExt in ('.png', '.svg'):
+				fileName = dataPlotter.generateGraphFile( \
+					fileName = os.path.join(chartPath, 'chart' + fileExt), dataSet = self.dataSet, \
+					chartTitle = "Temp and Humidity", chartXLabel = "Hour", chartYLabel = "Value")
+				
+				self.assertGreater(os.path.getsize(fileName), 0)
+
+if __name__ == "__main__":
+	unittest.main()
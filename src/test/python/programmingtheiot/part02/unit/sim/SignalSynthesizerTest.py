@@ -0,0 +1,111 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import unittest
+
+import numpy
+
+from programmingtheiot.cda.sim.SignalSynthesizer import ColoredNoiseStream
+from programmingtheiot.cda.sim.SignalSynthesizer import SignalSynthesizer
+
+class SignalSynthesizerTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	SignalSynthesizer. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing SignalSynthesizer class...")
+	
+	def setUp(self):
+		pass
+	
+	def tearDown(self):
+		pass
+	
+	def testColoredNoiseSpectrum(self):
+		sampleCount = 2 ** 16
+		
+		for noiseColor in (SignalSynthesizer.WHITE_NOISE, SignalSynthesizer.PINK_NOISE, SignalSynthesizer.BROWN_NOISE):
+			noise = SignalSynthesizer.generateColoredNoise(sampleCount, noiseColor, numpy.random.default_rng(42))
+			
+			self.assertEqual(noise.size, sampleCount)
+			self.assertAlmostEqual(noise.std(), 1.0, places = 2)
+			
+			# the log-log slope of the power spectrum is -noiseColor
+			power = numpy.abs(numpy.fft.rfft(noise))[1:] ** 2
+			frequencies = numpy.fft.rfftfreq(sampleCount)[1:]
+			slope = numpy.polyfit(numpy.log(frequencies), numpy.log(power), 1)[0]
+			
+			self.assertAlmostEqual(slope, -noiseColor, delta = 0.1)
+	
+	def testGenerateCurve(self):
+		timeEntries = numpy.linspace(0, 24 * 7, 24 * 7 * 60)
+		
+		dailyCurve = SignalSynthesizer(dailyAmplitude = 1.0, peakHour = 15.0).generateCurve(timeEntries)
+		
+		self.assertAlmostEqual(timeEntries[dailyCurve[:24 * 60].argmax()], 15.0, places = 1)
+		
+		trendCurve = SignalSynthesizer(dailyAmplitude = 0.0, trendPerDay = 1.0).generateCurve(timeEntries)
+		
+		self.assertAlmostEqual(trendCurve[-1], 7.0)
+		
+		# the random-walk drift is reproducible for the same generator seed
+		driftSynthesizer = SignalSynthesizer(dailyAmplitude = 1.0, randomWalkAmplitude = 1.0)
+		
+		self.assertTrue(numpy.array_equal( \
+			driftSynthesizer.generateCurve(timeEntries, numpy.random.default_rng(7)), \
+			driftSynthesizer.generateCurve(timeEntries, numpy.random.default_rng(7))))
+	
+	def testCurveStream(self):
+		timeEntries = numpy.linspace(0, 24 * 7, 24 * 7 * 60)
+		synthesizer = SignalSynthesizer(dailyAmplitude = 1.0, weeklyAmplitude = 0.5, trendPerDay = 0.5, randomWalkAmplitude = 1.0)
+		
+		curveStream = synthesizer.createCurveStream( \
+			startTime = timeEntries[0], totalCount = timeEntries.size, randomGenerator = numpy.random.default_rng(7))
+		
+		chunkedCurve = numpy.concatenate([curveStream.generateChunk(chunk) for chunk in numpy.array_split(timeEntries, 7)])
+		
+		# the drift carries on from one chunk to the next
+		self.assertTrue(numpy.allclose( \
+			chunkedCurve, synthesizer.generateCurve(timeEntries, numpy.random.default_rng(7)), rtol = 0.0, atol = 1e-9))
+	
+	def testColoredNoiseStream(self):
+		sampleCount = 2 ** 16
+		frequencies = numpy.fft.rfftfreq(sampleCount)[1:]
+		
+		# the spectrum is flat below the lowest corner frequency, and flattens towards the Nyquist frequency
+		band = (frequencies > 2.0 ** -10) & (frequencies < 0.1)
+		
+		for noiseColor in (SignalSynthesizer.WHITE_NOISE, SignalSynthesizer.PINK_NOISE, SignalSynthesizer.BROWN_NOISE):
+			noiseStream = ColoredNoiseStream(noiseColor, numpy.random.default_rng(42))
+			noise = numpy.concatenate([noiseStream.generateChunk(chunkSize) for chunkSize in (1, 4095, 2 ** 12, 2 ** 13, 2 ** 14, 2 ** 15)])
+			
+			self.assertEqual(noise.size, sampleCount)
+			
+			# brown noise only spans ~16 corner periods here, so its sample variance varies a lot
+			self.assertAlmostEqual(noise.std(), 1.0, delta = 0.3)
+			
+			# the filter state carries over, so the chunk sizes don't matter
+			self.assertTrue(numpy.allclose( \
+				noise, ColoredNoiseStream(noiseColor, numpy.random.default_rng(42)).generateChunk(sampleCount), rtol = 0.0, atol = 1e-9))
+			
+			power = numpy.abs(numpy.fft.rfft(noise))[1:] ** 2
+			slope = numpy.polyfit(numpy.log(frequencies[band]), numpy.log(power[band]), 1)[0]
+			
+			self.assertAlmostEqual(slope, -noiseColor, delta = 0.1)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,78 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy
+
+from programmingtheiot.cda.sim.SimTestDataLoader import SimTestDataLoader
+
+class SimTestDataLoaderTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	SimTestDataLoader. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	SIM_TEST_DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), \
+		'../../../../../../../simTestData/PIOT_SimulatedTestData_IndoorTemperature.json')
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing SimTestDataLoader class...")
+		
+		with open(self.SIM_TEST_DATA_FILE) as fileRef:
+			self.sensorDataList = json.load(fileRef)['sensorDataList']
+	
+	def setUp(self):
+		# work on a copy, so the sidecar isn't written into the repo
+		self.dataPath = tempfile.mkdtemp(prefix = 'sim-test-data-')
+		self.dataFile = shutil.copy(self.SIM_TEST_DATA_FILE, self.dataPath)
+	
+	def tearDown(self):
+		shutil.rmtree(self.dataPath, ignore_errors = True)
+	
+	def testParseSensorDataFile(self):
+		# a small block size forces fields to straddle block boundaries
+		timeOffsets, dataValues, epochOffsetSeconds = SimTestDataLoader(blockSize = 1024).parseSensorDataFile(self.dataFile)
+		
+		self.assertTrue(numpy.array_equal(timeOffsets, [sensorData['timeOffsetSeconds'] for sensorData in self.sensorDataList]))
+		self.assertTrue(numpy.array_equal(dataValues, [sensorData['value'] for sensorData in self.sensorDataList]))
+		self.assertGreater(epochOffsetSeconds, 0.0)
+	
+	def testLoadSensorDataSetWithSidecar(self):
+		dataLoader = SimTestDataLoader()
+		
+		dataSet = dataLoader.loadSensorDataSet(self.dataFile, useCurrentTime = False)
+		sidecarFile = dataLoader.getSidecarFileName(self.dataFile)
+		
+		self.assertTrue(os.path.isfile(sidecarFile))
+		self.assertEqual(dataSet.getDataEntryCount(), len(self.sensorDataList))
+		self.assertAlmostEqual(dataSet.getTimeEntries()[-1], self.sensorDataList[-1]['timeOffsetSeconds'] / 3600.0)
+		
+		sidecarDataSet = dataLoader.loadSensorDataSet(self.dataFile, useCurrentTime = False)
+		
+		self.assertEqual(sidecarDataSet.getCurrentTime(), dataSet.getCurrentTime())
+		self.assertTrue(numpy.array_equal(sidecarDataSet.getDataEntries(), dataSet.getDataEntries()))
+		
+		# a changed source file invalidates the sidecar
+		os.utime(self.dataFile, ns = (0, 0))
+		
+		self.assertEqual(dataLoader._loadSidecar(self.dataFile), (None, None, None))
+
+if __name__ == "__main__":
+	unittest.main()
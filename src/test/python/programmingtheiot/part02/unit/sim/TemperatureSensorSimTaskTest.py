@@ -10,9 +10,15 @@
 import logging
 import unittest
 
+from unittest import mock
+
+import numpy as calcLib
+
 import programmingtheiot.common.ConfigConst as ConfigConst
 
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
 from programmingtheiot.cda.sim.TemperatureSensorSimTask import TemperatureSensorSimTask
+from programmingtheiot.data.SensorData import SensorData
 
 class TemperatureSensorSimTaskTest(unittest.TestCase):
 	"""
@@ -50,6 +56,167 @@ class TemperatureSensorSimTaskTest(unittest.TestCase):
 		self.assertGreater(val, 0.0)
 		logging.info("Temperature data: %f", val)
 
+	def testPooledTelemetry(self):
+		pooledTask = TemperatureSensorSimTask(poolSize = 2)
+		
+		self.assertEqual(pooledTask.getPoolSize(), 2)
+		
+		sd1 = pooledTask.generateTelemetry()
+		sd2 = pooledTask.generateTelemetry()
+		sd3 = pooledTask.generateTelemetry()
+		
+		# pooled instances are recycled round-robin
+		self.assertIsNot(sd1, sd2)
+		self.assertIs(sd1, sd3)
+		self.assertIs(pooledTask.getLatestTelemetry(copy = False), sd3)
+		
+	def testPooledTelemetryTimeStamp(self):
+		pooledTask = TemperatureSensorSimTask(poolSize = 2)
+		
+		with mock.patch.object(SensorData, 'updateTimeStamp', autospec = True, side_effect = SensorData.updateTimeStamp) as updateTimeStamp:
+			sd = pooledTask.generateTelemetry()
+		
+		# the time stamp is only formatted once per reading
+		self.assertEqual(updateTimeStamp.call_count, 1)
+		self.assertIsNotNone(sd.getTimeStamp())
+		
+	def testLatestTelemetryCopy(self):
+		pooledTask = TemperatureSensorSimTask(poolSize = 1)
+		
+		sd = pooledTask.generateTelemetry()
+		sdCopy = pooledTask.getLatestTelemetry()
+		
+		self.assertIsNot(sd, sdCopy)
+		self.assertEqual(sd.getValue(), sdCopy.getValue())
+		self.assertEqual(sd.getTimeStamp(), sdCopy.getTimeStamp())
+		
+		# the copy is owned by the caller, and isn't overwritten
+		copyVal = sdCopy.getValue()
+		
+		while sd.getValue() == copyVal:
+			pooledTask.generateTelemetry()
+		
+		self.assertEqual(sdCopy.getValue(), copyVal)
+		self.assertEqual(sdCopy.getTypeID(), ConfigConst.TEMP_SENSOR_TYPE)
+
+	def testGenerateTelemetryBatch(self):
+		dataSet = SensorDataGenerator().generateDailyIndoorTemperatureDataSet()
+		dataSetTask = TemperatureSensorSimTask(dataSet = dataSet)
+		
+		batch = dataSetTask.generateTelemetryBatch(10)
+		
+		self.assertEqual(batch.getCount(), 10)
+		self.assertEqual(batch.getTypeID(), ConfigConst.TEMP_SENSOR_TYPE)
+		self.assertEqual(batch.getValues().tolist(), dataSet.getDataEntries()[0:10].tolist())
+		self.assertEqual(batch.getTimeStamps().tolist(), dataSet.getTimeStamps(slice(0, 10)).tolist())
+		self.assertEqual(dataSetTask.getTelemetryValue(), dataSet.getDataEntry(9))
+		
+		# batches are views into the data set (unless they wrap around)
+		self.assertTrue(calcLib.shares_memory(batch.getValues(), dataSet.getDataEntries()))
+		
+		# ... and continue where the previous reading left off
+		self.assertEqual(dataSetTask.generateTelemetry().getValue(), dataSet.getDataEntry(10))
+		
+	def testGenerateTelemetryBatchWrapAround(self):
+		dataSet = SensorDataGenerator().generateDailyIndoorTemperatureDataSet()
+		dataSetTask = TemperatureSensorSimTask(dataSet = dataSet)
+		entryCount = dataSet.getDataEntryCount()
+		
+		dataSetTask.generateTelemetryBatch(entryCount - 2)
+		batch = dataSetTask.generateTelemetryBatch(4)
+		
+		self.assertEqual(batch.getValues().tolist(), \
+			dataSet.getDataEntries()[[entryCount - 2, entryCount - 1, 0, 1]].tolist())
+		self.assertEqual(dataSetTask.generateTelemetry().getValue(), dataSet.getDataEntry(2))
+		
+	def testGenerateRandomTelemetryBatch(self):
+		batch = self.tSimTask.generateTelemetryBatch(5)
+		
+		self.assertEqual(batch.getCount(), 5)
+		self.assertTrue(calcLib.all(batch.getValues() >= SensorDataGenerator.LOW_NORMAL_INDOOR_TEMP))
+		self.assertTrue(calcLib.all(batch.getValues() <= SensorDataGenerator.HI_NORMAL_INDOOR_TEMP))
+
+	def testPlayback(self):
+		dataSet = SensorDataGenerator().generateDailyIndoorTemperatureDataSet()
+		timeStamps = dataSet.getTimeStamps()
+		playbackTask = TemperatureSensorSimTask(dataSet = dataSet)
+		
+		self.assertFalse(playbackTask.isPlaybackEnabled())
+		self.assertTrue(playbackTask.startPlayback(speed = 1000.0, startTime = timeStamps[0]))
+		self.assertEqual(playbackTask.getPlaybackSpeed(), 1000.0)
+		
+		# rewind the playback clock by 5.4 seconds, or 90 simulated minutes
+		playbackTask.playbackStartClock -= 5.4
+		
+		sd = playbackTask.generateTelemetry()
+		playbackTime = playbackTask.getLatestTelemetry(copy = False).getTimeStamp()
+		
+		self.assertGreaterEqual(playbackTask.lastPlaybackTime, timeStamps[0] + 5400.0)
+		self.assertAlmostEqual(sd.getValue(), calcLib.interp(playbackTask.lastPlaybackTime, timeStamps, dataSet.getDataEntries()), places = 6)
+		logging.info("Playback SensorData at %s: %f", playbackTime, sd.getValue())
+		
+		# a batch covers the simulated time since the previous reading
+		playbackTask.playbackStartClock -= 0.6
+		
+		batch = playbackTask.generateTelemetryBatch(10)
+		
+		self.assertEqual(batch.getCount(), 10)
+		self.assertGreaterEqual(batch.getTimeStamps()[-1] - batch.getTimeStamps()[0], 540.0)
+		self.assertTrue(calcLib.allclose(batch.getValues(), calcLib.interp(batch.getTimeStamps(), timeStamps, dataSet.getDataEntries())))
+		
+		playbackTask.stopPlayback()
+		
+		self.assertFalse(playbackTask.isPlaybackEnabled())
+		
+	def testPlaybackWrapAround(self):
+		dataSet = SensorDataGenerator().generateDailyIndoorTemperatureDataSet()
+		timeStamps = dataSet.getTimeStamps()
+		playbackTask = TemperatureSensorSimTask(dataSet = dataSet, playbackSpeed = 1.0)
+		
+		# one (simulated) day and 1 hour later plays back the entry for hour 1
+		playbackTask.startPlayback(speed = 1.0, startTime = timeStamps[-1] + 3600.0)
+		
+		self.assertAlmostEqual( \
+			float(playbackTask._getPlaybackValues(timeStamps[-1] + 3600.0)), \
+			calcLib.interp(timeStamps[0] + 3600.0, timeStamps, dataSet.getDataEntries()), places = 6)
+		
+	def testPlaybackRequiresDataSet(self):
+		self.assertFalse(TemperatureSensorSimTask().startPlayback(speed = 10.0))
+		
+	def testChunkedTelemetry(self):
+		dataSet = SensorDataGenerator(seed = 42).generateDailyIndoorTemperatureDataSet(streamID = 1)
+		dataChunks = SensorDataGenerator(seed = 42).generateSensorDataChunks( \
+			minValue = SensorDataGenerator.MIN_INDOOR_TEMP, maxValue = SensorDataGenerator.MAX_INDOOR_TEMP, \
+			startHour = 0, endHour = 24, chunkSize = 10, continuous = True, streamID = 1)
+		
+		chunkedTask = TemperatureSensorSimTask(dataChunks = dataChunks, playbackSpeed = 0.0)
+		
+		self.assertTrue(chunkedTask.isChunked())
+		self.assertFalse(chunkedTask.isDataSetSampled())
+		self.assertFalse(chunkedTask.startPlayback(speed = 10.0))
+		
+		# readings step through the chunks as they would through the data set, and batches span chunks
+		values = [chunkedTask.generateTelemetry().getValue() for _ in range(5)]
+		batch = chunkedTask.generateTelemetryBatch(25)
+		
+		self.assertEqual(batch.getCount(), 25)
+		self.assertTrue(calcLib.allclose(values + batch.getValues().tolist(), dataSet.getDataEntries()[0:30]))
+		self.assertTrue(calcLib.allclose(calcLib.diff(batch.getTimeStamps()), calcLib.diff(dataSet.getTimeStamps()[5:30])))
+		self.assertEqual(chunkedTask.chunkDataEntries.size, 10)
+		
+	def testChunkedTelemetryRunsOut(self):
+		dataChunks = SensorDataGenerator(seed = 42).generateSensorDataChunks(startHour = 0, endHour = 1, chunkSize = 50, streamID = 1)
+		chunkedTask = TemperatureSensorSimTask(dataChunks = dataChunks, playbackSpeed = 0.0)
+		
+		self.assertEqual(chunkedTask.generateTelemetryBatch(60).getCount(), 60)
+		
+		# once the chunks run out, the randomizer takes over
+		sensorData = chunkedTask.generateTelemetry()
+		
+		self.assertFalse(chunkedTask.isChunked())
+		self.assertGreaterEqual(sensorData.getValue(), SensorDataGenerator.LOW_NORMAL_INDOOR_TEMP)
+		self.assertLessEqual(sensorData.getValue(), SensorDataGenerator.HI_NORMAL_INDOOR_TEMP)
+
 if __name__ == "__main__":
 	unittest.main()
 	
\ No newline at end of file
@@ -0,0 +1,119 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import unittest
+
+from time import perf_counter
+
+import numpy as calcLib
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.cda.sim.HumidifierActuatorSimTask import HumidifierActuatorSimTask
+from programmingtheiot.cda.sim.HumiditySensorSimTask import HumiditySensorSimTask
+from programmingtheiot.cda.sim.HvacActuatorSimTask import HvacActuatorSimTask
+from programmingtheiot.cda.sim.TemperatureSensorSimTask import TemperatureSensorSimTask
+from programmingtheiot.cda.sim.ZonePlantModel import ZonePlantModel
+
+from programmingtheiot.data.ActuatorData import ActuatorData
+
+class ZonePlantModelTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	ZonePlantModel. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	TEMP_FLOOR = 18.0
+	TEMP_CEILING = 20.0
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing ZonePlantModel class...")
+		
+	def setUp(self):
+		pass
+
+	def tearDown(self):
+		pass
+	
+	def testPassiveCooling(self):
+		plantModel = ZonePlantModel(zoneCount = 3, zoneTemp = 20.0, outsideTemp = [10.0, 20.0, 30.0])
+		
+		# one time constant (R * C) later, each zone is ~63% of the way to the outside temperature
+		plantModel.step(ZonePlantModel.DEFAULT_THERMAL_MASS * ZonePlantModel.DEFAULT_THERMAL_RESISTANCE)
+		
+		expectedTemps = 20.0 + (calcLib.array([10.0, 20.0, 30.0]) - 20.0) * (1.0 - calcLib.exp(-1.0))
+		
+		self.assertTrue(calcLib.allclose(plantModel.getTemperatures(), expectedTemps))
+		
+	def testClosedLoop(self):
+		plantModel = ZonePlantModel(zoneCount = 2, zoneTemp = 15.0, zoneHumidity = 30.0, outsideHumidity = 35.0)
+		
+		hvacTask = HvacActuatorSimTask(plantModel = plantModel, zoneIndex = 1)
+		humidifierTask = HumidifierActuatorSimTask(plantModel = plantModel, zoneIndex = 1)
+		tempTask = TemperatureSensorSimTask(plantModel = plantModel, zoneIndex = 1)
+		humidityTask = HumiditySensorSimTask(plantModel = plantModel, zoneIndex = 1)
+		
+		self.assertEqual(tempTask.generateTelemetry().getValue(), 15.0)
+		
+		hvacCmd = ActuatorData(typeID = ConfigConst.HVAC_ACTUATOR_TYPE)
+		hvacCmd.setCommand(ConfigConst.COMMAND_ON)
+		hvacCmd.setValue(21.0)
+		
+		humidifierCmd = ActuatorData(typeID = ConfigConst.HUMIDIFIER_ACTUATOR_TYPE)
+		humidifierCmd.setCommand(ConfigConst.COMMAND_ON)
+		humidifierCmd.setValue(45.0)
+		
+		self.assertIsNotNone(hvacTask.updateActuator(hvacCmd))
+		self.assertIsNotNone(humidifierTask.updateActuator(humidifierCmd))
+		
+		# three hours, in one minute steps
+		for _ in range(180):
+			plantModel.step(60.0)
+		
+		# only the actuated zone (1) is heated and humidified - the proportional
+		# HVAC control settles slightly below its setpoint (at 20C here)
+		self.assertGreater(tempTask.generateTelemetry().getValue(), 19.5)
+		self.assertAlmostEqual(humidityTask.generateTelemetry().getValue(), 45.0, places = 1)
+		self.assertLess(plantModel.getSensorValue(ConfigConst.TEMP_SENSOR_TYPE, 0), 15.0)
+		self.assertLess(plantModel.getSensorValue(ConfigConst.HUMIDITY_SENSOR_TYPE, 0), 35.0)
+		
+		hvacCmd.setCommand(ConfigConst.COMMAND_OFF)
+		hvacTask.updateActuator(hvacCmd)
+		
+		self.assertFalse(plantModel.getHvacEnabled()[1])
+		
+	def testControlLoop(self):
+		zoneCount = 10000
+		plantModel = ZonePlantModel( \
+			zoneCount = zoneCount, zoneTemp = calcLib.linspace(12.0, 26.0, zoneCount), outsideTemp = 5.0)
+		
+		startTime = perf_counter()
+		
+		# one day, in one minute steps
+		commandCount = plantModel.runControlLoop( \
+			tempFloor = self.TEMP_FLOOR, tempCeiling = self.TEMP_CEILING, timeStep = 60.0, stepCount = 1440)
+		
+		elapsedTime = perf_counter() - startTime
+		
+		logging.info("Ran control loop for %d zones: %d HVAC commands in %.3f seconds.", zoneCount, commandCount, elapsedTime)
+		
+		temps = plantModel.getTemperatures()
+		
+		self.assertGreater(commandCount, zoneCount)
+		self.assertTrue(calcLib.all(temps >= self.TEMP_FLOOR - 0.5))
+		self.assertTrue(calcLib.all(temps <= self.TEMP_CEILING + 0.5))
+
+if __name__ == "__main__":
+	unittest.main()
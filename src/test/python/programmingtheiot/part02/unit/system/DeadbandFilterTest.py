@@ -0,0 +1,90 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import unittest
+
+from programmingtheiot.cda.sim.SensorDataGenerator import SensorDataGenerator
+from programmingtheiot.cda.system.DeadbandFilter import DeadbandFilter
+
+class DeadbandFilterTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	DeadbandFilter. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	POLL_SECS = 60.0
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing DeadbandFilter class...")
+		
+	def setUp(self):
+		pass
+
+	def tearDown(self):
+		pass
+	
+	def testAbsoluteDeadband(self):
+		deadbandFilter = DeadbandFilter(deadband = 0.5)
+		
+		results = [deadbandFilter.filterValue(val, now = 0.0) for val in [20.0, 20.3, 20.6, 20.4, 19.9, 20.0]]
+		
+		self.assertEqual(results, [True, False, True, False, True, False])
+		self.assertEqual(deadbandFilter.getReportedCount(), 3)
+		self.assertEqual(deadbandFilter.getSuppressedCount(), 3)
+		
+	def testPercentDeadband(self):
+		deadbandFilter = DeadbandFilter(deadbandPercent = 1.0)
+		
+		results = [deadbandFilter.filterValue(val, now = 0.0) for val in [1000.0, 1009.0, 1011.0, 1020.0, 1021.5]]
+		
+		self.assertEqual(results, [True, False, True, False, True])
+		
+	def testHysteresis(self):
+		deadbandFilter = DeadbandFilter(deadband = 0.5, hysteresis = 0.3)
+		
+		# the rise to 20.6 is reported; dropping back needs a change > 0.8
+		results = [deadbandFilter.filterValue(val, now = 0.0) for val in [20.0, 20.6, 19.9, 19.7, 20.4]]
+		
+		self.assertEqual(results, [True, True, False, True, False])
+		
+	def testMaxSilence(self):
+		deadbandFilter = DeadbandFilter(deadband = 10.0, maxSilenceSecs = 300.0)
+		
+		results = [deadbandFilter.filterValue(20.0, now = i * self.POLL_SECS) for i in range(11)]
+		
+		self.assertEqual([i for i, result in enumerate(results) if result], [0, 5, 10])
+		
+	def testPressureVolumeReduction(self):
+		# a slowly changing (noise free) pressure signal, polled every 5 seconds
+		dataSet = SensorDataGenerator().generateDailyEnvironmentPressureDataSet( \
+			noiseLevel = 0, minValue = SensorDataGenerator.LOW_NORMAL_ENV_PRESSURE, maxValue = SensorDataGenerator.HI_NORMAL_ENV_PRESSURE)
+		
+		deadbandFilter = DeadbandFilter(deadbandPercent = 0.1, maxSilenceSecs = 300.0, hysteresis = 0.2)
+		
+		for i in range(dataSet.getDataEntryCount()):
+			deadbandFilter.filterValue(float(dataSet.getDataEntry(i)), now = i * 5.0)
+		
+		logging.info( \
+			"Pressure readings reported: %d, suppressed: %d", \
+			deadbandFilter.getReportedCount(), deadbandFilter.getSuppressedCount())
+		
+		self.assertLessEqual(deadbandFilter.getReportedCount() * 10, dataSet.getDataEntryCount())
+		
+	def testFromConfigWithoutSection(self):
+		self.assertIsNone(DeadbandFilter.fromConfig(section = 'ConstrainedDevice.NoSuchSensor'))
+
+if __name__ == "__main__":
+	unittest.main()
+	
@@ -0,0 +1,97 @@
+#####
+# 
+# This class is part of the Programming the Internet of Things
+# project, and is available via the MIT License, which can be
+# found in the LICENSE file at the top level of this repository.
+# 
+# Copyright (c) 2020 by Andrew D. King
+# 
+
+import logging
+import sys
+import unittest
+
+import programmingtheiot.common.ConfigConst as ConfigConst
+
+from programmingtheiot.cda.sim.HvacActuatorSimTask import HvacActuatorSimTask
+from programmingtheiot.cda.system.TaskRegistry import TaskRegistry
+
+class TaskRegistryTest(unittest.TestCase):
+	"""
+	This test case class contains very basic unit tests for
+	TaskRegistry. It should not be considered complete,
+	but serve as a starting point for the student implementing
+	additional functionality within their Programming the IoT
+	environment.
+	"""
+	
+	@classmethod
+	def setUpClass(self):
+		logging.basicConfig(format = '%(asctime)s:%(module)s:%(levelname)s:%(message)s', level = logging.DEBUG)
+		logging.info("Testing TaskRegistry class...")
+		
+	def setUp(self):
+		pass
+
+	def tearDown(self):
+		pass
+	
+	def testGetTaskIsLazyAndCached(self):
+		taskRegistry = TaskRegistry()
+		
+		self.assertTrue(taskRegistry.hasTask(ConfigConst.HVAC_ACTUATOR_TYPE))
+		self.assertFalse(taskRegistry.isTaskLoaded(ConfigConst.HVAC_ACTUATOR_TYPE))
+		
+		hvacTask = taskRegistry.getTask(ConfigConst.HVAC_ACTUATOR_TYPE)
+		
+		self.assertIsInstance(hvacTask, HvacActuatorSimTask)
+		self.assertTrue(taskRegistry.isTaskLoaded(ConfigConst.HVAC_ACTUATOR_TYPE))
+		self.assertIs(taskRegistry.getTask(ConfigConst.HVAC_ACTUATOR_TYPE), hvacTask)
+		
+		# the resolved class is shared, but each registry has its own tasks
+		otherRegistry = TaskRegistry()
+		
+		self.assertIs(otherRegistry.getTaskClass(ConfigConst.HVAC_ACTUATOR_TYPE), HvacActuatorSimTask)
+		self.assertIsNot(otherRegistry.getTask(ConfigConst.HVAC_ACTUATOR_TYPE), hvacTask)
+		
+	def testEmulatorModulesNotImported(self):
+		taskRegistry = TaskRegistry(useEmulator = True)
+		
+		self.assertTrue(taskRegistry.hasTask(ConfigConst.LED_DISPLAY_ACTUATOR_TYPE))
+		self.assertEqual(len(taskRegistry.getLoadedTasks()), 0)
+		self.assertNotIn('programmingtheiot.cda.emulated.LedDisplayEmulatorTask', sys.modules)
+		
+	def testLoadTasks(self):
+		taskArgs = {}
+		
+		def createTaskArgs(typeID):
+			taskArgs[typeID] = True
+			return None
+		
+		taskRegistry = TaskRegistry(taskArgsFactory = createTaskArgs)
+		
+		typeIDs = [ConfigConst.HUMIDITY_SENSOR_TYPE, ConfigConst.LED_DISPLAY_ACTUATOR_TYPE, ConfigConst.TEMP_SENSOR_TYPE]
+		tasks = taskRegistry.loadTasks(typeIDs)
+		
+		# the LED display is only emulated, so it's skipped
+		self.assertEqual([task.getTypeID() for task in tasks], [ConfigConst.HUMIDITY_SENSOR_TYPE, ConfigConst.TEMP_SENSOR_TYPE])
+		self.assertEqual(sorted(taskArgs.keys()), [ConfigConst.HUMIDITY_SENSOR_TYPE, ConfigConst.TEMP_SENSOR_TYPE])
+		
+		tasks = taskRegistry.loadTasks()
+		
+		self.assertEqual(len(tasks), len(taskRegistry.getTaskTypes()))
+		self.assertEqual(len(taskRegistry.getLoadedTasks()), len(tasks))
+		
+	def testUnregisteredTask(self):
+		taskRegistry = TaskRegistry()
+		
+		self.assertIsNone(taskRegistry.getTask(ConfigConst.LED_DISPLAY_ACTUATOR_TYPE))
+		self.assertIsNone(taskRegistry.getTaskClass(ConfigConst.LED_DISPLAY_ACTUATOR_TYPE))
+		
+		taskRegistry.registerTask(ConfigConst.LED_DISPLAY_ACTUATOR_TYPE, 'programmingtheiot.cda.sim.HvacActuatorSimTask')
+		
+		self.assertIsInstance(taskRegistry.getTask(ConfigConst.LED_DISPLAY_ACTUATOR_TYPE), HvacActuatorSimTask)
+
+if __name__ == "__main__":
+	unittest.main()
+	